@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Sync and summary time of the cost analytics against the local stub.
+
+Syncs ``CostAnalytics`` into a fresh store (every invoice and the bandwidth
+of every instance), then again (only what is new), and compares the cold
+sync with fetching the same bandwidth one instance after another. Then
+reports how long loading the stored tables and computing the summary take,
+i.e. what the cost page waits for before it renders. The stub runs in a
+separate process and adds ``--latency-ms`` to every request. Run from the
+repository root:
+
+    python benchmarks/bench_analytics.py --instances 1000 --latency-ms 50
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from stub_server import spawn  # noqa: E402
+from vultr_cli.api.analytics import CostAnalytics  # noqa: E402
+from vultr_cli.api.client import VultrAPI  # noqa: E402
+from vultr_cli.api.ratelimit import TokenBucket  # noqa: E402
+from vultr_cli.api.store import LocalStore  # noqa: E402
+
+
+def timed(fn, runs=1):
+    """Result of the last of ``runs`` calls and their median time in ms."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instances", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    server, base_url = spawn("--instances", args.instances, "--latency-ms", args.latency_ms)
+    # The benchmark measures the client, not the shared API rate limit
+    api = VultrAPI("bench", base_url=base_url, pool_size=CostAnalytics.MAX_CONCURRENCY,
+                   rate_limiter=TokenBucket(rate=1e6, capacity=1e6))
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            store = LocalStore(os.path.join(directory, "bench.db"))
+            analytics = CostAnalytics(api, store)
+            (counts, errors), cold = timed(analytics.sync)
+            print(f"cold sync:        {cold:9.1f}ms  {counts}")
+            (counts, errors), warm = timed(analytics.sync)
+            print(f"incremental sync: {warm:9.1f}ms  {counts}")
+
+            instance_ids = [instance.id for instance in api.get_instances()]
+            _, sequential = timed(lambda: [api.get_instance_bandwidth(instance_id)
+                                           for instance_id in instance_ids])
+            print(f"sequential bandwidth only: {sequential:9.1f}ms "
+                  f"({sequential / cold:.1f}x the cold sync)")
+
+            _, load = timed(lambda: CostAnalytics(api, store), args.runs)
+            summary, compute = timed(analytics.summary, args.runs)
+            rows = sum(map(len, analytics.tables.values()))
+            print(f"load tables:      {load:9.2f}ms  ({rows} rows)")
+            print(f"summary:          {compute:9.2f}ms")
+            print(f"top instance:     {summary['top_bandwidth'][0]}")
+            store.close()
+    finally:
+        api.close()
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Threads vs. asyncio at high fan-out against the local stub.
+
+Fetches ``--requests`` instances with ``get_instance`` at each fan-out,
+once from a thread pool of that many workers sharing one ``VultrAPI`` and
+once as tasks of one ``AsyncVultrAPI``, and reports wall time, throughput,
+peak traced memory and thread count. The stub adds ``--latency-ms`` to
+every request so that fan-out, not the stub, is what is measured; it runs
+in a separate process so it does not compete for the GIL or add threads
+to the count. Needs aiohttp. Run from the repository root:
+
+    python benchmarks/bench_async.py --fan-out 50 100 200 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from stub_server import spawn  # noqa: E402
+from vultr_cli.api.aio import AsyncVultrAPI  # noqa: E402
+from vultr_cli.api.client import VultrAPI  # noqa: E402
+from vultr_cli.api.ratelimit import TokenBucket  # noqa: E402
+
+
+def unlimited():
+    # The benchmark measures the transport, not the shared API rate limit
+    return TokenBucket(rate=1e6, capacity=1e6)
+
+
+def measure(run):
+    """Wall time and peak thread count of ``run()``, then the peak traced
+    memory of a second run (tracing would distort the timing)."""
+    threads = [threading.active_count()]
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(0.01):
+            threads.append(threading.active_count())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        run()
+        elapsed = time.perf_counter() - start
+    finally:
+        done.set()
+        sampler.join()
+
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # Minus the sampler itself
+    return elapsed, peak, max(threads) - 1
+
+
+def bench_threads(base_url, ids, fan_out):
+    with VultrAPI("bench", base_url=base_url, pool_size=fan_out,
+                  rate_limiter=unlimited()) as api:
+        with ThreadPoolExecutor(max_workers=fan_out) as executor:
+            return measure(lambda: list(executor.map(api.get_instance, ids)))
+
+
+def bench_asyncio(base_url, ids, fan_out):
+    async def fetch():
+        async with AsyncVultrAPI("bench", base_url=base_url, pool_size=fan_out,
+                                 max_concurrency=fan_out, rate_limiter=unlimited()) as api:
+            await asyncio.gather(*(api.get_instance(instance_id) for instance_id in ids))
+
+    return measure(lambda: asyncio.run(fetch()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fan-out", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--instances", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    process, base_url = spawn("--instances", args.instances,
+                              "--latency-ms", args.latency_ms)
+    try:
+        with VultrAPI("bench", base_url=base_url, rate_limiter=unlimited()) as api:
+            all_ids = [instance.id for instance in api.get_instances()]
+        # An id repeats only every --instances requests, so few GETs are coalesced
+        ids = [all_ids[i % len(all_ids)] for i in range(args.requests)]
+
+        print(f"{'fan-out':>7} {'model':<8} {'wall s':>8} {'req/s':>8} {'peak MiB':>9} "
+              f"{'threads':>7}")
+        for fan_out in args.fan_out:
+            for name, bench in (("threads", bench_threads), ("asyncio", bench_asyncio)):
+                elapsed, peak, threads = bench(base_url, ids, fan_out)
+                print(f"{fan_out:>7} {name:<8} {elapsed:>8.2f} "
+                      f"{len(ids) / elapsed:>8.0f} {peak / 2 ** 20:>9.1f} {threads:>7}")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main()
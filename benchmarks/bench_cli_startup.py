@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Startup time of the headless `vultr-cli` command line.
+
+Times fresh interpreters: a bare `python -c pass` baseline, `--help`
+(argument parsing only) and a full `regions` call against the local stub,
+and fails if the CLI imports Kivy or its own startup exceeds the budget.
+Run from the repository root:
+
+    python benchmarks/bench_cli_startup.py --runs 20 --budget-ms 100
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from stub_server import StubServer  # noqa: E402
+
+
+def timed(command, env, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, env=env, stdout=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def imported_modules(command, env):
+    """Top-level packages imported by ``command``, from ``-X importtime``."""
+    result = subprocess.run([command[0], "-X", "importtime"] + command[1:], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            text=True, check=True)
+    return {line.rsplit("|", 1)[-1].strip().split(".")[0]
+            for line in result.stderr.splitlines() if line.startswith("import time:")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=100.0,
+                        help="maximum CLI startup on top of the bare interpreter")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=os.path.join(ROOT, "src"), VULTR_API_KEY="bench")
+    python = sys.executable
+    cli = [python, "-m", "vultr_cli"]
+
+    with StubServer() as server:
+        regions = cli + ["--base-url", server.base_url, "regions"]
+        timed(regions, env, 1)  # compile the .pyc files first
+        baseline = timed([python, "-c", "pass"], env, args.runs)
+        help_ms = timed(cli + ["--help"], env, args.runs)
+        regions_ms = timed(regions, env, args.runs)
+        modules = imported_modules(regions, env)
+
+    print(f"{'python -c pass':<22} {baseline:7.1f}ms")
+    print(f"{'vultr-cli --help':<22} {help_ms:7.1f}ms (+{help_ms - baseline:.1f}ms)")
+    print(f"{'vultr-cli regions':<22} {regions_ms:7.1f}ms (+{regions_ms - baseline:.1f}ms, "
+          f"including requests and one API call)")
+
+    failures = []
+    if "kivy" in modules:
+        failures.append("vultr-cli imported kivy")
+    if help_ms - baseline > args.budget_ms:
+        failures.append(f"startup {help_ms - baseline:.1f}ms exceeds {args.budget_ms}ms")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Import time and memory of the hand-written vs. the generated API client.
+
+Every scenario runs in a fresh interpreter so nothing is already imported.
+Run from the repository root (after `python tools/generate_client.py`):
+
+    python benchmarks/bench_import.py --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Code timed after the shared dependency (requests) is already imported
+CLIENT = "from vultr_cli.api.client import VultrAPI\napi = VultrAPI('bench')\n"
+SCENARIOS = {
+    "hand-written client": CLIENT,
+    "generated package": CLIENT + "from vultr_cli.api.generated import VultrClient\n"
+                                  "VultrClient(api)",
+    "generated, 1 group": CLIENT + "from vultr_cli.api.generated import VultrClient\n"
+                                   "VultrClient(api).instances",
+    "generated, all groups": CLIENT + "from vultr_cli.api.generated import GROUPS, VultrClient\n"
+                                      "client = VultrClient(api)\n"
+                                      "for name in GROUPS: getattr(client, name)",
+    "parse openapi.json": CLIENT + "import json\n"
+                                   "spec = json.load(open("
+                                   f"{os.path.join(ROOT, 'openapi.json')!r}))",
+}
+
+# tracemalloc slows imports down, so time and memory come from separate runs
+PROBE = """
+import json, sys, time, tracemalloc
+sys.path.insert(0, {src!r})
+import requests
+if {traced}:
+    tracemalloc.start()
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000,
+                  "kib": tracemalloc.get_traced_memory()[0] / 1024,
+                  "modules": len(sys.modules)}}))
+"""
+
+
+def run(code, traced=False):
+    probe = PROBE.format(src=os.path.join(ROOT, "src"), code=code, traced=traced)
+    output = subprocess.check_output([sys.executable, "-c", probe])
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    run(SCENARIOS["generated, all groups"])  # compile the .pyc files first
+    for name, code in SCENARIOS.items():
+        ms = statistics.median(run(code)["ms"] for _ in range(args.runs))
+        traced = run(code, traced=True)
+        print(f"{name:<22} import={ms:7.2f}ms retained={traced['kib']:8.1f}KiB "
+              f"modules={traced['modules']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Frame time and memory of widget-per-row lists vs the RecycleView-based lists.
+
+Needs a Kivy window; on a headless machine use SDL's offscreen driver:
+
+    SDL_VIDEODRIVER=offscreen python benchmarks/bench_lists.py --rows 5000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from kivy.base import EventLoop  # noqa: E402
+from kivy.core.window import Window  # noqa: E402
+from kivy.metrics import dp  # noqa: E402
+from kivy.uix.boxlayout import BoxLayout  # noqa: E402
+from kivy.uix.button import Button  # noqa: E402
+from kivy.uix.gridlayout import GridLayout  # noqa: E402
+from kivy.uix.label import Label  # noqa: E402
+from kivy.uix.scrollview import ScrollView  # noqa: E402
+
+from stub_server import make_dataset  # noqa: E402
+from vultr_cli.api.models import Instance, Plan  # noqa: E402
+from vultr_cli.ui.app import DataListView, InstanceRow, PlanRow  # noqa: E402
+
+
+class FakePage:
+    """Stands in for the owning page the row views call back into."""
+
+    selected_ids = set()
+    selected_plan_id = None
+
+    def toggle_selected(self, instance_id, active):
+        pass
+
+    def delete_instance(self, instance_id):
+        pass
+
+    def select_plan(self, plan):
+        pass
+
+
+def frame():
+    start = time.perf_counter()
+    EventLoop.idle()
+    return (time.perf_counter() - start) * 1000
+
+
+def grid_of_instances(instances):
+    """The previous GridLayout-in-ScrollView instance list."""
+    scroll = ScrollView()
+    layout = GridLayout(cols=1, spacing=dp(5), size_hint_y=None)
+    layout.bind(minimum_height=layout.setter("height"))
+    scroll.add_widget(layout)
+    for instance in instances:
+        row = BoxLayout(orientation="vertical", size_hint_y=None, height=dp(140))
+        row.add_widget(Label(text=f"ID: {instance['id']}\nPlan: {instance['plan']}\n"
+                                  f"IP: {instance['main_ip']}", size_hint_y=0.7))
+        row.add_widget(Button(text="Destroy", size_hint_y=None, height=dp(30),
+                              disabled=instance["server_status"] != "ok"))
+        layout.add_widget(row)
+    return scroll
+
+
+def grid_of_plans(plans):
+    """The previous GridLayout-in-ScrollView plan list."""
+    scroll = ScrollView()
+    layout = GridLayout(cols=1, spacing=dp(5), size_hint_y=None)
+    layout.bind(minimum_height=layout.setter("height"))
+    scroll.add_widget(layout)
+    for plan in plans:
+        layout.add_widget(Button(text=f"{plan['id']} - {plan['vcpu_count']} vCPU",
+                                 size_hint_y=None, height=dp(50)))
+    return scroll
+
+
+def recycled(viewclass, row_height, data):
+    view = DataListView(FakePage(), viewclass, row_height)
+    view.data = data
+    return view
+
+
+def measure(name, build, frames):
+    tracemalloc.start()
+    start = time.perf_counter()
+    widget = build()
+    Window.add_widget(widget)
+    frame()
+    frame()
+    first_frame = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    samples = []
+    for i in range(frames):
+        widget.scroll_y = 1 - (i % 100) / 100
+        samples.append(frame())
+    Window.remove_widget(widget)
+    print(f"{name:<28} build+first frame={first_frame:8.1f}ms "
+          f"scroll frame mean={statistics.mean(samples):6.2f}ms "
+          f"max={max(samples):6.2f}ms mem={current / 2 ** 20:6.1f}MiB "
+          f"peak={peak / 2 ** 20:6.1f}MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    EventLoop.ensure_window()
+    data = make_dataset(instances=args.rows, plans=args.rows)
+
+    measure("instances: GridLayout", lambda: grid_of_instances(data["instances"]),
+            args.frames)
+    measure("instances: RecycleView",
+            lambda: recycled(InstanceRow, dp(140),
+                             [{"instance": Instance.from_dict(i)} for i in data["instances"]]),
+            args.frames)
+    measure("plans: GridLayout", lambda: grid_of_plans(data["plans"]), args.frames)
+    measure("plans: RecycleView",
+            lambda: recycled(PlanRow, dp(50),
+                             [{"plan": Plan.from_dict(p),
+                               "text": f"{p['id']} - {p['vcpu_count']} vCPU"}
+                              for p in data["plans"]]),
+            args.frames)
+
+
+if __name__ == "__main__":
+    main()
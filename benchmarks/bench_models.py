@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Parse time and retained memory of raw response dicts vs. the slotted models.
+
+Uses synthetic payloads shaped like the real API by default; pass responses
+recorded from the API (e.g. `curl -H "Authorization: Bearer $KEY"
+https://api.vultr.com/v2/plans > plans.json`) to measure those instead.
+Run from the repository root:
+
+    python benchmarks/bench_models.py --instances 5000
+    python benchmarks/bench_models.py --payload plans.json --payload instances.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from stub_server import make_dataset  # noqa: E402
+from vultr_cli.api import jsonlib  # noqa: E402
+from vultr_cli.api.models import Instance, Plan, Region, Snapshot  # noqa: E402
+
+MODELS = {"regions": Region, "plans": Plan, "snapshots": Snapshot, "instances": Instance}
+
+
+def load_payloads(paths, instances, plans):
+    """Yield ``(collection key, encoded response body)`` pairs."""
+    if not paths:
+        dataset = make_dataset(instances=instances, plans=plans)
+        for key in MODELS:
+            yield key, json.dumps({key: dataset[key]}).encode()
+        return
+    for path in paths:
+        with open(path, "rb") as f:
+            body = f.read()
+        key = next(k for k in json.loads(body) if k in MODELS)
+        yield key, body
+
+
+def measure(parse, body, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        parse(body)
+        samples.append((time.perf_counter() - start) * 1000)
+    gc.collect()
+    tracemalloc.start()
+    result = parse(body)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return statistics.median(samples), retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payload", action="append", default=[],
+                        help="recorded list response (repeatable)")
+    parser.add_argument("--instances", type=int, default=5000)
+    parser.add_argument("--plans", type=int, default=400)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    decoders = {"json": json.loads}
+    if jsonlib.BACKEND != "json":
+        decoders[jsonlib.BACKEND] = jsonlib.loads
+
+    for key, body in load_payloads(args.payload, args.instances, args.plans):
+        model = MODELS[key]
+        print(f"{key} ({len(body) / 1024:.0f} KiB)")
+        for name, decode in decoders.items():
+            scenarios = {
+                "raw dicts": lambda b, d=decode: d(b)[key],
+                model.__name__: lambda b, d=decode: [model.from_dict(item)
+                                                     for item in d(b)[key]],
+            }
+            for label, parse in scenarios.items():
+                ms, retained = measure(parse, body, args.runs)
+                print(f"  {name:<7} {label:<10} parse={ms:8.2f}ms "
+                      f"retained={retained / 1024:9.1f}KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Rate limiting and retry behaviour of VultrAPI against a stub returning 429 bursts.
+
+Run from the repository root:
+
+    python benchmarks/bench_ratelimit.py --requests 120 --burst 5
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from stub_server import StubServer  # noqa: E402
+from vultr_cli.api.client import VultrAPI, VultrAPIError  # noqa: E402
+from vultr_cli.api.ratelimit import TokenBucket  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=120)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--burst", type=int, default=5,
+                        help="consecutive 429 responses injected every 20 requests")
+    args = parser.parse_args()
+
+    with StubServer() as server:
+        bucket = TokenBucket()
+        clients = [VultrAPI("bench", base_url=server.base_url, rate_limiter=bucket)
+                   for _ in range(2)]
+
+        def call(i):
+            if i % 20 == 0:
+                server.inject(429, args.burst, retry_after=0)
+            try:
+                clients[i % 2].get_regions()
+                return True
+            except VultrAPIError:
+                return False
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            ok = sum(executor.map(call, range(args.requests)))
+        elapsed = time.perf_counter() - start
+
+    retries = sum(c.stats["retries"] for c in clients)
+    throttled = sum(c.stats["throttled"] for c in clients)
+    print(f"succeeded={ok}/{args.requests} elapsed={elapsed:.2f}s "
+          f"rate={args.requests / elapsed:.1f} req/s")
+    print(f"429 responses={throttled} retries={retries} "
+          f"limiter waits={bucket.waits} limiter wait time={bucket.wait_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
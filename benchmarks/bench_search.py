@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Build, refresh and per-keystroke query time of the instance search index.
+
+Indexes ``--instances`` synthetic instances, reapplies a refresh in which
+``--churn`` percent of them changed, were added or were removed, then
+types each query one character at a time (as the search box sees it) and
+reports p50/p99/max per keystroke, against a linear scan over the same
+fields for comparison. Run from the repository root:
+
+    python benchmarks/bench_search.py --instances 10000
+"""
+
+import argparse
+import gc
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from stub_server import make_dataset  # noqa: E402
+from vultr_cli.api.models import Instance  # noqa: E402
+from vultr_cli.api.search import InstanceIndex  # noqa: E402
+
+QUERIES = ["node-42", "10.0.1.7", "region:r03 node-1", "active", "inst-00099", "tag:web",
+           "ubuntu vc2"]
+
+
+def refreshed(dataset, churn, rng):
+    """The instance list of a refresh in which ``churn`` percent changed."""
+    items = [dict(item) for item in dataset]
+    count = max(1, len(items) * churn // 100)
+    for item in rng.sample(items, count):
+        item.update(status="pending", server_status="locked", label=item["label"] + "-new")
+    for index in sorted(rng.sample(range(len(items)), count // 2), reverse=True):
+        del items[index]
+    items += [dict(dataset[0], id=f"added-{i}", label=f"added-{i}") for i in range(count // 2)]
+    return [Instance.from_dict(item) for item in items]
+
+
+def linear_scan(instances, query):
+    """What filtering without the index costs: a substring test per field."""
+    terms = query.lower().split()
+    return [instance for instance in instances
+            if all(any(term in str(getattr(instance, field)).lower()
+                       for field in InstanceIndex.FIELDS) for term in terms)]
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return (statistics.median(samples), samples[int(len(samples) * 0.99)], samples[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instances", type=int, default=10000)
+    parser.add_argument("--churn", type=int, default=1, help="percent changed per refresh")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    dataset = make_dataset(instances=args.instances)["instances"]
+    instances = [Instance.from_dict(item) for item in dataset]
+
+    builds = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        index = InstanceIndex(instances)
+        builds.append((time.perf_counter() - start) * 1000)
+    gc.collect()
+    tracemalloc.start()
+    index = InstanceIndex(instances)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"build:   {statistics.median(builds):8.1f}ms for {len(index)} instances, "
+          f"{retained / 2 ** 20:.1f} MiB")
+
+    updates = []
+    for _ in range(args.runs):
+        refresh = refreshed(dataset, args.churn, rng)
+        start = time.perf_counter()
+        counts = index.update(refresh)
+        updates.append((time.perf_counter() - start) * 1000)
+        index.update(instances)
+    print(f"refresh: {statistics.median(updates):8.1f}ms for {args.churn}% churn "
+          f"(added, changed, removed = {counts})")
+
+    print(f"{'query':<20} {'matches':>7} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+          f"{'scan ms':>8}")
+    for query in QUERIES:
+        keystrokes = [query[:length] for length in range(1, len(query) + 1)]
+        samples = []
+        for _ in range(args.runs):
+            index.update(refreshed(dataset, args.churn, rng))  # invalidates cached terms
+            index.update(instances)
+            for text in keystrokes:
+                start = time.perf_counter()
+                matches = index.filter(text)
+                samples.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        scanned = linear_scan(instances, query)
+        scan = (time.perf_counter() - start) * 1000
+        p50, p99, worst = percentiles(samples)
+        print(f"{query:<20} {len(matches):>7} {p50:>8.3f} {p99:>8.3f} {worst:>8.3f} "
+              f"{scan:>8.1f}")
+        del scanned
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Per-request latency: module-level requests.get vs the pooled VultrAPI session.
+
+Run from the repository root:
+
+    python benchmarks/bench_session.py --requests 200 --handshake-ms 30
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import requests  # noqa: E402
+
+from stub_server import StubServer  # noqa: E402
+from vultr_cli.api.client import VultrAPI  # noqa: E402
+
+
+def timed(fn, count):
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name, samples, connections):
+    samples = sorted(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{name:<22} mean={statistics.mean(samples):7.2f}ms "
+          f"p50={statistics.median(samples):7.2f}ms p99={p99:7.2f}ms "
+          f"connections={connections}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--handshake-ms", type=float, default=30.0,
+                        help="simulated TCP+TLS setup cost per new connection")
+    args = parser.parse_args()
+
+    with StubServer(handshake_delay=args.handshake_ms / 1000) as server:
+        url = f"{server.base_url}/regions"
+        headers = {"Authorization": "Bearer bench"}
+        unpooled = timed(lambda: requests.get(url, headers=headers), args.requests)
+        report("requests.get", unpooled, server.connections)
+
+        before = server.connections
+        with VultrAPI("bench", base_url=server.base_url) as api:
+            pooled = timed(api.get_regions, args.requests)
+        report("VultrAPI (pooled)", pooled, server.connections - before)
+
+    saved = statistics.mean(unpooled) - statistics.mean(pooled)
+    print(f"saved per request: {saved:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
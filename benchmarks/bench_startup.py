@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Time to first frame of the Kivy app with a stored API key.
+
+Starts the app in a fresh interpreter (cold and with a warm catalog cache)
+against the local stub, with a simulated mobile handshake delay, and reports
+the `startup_stats` milestones plus how many background API requests had
+been started when the first frame was drawn (none of them block it). Needs
+a Kivy window; SDL_VIDEODRIVER=offscreen works on headless machines. Run from the repository root:
+
+    python benchmarks/bench_startup.py --runs 5 --handshake-ms 150
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def child(base_url):
+    """Run the app once and print its startup stats as JSON."""
+    started = time.perf_counter()
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+    sys.path.insert(0, os.path.join(ROOT, "src"))
+
+    from kivy.clock import Clock
+
+    from vultr_cli.api.client import VultrAPI
+    from vultr_cli.ui.app import VultrCliApp
+
+    VultrAPI.BASE_URL = base_url
+
+    class BenchApp(VultrCliApp):
+        def on_first_frame(self, window):
+            super().on_first_frame(window)
+            self.startup_stats["requests_started"] = (
+                self.api_client.stats["requests"] if self.api_client else 0)
+
+        def mark_startup(self, event):
+            super().mark_startup(event)
+            if event == "key_validated":
+                Clock.schedule_once(lambda dt: self.stop(), 0.1)
+
+    app = BenchApp(started=started)
+    Clock.schedule_once(lambda dt: app.stop(), 30)
+    app.run()
+    print(json.dumps(app.startup_stats))
+
+
+def run_once(base_url, workdir):
+    output = subprocess.check_output(
+        [sys.executable, os.path.abspath(__file__), "--child", base_url],
+        cwd=workdir, stderr=subprocess.DEVNULL, text=True)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--handshake-ms", type=float, default=150)
+    parser.add_argument("--child", metavar="BASE_URL", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child)
+        return
+
+    sys.path.insert(0, os.path.join(ROOT, "src"))
+    from stub_server import StubServer
+
+    workdir = tempfile.mkdtemp(prefix="vultr-startup-")
+    try:
+        with open(os.path.join(workdir, "vultr_config.json"), "w") as f:
+            json.dump({"api_key": "bench"}, f)
+        with StubServer(handshake_delay=args.handshake_ms / 1000) as server:
+            for label, keep_cache in (("cold cache", False), ("warm cache", True)):
+                runs = []
+                for _ in range(args.runs):
+                    if not keep_cache:
+                        shutil.rmtree(os.path.join(workdir, "vultr_cache"), ignore_errors=True)
+                    runs.append(run_once(server.base_url, workdir))
+                stats = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+                print(f"{label:<11} build={stats['build']:7.1f}ms "
+                      f"first_frame={stats['first_frame']:7.1f}ms "
+                      f"key_validated={stats.get('key_validated', float('nan')):7.1f}ms "
+                      f"requests_started={stats['requests_started']:.0f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
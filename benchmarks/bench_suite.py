@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Throughput, latency and memory suite for VultrAPI against the local stub.
+
+Runs every scenario against the openapi.json-driven stub and writes the
+results as JSON so runs can be tracked over time; ``--baseline`` compares
+against an earlier results file and fails on regressions beyond
+``--tolerance``. The deploy and instance list data paths are timed without
+Kivy. Run from the repository root:
+
+    python benchmarks/bench_suite.py --instances 5000 --output results.json
+    python benchmarks/bench_suite.py --baseline results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from stub_server import StubServer, make_dataset  # noqa: E402
+from vultr_cli.api import jsonlib  # noqa: E402
+from vultr_cli.api.availability import AvailabilityIndex  # noqa: E402
+from vultr_cli.api.client import VultrAPI, VultrAPIError  # noqa: E402
+from vultr_cli.api.metrics import MetricsRegistry  # noqa: E402
+from vultr_cli.api.plans import PlanIndex  # noqa: E402
+from vultr_cli.api.ratelimit import TokenBucket  # noqa: E402
+from vultr_cli.api.store import LocalStore  # noqa: E402
+
+# Metric name suffixes and whether a larger value is better
+DIRECTIONS = {"_ms": False, "_us": False, "_bytes": False, "_per_s": True}
+
+
+def percentile(samples, q):
+    samples = sorted(samples)
+    return samples[min(int(len(samples) * q / 100), len(samples) - 1)]
+
+
+def client(server, metrics=None):
+    # The suite measures the client, not the shared API rate limit
+    return VultrAPI("bench", base_url=server.base_url, metrics=metrics,
+                    rate_limiter=TokenBucket(rate=1e6, capacity=1e6))
+
+
+def timed(fn, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def peak_memory(fn):
+    tracemalloc.start()
+    try:
+        result = fn()
+        return tracemalloc.get_traced_memory()[1], result
+    finally:
+        tracemalloc.stop()
+
+
+def request_latency(metrics, route):
+    """p50/p99 per request of ``route`` from the client's metrics, in ms."""
+    for histogram in metrics.snapshot()["histograms"]:
+        labels = histogram["labels"]
+        if labels.get("route") == route and labels.get("phase") == "total":
+            return {"request_p50_ms": histogram["p50"] * 1000,
+                    "request_p99_ms": histogram["p99"] * 1000}
+    return {}
+
+
+def bench_list(server, args, fetch, route):
+    metrics = MetricsRegistry()
+    with client(server, metrics) as api:
+        fetch(api)  # warm up the connection pool
+        metrics.reset()
+        samples = timed(lambda: fetch(api), args.runs)
+        peak, items = peak_memory(lambda: fetch(api))
+    return {
+        "items": len(items),
+        "p50_ms": statistics.median(samples),
+        "p99_ms": percentile(samples, 99),
+        "items_per_s": len(items) / (statistics.median(samples) / 1000),
+        "peak_bytes": peak,
+        **request_latency(metrics, route),
+    }
+
+
+def bench_concurrent_gets(server, args):
+    ids = [instance["id"] for instance in server.httpd.dataset["instances"]]
+    with client(server) as api:
+        def get(i):
+            start = time.perf_counter()
+            api.get_instance(ids[i % len(ids)])
+            return (time.perf_counter() - start) * 1000
+
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            list(executor.map(get, range(args.workers)))  # warm up
+            start = time.perf_counter()
+            samples = list(executor.map(get, range(args.requests)))
+            elapsed = time.perf_counter() - start
+    return {
+        "workers": args.workers,
+        "requests_per_s": args.requests / elapsed,
+        "p50_ms": statistics.median(samples),
+        "p99_ms": percentile(samples, 99),
+    }
+
+
+def bench_faults(args, dataset):
+    fault_rates = {429: args.fault_rate, 503: args.fault_rate / 2}
+    with StubServer(dataset=dataset, fault_rates=fault_rates) as server, \
+            client(server) as api:
+        ok = 0
+        samples = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            try:
+                api.get_instances()
+                ok += 1
+            except VultrAPIError:
+                pass
+            samples.append((time.perf_counter() - start) * 1000)
+        return {
+            "fault_rates": {str(status): rate for status, rate in fault_rates.items()},
+            "success_ratio": ok / args.runs,
+            "retries_per_list": api.stats["retries"] / args.runs,
+            "p50_ms": statistics.median(samples),
+        }
+
+
+def bench_deploy_path(server, args):
+    """What DeployPage does on start: parallel catalog fetch, availability
+    prefetch, plan index build and filter queries."""
+    with client(server) as api:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            regions, plans, snapshots = executor.map(
+                lambda fetch: fetch(), [api.get_regions, lambda: api.get_plans("all"),
+                                        api.get_snapshots])
+        fetch_ms = (time.perf_counter() - start) * 1000
+
+        availability = AvailabilityIndex()
+        start = time.perf_counter()
+        availability.prefetch(api, [region.id for region in regions])
+        prefetch_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    index = PlanIndex(plans)
+    index_ms = (time.perf_counter() - start) * 1000
+
+    rng = random.Random(0)
+    queries = [
+        {"available": availability.plans_in(rng.choice(regions).id),
+         "plan_type": rng.choice(index.types + [None]),
+         "min_vcpu": rng.choice([None, 2, 4]),
+         "max_price": rng.choice([None, 50, 200]),
+         "sort": rng.choice(PlanIndex.SORT_KEYS)}
+        for _ in range(1000)
+    ]
+    start = time.perf_counter()
+    for query in queries:
+        index.query(**query)
+    query_us = (time.perf_counter() - start) * 1e6 / len(queries)
+    return {"plans": len(plans), "regions": len(regions), "fetch_ms": fetch_ms,
+            "prefetch_ms": prefetch_ms, "index_ms": index_ms, "query_us": query_us}
+
+
+def bench_instance_list_path(server, args):
+    """What InstanceListPage does: render from the store, fetch, save."""
+    with tempfile.TemporaryDirectory() as directory, client(server) as api:
+        store = LocalStore(os.path.join(directory, "state.db"))
+        try:
+            start = time.perf_counter()
+            instances = api.get_instances()
+            fetch_ms = (time.perf_counter() - start) * 1000
+            save_ms = statistics.median(
+                timed(lambda: store.save("instances", instances), args.runs))
+            load_ms = statistics.median(timed(lambda: store.load("instances"), args.runs))
+        finally:
+            store.close()
+    return {"instances": len(instances), "fetch_ms": fetch_ms,
+            "store_save_ms": save_ms, "store_load_ms": load_ms}
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, tolerance):
+    """Regressions of ``results`` against ``baseline`` beyond ``tolerance``."""
+    regressions = []
+    for scenario, metrics in results["results"].items():
+        before = baseline["results"].get(scenario, {})
+        for name, value in metrics.items():
+            higher_is_better = next((better for suffix, better in DIRECTIONS.items()
+                                     if name.endswith(suffix)), None)
+            old = before.get(name)
+            if higher_is_better is None or not isinstance(old, (int, float)) or not old:
+                continue
+            change = (value - old) / old
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(f"{scenario}.{name}: {old:.4g} -> {value:.4g} "
+                                   f"({change:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instances", type=int, default=5000)
+    parser.add_argument("--plans", type=int, default=500)
+    parser.add_argument("--regions", type=int, default=32)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=2000,
+                        help="requests for the concurrent get_instance scenario")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="latency the stub adds to every request")
+    parser.add_argument("--fault-rate", type=float, default=0.1,
+                        help="429 rate of the fault scenario (503 gets half of it)")
+    parser.add_argument("--output", help="write the results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="results JSON of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="relative slowdown reported as a regression (default: 0.25)")
+    args = parser.parse_args()
+
+    dataset = make_dataset(instances=args.instances, plans=args.plans,
+                           regions=args.regions)
+    results = {}
+    with StubServer(dataset=dataset, latency=args.latency_ms / 1000) as server:
+        results["list_instances"] = bench_list(server, args,
+                                               VultrAPI.get_instances, "/instances")
+        results["list_plans"] = bench_list(server, args,
+                                           lambda api: api.get_plans("all"), "/plans")
+        results["get_instance_concurrent"] = bench_concurrent_gets(server, args)
+        results["deploy_data_path"] = bench_deploy_path(server, args)
+        results["instance_list_data_path"] = bench_instance_list_path(server, args)
+    results["faults"] = bench_faults(args, dataset)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "json_backend": jsonlib.BACKEND,
+            "params": {name: value for name, value in vars(args).items()
+                       if name not in ("output", "baseline")},
+        },
+        "results": results,
+    }
+
+    for scenario, metrics in results.items():
+        line = " ".join(f"{name}={value:.4g}" if isinstance(value, float)
+                        else f"{name}={value}" for name, value in metrics.items())
+        print(f"{scenario:<24} {line}", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Bytes transferred, time and peak memory of the instance and plan lists
+by content encoding, streamed vs. full-buffer decoding.
+
+The stub runs in a child process, so the traced memory is the client's
+alone. Brotli needs the ``brotli`` package on both sides. Run from the
+repository root:
+
+    python benchmarks/bench_transfer.py --instances 5000 --plans 500
+    python benchmarks/bench_transfer.py --per-page 100  # the earlier page size
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from stub_server import brotli, spawn  # noqa: E402
+from vultr_cli.api import jsonlib  # noqa: E402
+from vultr_cli.api.client import VultrAPI  # noqa: E402
+from vultr_cli.api.metrics import MetricsRegistry  # noqa: E402
+from vultr_cli.api.ratelimit import TokenBucket  # noqa: E402
+
+LISTS = {
+    "instances": (VultrAPI.get_instances, "/instances"),
+    "plans": (lambda api: api.get_plans("all"), "/plans"),
+}
+
+
+def byte_totals(metrics, route):
+    """Decoded and transferred body bytes of ``route`` from the metrics."""
+    totals = {}
+    for histogram in metrics.snapshot()["histograms"]:
+        if histogram["labels"].get("route") == route:
+            totals[histogram["name"]] = histogram["sum"]
+    return (totals.get("vultr_api_response_bytes", 0),
+            totals.get("vultr_api_transfer_bytes", 0))
+
+
+def bench(base_url, fetch, route, encoding, stream, args):
+    metrics = MetricsRegistry()
+    with VultrAPI("bench", base_url=base_url, metrics=metrics,
+                  rate_limiter=TokenBucket(rate=1e6, capacity=1e6)) as api:
+        api.STREAM_LISTS = stream
+        api.DEFAULT_PER_PAGE = args.per_page
+        api.session.headers["Accept-Encoding"] = encoding
+        fetch(api)  # warm up the connection pool
+        metrics.reset()
+        sent = api.stats["requests"]
+        fetch(api)
+        requests = api.stats["requests"] - sent
+        decoded, transferred = byte_totals(metrics, route)
+
+        samples = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            fetch(api)
+            samples.append((time.perf_counter() - start) * 1000)
+
+        tracemalloc.start()
+        try:
+            items = fetch(api)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return (len(items), requests, decoded, transferred, statistics.median(samples),
+            peak)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instances", type=int, default=5000)
+    parser.add_argument("--plans", type=int, default=500)
+    parser.add_argument("--per-page", type=int, default=VultrAPI.DEFAULT_PER_PAGE)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="latency the stub adds to every request, e.g. a mobile RTT")
+    args = parser.parse_args()
+
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+    process, base_url = spawn("--instances", args.instances, "--plans", args.plans,
+                              "--latency-ms", args.latency_ms)
+    try:
+        print(f"JSON backend of the full-buffer path: {jsonlib.BACKEND}")
+        print(f"{'list':<10} {'encoding':<9} {'decode':<7} {'items':>6} {'reqs':>5} "
+              f"{'body KiB':>9} {'wire KiB':>9} {'p50 ms':>8} {'peak KiB':>9}")
+        for name, (fetch, route) in LISTS.items():
+            for encoding in encodings:
+                for stream in (False, True):
+                    items, requests, decoded, transferred, p50, peak = bench(
+                        base_url, fetch, route, encoding, stream, args)
+                    print(f"{name:<10} {encoding:<9} {'stream' if stream else 'buffer':<7} "
+                          f"{items:>6} {requests:>5} {decoded / 1024:>9.0f} "
+                          f"{transferred / 1024:>9.0f} {p50:>8.1f} {peak / 1024:>9.0f}")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main()
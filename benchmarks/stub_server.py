@@ -0,0 +1,463 @@
+"""Local stub of the Vultr API v2 used by the benchmarks."""
+
+import argparse
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SPEC_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "openapi.json")
+COLLECTIONS = ("regions", "plans", "snapshots", "instances")
+MIN_COMPRESS_SIZE = 1024
+
+
+def _resolve(spec, schema):
+    while "$ref" in schema:
+        node = spec
+        for part in schema["$ref"].lstrip("#/").split("/"):
+            node = node[part]
+        schema = node
+    return schema
+
+
+def sample(spec, schema):
+    """A value matching ``schema``: its example or first enum value if any,
+    otherwise an empty value of the right type."""
+    schema = _resolve(spec, schema or {})
+    if "example" in schema:
+        return schema["example"]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    if "allOf" in schema:
+        merged = {}
+        for part in schema["allOf"]:
+            merged.update(sample(spec, part))
+        return merged
+    kind = schema.get("type")
+    if kind == "object" or "properties" in schema:
+        return {name: sample(spec, prop)
+                for name, prop in schema.get("properties", {}).items()}
+    if kind == "array":
+        return []
+    return {"integer": 0, "number": 0.0, "boolean": False}.get(kind, "")
+
+
+@lru_cache(maxsize=None)
+def load_templates(spec_file=SPEC_FILE):
+    """One record per list endpoint, shaped by ``openapi.json``.
+
+    Every field of the item schema is present, filled from the endpoint's
+    documented example where it has one and from the schema otherwise.
+    The result is cached; ``make_dataset`` copies the records it uses.
+    """
+    with open(spec_file) as f:
+        spec = json.load(f)
+    templates = {}
+    for key in COLLECTIONS:
+        content = spec["paths"][f"/{key}"]["get"]["responses"]["200"]["content"]
+        media = content["application/json"]
+        record = sample(spec, media["schema"]["properties"][key]["items"])
+        for example in media.get("examples", {}).values():
+            record.update(example["value"][key][0])
+            break
+        templates[key] = record
+    account = spec["paths"]["/account"]["get"]["responses"]["200"]["content"]
+    templates["account"] = next(iter(account["application/json"]["examples"].values())
+                                )["value"]["account"]
+    return templates
+
+
+def make_dataset(instances=250, plans=40, regions=32, snapshots=3, invoices=24,
+                 spec_file=SPEC_FILE):
+    """Build synthetic collections shaped like the real API payloads."""
+    templates = load_templates(spec_file)
+
+    def record(key, **fields):
+        return dict(templates[key], **fields)
+
+    region_list = [
+        record("regions", id=f"r{i:02d}", city=f"City {i}", country="JP",
+               continent="Asia", options=["ddos_protection"])
+        for i in range(regions)
+    ]
+    region_list[0]["city"] = "Osaka"
+    region_ids = [r["id"] for r in region_list]
+    plan_types = ["vc2", "vhf", "vdc"]
+    plan_list = [
+        record("plans", id=f"{plan_types[i % 3]}-{i + 1}c-{2 * (i + 1)}gb",
+               vcpu_count=i + 1, ram=2048 * (i + 1), disk=25 * (i + 1), disk_count=1,
+               bandwidth=1024 * (i + 1), monthly_cost=5 * (i + 1),
+               type=plan_types[i % 3], locations=region_ids)
+        for i in range(plans)
+    ]
+    snapshot_list = [
+        record("snapshots", id=f"snap-{i}", date_created="2024-01-01T00:00:00+00:00",
+               description=f"snapshot {i}", size=4 * 2 ** 30, compressed_size=2 ** 30,
+               status="complete", os_id=215, app_id=0)
+        for i in range(snapshots)
+    ]
+    instance_list = [
+        record("instances", id=f"inst-{i:06d}", os="Ubuntu 22.04 x64", ram=2048, disk=55,
+               main_ip=f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", vcpu_count=1,
+               region=region_ids[i % len(region_ids)],
+               plan=plan_list[i % len(plan_list)]["id"],
+               date_created="2024-01-01T00:00:00+00:00", status="active",
+               power_status="running", server_status="ok", v6_network="", v6_main_ip="",
+               v6_network_size=0, label=f"node-{i}", hostname=f"node-{i}", tag="",
+               tags=[], pending_charges="0.42")
+        for i in range(instances)
+    ]
+    # Monthly invoices, newest first like the API
+    today = datetime.date.today()
+    billing_history = []
+    for k in range(invoices):
+        year, month = divmod(today.year * 12 + today.month - 1 - k, 12)
+        billing_history.append({
+            "id": 100000 + invoices - k, "date": f"{year}-{month + 1:02d}-01T00:00:00+00:00",
+            "type": "invoice", "description": f"Invoice #{100000 + invoices - k}",
+            "amount": round(0.42 * instances * (1 + k % 3 / 10), 2), "balance": 0,
+        })
+    return {
+        "account": dict(templates["account"],
+                        pending_charges=round(0.42 * instances, 2)),
+        "regions": region_list,
+        "plans": plan_list,
+        "snapshots": snapshot_list,
+        "instances": instance_list,
+        "billing_history": billing_history,
+    }
+
+
+def instance_bandwidth(instance_id, days=30):
+    """Daily traffic of the last ``days`` days up to today, stable per id."""
+    seed = int(hashlib.sha1(instance_id.encode()).hexdigest()[:8], 16)
+    today = datetime.date.today()
+    bandwidth = {}
+    for age in range(days - 1, -1, -1):
+        day = today - datetime.timedelta(days=age)
+        scale = (seed >> (age % 16)) % 1000 + 1
+        bandwidth[day.isoformat()] = {"incoming_bytes": scale * 1_000_000,
+                                      "outgoing_bytes": scale * 2_500_000}
+    return bandwidth
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves the stub dataset over keep-alive HTTP/1.1 with cursor paging."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Emulate the cost of a fresh TCP + TLS handshake on a mobile link.
+        if self.server.handshake_delay:
+            time.sleep(self.server.handshake_delay)
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        encoding = self._encoding(len(body))
+        if encoding == "br":
+            body = brotli.compress(body, quality=5)
+        elif encoding == "gzip":
+            body = gzip.compress(body, 6)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+            self.send_header("Vary", "Accept-Encoding")
+        if status == 200:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _encoding(self, size):
+        """Content-Encoding for a body of ``size`` bytes, as the API's front
+        end would pick it: brotli over gzip, nothing for small bodies."""
+        if not self.server.compress or size < MIN_COMPRESS_SIZE:
+            return None
+        accepted = {part.split(";")[0].strip()
+                    for part in self.headers.get("Accept-Encoding", "").split(",")}
+        if "br" in accepted and brotli is not None:
+            return "br"
+        return "gzip" if "gzip" in accepted else None
+
+    def _send_page(self, key, items, query):
+        per_page = int(query.get("per_page", ["100"])[0])
+        start = int(query.get("cursor", ["0"])[0] or 0)
+        end = start + per_page
+        links = {"next": str(end) if end < len(items) else "",
+                 "prev": str(max(start - per_page, 0)) if start else ""}
+        self._send_json(200, {key: items[start:end],
+                              "meta": {"total": len(items), "links": links}})
+
+    def _inject_fault(self, apply=None):
+        """Apply the configured latency, then answer with the next queued
+        fault or a random one drawn from ``fault_rates``, if any; returns
+        True if it did. A fault queued with ``applied`` first runs ``apply``,
+        the request's effect, as if only the response got lost."""
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        with self.server.lock:
+            self.server.requests += 1
+            fault = self.server.faults.popleft() if self.server.faults else None
+            if fault is None:
+                draw = self.server.random.random()
+                for status, rate in self.server.fault_rates.items():
+                    if draw < rate:
+                        fault = (status, 0 if status == 429 else None, False)
+                        break
+                    draw -= rate
+        if fault is None:
+            return False
+        status, retry_after, applied = fault
+        if applied and apply is not None:
+            apply()
+        body = json.dumps({"error": f"injected {status}", "status": status}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if retry_after is not None:
+            self.send_header("Retry-After", str(retry_after))
+        self.end_headers()
+        self.wfile.write(body)
+        return True
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        if self._inject_fault():
+            return
+        url = urlparse(self.path)
+        parts = url.path.strip("/").split("/")[1:]  # drop the "v2" prefix
+        query = parse_qs(url.query)
+        data = self.server.dataset
+        if parts == ["plans"] and query.get("type", ["all"])[0] != "all":
+            plan_type = query["type"][0]
+            self._send_page("plans", [p for p in data["plans"] if p["type"] == plan_type],
+                            query)
+        elif parts == ["instances"] and query.get("tag"):
+            tag = query["tag"][0]
+            self._send_page("instances", [i for i in data["instances"] if tag in i["tags"]],
+                            query)
+        elif parts == ["account"]:
+            self._send_json(200, {"account": data["account"]})
+        elif parts == ["billing", "history"]:
+            self._send_page("billing_history", data["billing_history"], query)
+        elif parts == ["billing", "pending-charges"]:
+            charges = [{"description": f"Cloud Compute ({i['label']})", "product": "Compute",
+                        "start_date": i["date_created"], "end_date": i["date_created"],
+                        "units": 1, "unit_type": "hours",
+                        "unit_price": float(i["pending_charges"]),
+                        "total": float(i["pending_charges"])}
+                       for i in data["instances"]]
+            self._send_json(200, {"pending_charges": charges})
+        elif len(parts) == 3 and parts[0] == "instances" and parts[2] == "bandwidth":
+            if any(i["id"] == parts[1] for i in data["instances"]):
+                self._send_json(200, {"bandwidth": instance_bandwidth(parts[1])})
+            else:
+                self._send_json(404, {"error": "Invalid instance-id."})
+        elif len(parts) == 1 and parts[0] in data:
+            self._send_page(parts[0], data[parts[0]], query)
+        elif len(parts) == 2 and parts[0] == "instances":
+            match = [i for i in data["instances"] if i["id"] == parts[1]]
+            if match:
+                self._send_json(200, {"instance": match[0]})
+            else:
+                self._send_json(404, {"error": "Invalid instance-id."})
+        elif len(parts) == 2 and parts[0] == "snapshots":
+            match = [s for s in data["snapshots"] if s["id"] == parts[1]]
+            if match:
+                self._send_json(200, {"snapshot": match[0]})
+            else:
+                self._send_json(404, {"error": "Invalid snapshot-id."})
+        elif len(parts) == 3 and parts[0] == "regions" and parts[2] == "availability":
+            plans = [p["id"] for p in data["plans"] if parts[1] in p["locations"]]
+            self._send_json(200, {"available_plans": plans})
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        body = self._read_json()  # drain the body so the connection stays usable
+        if self._inject_fault():
+            return
+        parts = urlparse(self.path).path.strip("/").split("/")[1:]
+        if parts == ["instances"]:
+            instance = make_dataset(instances=1, plans=1, regions=1,
+                                    snapshots=0)["instances"][0]
+            instance.update(id=str(uuid.uuid4()), plan=body.get("plan"),
+                            region=body.get("region"), label=body.get("label", ""),
+                            tags=body.get("tags", []),
+                            status="pending", server_status="none",
+                            main_ip="0.0.0.0")
+            with self.server.lock:
+                self.server.dataset["instances"].append(instance)
+            self._send_json(202, {"instance": instance})
+        elif (len(parts) == 2 and parts[0] == "instances"
+              and parts[1] in ("reboot", "halt", "start")):
+            self.send_response(204)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_DELETE(self):
+        parts = urlparse(self.path).path.strip("/").split("/")[1:]
+
+        def delete():
+            """Remove the instance; False if there was none."""
+            with self.server.lock:
+                instances = self.server.dataset["instances"]
+                count = len(instances)
+                instances[:] = [i for i in instances if i["id"] != parts[1]]
+                return len(instances) < count
+
+        is_instance = len(parts) == 2 and parts[0] == "instances"
+        if self._inject_fault(delete if is_instance else None):
+            return
+        if is_instance and delete():
+            self.send_response(204)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+
+class StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default listen backlog of 5 drops the connection bursts of the
+    # concurrency benchmarks
+    request_queue_size = 1024
+
+
+class StubServer:
+    """Runs a ``StubHandler`` server on a background thread.
+
+    ``handshake_delay`` is added once per connection and ``latency`` to
+    every request (seconds). ``fault_rates`` maps statuses to the fraction
+    of requests answered with them, e.g. ``{429: 0.05, 503: 0.01}``; the
+    draws are seeded so runs are repeatable. Bodies of 1 KiB or more are
+    compressed as the client accepts, unless ``compress`` is false.
+    """
+
+    def __init__(self, handshake_delay=0.0, dataset=None, handler=StubHandler,
+                 latency=0.0, fault_rates=None, seed=0, port=0, compress=True):
+        self.httpd = StubHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.handshake_delay = handshake_delay
+        self.httpd.latency = latency
+        self.httpd.compress = compress
+        self.httpd.fault_rates = dict(fault_rates or {})
+        self.httpd.random = random.Random(seed)
+        self.httpd.dataset = dataset if dataset is not None else make_dataset()
+        self.httpd.connections = 0
+        self.httpd.requests = 0
+        self.httpd.faults = deque()
+        self.httpd.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}/v2"
+
+    @property
+    def connections(self):
+        return self.httpd.connections
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    def inject(self, status, count=1, retry_after=None, applied=False):
+        """Answer the next ``count`` requests with ``status`` (e.g. a 429 burst).
+
+        With ``applied`` a DELETE still takes effect before the fault answers.
+        """
+        with self.httpd.lock:
+            self.httpd.faults.extend([(status, retry_after, applied)] * count)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def spawn(*options):
+    """Run this module as a server in a child process, e.g. to keep it from
+    competing with a benchmark for the GIL; ``options`` are command line
+    options. Returns the process and its base URL once it accepts
+    connections."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    process = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--port",
+                                str(port), *map(str, options)],
+                               stdout=subprocess.PIPE, text=True)
+    process.stdout.readline()  # "Serving ..."
+    return process, f"http://127.0.0.1:{port}/v2"
+
+
+def parse_fault(text):
+    status, rate = text.split("=")
+    return int(status), float(rate)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the stub API until interrupted.")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--instances", type=int, default=5000)
+    parser.add_argument("--plans", type=int, default=500)
+    parser.add_argument("--regions", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--handshake-ms", type=float, default=0.0)
+    parser.add_argument("--no-compress", dest="compress", action="store_false",
+                        help="never compress responses")
+    parser.add_argument("--fault", type=parse_fault, action="append", default=[],
+                        metavar="STATUS=RATE", help="e.g. --fault 429=0.05 --fault 503=0.01")
+    args = parser.parse_args()
+    dataset = make_dataset(instances=args.instances, plans=args.plans, regions=args.regions)
+    with StubServer(handshake_delay=args.handshake_ms / 1000, dataset=dataset,
+                    latency=args.latency_ms / 1000, fault_rates=dict(args.fault),
+                    port=args.port, compress=args.compress) as server:
+        print(f"Serving {server.base_url} (Ctrl+C to stop)", flush=True)
+        try:
+            server.thread.join()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
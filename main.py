@@ -6,6 +6,9 @@ This file serves as the entry point for Buildozer Android builds
 
 import os
 import sys
+import time
+
+STARTED = time.perf_counter()  # Before Kivy is imported, for the startup stats
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -13,4 +16,4 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from vultr_cli.ui.app import VultrCliApp
 
 if __name__ == "__main__":
-    VultrCliApp().run()
\ No newline at end of file
+    VultrCliApp(started=STARTED).run()
\ No newline at end of file
@@ -0,0 +1,7 @@
+"""``python -m vultr_cli``: the headless command line."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
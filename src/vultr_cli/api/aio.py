@@ -0,0 +1,525 @@
+"""asyncio variant of the Vultr API client.
+
+Built on aiohttp, which is optional (``pip install vultr-cli[async]``); the
+rest of the package works without it. ``AsyncVultrAPI`` mirrors the
+``VultrAPI`` surface with coroutines, and ``AsyncDelegate`` lets a
+synchronous ``VultrAPI`` run many calls on one event loop thread.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .client import VultrAPIError, _BaseClient
+from .models import Account, BillingEntry, Instance, PendingCharge, Plan, Region, Snapshot
+
+
+class _Response:
+    """The parts of a ``requests.Response`` the shared client code reads."""
+
+    __slots__ = ("status_code", "headers", "content", "reason", "elapsed", "request")
+
+    def __init__(self, status_code, headers, content, reason, elapsed, method):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.reason = reason
+        self.elapsed = elapsed
+        self.request = SimpleNamespace(method=method)
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", "replace")
+
+
+class AsyncSingleFlight:
+    """``SingleFlight`` for coroutines on one event loop.
+
+    The shared call runs as its own task, so a caller being cancelled does
+    not cancel it for the others.
+    """
+
+    def __init__(self):
+        self.stats = {"calls": 0, "shared": 0}
+        self._calls = {}
+
+    async def do(self, keys, fn):
+        for key in keys:
+            task = self._calls.get(key)
+            if task is not None:
+                self.stats["shared"] += 1
+                break
+        else:
+            key = keys[-1]
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            self.stats["calls"] += 1
+            task.add_done_callback(lambda done, key=key: self._finished(key, done))
+        return await asyncio.shield(task)
+
+    def _finished(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # Retrieved even if every caller was cancelled
+
+    def forget(self, prefix):
+        for key in [key for key in self._calls if key[0].startswith(prefix)]:
+            del self._calls[key]
+
+    def in_flight(self):
+        return len(self._calls)
+
+
+def _trace_config():
+    """Times connection setup into the ``trace_request_ctx`` dict of a request."""
+    async def on_start(session, context, params):
+        context.connect_started = time.perf_counter()
+
+    async def on_end(session, context, params):
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx["connect"] += (time.perf_counter()
+                                                     - context.connect_started)
+
+    config = aiohttp.TraceConfig()
+    config.on_connection_create_start.append(on_start)
+    config.on_connection_create_end.append(on_end)
+    return config
+
+
+class AsyncVultrAPI(_BaseClient):
+    """Vultr API client for asyncio.
+
+    Same methods, arguments, models, retries, rate limiting, catalog cache,
+    metrics and GET coalescing as ``VultrAPI``, but every call is a
+    coroutine (``iter_*`` are async generators) sharing one aiohttp
+    connection pool of ``pool_size`` connections. At most
+    ``max_concurrency`` requests are in flight at once, however many tasks
+    call the client; cancelling a task cancels its request. The session is
+    created on first use, inside the running loop; use ``async with`` or
+    ``await close()`` when done.
+    """
+
+    DEFAULT_POOL_SIZE = 100
+    DEFAULT_CONCURRENCY = 50
+    TRANSIENT_ERRORS = _BaseClient.TRANSIENT_ERRORS + (
+        (aiohttp.ClientError, asyncio.TimeoutError) if aiohttp is not None else ())
+
+    def __init__(self, api_key, base_url=None, pool_size=DEFAULT_POOL_SIZE,
+                 timeout=_BaseClient.DEFAULT_TIMEOUT, cache=None, rate_limiter=None,
+                 max_retries=_BaseClient.DEFAULT_MAX_RETRIES, metrics=None,
+                 max_concurrency=DEFAULT_CONCURRENCY):
+        if aiohttp is None:
+            raise ImportError("AsyncVultrAPI needs aiohttp: pip install vultr-cli[async]")
+        super().__init__(api_key, base_url, timeout, cache, rate_limiter, max_retries,
+                         metrics)
+        self.pool_size = pool_size
+        self.max_concurrency = max_concurrency
+        self.inflight = AsyncSingleFlight()
+        self.session = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the pooled session and release its connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _session(self):
+        if self.session is None:
+            connect, read = self.timeout
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(sock_connect=connect, sock_read=read),
+                trace_configs=[_trace_config()],
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.session
+
+    async def _request(self, method, path, retry=None, route=None, params=None,
+                       json=None, headers=None):
+        """Send a rate-limited request, retrying transient failures."""
+        if retry is None:
+            retry = method in self.IDEMPOTENT_METHODS
+        session = self._session()
+        url = f"{self.base_url}{path}"
+        labels = {"method": method, "route": route or path}
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire_async()
+            self._count("requests")
+            trace = {"connect": 0.0}
+            started = time.perf_counter()
+            try:
+                async with self._semaphore:
+                    async with session.request(method, url, params=params, json=json,
+                                               headers=headers,
+                                               trace_request_ctx=trace) as raw:
+                        headers_at = time.perf_counter() - started
+                        content = await raw.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                self._record(labels, None, started, trace["connect"])
+                if not retry or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                response = _Response(raw.status, raw.headers, content, raw.reason,
+                                     timedelta(seconds=headers_at), method)
+                self._record(labels, response, started, trace["connect"])
+                if response.status_code == 429:
+                    self._count("throttled")
+                if (response.status_code not in self.RETRY_STATUSES
+                        or not retry or attempt >= self.max_retries):
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+            attempt += 1
+            self._count("retries")
+            if self.metrics is not None:
+                self.metrics.inc("vultr_api_retries_total", labels)
+            await asyncio.sleep(delay)
+
+    async def _paginate(self, path, key, params=None, per_page=None, model=None,
+                        route=None):
+        """Yield items of a list endpoint, following ``meta.links.next``."""
+        params = dict(params or {})
+        params["per_page"] = per_page or self.DEFAULT_PER_PAGE
+        while True:
+            response = await self._request("GET", path, route=route, params=params)
+            if response.status_code != 200:
+                raise self._error(response, f"Failed to list {key}")
+            payload = self._decode(response, route or path)
+            items = payload.get(key, [])
+            if model is not None:
+                items = [model.from_dict(item) for item in items]
+            for item in items:
+                yield item
+            cursor = payload.get("meta", {}).get("links", {}).get("next")
+            if not cursor:
+                return
+            params["cursor"] = cursor
+
+    async def _list(self, path, key, params=None, model=None, route=None):
+        return [item async for item in self._paginate(path, key, params, model=model,
+                                                      route=route)]
+
+    async def _cached(self, endpoint, path, key, params=None, paged=True, refresh=False,
+                      model=None, route=None):
+        """GET a catalog resource through ``self.cache`` (see ``VultrAPI``)."""
+        if self.cache is None:
+            if paged:
+                return await self._list(path, key, params, model)
+            response = await self._request("GET", path, route=route, params=params)
+            if response.status_code != 200:
+                raise self._error(response, f"Failed to get {key}")
+            return self._parse(self._decode(response, route or path).get(key, []), model)
+
+        endpoint = self._cache_endpoint(endpoint)
+        params, cache_key = self._cache_key(path, params, paged)
+        entry = self.cache.get(endpoint, cache_key)
+        if entry is not None and not refresh and self.cache.is_fresh(endpoint, entry):
+            self.cache.record("hits")
+            return self._parse(entry["data"], model)
+
+        self.cache.record("misses")
+        try:
+            response = await self._request("GET", path, route=route, params=params,
+                                           headers=self._validators(entry))
+            if response.status_code == 304 and entry is not None:
+                self.cache.record("revalidated")
+                return self._parse(self.cache.touch(endpoint, cache_key, entry)["data"],
+                                   model)
+            if response.status_code != 200:
+                raise self._error(response, f"Failed to get {key}")
+            payload = self._decode(response, route or path)
+            data = self._parse(payload.get(key, []), model)
+            cursor = payload.get("meta", {}).get("links", {}).get("next") if paged else None
+            if cursor:
+                data = data + await self._list(path, key, dict(params, cursor=cursor),
+                                               model, route)
+        except self.TRANSIENT_ERRORS + (VultrAPIError,) as e:
+            # Only outages fall back to stale data; e.g. a revoked key must fail
+            if entry is None or not self.is_transient(e):
+                raise
+            self.cache.record("stale")
+            return self._parse(entry["data"], model)
+
+        self._cache_put(endpoint, cache_key, data, model, response)
+        return data
+
+    async def _shared(self, path, params, fn, refresh=False):
+        result = await self.inflight.do(self._flight_keys(path, params, refresh), fn)
+        return list(result) if isinstance(result, list) else result
+
+    async def call(self, method, path, params=None, json=None, retry=None, route=None):
+        """Send any API request and return its decoded JSON body (see
+        ``VultrAPI.call``)."""
+        params = self._query(params)
+        if method == "GET":
+            return await self._shared(path, params, lambda: self._call(
+                method, path, params, json, retry, route))
+        try:
+            return await self._call(method, path, params, json, retry, route)
+        finally:
+            self._mutated(path)
+
+    async def _call(self, method, path, params, json, retry, route):
+        response = await self._request(method, path, retry=retry, route=route,
+                                       params=params or None, json=json)
+        if not 200 <= response.status_code < 300:
+            raise self._error(response, f"{method} {path} failed")
+        if not response.content:
+            return None
+        if "json" not in response.headers.get("Content-Type", "json"):
+            return response.text
+        return self._decode(response, route or path)
+
+    def iter_plans(self, plan_type="vc2", per_page=None):
+        return self._paginate("/plans", "plans", {"type": plan_type}, per_page, Plan)
+
+    def iter_regions(self, per_page=None):
+        return self._paginate("/regions", "regions", per_page=per_page, model=Region)
+
+    def iter_snapshots(self, per_page=None):
+        return self._paginate("/snapshots", "snapshots", per_page=per_page,
+                              model=Snapshot)
+
+    def iter_billing_history(self, per_page=None):
+        return self._paginate("/billing/history", "billing_history", per_page=per_page,
+                              model=BillingEntry)
+
+    def iter_instances(self, per_page=None, tag=None):
+        params = {"show_pending_charges": "true"}
+        if tag:
+            params["tag"] = tag
+        return self._paginate("/instances", "instances", params, per_page, Instance)
+
+    async def get_plans(self, plan_type="vc2", refresh=False):
+        params = {"type": plan_type}
+        return await self._shared("/plans", params, lambda: self._cached(
+            "plans", "/plans", "plans", params, refresh=refresh, model=Plan), refresh)
+
+    async def get_regions(self, refresh=False):
+        return await self._shared("/regions", None, lambda: self._cached(
+            "regions", "/regions", "regions", refresh=refresh, model=Region), refresh)
+
+    async def get_available_plans_in_region(self, region_id, refresh=False):
+        path = f"/regions/{region_id}/availability"
+        return await self._shared(path, None, lambda: self._cached(
+            "availability", path, "available_plans", paged=False, refresh=refresh,
+            route="/regions/{region-id}/availability"), refresh)
+
+    async def get_account(self):
+        """Account details including ``balance`` and ``pending_charges``."""
+        return await self._shared("/account", None, self._get_account)
+
+    async def _get_account(self):
+        response = await self._request("GET", "/account")
+        if response.status_code != 200:
+            raise self._error(response, "Failed to get account")
+        return Account.from_dict(self._decode(response, "/account").get("account", {}))
+
+    async def get_billing_history(self):
+        return await self._shared("/billing/history", None, lambda: self._list(
+            "/billing/history", "billing_history", model=BillingEntry))
+
+    async def get_pending_charges(self):
+        return await self._shared("/billing/pending-charges", None,
+                                  self._get_pending_charges)
+
+    async def _get_pending_charges(self):
+        response = await self._request("GET", "/billing/pending-charges")
+        if response.status_code != 200:
+            raise self._error(response, "Failed to get pending charges")
+        payload = self._decode(response, "/billing/pending-charges")
+        return [PendingCharge.from_dict(item) for item in payload.get("pending_charges", [])]
+
+    async def get_snapshots(self, refresh=False):
+        return await self._shared("/snapshots", None, lambda: self._cached(
+            "snapshots", "/snapshots", "snapshots", refresh=refresh, model=Snapshot),
+            refresh)
+
+    async def get_snapshot(self, snapshot_id):
+        return await self._shared(f"/snapshots/{snapshot_id}", None,
+                                  lambda: self._get_snapshot(snapshot_id))
+
+    async def _get_snapshot(self, snapshot_id):
+        response = await self._request("GET", f"/snapshots/{snapshot_id}",
+                                       route="/snapshots/{snapshot-id}")
+        if response.status_code != 200:
+            raise self._error(response, f"Failed to get snapshot {snapshot_id}")
+        return Snapshot.from_dict(
+            self._decode(response, "/snapshots/{snapshot-id}").get("snapshot", {}))
+
+    async def create_instance(self, plan_id, region_id, snapshot_id, label=None,
+                              tags=None, retry=False):
+        data = {
+            "plan": plan_id,
+            "region": region_id,
+            "snapshot_id": snapshot_id,
+            "enable_ipv6": True,
+            "backups": "disabled"
+        }
+        if label:
+            data["label"] = label
+        if tags:
+            data["tags"] = list(tags)
+        try:
+            response = await self._request("POST", "/instances", retry=retry, json=data)
+        finally:
+            self._mutated("/instances")
+        if response.status_code in [200, 201, 202]:
+            payload = self._decode(response, "/instances")
+            return Instance.from_dict(payload.get("instance", {}))
+        raise self._error(response, "Failed to create instance")
+
+    async def get_instances(self):
+        return await self._shared("/instances", None, lambda: self._list(
+            "/instances", "instances", {"show_pending_charges": "true"}, Instance))
+
+    async def get_instance(self, instance_id):
+        return await self._shared(f"/instances/{instance_id}", None,
+                                  lambda: self._get_instance(instance_id))
+
+    async def _get_instance(self, instance_id):
+        response = await self._request("GET", f"/instances/{instance_id}",
+                                       route="/instances/{instance-id}")
+        if response.status_code != 200:
+            raise self._error(response, f"Failed to get instance {instance_id}")
+        return Instance.from_dict(
+            self._decode(response, "/instances/{instance-id}").get("instance", {}))
+
+    async def get_instance_bandwidth(self, instance_id):
+        return await self._shared(f"/instances/{instance_id}/bandwidth", None,
+                                  lambda: self._get_instance_bandwidth(instance_id))
+
+    async def _get_instance_bandwidth(self, instance_id):
+        response = await self._request("GET", f"/instances/{instance_id}/bandwidth",
+                                       route="/instances/{instance-id}/bandwidth")
+        if response.status_code != 200:
+            raise self._error(response, f"Failed to get bandwidth of instance {instance_id}")
+        return self._decode(response, "/instances/{instance-id}/bandwidth").get("bandwidth", {})
+
+    async def delete_instance(self, instance_id):
+        try:
+            response = await self._request("DELETE", f"/instances/{instance_id}",
+                                           route="/instances/{instance-id}")
+        finally:
+            self._mutated("/instances")
+        # 404: already gone, e.g. a retry after a response lost past the deletion
+        return response.status_code in (204, 404)
+
+    async def _instances_action(self, action, instance_ids, retry):
+        try:
+            response = await self._request("POST", f"/instances/{action}", retry=retry,
+                                           json={"instance_ids": list(instance_ids)})
+        finally:
+            self._mutated("/instances")
+        if response.status_code != 204:
+            raise self._error(response, f"Failed to {action} instances")
+
+    async def reboot_instances(self, instance_ids):
+        """Reboot several instances with one batch request."""
+        await self._instances_action("reboot", instance_ids, retry=False)
+
+    async def halt_instances(self, instance_ids):
+        """Halt several instances with one batch request."""
+        await self._instances_action("halt", instance_ids, retry=True)
+
+    async def start_instances(self, instance_ids):
+        """Start several instances with one batch request."""
+        await self._instances_action("start", instance_ids, retry=True)
+
+
+class AsyncDelegate:
+    """Runs ``AsyncVultrAPI`` calls for a synchronous ``VultrAPI``.
+
+    Owns an event loop on a daemon thread and an async client with the same
+    key, base URL, rate limiter, cache and metrics as ``api``; requests are
+    counted in ``api.stats``.
+    """
+
+    def __init__(self, api):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="vultr-asyncio",
+                                       daemon=True)
+        self.thread.start()
+        self.client = AsyncVultrAPI(api.api_key, base_url=api.base_url, timeout=api.timeout,
+                                    cache=api.cache, rate_limiter=api.rate_limiter,
+                                    max_retries=api.max_retries, metrics=api.metrics)
+        self.client.stats = api.stats
+        self.client._stats_lock = api._stats_lock
+        self.closed = False
+        self._futures = set()  # Outstanding map() calls
+        self._lock = threading.Lock()
+
+    def map(self, method, arguments, max_concurrency):
+        """Await ``method`` once per argument tuple, at most
+        ``max_concurrency`` at a time; results (or exceptions) in order.
+
+        Interrupting the calling thread cancels the outstanding calls.
+        Raises ``RuntimeError`` once the delegate is closed, also in the
+        callers still waiting when ``close`` is called.
+        """
+        async def gather():
+            limit = asyncio.Semaphore(max_concurrency)
+            fn = getattr(self.client, method)
+
+            async def run(args):
+                async with limit:
+                    return await fn(*args)
+
+            return await asyncio.gather(*(run(args) for args in arguments),
+                                        return_exceptions=True)
+
+        with self._lock:
+            if self.closed:
+                raise RuntimeError("The client is closed")
+            future = asyncio.run_coroutine_threadsafe(gather(), self.loop)
+            self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        try:
+            return future.result()
+        except concurrent.futures.CancelledError:
+            raise RuntimeError("The client was closed during the calls") from None
+        except BaseException:
+            future.cancel()
+            raise
+
+    def close(self):
+        """Cancel the outstanding calls, then stop the event loop."""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+
+        async def shutdown():
+            # The loop only runs this delegate's calls
+            tasks = asyncio.all_tasks() - {asyncio.current_task()}
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.client.close()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result(timeout=5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+        self.loop.close()
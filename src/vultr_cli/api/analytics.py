@@ -0,0 +1,376 @@
+"""Cost and usage analytics of an account, kept in local column tables."""
+
+import calendar
+import datetime
+import heapq
+import json
+import threading
+import time
+from array import array
+from functools import partial
+from itertools import compress
+
+from .bulk import fan_out
+
+TEXT = "text"  # Column type of dictionary-encoded strings
+
+
+class SyncCancelled(Exception):
+    """Raised by a ``CostAnalytics.sync`` stopped by ``cancel``."""
+
+
+def _today():
+    # Billing periods and bandwidth days are UTC
+    return datetime.datetime.now(datetime.timezone.utc).date()
+
+
+def _day(timestamp):
+    """Day number (``date.toordinal``) of an API date or timestamp."""
+    return datetime.date.fromisoformat((timestamp or "0001-01-01")[:10]).toordinal()
+
+
+class Table:
+    """Equal-length columns: numbers in typed ``array``s, strings as codes
+    into a per-column list of their distinct values.
+
+    Each column is one flat machine-typed buffer, so an aggregate walks one
+    or two columns without building an object per row, and a table is stored
+    as one blob per column (``dump``/``load``) instead of a row per record.
+    """
+
+    def __init__(self, schema):
+        self.schema = dict(schema)  # Column name -> array typecode, or TEXT
+        self.clear()
+
+    def clear(self):
+        self.columns = {name: array("I" if kind == TEXT else kind)
+                        for name, kind in self.schema.items()}
+        self.values = {name: [] for name, kind in self.schema.items() if kind == TEXT}
+        self._codes = {name: {} for name in self.values}
+
+    def __len__(self):
+        return len(next(iter(self.columns.values())))
+
+    def code(self, name, value):
+        """Code of ``value`` in the TEXT column ``name``, assigned if new."""
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.values[name])
+            self.values[name].append(value)
+        return code
+
+    def decode(self, name):
+        """The values of the TEXT column ``name``, row by row."""
+        values = self.values[name]
+        return [values[code] for code in self.columns[name]]
+
+    def extend(self, rows):
+        """Append ``rows``, tuples in schema order."""
+        for (name, kind), column in zip(self.schema.items(), zip(*rows)):
+            if kind == TEXT:
+                codes = self._codes[name]
+                column = [codes[value] if value in codes else self.code(name, value)
+                          for value in column]
+            self.columns[name].extend(column)
+
+    def keep(self, mask):
+        """Keep only the rows whose entry in ``mask`` is true."""
+        for name, column in self.columns.items():
+            self.columns[name] = array(column.typecode, compress(column, mask))
+
+    def group_sum(self, key, value, mask=None):
+        """``{key: (sum of value, rows)}`` over the rows selected by ``mask``."""
+        keys = self.columns[key]
+        amounts = self.columns[value]
+        if mask is not None:
+            keys = compress(keys, mask)
+            amounts = compress(amounts, mask)
+        totals = [0] * len(self.values[key])
+        counts = [0] * len(totals)
+        for code, amount in zip(keys, amounts):
+            totals[code] += amount
+            counts[code] += 1
+        return {value: (totals[code], counts[code])
+                for code, value in enumerate(self.values[key]) if counts[code]}
+
+    def dump(self):
+        """Column name -> ``(type, bytes)``, as ``LocalStore.save_columns`` takes."""
+        columns = {name: (column.typecode, column.tobytes())
+                   for name, column in self.columns.items()}
+        for name, values in self.values.items():
+            columns[f"{name}.values"] = (TEXT, json.dumps(values).encode())
+        return columns
+
+    def load(self, columns):
+        """Restore a ``dump``; the table stays empty if a column is missing,
+        e.g. before the first sync or after a schema change."""
+        self.clear()
+        names = list(self.schema) + [f"{name}.values" for name in self.values]
+        if any(name not in columns for name in names):
+            return
+        for name in self.schema:
+            typecode, data = columns[name]
+            column = array(typecode)
+            column.frombytes(data)
+            self.columns[name] = column
+        for name in self.values:
+            values = self.values[name] = json.loads(columns[f"{name}.values"][1])
+            self._codes[name] = {value: code for code, value in enumerate(values)}
+
+
+class CostAnalytics:
+    """Costs and traffic of one account, aggregated from local ``Table``s.
+
+    ``sync`` fetches billing history, pending charges and the instances with
+    their daily bandwidth concurrently, and only what is new: the history up
+    to the first entry already stored, and the bandwidth of instances not
+    fetched yet today or within ``BANDWIDTH_TTL`` (``refresh`` fetches all of
+    it), since the current day's counters keep growing. Each table is saved
+    in the ``LocalStore`` as soon as its source has arrived, so ``summary``
+    works from local data alone and is ready at once, also offline.
+    Syncs run one at a time, a second one waits for the first, and
+    ``cancel`` stops the running and waiting ones at their next step. All
+    methods may be called from any thread.
+    """
+
+    MAX_CONCURRENCY = 20  # Bandwidth requests in flight
+    BANDWIDTH_BATCH = 100  # Bandwidth requests between checks for cancel()
+    BANDWIDTH_TTL = 15 * 60  # Seconds before an instance's bandwidth is fetched again
+    BANDWIDTH_DAYS = 92  # Days of bandwidth kept
+    TABLES = {
+        "history": {"id": "q", "day": "i", "type": TEXT, "amount": "d"},
+        "pending": {"product": TEXT, "total": "d"},
+        "instances": {"id": TEXT, "label": TEXT, "region": TEXT, "plan": TEXT,
+                      "charges": "d"},
+        "bandwidth": {"instance": TEXT, "day": "i", "incoming": "q", "outgoing": "q"},
+        "fetched": {"instance": TEXT, "at": "d"},  # When bandwidth was last fetched
+    }
+
+    def __init__(self, api, store):
+        self.api = api
+        self.store = store
+        self.tables = {name: Table(schema) for name, schema in self.TABLES.items()}
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()  # Held by the running sync
+        self._generation = 0  # Incremented by cancel()
+        for name, table in self.tables.items():
+            table.load(store.load_columns(f"analytics.{name}"))
+
+    def synced_at(self):
+        """When the tables were last all saved, or None."""
+        times = [self.store.synced_at(f"analytics.{name}") for name in self.tables]
+        return None if None in times else min(times)
+
+    def _update(self, name, change):
+        """Apply ``change(table)`` and save the table."""
+        with self._lock:
+            table = self.tables[name]
+            change(table)
+            columns = table.dump()
+        self.store.save_columns(f"analytics.{name}", columns)
+
+    def _replace(self, name, rows):
+        def replace(table):
+            table.clear()
+            table.extend(rows)
+
+        self._update(name, replace)
+
+    def cancel(self):
+        """Stop the syncs running now, between requests, pages and batches
+        of bandwidth requests; what they already saved is kept."""
+        with self._lock:
+            self._generation += 1
+
+    def sync(self, refresh=False):
+        """Fetch what is new from the API and save it.
+
+        Returns ``(counts, errors)``: rows fetched per table, and the
+        exceptions of the sources that failed (their tables keep the last
+        stored data). Raises ``SyncCancelled`` if ``cancel`` was called.
+        """
+        generation = self._generation
+
+        def check():
+            if self._generation != generation:
+                raise SyncCancelled("Sync cancelled")
+
+        sources = [self._sync_history, self._sync_pending,
+                   partial(self._sync_usage, refresh=refresh)]
+        counts = {}
+        errors = []
+        with self._sync_lock:
+            check()
+            for result in fan_out(lambda source: source(check), sources, len(sources)):
+                if result.ok:
+                    counts.update(result.result)
+                else:
+                    errors.append(result.error)
+            check()
+        return counts, errors
+
+    def _sync_history(self, check):
+        with self._lock:
+            known = set(self.tables["history"].columns["id"])
+        rows = []
+        # Newest first, so the first page usually holds everything new
+        for entry in self.api.iter_billing_history():
+            check()
+            if entry.id in known:
+                break
+            rows.append((entry.id, _day(entry.date), entry.type or "",
+                         float(entry.amount or 0)))
+        added = []
+
+        def add(table):
+            # Only the ids not stored meanwhile, e.g. by a cancelled sync
+            known = set(table.columns["id"])
+            new = [row for row in rows if row[0] not in known]
+            table.extend(new)
+            added.extend(new)
+
+        if rows:
+            self._update("history", add)
+        return {"history": len(added)}
+
+    def _sync_pending(self, check):
+        check()
+        charges = self.api.get_pending_charges()
+        self._replace("pending", [(charge.product or "", float(charge.total or 0))
+                                  for charge in charges])
+        return {"pending": len(charges)}
+
+    def _sync_usage(self, check, refresh):
+        check()
+        instances = self.api.get_instances()
+        self._replace("instances", [
+            (instance.id, instance.label or instance.id, instance.region or "",
+             instance.plan or "", float(instance.pending_charges or 0))
+            for instance in instances
+        ])
+
+        now = time.time()
+        today = _today()
+        midnight = datetime.datetime.combine(today, datetime.time(),
+                                             datetime.timezone.utc).timestamp()
+        # Fetched today and recently enough: the day so far is up to date
+        fresh_since = max(midnight, now - self.BANDWIDTH_TTL)
+        with self._lock:
+            fetched_table = self.tables["fetched"]
+            fetched_at = dict(zip(fetched_table.decode("instance"),
+                                  fetched_table.columns["at"]))
+        instance_ids = [instance.id for instance in instances
+                        if refresh or fetched_at.get(instance.id, 0) < fresh_since]
+        results = []
+        cancelled = None
+        for start in range(0, len(instance_ids), self.BANDWIDTH_BATCH):
+            try:
+                check()
+            except SyncCancelled as e:
+                cancelled = e  # Still save the batches fetched so far
+                break
+            batch = instance_ids[start:start + self.BANDWIDTH_BATCH]
+            results += self.api.concurrently("get_instance_bandwidth",
+                                             [(instance_id,) for instance_id in batch],
+                                             self.MAX_CONCURRENCY)
+        fetched = {}  # Instance id -> [(day, incoming, outgoing)]
+        errors = []
+        for instance_id, result in zip(instance_ids, results):
+            if isinstance(result, Exception):
+                errors.append(result)
+                continue
+            fetched[instance_id] = [
+                (_day(day), usage.get("incoming_bytes") or 0, usage.get("outgoing_bytes") or 0)
+                for day, usage in result.items()
+            ]
+
+        def merge(table):
+            # The response covers the whole month so far: drop the stored days
+            # it repeats (the last of which was partial) and expired ones
+            first = {table.code("instance", instance_id): min(rows)[0]
+                     for instance_id, rows in fetched.items() if rows}
+            cutoff = today.toordinal() - self.BANDWIDTH_DAYS
+            end = today.toordinal() + 1
+            table.keep([cutoff < day < first.get(code, end) for code, day in
+                        zip(table.columns["instance"], table.columns["day"])])
+            table.extend((instance_id, day, incoming, outgoing)
+                         for instance_id, rows in fetched.items()
+                         for day, incoming, outgoing in rows)
+
+        if errors and not fetched:
+            raise errors[0]
+        if fetched:
+            self._update("bandwidth", merge)
+            current = {instance.id for instance in instances}
+            fetched_at.update(dict.fromkeys(fetched, now))
+            self._replace("fetched", [(instance_id, at)
+                                      for instance_id, at in fetched_at.items()
+                                      if instance_id in current])
+        if cancelled is not None:
+            raise cancelled
+        return {"instances": len(instances),
+                "bandwidth": sum(len(rows) for rows in fetched.values())}
+
+    def cost_by(self, field):
+        """``[(region or plan, pending charges, instances)]``, costliest first."""
+        with self._lock:
+            totals = self.tables["instances"].group_sum(field, "charges")
+        return sorted(((key, total, count) for key, (total, count) in totals.items()),
+                      key=lambda row: -row[1])
+
+    def cost_by_product(self):
+        """``[(product, pending charges)]`` of the current period, costliest first."""
+        with self._lock:
+            totals = self.tables["pending"].group_sum("product", "total")
+        return sorted(((key, total) for key, (total, count) in totals.items()),
+                      key=lambda row: -row[1])
+
+    def burn_rate(self, today=None, invoices=3):
+        """Charges of the month so far, per day and projected to month end,
+        next to the last and average of the last ``invoices`` invoices."""
+        today = today or _today()
+        with self._lock:
+            month_to_date = (sum(self.tables["pending"].columns["total"])
+                             or sum(self.tables["instances"].columns["charges"]))
+            history = self.tables["history"]
+            is_invoice = [kind == "invoice" for kind in history.decode("type")]
+            recent = heapq.nlargest(invoices, zip(compress(history.columns["day"], is_invoice),
+                                                  compress(history.columns["amount"],
+                                                           is_invoice)))
+        per_day = month_to_date / today.day
+        return {
+            "month_to_date": month_to_date,
+            "per_day": per_day,
+            "projected": per_day * calendar.monthrange(today.year, today.month)[1],
+            "last_invoice": recent[0][1] if recent else None,
+            "average_invoice": sum(amount for day, amount in recent) / len(recent)
+            if recent else None,
+        }
+
+    def top_bandwidth(self, n=10, days=30, today=None):
+        """``[(instance id, label, incoming, outgoing bytes)]`` of the ``n``
+        instances with the most traffic in the last ``days`` days."""
+        cutoff = (today or _today()).toordinal() - days
+        with self._lock:
+            bandwidth = self.tables["bandwidth"]
+            recent = [day > cutoff for day in bandwidth.columns["day"]]
+            incoming = bandwidth.group_sum("instance", "incoming", recent)
+            outgoing = bandwidth.group_sum("instance", "outgoing", recent)
+            instances = self.tables["instances"]
+            labels = dict(zip(instances.decode("id"), instances.decode("label")))
+        top = heapq.nlargest(n, incoming, key=lambda instance_id: (
+            incoming[instance_id][0] + outgoing[instance_id][0]))
+        return [(instance_id, labels.get(instance_id, instance_id), incoming[instance_id][0],
+                 outgoing[instance_id][0]) for instance_id in top]
+
+    def summary(self, top=10):
+        """Everything the cost page shows, from the local tables only."""
+        return {
+            "instances": len(self.tables["instances"]),
+            "burn_rate": self.burn_rate(),
+            "by_region": self.cost_by("region")[:top],
+            "by_plan": self.cost_by("plan")[:top],
+            "by_product": self.cost_by_product()[:top],
+            "top_bandwidth": self.top_bandwidth(top),
+        }
@@ -0,0 +1,58 @@
+"""Region to plan availability index."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AvailabilityIndex:
+    """In-memory index of which plans are available in which regions.
+
+    Answers both "which plans can I deploy in region R" and "which regions
+    offer plan P" with a local lookup once the regions have been fetched.
+    """
+
+    def __init__(self):
+        self._by_region = {}
+        self._by_plan = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, region_id):
+        return region_id in self._by_region
+
+    def __len__(self):
+        return len(self._by_region)
+
+    def update(self, region_id, plan_ids):
+        """Record the plans currently available in ``region_id``."""
+        plans = frozenset(plan_ids)
+        with self._lock:
+            for plan_id in self._by_region.get(region_id, ()):
+                self._by_plan[plan_id].discard(region_id)
+            self._by_region[region_id] = plans
+            for plan_id in plans:
+                self._by_plan.setdefault(plan_id, set()).add(region_id)
+
+    def plans_in(self, region_id):
+        """Plan ids available in ``region_id``, or None if not indexed yet."""
+        return self._by_region.get(region_id)
+
+    def regions_offering(self, plan_id):
+        """Sorted ids of the indexed regions where ``plan_id`` is available."""
+        with self._lock:
+            return sorted(self._by_plan.get(plan_id, ()))
+
+    def prefetch(self, api, region_ids, max_workers=4):
+        """Fetch availability for every region in ``region_ids`` concurrently.
+
+        The client's shared rate limiter keeps the burst under the API limit.
+        Regions that fail are skipped; returns how many were indexed.
+        """
+        def fetch(region_id):
+            try:
+                self.update(region_id, api.get_available_plans_in_region(region_id))
+                return True
+            except Exception:
+                return False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return sum(executor.map(fetch, region_ids))
@@ -0,0 +1,92 @@
+"""Bulk instance operations on top of VultrAPI."""
+
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .client import VultrAPIError
+
+BulkResult = namedtuple("BulkResult", ["item", "ok", "result", "error"])
+BulkResult.__doc__ = """Outcome of one item of a bulk operation."""
+
+
+def fan_out(fn, items, max_workers):
+    """Run ``fn`` on every item on up to ``max_workers`` threads and yield a
+    ``BulkResult`` per item in completion order."""
+    items = list(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {executor.submit(fn, item): item for item in items}
+    try:
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = futures[future]
+                error = future.exception()
+                if error is None:
+                    yield BulkResult(item, True, future.result(), None)
+                else:
+                    yield BulkResult(item, False, None, error)
+    finally:
+        # Stop queued work if the caller abandons the generator early
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+class BulkOperations:
+    """Fan out instance operations over a bounded worker pool.
+
+    Creates and destroys are issued one request per item on up to
+    ``max_workers`` threads; the client's shared rate limiter keeps the
+    total under the API limit. Reboot, halt and start use the native batch
+    endpoints, split into chunks of ``batch_size`` ids. Every method yields a
+    ``BulkResult`` per item as soon as it is known, so callers can report
+    progress while the rest is still running.
+    """
+
+    DEFAULT_MAX_WORKERS = 8
+    DEFAULT_BATCH_SIZE = 100
+
+    def __init__(self, api, max_workers=DEFAULT_MAX_WORKERS,
+                 batch_size=DEFAULT_BATCH_SIZE):
+        self.api = api
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+
+    def _fan_out(self, fn, items):
+        return fan_out(fn, items, self.max_workers)
+
+    def create_many(self, specs, retry=False):
+        """Create one instance per spec dict (``plan_id``, ``region_id``,
+        ``snapshot_id`` and optional ``label``)."""
+        return self._fan_out(lambda spec: self.api.create_instance(retry=retry, **spec),
+                             specs)
+
+    def destroy_many(self, instance_ids):
+        """Destroy every instance in ``instance_ids``."""
+        def destroy(instance_id):
+            if not self.api.delete_instance(instance_id):
+                raise VultrAPIError(f"Failed to destroy instance {instance_id}")
+            return instance_id
+
+        return self._fan_out(destroy, instance_ids)
+
+    def _batch(self, method, instance_ids):
+        instance_ids = list(instance_ids)
+        chunks = [instance_ids[i:i + self.batch_size]
+                  for i in range(0, len(instance_ids), self.batch_size)]
+        for result in self._fan_out(method, chunks):
+            for instance_id in result.item:
+                yield BulkResult(instance_id, result.ok, None, result.error)
+
+    def reboot(self, instance_ids):
+        """Reboot instances through the ``/instances/reboot`` batch endpoint."""
+        return self._batch(self.api.reboot_instances, instance_ids)
+
+    def halt(self, instance_ids):
+        """Halt instances through the ``/instances/halt`` batch endpoint."""
+        return self._batch(self.api.halt_instances, instance_ids)
+
+    def start(self, instance_ids):
+        """Start instances through the ``/instances/start`` batch endpoint."""
+        return self._batch(self.api.start_instances, instance_ids)
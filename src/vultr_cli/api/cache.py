@@ -0,0 +1,114 @@
+"""Persistent on-disk cache for Vultr catalog responses."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class CatalogCache:
+    """On-disk cache for catalog endpoints (regions, plans, availability,
+    snapshots).
+
+    Entries are JSON files holding the decoded data together with the
+    ``ETag``/``Last-Modified`` validators of the response, so stale entries
+    can be revalidated with a conditional request and still served when the
+    device is offline. Each endpoint has its own time-to-live in seconds.
+    An endpoint may be scoped as ``endpoint.scope`` (e.g. snapshots per
+    account); it has the time-to-live of ``endpoint``, and invalidating it
+    leaves the other scopes alone.
+    """
+
+    DEFAULT_TTLS = {
+        "regions": 24 * 3600,
+        "plans": 24 * 3600,
+        "availability": 30 * 60,
+        "snapshots": 10 * 60,  # Pending ones are polled one by one meanwhile
+    }
+
+    def __init__(self, directory, ttls=None):
+        self.directory = directory
+        self.ttls = dict(self.DEFAULT_TTLS, **(ttls or {}))
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stale": 0}
+        self._memory = {}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, endpoint, key):
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(self.directory, f"{endpoint}-{digest}.json")
+
+    def get(self, endpoint, key):
+        """Return the stored entry for ``key`` (fresh or not), or None."""
+        path = self._path(endpoint, key)
+        with self._lock:
+            entry = self._memory.get(path)
+        if entry is not None:
+            return entry
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            self._memory[path] = entry
+        return entry
+
+    def is_fresh(self, endpoint, entry):
+        ttl = self.ttls.get(endpoint.split(".")[0], 0)
+        return time.time() - entry.get("stored_at", 0) < ttl
+
+    def put(self, endpoint, key, data, etag=None, last_modified=None):
+        entry = {
+            "stored_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "data": data,
+        }
+        self._write(endpoint, key, entry)
+        return entry
+
+    def touch(self, endpoint, key, entry):
+        """Mark ``entry`` fresh again after a successful revalidation."""
+        entry = dict(entry, stored_at=time.time())
+        self._write(endpoint, key, entry)
+        return entry
+
+    def _write(self, endpoint, key, entry):
+        path = self._path(endpoint, key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with self._lock:
+            self._memory[path] = entry
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            # The in-memory copy still serves this session.
+            pass
+
+    def invalidate(self, endpoint=None):
+        """Drop cached entries for ``endpoint`` (with all its scopes unless
+        one is given), or everything when None."""
+        prefix = ("" if not endpoint else (f"{endpoint}-",) if "." in endpoint
+                  else (f"{endpoint}-", f"{endpoint}."))
+        with self._lock:
+            for path in list(self._memory):
+                if os.path.basename(path).startswith(prefix):
+                    del self._memory[path]
+            for name in os.listdir(self.directory):
+                if name.startswith(prefix) and name.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
+
+    def record(self, event):
+        with self._lock:
+            self.stats[event] += 1
+
+    @property
+    def hit_rate(self):
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
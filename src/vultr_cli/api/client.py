@@ -1,51 +1,605 @@
 """Vultr API client."""
 
+import hashlib
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urlencode
+
 import requests
 
+from . import tracing
+from .jsonlib import loads
+from .jsonstream import ArrayStream
+from .metrics import MetricsRegistry
+from .models import (Account, BillingEntry, Instance, PendingCharge, Plan, Region, Snapshot,
+                     intern_ids)
+from .ratelimit import TokenBucket
+from .singleflight import SingleFlight
+
+
+class VultrAPIError(Exception):
+    """Error response from the Vultr API."""
 
-class VultrAPI:
-    """Vultr API client."""
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class _BaseClient:
+    """Transport-independent parts shared by ``VultrAPI`` and ``AsyncVultrAPI``:
+    settings, retry policy, metrics, error mapping and catalog cache helpers."""
 
     BASE_URL = "https://api.vultr.com/v2"
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_TIMEOUT = (5, 30)  # (connect, read) seconds
+    DEFAULT_PER_PAGE = 100  # API default; the maximum is 500
+    DEFAULT_MAX_RETRIES = 4
+    BACKOFF_BASE = 0.5
+    BACKOFF_CAP = 8.0
+    IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+    RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+    # Exceptions raised when the API could not be reached at all
+    TRANSIENT_ERRORS = (requests.RequestException,)
+    # Cached endpoints whose data belongs to the account rather than the URL
+    ACCOUNT_ENDPOINTS = frozenset(["snapshots"])
 
-    def __init__(self, api_key):
+    def __init__(self, api_key, base_url=None, timeout=DEFAULT_TIMEOUT, cache=None,
+                 rate_limiter=None, max_retries=DEFAULT_MAX_RETRIES, metrics=None):
         self.api_key = api_key
+        # Identifies the account in shared caches without storing the key
+        self.account_hash = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        self.cache = cache
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.describe("vultr_api_requests_total", "API request attempts by status.")
+            metrics.describe("vultr_api_retries_total", "API requests retried.")
+            metrics.describe("vultr_api_request_seconds", "API request time by phase.")
+            metrics.describe("vultr_api_response_bytes", "API response body size.")
+            metrics.describe("vultr_api_transfer_bytes",
+                             "API response body size as transferred (compressed).")
+        self.rate_limiter = rate_limiter or TokenBucket.shared(api_key)
+        self.max_retries = max_retries
+        self.stats = {"requests": 0, "retries": 0, "throttled": 0}
+        self._stats_lock = threading.Lock()
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.timeout = timeout
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
 
-    def get_plans(self, plan_type="vc2"):
-        url = f"{self.BASE_URL}/plans"
+    def _record(self, labels, response, started, connect, size=None, transferred=None):
+        """Record one attempt in ``self.metrics``; ``response`` is None on
+        connection errors and timeouts, ``connect`` the seconds spent
+        opening connections. ``size`` is the decoded body size (default:
+        ``len(response.content)``), ``transferred`` the body size on the
+        wire if the transport knows it."""
+        if self.metrics is None:
+            return
+        total = time.perf_counter() - started
+        status = "error" if response is None else str(response.status_code)
+        self.metrics.inc("vultr_api_requests_total", dict(labels, status=status))
+        phases = {"total": total, "connect": connect}
+        if response is not None:
+            # elapsed runs until the headers were parsed, the rest is the body
+            headers_at = response.elapsed.total_seconds()
+            phases["ttfb"] = max(headers_at - phases["connect"], 0.0)
+            phases["download"] = max(total - headers_at, 0.0)
+            if size is None:
+                size = len(response.content)
+            self.metrics.observe("vultr_api_response_bytes", size, labels,
+                                 buckets=MetricsRegistry.SIZE_BUCKETS)
+            if transferred is not None:
+                self.metrics.observe("vultr_api_transfer_bytes", transferred, labels,
+                                     buckets=MetricsRegistry.SIZE_BUCKETS)
+        for phase, seconds in phases.items():
+            self.metrics.observe("vultr_api_request_seconds", seconds,
+                                 dict(labels, phase=phase))
+
+    def _decode(self, response, route):
+        """Decode a JSON response, timing it as the ``decode`` phase."""
+        started = time.perf_counter()
+        payload = loads(response.content)
+        if self.metrics is not None:
+            labels = {"method": response.request.method, "route": route, "phase": "decode"}
+            self.metrics.observe("vultr_api_request_seconds",
+                                 time.perf_counter() - started, labels)
+        return payload
+
+    def _count(self, name):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def _backoff(self, attempt):
+        return random.uniform(0, min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** attempt))
+
+    def _retry_after(self, response):
+        try:
+            return min(float(response.headers["Retry-After"]), self.BACKOFF_CAP)
+        except (KeyError, ValueError):
+            return None
+
+    @classmethod
+    def is_transient(cls, error):
+        """Whether ``error`` means the API could not be reached (connection
+        errors, timeouts, 429 or 5xx) rather than that it refused the request."""
+        if not isinstance(error, cls.TRANSIENT_ERRORS + (VultrAPIError,)):
+            return False
+        return getattr(error, "status_code", None) in (None, *cls.RETRY_STATUSES)
+
+    @staticmethod
+    def _error(response, action):
+        try:
+            message = loads(response.content).get("error") or "Unknown error"
+        except (ValueError, AttributeError):
+            message = response.reason or "Unknown error"
+        return VultrAPIError(f"{action}: {message} (HTTP {response.status_code})",
+                             response.status_code)
+
+    def _cache_endpoint(self, endpoint):
+        """Cache endpoint name of ``endpoint``, per account for
+        ``ACCOUNT_ENDPOINTS`` so that clients of different accounts sharing
+        one ``CatalogCache`` never see each other's entries."""
+        if endpoint in self.ACCOUNT_ENDPOINTS:
+            return f"{endpoint}.{self.account_hash}"
+        return endpoint
+
+    def _cache_key(self, path, params, paged):
+        """Request parameters and cache key of a cached GET."""
+        params = dict(params or {})
+        if paged:
+            params["per_page"] = self.DEFAULT_PER_PAGE
+        return params, f"{self.base_url}{path}?{urlencode(sorted(params.items()))}"
+
+    @staticmethod
+    def _validators(entry):
+        """Conditional request headers revalidating a stored cache ``entry``."""
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def _cache_put(self, endpoint, cache_key, data, model, response):
+        stored = data if model is None else [item.to_dict() for item in data]
+        self.cache.put(endpoint, cache_key, stored,
+                       etag=response.headers.get("ETag"),
+                       last_modified=response.headers.get("Last-Modified"))
+
+    @staticmethod
+    def _flight_keys(path, params, refresh):
+        """Single-flight keys of a GET: a call without ``refresh`` may also
+        join an in-flight refresh."""
+        key = (path, tuple(sorted((params or {}).items())))
+        return [key + (True,)] if refresh else [key + (True,), key + (False,)]
+
+    def _mutated(self, path):
+        """Stop sharing in-flight GETs of the collection ``path`` belongs to."""
+        self.inflight.forget("/" + path.strip("/").split("/")[0])
+
+    @staticmethod
+    def _parse(items, model):
+        if model is None:
+            return intern_ids(items)
+        return [model.from_dict(item) for item in items]
+
+    def invalidate_cache(self, endpoint=None):
+        """Drop cached catalog data for ``endpoint`` (or all of it); only this
+        account's entries of ``ACCOUNT_ENDPOINTS``."""
+        if self.cache is not None:
+            self.cache.invalidate(endpoint and self._cache_endpoint(endpoint))
+
+    @staticmethod
+    def _query(params):
+        """Drop None query parameters and send booleans as ``true``/``false``."""
+        return {
+            name: str(value).lower() if isinstance(value, bool) else value
+            for name, value in (params or {}).items() if value is not None
+        }
+
+
+class VultrAPI(_BaseClient):
+    """Vultr API client.
+
+    Owns a pooled keep-alive ``requests.Session`` so repeated calls reuse the
+    same TCP/TLS connection to api.vultr.com. Use it as a context manager or
+    call ``close()`` when done.
+
+    Pass a ``CatalogCache`` as ``cache`` to serve regions, plans and region
+    availability from disk; ``refresh=True`` on those getters forces a
+    revalidation against the API.
+
+    Every request first takes a token from a rate limiter that is shared by
+    all clients using the same API key. Responses with status 429 or 5xx and
+    connection errors are retried with jittered exponential backoff; this is
+    automatic for idempotent verbs, while POSTs retry only when the caller
+    passes ``retry=True``. Errors that survive the retries raise
+    ``VultrAPIError``.
+
+    Regions, plans, snapshots and instances are returned as the compact
+    models of ``vultr_cli.api.models`` rather than raw response dicts.
+
+    With a ``MetricsRegistry`` as ``metrics``, every attempt records its
+    status and per-phase timings (connect, TTFB, download, decode, total)
+    and payload size, labelled by method and route template, e.g.
+    ``/instances/{instance-id}``.
+
+    Concurrent identical GETs through the ``get_*`` methods and ``call`` are
+    coalesced by ``inflight`` into one request whose parsed result every
+    caller receives (lists are copied per caller; the items are shared and
+    must not be modified). A call without ``refresh`` also joins an
+    in-flight refresh. Mutations stop later callers from joining GETs of the
+    same collection (e.g. ``/instances``) that were started before them.
+
+    ``concurrently`` issues many calls at once on a thread pool, or with
+    ``use_asyncio=True`` (needs aiohttp) on one event loop through an
+    ``AsyncVultrAPI``.
+
+    Responses are compressed in transit (gzip, or brotli when the
+    ``brotli`` package is installed). List pages are decoded as they stream
+    in, item by item, instead of buffering and parsing the whole body;
+    ``STREAM_LISTS = False`` restores the full-buffer path. Lists are
+    fetched 500 items (the API maximum) per page.
+    """
+
+    STREAM_LISTS = True
+    STREAM_CHUNK = 64 * 1024
+    # Streamed pages cost no more memory when larger, so save round trips
+    DEFAULT_PER_PAGE = 500
+
+    def __init__(self, api_key, base_url=None, pool_size=_BaseClient.DEFAULT_POOL_SIZE,
+                 timeout=_BaseClient.DEFAULT_TIMEOUT, cache=None, rate_limiter=None,
+                 max_retries=_BaseClient.DEFAULT_MAX_RETRIES, metrics=None,
+                 use_asyncio=False):
+        super().__init__(api_key, base_url, timeout, cache, rate_limiter, max_retries,
+                         metrics)
+        self.inflight = SingleFlight()
+        self.use_asyncio = use_asyncio
+        self.closed = False
+        self._delegate = None  # AsyncDelegate, started by the first concurrently()
+        self._delegate_lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = tracing.TracingAdapter(pool_connections=pool_size,
+                                         pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Close the pooled session and release its connections.
+
+        Calls of ``concurrently`` still running raise ``RuntimeError``, as do
+        later ones.
+        """
+        with self._delegate_lock:
+            self.closed = True
+            delegate = self._delegate
+        if delegate is not None:
+            delegate.close()
+        self.session.close()
+
+    def concurrently(self, method, arguments, max_concurrency=50):
+        """Call ``method`` (a method name, e.g. ``"get_instance"``) once per
+        argument tuple in ``arguments``, at most ``max_concurrency`` at once.
+
+        Returns the results in argument order, with the exception in place
+        of a call that failed. The calls run on a thread pool, or with
+        ``use_asyncio`` (and aiohttp installed) as tasks of an
+        ``AsyncVultrAPI`` sharing this client's rate limiter, cache and
+        metrics.
+        """
+        if self.closed:
+            raise RuntimeError("The client is closed")
+        arguments = [tuple(args) for args in arguments]
+        if not arguments:
+            return []
+        delegate = self._async_delegate()
+        if delegate is not None:
+            return delegate.map(method, arguments, max_concurrency)
+
+        fn = getattr(self, method)
+
+        def run(args):
+            if self.closed:
+                return RuntimeError("The client was closed during the calls")
+            try:
+                return fn(*args)
+            except Exception as e:
+                return e
+
+        workers = min(max_concurrency, len(arguments))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, arguments))
+
+    def _async_delegate(self):
+        if not self.use_asyncio:
+            return None
+        with self._delegate_lock:
+            if self._delegate is None and not self.closed:
+                try:
+                    from .aio import AsyncDelegate, aiohttp
+                except ImportError:
+                    return None
+                if aiohttp is None:
+                    return None
+                self._delegate = AsyncDelegate(self)
+            return self._delegate
+
+    def _request(self, method, path, retry=None, route=None, **kwargs):
+        """Send a rate-limited request, retrying transient failures.
+
+        ``route`` is the path template used to label metrics (default: path).
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if retry is None:
+            retry = method in self.IDEMPOTENT_METHODS
+        url = f"{self.base_url}{path}"
+        labels = {"method": method, "route": route or path}
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            self._count("requests")
+            tracing.reset()
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(labels, None, started, tracing.connect_time())
+                if not retry or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                connect = tracing.connect_time()
+                if kwargs.get("stream") and response.status_code == 200:
+                    # Recorded by _read_list once the body has been read
+                    response.record = partial(self._record, labels, response, started,
+                                              connect)
+                else:
+                    response.content  # Reads (and releases) a streamed error body
+                    self._record(labels, response, started, connect,
+                                 transferred=response.raw.tell())
+                if response.status_code == 429:
+                    self._count("throttled")
+                if (response.status_code not in self.RETRY_STATUSES
+                        or not retry or attempt >= self.max_retries):
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+            attempt += 1
+            self._count("retries")
+            if self.metrics is not None:
+                self.metrics.inc("vultr_api_retries_total", labels)
+            time.sleep(delay)
+
+    def _paginate(self, path, key, params=None, per_page=None, model=None, route=None):
+        """Yield items of a list endpoint, following ``meta.links.next`` lazily.
+
+        Items are parsed into ``model`` instances when one is given.
+        """
+        params = dict(params or {})
+        params["per_page"] = per_page or self.DEFAULT_PER_PAGE
+        while True:
+            response = self._request("GET", path, route=route, params=params,
+                                     stream=self.STREAM_LISTS)
+            if response.status_code != 200:
+                raise self._error(response, f"Failed to list {key}")
+            items, payload = self._read_list(response, key, model, route or path)
+            yield from items
+            cursor = payload.get("meta", {}).get("links", {}).get("next")
+            if not cursor:
+                return
+            params["cursor"] = cursor
+
+    def _read_list(self, response, key, model, route):
+        """Items of the list response ``response`` (as ``model`` instances if
+        given) and a dict of its other members, complete once the items have
+        been consumed.
+
+        A streamed response is decoded while it arrives and each item is
+        parsed into its model right away, so only the fields the model keeps
+        are held beyond the current chunk.
+        """
+        if not self.STREAM_LISTS:
+            payload = self._decode(response, route)
+            items = payload.pop(key, [])
+            if model is not None:
+                items = [model.from_dict(item) for item in items]
+            return items, payload
+        stream = ArrayStream(key, None if model is None else model.from_dict)
+        return self._stream_items(response, stream), stream.members
+
+    def _stream_items(self, response, stream):
+        try:
+            for chunk in response.iter_content(self.STREAM_CHUNK):
+                yield from stream.feed(chunk)
+            yield from stream.close()
+        finally:
+            response.close()
+        response.record(size=stream.size, transferred=response.raw.tell())
+
+    def _cached(self, endpoint, path, key, params=None, paged=True, refresh=False,
+                model=None, route=None):
+        """GET a catalog resource through ``self.cache``.
+
+        Fresh entries are returned without touching the network, stale ones
+        are revalidated with ``If-None-Match``/``If-Modified-Since``, and the
+        last stored copy is served if the API cannot be reached. With a
+        ``model``, items are returned as model instances and only their
+        fields are stored.
+        """
+        if self.cache is None:
+            if paged:
+                return list(self._paginate(path, key, params, model=model))
+            response = self._request("GET", path, route=route, params=params)
+            if response.status_code != 200:
+                raise self._error(response, f"Failed to get {key}")
+            return self._parse(self._decode(response, route or path).get(key, []), model)
+
+        endpoint = self._cache_endpoint(endpoint)
+        params, cache_key = self._cache_key(path, params, paged)
+        entry = self.cache.get(endpoint, cache_key)
+        if entry is not None and not refresh and self.cache.is_fresh(endpoint, entry):
+            self.cache.record("hits")
+            return self._parse(entry["data"], model)
+
+        self.cache.record("misses")
+        try:
+            response = self._request("GET", path, route=route, params=params,
+                                     headers=self._validators(entry),
+                                     stream=paged and self.STREAM_LISTS)
+            if response.status_code == 304 and entry is not None:
+                self.cache.record("revalidated")
+                return self._parse(self.cache.touch(endpoint, cache_key, entry)["data"],
+                                   model)
+            if response.status_code != 200:
+                raise self._error(response, f"Failed to get {key}")
+            if paged:
+                items, payload = self._read_list(response, key, model, route or path)
+                data = list(items) if model is not None else intern_ids(items)
+            else:
+                payload = self._decode(response, route or path)
+                data = self._parse(payload.get(key, []), model)
+            cursor = payload.get("meta", {}).get("links", {}).get("next") if paged else None
+            if cursor:
+                data = data + list(self._paginate(path, key, dict(params, cursor=cursor),
+                                                  model=model, route=route))
+        except (requests.RequestException, VultrAPIError) as e:
+            # Only outages fall back to stale data; e.g. a revoked key must fail
+            if entry is None or not self.is_transient(e):
+                raise
+            self.cache.record("stale")
+            return self._parse(entry["data"], model)
+
+        self._cache_put(endpoint, cache_key, data, model, response)
+        return data
+
+    def _shared(self, path, params, fn, refresh=False):
+        """Run the GET ``fn`` once for all concurrent callers of ``path``
+        with ``params``."""
+        result = self.inflight.do(self._flight_keys(path, params, refresh), fn)
+        return list(result) if isinstance(result, list) else result
+
+    def call(self, method, path, params=None, json=None, retry=None, route=None):
+        """Send any API request and return its decoded JSON body.
+
+        Query parameters that are None are dropped and booleans are sent as
+        ``true``/``false``. Returns None for empty responses (e.g. 204), the
+        text of non-JSON ones, and raises ``VultrAPIError`` for non-2xx ones.
+        ``route`` is the path template used to label metrics. This is the
+        transport used by the generated ``VultrClient``.
+        """
+        params = self._query(params)
+        if method == "GET":
+            return self._shared(path, params, lambda: self._call(method, path, params,
+                                                                 json, retry, route))
+        try:
+            return self._call(method, path, params, json, retry, route)
+        finally:
+            self._mutated(path)
+
+    def _call(self, method, path, params, json, retry, route):
+        response = self._request(method, path, retry=retry, route=route,
+                                 params=params or None, json=json)
+        if not 200 <= response.status_code < 300:
+            raise self._error(response, f"{method} {path} failed")
+        if not response.content:
+            return None
+        if "json" not in response.headers.get("Content-Type", "json"):
+            return response.text
+        return self._decode(response, route or path)
+
+    def iter_plans(self, plan_type="vc2", per_page=None):
+        return self._paginate("/plans", "plans", {"type": plan_type}, per_page, Plan)
+
+    def iter_regions(self, per_page=None):
+        return self._paginate("/regions", "regions", per_page=per_page, model=Region)
+
+    def iter_snapshots(self, per_page=None):
+        return self._paginate("/snapshots", "snapshots", per_page=per_page,
+                              model=Snapshot)
+
+    def iter_billing_history(self, per_page=None):
+        """Invoices, payments and credits, newest first."""
+        return self._paginate("/billing/history", "billing_history", per_page=per_page,
+                              model=BillingEntry)
+
+    def iter_instances(self, per_page=None, tag=None):
+        params = {"show_pending_charges": "true"}
+        if tag:
+            params["tag"] = tag
+        return self._paginate("/instances", "instances", params, per_page, Instance)
+
+    def get_plans(self, plan_type="vc2", refresh=False):
         params = {"type": plan_type}
-        response = requests.get(url, headers=self.headers, params=params)
-        if response.status_code == 200:
-            return response.json().get("plans", [])
-        return []
-
-    def get_regions(self):
-        url = f"{self.BASE_URL}/regions"
-        response = requests.get(url, headers=self.headers)
-        if response.status_code == 200:
-            return response.json().get("regions", [])
-        return []
-
-    def get_available_plans_in_region(self, region_id):
-        url = f"{self.BASE_URL}/regions/{region_id}/availability"
-        response = requests.get(url, headers=self.headers)
-        if response.status_code == 200:
-            return response.json().get("available_plans", [])
-        return []
-
-    def get_snapshots(self):
-        url = f"{self.BASE_URL}/snapshots"
-        response = requests.get(url, headers=self.headers)
-        if response.status_code == 200:
-            return response.json().get("snapshots", [])
-        return []
-
-    def create_instance(self, plan_id, region_id, snapshot_id):
-        url = f"{self.BASE_URL}/instances"
+        return self._shared("/plans", params, lambda: self._cached(
+            "plans", "/plans", "plans", params, refresh=refresh, model=Plan), refresh)
+
+    def get_regions(self, refresh=False):
+        return self._shared("/regions", None, lambda: self._cached(
+            "regions", "/regions", "regions", refresh=refresh, model=Region), refresh)
+
+    def get_available_plans_in_region(self, region_id, refresh=False):
+        path = f"/regions/{region_id}/availability"
+        return self._shared(path, None, lambda: self._cached(
+            "availability", path, "available_plans", paged=False, refresh=refresh,
+            route="/regions/{region-id}/availability"), refresh)
+
+    def get_account(self):
+        """Account details including ``balance`` and ``pending_charges``."""
+        return self._shared("/account", None, self._get_account)
+
+    def _get_account(self):
+        response = self._request("GET", "/account")
+        if response.status_code != 200:
+            raise self._error(response, "Failed to get account")
+        return Account.from_dict(self._decode(response, "/account").get("account", {}))
+
+    def get_billing_history(self):
+        return self._shared("/billing/history", None,
+                            lambda: list(self.iter_billing_history()))
+
+    def get_pending_charges(self):
+        """Line items charged so far in the current billing period."""
+        return self._shared("/billing/pending-charges", None, self._get_pending_charges)
+
+    def _get_pending_charges(self):
+        response = self._request("GET", "/billing/pending-charges")
+        if response.status_code != 200:
+            raise self._error(response, "Failed to get pending charges")
+        payload = self._decode(response, "/billing/pending-charges")
+        return [PendingCharge.from_dict(item) for item in payload.get("pending_charges", [])]
+
+    def get_snapshots(self, refresh=False):
+        return self._shared("/snapshots", None, lambda: self._cached(
+            "snapshots", "/snapshots", "snapshots", refresh=refresh, model=Snapshot), refresh)
+
+    def get_snapshot(self, snapshot_id):
+        return self._shared(f"/snapshots/{snapshot_id}", None,
+                            lambda: self._get_snapshot(snapshot_id))
+
+    def _get_snapshot(self, snapshot_id):
+        response = self._request("GET", f"/snapshots/{snapshot_id}",
+                                 route="/snapshots/{snapshot-id}")
+        if response.status_code != 200:
+            raise self._error(response, f"Failed to get snapshot {snapshot_id}")
+        return Snapshot.from_dict(
+            self._decode(response, "/snapshots/{snapshot-id}").get("snapshot", {}))
+
+    def create_instance(self, plan_id, region_id, snapshot_id, label=None, tags=None,
+                        retry=False):
         data = {
             "plan": plan_id,
             "region": region_id,
@@ -53,22 +607,73 @@ class VultrAPI:
             "enable_ipv6": True,
             "backups": "disabled"
         }
-        response = requests.post(url, headers=self.headers, json=data)
+        if label:
+            data["label"] = label
+        if tags:
+            data["tags"] = list(tags)
+        try:
+            response = self._request("POST", "/instances", retry=retry, json=data)
+        finally:
+            self._mutated("/instances")
         if response.status_code in [200, 201, 202]:
-            return response.json()
-        else:
-            error_msg = response.json().get("error", "Unknown error")
-            raise Exception(f"Failed to create instance: {error_msg}")
+            payload = self._decode(response, "/instances")
+            return Instance.from_dict(payload.get("instance", {}))
+        raise self._error(response, "Failed to create instance")
 
     def get_instances(self):
-        url = f"{self.BASE_URL}/instances"
-        params = {"show_pending_charges": "true"}
-        response = requests.get(url, headers=self.headers, params=params)
-        if response.status_code == 200:
-            return response.json().get("instances", [])
-        return []
+        return self._shared("/instances", None, lambda: list(self.iter_instances()))
+
+    def get_instance(self, instance_id):
+        return self._shared(f"/instances/{instance_id}", None,
+                            lambda: self._get_instance(instance_id))
+
+    def _get_instance(self, instance_id):
+        response = self._request("GET", f"/instances/{instance_id}",
+                                 route="/instances/{instance-id}")
+        if response.status_code != 200:
+            raise self._error(response, f"Failed to get instance {instance_id}")
+        return Instance.from_dict(
+            self._decode(response, "/instances/{instance-id}").get("instance", {}))
+
+    def get_instance_bandwidth(self, instance_id):
+        """Daily traffic of the current month, ``{"YYYY-MM-DD": {"incoming_bytes":
+        ..., "outgoing_bytes": ...}}``."""
+        return self._shared(f"/instances/{instance_id}/bandwidth", None,
+                            lambda: self._get_instance_bandwidth(instance_id))
+
+    def _get_instance_bandwidth(self, instance_id):
+        response = self._request("GET", f"/instances/{instance_id}/bandwidth",
+                                 route="/instances/{instance-id}/bandwidth")
+        if response.status_code != 200:
+            raise self._error(response, f"Failed to get bandwidth of instance {instance_id}")
+        return self._decode(response, "/instances/{instance-id}/bandwidth").get("bandwidth", {})
 
     def delete_instance(self, instance_id):
-        url = f"{self.BASE_URL}/instances/{instance_id}"
-        response = requests.delete(url, headers=self.headers)
-        return response.status_code == 204
+        try:
+            response = self._request("DELETE", f"/instances/{instance_id}",
+                                     route="/instances/{instance-id}")
+        finally:
+            self._mutated("/instances")
+        # 404: already gone, e.g. a retry after a response lost past the deletion
+        return response.status_code in (204, 404)
+
+    def _instances_action(self, action, instance_ids, retry):
+        try:
+            response = self._request("POST", f"/instances/{action}", retry=retry,
+                                     json={"instance_ids": list(instance_ids)})
+        finally:
+            self._mutated("/instances")
+        if response.status_code != 204:
+            raise self._error(response, f"Failed to {action} instances")
+
+    def reboot_instances(self, instance_ids):
+        """Reboot several instances with one batch request."""
+        self._instances_action("reboot", instance_ids, retry=False)
+
+    def halt_instances(self, instance_ids):
+        """Halt several instances with one batch request."""
+        self._instances_action("halt", instance_ids, retry=True)
+
+    def start_instances(self, instance_ids):
+        """Start several instances with one batch request."""
+        self._instances_action("start", instance_ids, retry=True)
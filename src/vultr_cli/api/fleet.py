@@ -0,0 +1,48 @@
+"""Instances and billing aggregated over several Vultr accounts."""
+
+from collections import namedtuple
+
+from .bulk import fan_out
+
+FleetResult = namedtuple("FleetResult", ["profile", "kind", "ok", "result", "error"])
+FleetResult.__doc__ = """One account's instances or account details, or the error."""
+
+
+class Fleet:
+    """Fetches every account of a set of profiles concurrently.
+
+    ``clients`` maps profile names to ``VultrAPI`` clients. Each keeps its
+    own connection pool and the rate limiter of its own key, so a slow or
+    throttled account does not hold back the others. ``fetch`` yields a
+    ``FleetResult`` per profile and kind (``account`` or ``instances``) as
+    soon as it arrives, so callers can merge them incrementally.
+    """
+
+    KINDS = ("account", "instances")
+
+    def __init__(self, clients, max_workers=8):
+        self.clients = dict(clients)
+        self.max_workers = max_workers
+
+    def __len__(self):
+        return len(self.clients)
+
+    def fetch(self, kinds=KINDS):
+        def run(task):
+            profile, kind = task
+            api = self.clients[profile]
+            return api.get_account() if kind == "account" else api.get_instances()
+
+        tasks = [(profile, kind) for profile in self.clients for kind in kinds]
+        for result in fan_out(run, tasks, self.max_workers):
+            profile, kind = result.item
+            yield FleetResult(profile, kind, result.ok, result.result, result.error)
+
+    @staticmethod
+    def billing_totals(accounts):
+        """Summed ``balance`` and ``pending_charges`` of ``Account`` models."""
+        return {
+            "balance": sum(float(account.balance or 0) for account in accounts),
+            "pending_charges": sum(float(account.pending_charges or 0)
+                                   for account in accounts),
+        }
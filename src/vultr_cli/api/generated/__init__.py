@@ -0,0 +1,81 @@
+"""Spec-driven Vultr API client (356 operations).
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+import importlib
+
+# Resource group attribute -> (class name, operation count). Each group lives
+# in its own module, imported the first time the attribute is used.
+GROUPS = {
+    "account": ("AccountResource", 3),  # account
+    "api_keys": ("ApiKeysResource", 4),  # api-keys
+    "application": ("ApplicationResource", 1),  # application
+    "backup": ("BackupResource", 2),  # backup
+    "baremetal": ("BaremetalResource", 28),  # baremetal
+    "billing": ("BillingResource", 6),  # billing
+    "block": ("BlockResource", 7),  # block
+    "cdns": ("CDNsResource", 15),  # CDNs
+    "container_registry": ("ContainerRegistryResource", 30),  # Container Registry
+    "dns": ("DnsResource", 13),  # dns
+    "firewall": ("FirewallResource", 9),  # firewall
+    "instances": ("InstancesResource", 41),  # instances
+    "iso": ("IsoResource", 5),  # iso
+    "kubernetes": ("KubernetesResource", 18),  # kubernetes
+    "load_balancer": ("LoadBalancerResource", 13),  # load-balancer
+    "logs": ("LogsResource", 1),  # logs
+    "managed_databases": ("ManagedDatabasesResource", 65),  # managed-databases
+    "marketplace": ("MarketplaceResource", 1),  # marketplace
+    "os": ("OsResource", 1),  # os
+    "plans": ("PlansResource", 2),  # plans
+    "private_networks": ("PrivateNetworksResource", 5),  # private Networks
+    "region": ("RegionResource", 2),  # region
+    "reserved_ip": ("ReservedIpResource", 8),  # reserved-ip
+    "s3": ("S3Resource", 9),  # s3
+    "serverless_inference": ("ServerlessInferenceResource", 6),  # serverless-inference
+    "snapshot": ("SnapshotResource", 6),  # snapshot
+    "ssh": ("SshResource", 5),  # ssh
+    "startup": ("StartupResource", 5),  # startup
+    "storage_gateways": ("StorageGatewaysResource", 7),  # storage-gateways
+    "subaccount": ("SubaccountResource", 2),  # subaccount
+    "users": ("UsersResource", 13),  # users
+    "vfs": ("VFSResource", 10),  # VFS
+    "vpc2": ("VPC2Resource", 8),  # VPC2
+    "vpcs": ("VPCsResource", 5),  # VPCs
+}
+
+
+class VultrClient:
+    """Every operation of the Vultr API, grouped by resource.
+
+    Wraps a ``VultrAPI`` so generated calls share its pooled session, rate
+    limiter and retries::
+
+        client = VultrClient(VultrAPI(api_key))
+        client.billing.list_billing_history()
+    """
+
+    def __init__(self, api):
+        self._api = api
+
+    def __getattr__(self, name):
+        if name not in GROUPS:
+            raise AttributeError(f"VultrClient has no resource group {name!r}")
+        resource = getattr(_load(name), GROUPS[name][0])(self._api)
+        setattr(self, name, resource)
+        return resource
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(GROUPS))
+
+
+def _load(module):
+    return importlib.import_module(f"{__name__}.{module}")
+
+
+def __getattr__(name):
+    """Lazily expose the resource classes, e.g. ``generated.InstancesResource``."""
+    for module, (class_name, _) in GROUPS.items():
+        if class_name == name:
+            return getattr(_load(module), class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
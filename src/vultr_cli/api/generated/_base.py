@@ -0,0 +1,24 @@
+"""Shared helpers for the generated resource groups.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from urllib.parse import quote
+
+try:
+    from typing import TypedDict
+except ImportError:  # Python < 3.8
+    from typing_extensions import TypedDict
+
+__all__ = ["Resource", "TypedDict", "_quote"]
+
+
+def _quote(value):
+    return quote(str(value), safe="")
+
+
+class Resource:
+    """Base class of the generated resource groups."""
+
+    def __init__(self, api):
+        self._api = api
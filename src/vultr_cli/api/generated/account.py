@@ -0,0 +1,36 @@
+"""The ``account`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Account, AccountBandwidth, AccountBgp
+
+
+GetAccountResponse = TypedDict("GetAccountResponse", {"account": "Account"}, total=False)
+GetAccountResponse.__doc__ = "Response of get_account()."
+
+GetAccountBandwidthResponse = TypedDict("GetAccountBandwidthResponse", {"bandwidth": "AccountBandwidth"}, total=False)
+GetAccountBandwidthResponse.__doc__ = "Response of get_account_bandwidth()."
+
+
+class AccountResource(Resource):
+    """Operations tagged ``account``."""
+
+    def get_account(self) -> GetAccountResponse:
+        """Get Account Info"""
+        return self._api.call("GET", "/account")
+
+    def get_account_bgp(self) -> AccountBgp:
+        """Get Account BGP Info"""
+        return self._api.call("GET", "/account/bgp")
+
+    def get_account_bandwidth(self) -> GetAccountBandwidthResponse:
+        """Get Account Bandwidth Info"""
+        return self._api.call("GET", "/account/bandwidth")
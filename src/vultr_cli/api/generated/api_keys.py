@@ -0,0 +1,46 @@
+"""The ``api-keys`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Apikey
+
+
+GetApiKeyResponse = TypedDict("GetApiKeyResponse", {"api_key": "Apikey"}, total=False)
+GetApiKeyResponse.__doc__ = "Response of get_api_key()."
+
+ListApiKeysResponse = TypedDict("ListApiKeysResponse", {"api_keys": "List[Apikey]"}, total=False)
+ListApiKeysResponse.__doc__ = "Response of list_api_keys()."
+
+CreateApiKeyRequest = TypedDict("CreateApiKeyRequest", {"name": "str", "expire": "bool", "date_expire": "str"}, total=False)
+CreateApiKeyRequest.__doc__ = "Request body of create_api_key()."
+
+CreateApiKeyResponse = TypedDict("CreateApiKeyResponse", {"api_key": "Apikey"}, total=False)
+CreateApiKeyResponse.__doc__ = "Response of create_api_key()."
+
+
+class ApiKeysResource(Resource):
+    """Operations tagged ``api-keys``."""
+
+    def get_api_key(self) -> GetApiKeyResponse:
+        """Get API Key"""
+        return self._api.call("GET", "/apikeys/{apikey-id}")
+
+    def delete_api_key(self) -> None:
+        """Delete API Key"""
+        return self._api.call("DELETE", "/apikeys/{apikey-id}")
+
+    def list_api_keys(self) -> ListApiKeysResponse:
+        """List API Keys"""
+        return self._api.call("GET", "/apikeys")
+
+    def create_api_key(self, body: Optional[CreateApiKeyRequest] = None) -> CreateApiKeyResponse:
+        """Create API Key"""
+        return self._api.call("POST", "/apikeys", json=body)
@@ -0,0 +1,25 @@
+"""The ``application`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Application, Meta
+
+
+ListApplicationsResponse = TypedDict("ListApplicationsResponse", {"applications": "List[Application]", "meta": "Meta"}, total=False)
+ListApplicationsResponse.__doc__ = "Response of list_applications()."
+
+
+class ApplicationResource(Resource):
+    """Operations tagged ``application``."""
+
+    def list_applications(self, *, type: Optional[str] = None, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListApplicationsResponse:
+        """List Applications"""
+        return self._api.call("GET", "/applications", params={"type": type, "per_page": per_page, "cursor": cursor})
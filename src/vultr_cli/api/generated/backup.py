@@ -0,0 +1,32 @@
+"""The ``backup`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Backup, Meta
+
+
+ListBackupsResponse = TypedDict("ListBackupsResponse", {"backups": "List[Backup]", "meta": "Meta"}, total=False)
+ListBackupsResponse.__doc__ = "Response of list_backups()."
+
+GetBackupResponse = TypedDict("GetBackupResponse", {"backup": "Backup"}, total=False)
+GetBackupResponse.__doc__ = "Response of get_backup()."
+
+
+class BackupResource(Resource):
+    """Operations tagged ``backup``."""
+
+    def list_backups(self, *, instance_id: Optional[str] = None, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListBackupsResponse:
+        """List Backups"""
+        return self._api.call("GET", "/backups", params={"instance_id": instance_id, "per_page": per_page, "cursor": cursor})
+
+    def get_backup(self, backup_id: str) -> GetBackupResponse:
+        """Get a Backup"""
+        return self._api.call("GET", f"/backups/{_quote(backup_id)}", route="/backups/{backup-id}")
@@ -0,0 +1,208 @@
+"""The ``baremetal`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Baremetal, BaremetalGet, BaremetalIpv4, BaremetalIpv6, InstanceVpc, InstanceVpc2, Meta
+
+
+ListBaremetalsResponse = TypedDict("ListBaremetalsResponse", {"bare_metals": "List[BaremetalGet]", "meta": "Meta"}, total=False)
+ListBaremetalsResponse.__doc__ = "Response of list_baremetals()."
+
+CreateBaremetalRequest = TypedDict("CreateBaremetalRequest", {"region": "str", "plan": "str", "script_id": "str", "enable_ipv6": "bool", "sshkey_id": "List[str]", "user_data": "str", "label": "str", "activation_email": "bool", "hostname": "str", "tag": "str", "reserved_ipv4": "str", "os_id": "int", "snapshot_id": "str", "app_id": "int", "image_id": "str", "ipxe_chain_url": "str", "persistent_pxe": "bool", "attach_vpc2": "List[str]", "detach_vpc2": "List[str]", "enable_vpc2": "bool", "tags": "List[str]", "user_scheme": "str", "mdisk_mode": "str", "app_variables": "Dict[str, Any]"}, total=False)
+CreateBaremetalRequest.__doc__ = "Request body of create_baremetal()."
+
+CreateBaremetalResponse = TypedDict("CreateBaremetalResponse", {"baremetal": "Baremetal"}, total=False)
+CreateBaremetalResponse.__doc__ = "Response of create_baremetal()."
+
+GetBaremetalResponse = TypedDict("GetBaremetalResponse", {"bare_metal": "BaremetalGet"}, total=False)
+GetBaremetalResponse.__doc__ = "Response of get_baremetal()."
+
+UpdateBaremetalRequest = TypedDict("UpdateBaremetalRequest", {"user_data": "str", "label": "str", "tag": "str", "os_id": "int", "app_id": "int", "image_id": "str", "enable_ipv6": "bool", "attach_vpc2": "List[str]", "detach_vpc2": "List[str]", "enable_vpc2": "bool", "tags": "List[str]", "user_scheme": "str", "mdisk_mode": "str", "ipxe_chain_url": "str"}, total=False)
+UpdateBaremetalRequest.__doc__ = "Request body of update_baremetal()."
+
+UpdateBaremetalResponse = TypedDict("UpdateBaremetalResponse", {"bare_metal": "Baremetal"}, total=False)
+UpdateBaremetalResponse.__doc__ = "Response of update_baremetal()."
+
+GetIpv4BaremetalResponse = TypedDict("GetIpv4BaremetalResponse", {"ipv4s": "List[BaremetalIpv4]", "meta": "Meta"}, total=False)
+GetIpv4BaremetalResponse.__doc__ = "Response of get_ipv4_baremetal()."
+
+GetIpv6BaremetalResponse = TypedDict("GetIpv6BaremetalResponse", {"ipv6s": "List[BaremetalIpv6]", "meta": "Meta"}, total=False)
+GetIpv6BaremetalResponse.__doc__ = "Response of get_ipv6_baremetal()."
+
+CreateBaremetalReverseIpv4Request = TypedDict("CreateBaremetalReverseIpv4Request", {"ip": "str", "reverse": "str"}, total=False)
+CreateBaremetalReverseIpv4Request.__doc__ = "Request body of create_baremetal_reverse_ipv4()."
+
+CreateBaremetalReverseIpv6Request = TypedDict("CreateBaremetalReverseIpv6Request", {"ip": "str", "reverse": "str"}, total=False)
+CreateBaremetalReverseIpv6Request.__doc__ = "Request body of create_baremetal_reverse_ipv6()."
+
+PostBaremetalInstanceIdIpv4ReverseDefaultRequest = TypedDict("PostBaremetalInstanceIdIpv4ReverseDefaultRequest", {"ip": "str"}, total=False)
+PostBaremetalInstanceIdIpv4ReverseDefaultRequest.__doc__ = "Request body of post_baremetal_instance_id_ipv4_reverse_default()."
+
+ReinstallBaremetalRequest = TypedDict("ReinstallBaremetalRequest", {"hostname": "str"}, total=False)
+ReinstallBaremetalRequest.__doc__ = "Request body of reinstall_baremetal()."
+
+ReinstallBaremetalResponse = TypedDict("ReinstallBaremetalResponse", {"bare_metal": "Baremetal"}, total=False)
+ReinstallBaremetalResponse.__doc__ = "Response of reinstall_baremetal()."
+
+GetBandwidthBaremetalResponse = TypedDict("GetBandwidthBaremetalResponse", {"bandwidth": "Dict[str, Any]"}, total=False)
+GetBandwidthBaremetalResponse.__doc__ = "Response of get_bandwidth_baremetal()."
+
+HaltBaremetalsRequest = TypedDict("HaltBaremetalsRequest", {"baremetal_ids": "List[str]"}, total=False)
+HaltBaremetalsRequest.__doc__ = "Request body of halt_baremetals()."
+
+RebootBareMetalsRequest = TypedDict("RebootBareMetalsRequest", {"baremetal_ids": "List[str]"}, total=False)
+RebootBareMetalsRequest.__doc__ = "Request body of reboot_bare_metals()."
+
+StartBareMetalsRequest = TypedDict("StartBareMetalsRequest", {"baremetal_ids": "List[str]"}, total=False)
+StartBareMetalsRequest.__doc__ = "Request body of start_bare_metals()."
+
+GetBareMetalUserdataResponse = TypedDict("GetBareMetalUserdataResponse", {"user_data": "Dict[str, Any]"}, total=False)
+GetBareMetalUserdataResponse.__doc__ = "Response of get_bare_metal_userdata()."
+
+GetBareMetalsUpgradesResponse = TypedDict("GetBareMetalsUpgradesResponse", {"upgrades": "Dict[str, Any]"}, total=False)
+GetBareMetalsUpgradesResponse.__doc__ = "Response of get_bare_metals_upgrades()."
+
+GetBareMetalVncResponse = TypedDict("GetBareMetalVncResponse", {"vnc": "Dict[str, Any]"}, total=False)
+GetBareMetalVncResponse.__doc__ = "Response of get_bare_metal_vnc()."
+
+AttachBaremetalsVpcsRequest = TypedDict("AttachBaremetalsVpcsRequest", {"vpc_id": "str"}, total=False)
+AttachBaremetalsVpcsRequest.__doc__ = "Request body of attach_baremetals_vpcs()."
+
+DetachBaremetalVpcsRequest = TypedDict("DetachBaremetalVpcsRequest", {"vpc_id": "str"}, total=False)
+DetachBaremetalVpcsRequest.__doc__ = "Request body of detach_baremetal_vpcs()."
+
+ListBaremetalVpcsResponse = TypedDict("ListBaremetalVpcsResponse", {"vpcs": "List[InstanceVpc]"}, total=False)
+ListBaremetalVpcsResponse.__doc__ = "Response of list_baremetal_vpcs()."
+
+AttachBaremetalsVpc2Request = TypedDict("AttachBaremetalsVpc2Request", {"vpc_id": "str", "ip_address": "str"}, total=False)
+AttachBaremetalsVpc2Request.__doc__ = "Request body of attach_baremetals_vpc2()."
+
+DetachBaremetalVpc2Request = TypedDict("DetachBaremetalVpc2Request", {"vpc_id": "str"}, total=False)
+DetachBaremetalVpc2Request.__doc__ = "Request body of detach_baremetal_vpc2()."
+
+ListBaremetalVpc2Response = TypedDict("ListBaremetalVpc2Response", {"vpcs": "List[InstanceVpc2]"}, total=False)
+ListBaremetalVpc2Response.__doc__ = "Response of list_baremetal_vpc2()."
+
+
+class BaremetalResource(Resource):
+    """Operations tagged ``baremetal``."""
+
+    def list_baremetals(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListBaremetalsResponse:
+        """List Bare Metal Instances"""
+        return self._api.call("GET", "/bare-metals", params={"per_page": per_page, "cursor": cursor})
+
+    def create_baremetal(self, body: Optional[CreateBaremetalRequest] = None) -> CreateBaremetalResponse:
+        """Create Bare Metal Instance"""
+        return self._api.call("POST", "/bare-metals", json=body)
+
+    def get_baremetal(self, baremetal_id: str) -> GetBaremetalResponse:
+        """Get Bare Metal"""
+        return self._api.call("GET", f"/bare-metals/{_quote(baremetal_id)}", route="/bare-metals/{baremetal-id}")
+
+    def update_baremetal(self, baremetal_id: str, body: Optional[UpdateBaremetalRequest] = None) -> UpdateBaremetalResponse:
+        """Update Bare Metal"""
+        return self._api.call("PATCH", f"/bare-metals/{_quote(baremetal_id)}", json=body, route="/bare-metals/{baremetal-id}")
+
+    def delete_baremetal(self, baremetal_id: str) -> None:
+        """Delete Bare Metal"""
+        return self._api.call("DELETE", f"/bare-metals/{_quote(baremetal_id)}", route="/bare-metals/{baremetal-id}")
+
+    def get_ipv4_baremetal(self, baremetal_id: str) -> GetIpv4BaremetalResponse:
+        """Bare Metal IPv4 Addresses"""
+        return self._api.call("GET", f"/bare-metals/{_quote(baremetal_id)}/ipv4", route="/bare-metals/{baremetal-id}/ipv4")
+
+    def get_ipv6_baremetal(self, baremetal_id: str) -> GetIpv6BaremetalResponse:
+        """Bare Metal IPv6 Addresses"""
+        return self._api.call("GET", f"/bare-metals/{_quote(baremetal_id)}/ipv6", route="/bare-metals/{baremetal-id}/ipv6")
+
+    def create_baremetal_reverse_ipv4(self, baremetal_id: str, body: Optional[CreateBaremetalReverseIpv4Request] = None) -> None:
+        """Create Baremetal Reverse IPv4"""
+        return self._api.call("POST", f"/bare-metals/{_quote(baremetal_id)}/ipv4/reverse", json=body, route="/bare-metals/{baremetal-id}/ipv4/reverse")
+
+    def create_baremetal_reverse_ipv6(self, baremetal_id: str, body: Optional[CreateBaremetalReverseIpv6Request] = None) -> None:
+        """Create Baremetal Reverse IPv6"""
+        return self._api.call("POST", f"/bare-metals/{_quote(baremetal_id)}/ipv6/reverse", json=body, route="/bare-metals/{baremetal-id}/ipv6/reverse")
+
+    def post_baremetal_instance_id_ipv4_reverse_default(self, baremetal_id: str, body: Optional[PostBaremetalInstanceIdIpv4ReverseDefaultRequest] = None) -> None:
+        """Set Default Reverse DNS Entry"""
+        return self._api.call("POST", f"/bare-metals/{_quote(baremetal_id)}/ipv4/reverse/default", json=body, route="/bare-metals/{baremetal-id}/ipv4/reverse/default")
+
+    def delete_baremetal_reverse_ipv6(self, baremetal_id: str, ipv6: str) -> None:
+        """Delete BareMetal Reverse IPv6"""
+        return self._api.call("DELETE", f"/bare-metals/{_quote(baremetal_id)}/ipv6/reverse/{_quote(ipv6)}", route="/bare-metals/{baremetal-id}/ipv6/reverse/{ipv6}")
+
+    def start_baremetal(self, baremetal_id: str) -> None:
+        """Start Bare Metal"""
+        return self._api.call("POST", f"/bare-metals/{_quote(baremetal_id)}/start", route="/bare-metals/{baremetal-id}/start")
+
+    def reboot_baremetal(self, baremetal_id: str) -> None:
+        """Reboot Bare Metal"""
+        return self._api.call("POST", f"/bare-metals/{_quote(baremetal_id)}/reboot", route="/bare-metals/{baremetal-id}/reboot")
+
+    def reinstall_baremetal(self, baremetal_id: str, body: Optional[ReinstallBaremetalRequest] = None) -> ReinstallBaremetalResponse:
+        """Reinstall Bare Metal"""
+        return self._api.call("POST", f"/bare-metals/{_quote(baremetal_id)}/reinstall", json=body, route="/bare-metals/{baremetal-id}/reinstall")
+
+    def halt_baremetal(self, baremetal_id: str) -> None:
+        """Halt Bare Metal"""
+        return self._api.call("POST", f"/bare-metals/{_quote(baremetal_id)}/halt", route="/bare-metals/{baremetal-id}/halt")
+
+    def get_bandwidth_baremetal(self, baremetal_id: str) -> GetBandwidthBaremetalResponse:
+        """Bare Metal Bandwidth"""
+        return self._api.call("GET", f"/bare-metals/{_quote(baremetal_id)}/bandwidth", route="/bare-metals/{baremetal-id}/bandwidth")
+
+    def halt_baremetals(self, body: Optional[HaltBaremetalsRequest] = None) -> None:
+        """Halt Bare Metals"""
+        return self._api.call("POST", "/bare-metals/halt", json=body)
+
+    def reboot_bare_metals(self, body: Optional[RebootBareMetalsRequest] = None) -> None:
+        """Reboot Bare Metals"""
+        return self._api.call("POST", "/bare-metals/reboot", json=body)
+
+    def start_bare_metals(self, body: Optional[StartBareMetalsRequest] = None) -> None:
+        """Start Bare Metals"""
+        return self._api.call("POST", "/bare-metals/start", json=body)
+
+    def get_bare_metal_userdata(self, baremetal_id: str) -> GetBareMetalUserdataResponse:
+        """Get Bare Metal User Data"""
+        return self._api.call("GET", f"/bare-metals/{_quote(baremetal_id)}/user-data", route="/bare-metals/{baremetal-id}/user-data")
+
+    def get_bare_metals_upgrades(self, baremetal_id: str, *, type: Optional[str] = None) -> GetBareMetalsUpgradesResponse:
+        """Get Available Bare Metal Upgrades"""
+        return self._api.call("GET", f"/bare-metals/{_quote(baremetal_id)}/upgrades", params={"type": type}, route="/bare-metals/{baremetal-id}/upgrades")
+
+    def get_bare_metal_vnc(self, baremetal_id: str) -> GetBareMetalVncResponse:
+        """Get VNC URL for a Bare Metal"""
+        return self._api.call("GET", f"/bare-metals/{_quote(baremetal_id)}/vnc", route="/bare-metals/{baremetal-id}/vnc")
+
+    def attach_baremetals_vpcs(self, baremetal_id: str, body: Optional[AttachBaremetalsVpcsRequest] = None) -> None:
+        """Attach VPC Network to Bare Metal Instance"""
+        return self._api.call("POST", f"/bare-metals/{_quote(baremetal_id)}/vpcs/attach", json=body, route="/bare-metals/{baremetal-id}/vpcs/attach")
+
+    def detach_baremetal_vpcs(self, baremetal_id: str, body: Optional[DetachBaremetalVpcsRequest] = None) -> None:
+        """Detach VPC Network from Bare Metal Instance"""
+        return self._api.call("POST", f"/bare-metals/{_quote(baremetal_id)}/vpcs/detach", json=body, route="/bare-metals/{baremetal-id}/vpcs/detach")
+
+    def list_baremetal_vpcs(self, baremetal_id: str) -> ListBaremetalVpcsResponse:
+        """List Bare Metal Instance VPC Networks"""
+        return self._api.call("GET", f"/bare-metals/{_quote(baremetal_id)}/vpcs", route="/bare-metals/{baremetal-id}/vpcs")
+
+    def attach_baremetals_vpc2(self, baremetal_id: str, body: Optional[AttachBaremetalsVpc2Request] = None) -> None:
+        """Attach VPC 2.0 Network to Bare Metal Instance"""
+        return self._api.call("POST", f"/bare-metals/{_quote(baremetal_id)}/vpc2/attach", json=body, route="/bare-metals/{baremetal-id}/vpc2/attach")
+
+    def detach_baremetal_vpc2(self, baremetal_id: str, body: Optional[DetachBaremetalVpc2Request] = None) -> None:
+        """Detach VPC 2.0 Network from Bare Metal Instance"""
+        return self._api.call("POST", f"/bare-metals/{_quote(baremetal_id)}/vpc2/detach", json=body, route="/bare-metals/{baremetal-id}/vpc2/detach")
+
+    def list_baremetal_vpc2(self, baremetal_id: str) -> ListBaremetalVpc2Response:
+        """List Bare Metal Instance VPC 2.0 Networks"""
+        return self._api.call("GET", f"/bare-metals/{_quote(baremetal_id)}/vpc2", route="/bare-metals/{baremetal-id}/vpc2")
@@ -0,0 +1,57 @@
+"""The ``billing`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Billing, Invoice, Meta
+
+
+ListBillingHistoryResponse = TypedDict("ListBillingHistoryResponse", {"billing_history": "List[Billing]", "meta": "Meta"}, total=False)
+ListBillingHistoryResponse.__doc__ = "Response of list_billing_history()."
+
+ListInvoicesResponse = TypedDict("ListInvoicesResponse", {"billing_invoices": "List[Invoice]", "meta": "Meta"}, total=False)
+ListInvoicesResponse.__doc__ = "Response of list_invoices()."
+
+GetInvoiceResponse = TypedDict("GetInvoiceResponse", {"billing_invoice": "Invoice"}, total=False)
+GetInvoiceResponse.__doc__ = "Response of get_invoice()."
+
+GetInvoiceItemsResponse = TypedDict("GetInvoiceItemsResponse", {"invoice_items": "List[Dict[str, Any]]", "meta": "Dict[str, Any]"}, total=False)
+GetInvoiceItemsResponse.__doc__ = "Response of get_invoice_items()."
+
+PendingChargesResponse = TypedDict("PendingChargesResponse", {"pending_charges": "List[Billing]"}, total=False)
+PendingChargesResponse.__doc__ = "Response of pending_charges()."
+
+
+class BillingResource(Resource):
+    """Operations tagged ``billing``."""
+
+    def list_billing_history(self) -> ListBillingHistoryResponse:
+        """List Billing History"""
+        return self._api.call("GET", "/billing/history")
+
+    def list_invoices(self) -> ListInvoicesResponse:
+        """List Invoices"""
+        return self._api.call("GET", "/billing/invoices")
+
+    def get_invoice(self, invoice_id: str) -> GetInvoiceResponse:
+        """Get Invoice"""
+        return self._api.call("GET", f"/billing/invoices/{_quote(invoice_id)}", route="/billing/invoices/{invoice-id}")
+
+    def get_invoice_items(self, invoice_id: str) -> GetInvoiceItemsResponse:
+        """Get Invoice Items"""
+        return self._api.call("GET", f"/billing/invoices/{_quote(invoice_id)}/items", route="/billing/invoices/{invoice-id}/items")
+
+    def pending_charges(self) -> PendingChargesResponse:
+        """List Pending Charges"""
+        return self._api.call("GET", "/billing/pending-charges")
+
+    def pending_charges_csv(self) -> str:
+        """Get Pending Charges CSV"""
+        return self._api.call("GET", "/billing/pending-charges/csv")
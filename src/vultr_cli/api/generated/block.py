@@ -0,0 +1,67 @@
+"""The ``block`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Blockstorage, Meta
+
+
+ListBlocksResponse = TypedDict("ListBlocksResponse", {"blocks": "List[Blockstorage]", "meta": "Meta"}, total=False)
+ListBlocksResponse.__doc__ = "Response of list_blocks()."
+
+CreateBlockRequest = TypedDict("CreateBlockRequest", {"region": "str", "size_gb": "int", "label": "str", "block_type": "str"}, total=False)
+CreateBlockRequest.__doc__ = "Request body of create_block()."
+
+CreateBlockResponse = TypedDict("CreateBlockResponse", {"block": "Blockstorage"}, total=False)
+CreateBlockResponse.__doc__ = "Response of create_block()."
+
+GetBlockResponse = TypedDict("GetBlockResponse", {"block": "Blockstorage"}, total=False)
+GetBlockResponse.__doc__ = "Response of get_block()."
+
+UpdateBlockRequest = TypedDict("UpdateBlockRequest", {"label": "str", "size_gb": "int"}, total=False)
+UpdateBlockRequest.__doc__ = "Request body of update_block()."
+
+AttachBlockRequest = TypedDict("AttachBlockRequest", {"instance_id": "str", "live": "bool"}, total=False)
+AttachBlockRequest.__doc__ = "Request body of attach_block()."
+
+DetachBlockRequest = TypedDict("DetachBlockRequest", {"live": "bool"}, total=False)
+DetachBlockRequest.__doc__ = "Request body of detach_block()."
+
+
+class BlockResource(Resource):
+    """Operations tagged ``block``."""
+
+    def list_blocks(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListBlocksResponse:
+        """List Block storages"""
+        return self._api.call("GET", "/blocks", params={"per_page": per_page, "cursor": cursor})
+
+    def create_block(self, body: Optional[CreateBlockRequest] = None) -> CreateBlockResponse:
+        """Create Block Storage"""
+        return self._api.call("POST", "/blocks", json=body)
+
+    def get_block(self, block_id: str) -> GetBlockResponse:
+        """Get Block Storage"""
+        return self._api.call("GET", f"/blocks/{_quote(block_id)}", route="/blocks/{block-id}")
+
+    def update_block(self, block_id: str, body: Optional[UpdateBlockRequest] = None) -> None:
+        """Update Block Storage"""
+        return self._api.call("PATCH", f"/blocks/{_quote(block_id)}", json=body, route="/blocks/{block-id}")
+
+    def delete_block(self, block_id: str) -> None:
+        """Delete Block Storage"""
+        return self._api.call("DELETE", f"/blocks/{_quote(block_id)}", route="/blocks/{block-id}")
+
+    def attach_block(self, block_id: str, body: Optional[AttachBlockRequest] = None) -> None:
+        """Attach Block Storage"""
+        return self._api.call("POST", f"/blocks/{_quote(block_id)}/attach", json=body, route="/blocks/{block-id}/attach")
+
+    def detach_block(self, block_id: str, body: Optional[DetachBlockRequest] = None) -> None:
+        """Detach Block Storage"""
+        return self._api.call("POST", f"/blocks/{_quote(block_id)}/detach", json=body, route="/blocks/{block-id}/detach")
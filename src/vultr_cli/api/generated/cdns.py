@@ -0,0 +1,126 @@
+"""The ``CDNs`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, Pullzone, Pushzone, Pushzonefile, Pushzonefilemeta, Uploadendpoint
+
+
+ListPullzonesResponse = TypedDict("ListPullzonesResponse", {"pull_zones": "List[Pullzone]", "meta": "Meta"}, total=False)
+ListPullzonesResponse.__doc__ = "Response of list_pullzones()."
+
+CreatePullzoneRequest = TypedDict("CreatePullzoneRequest", {"label": "str", "origin_scheme": "str", "origin_domain": "str", "vanity_domain": "str", "ssl_cert": "str", "ssl_cert_key": "str", "cors": "bool", "gzip": "bool", "block_ai": "bool", "block_bad_bots": "bool"}, total=False)
+CreatePullzoneRequest.__doc__ = "Request body of create_pullzone()."
+
+CreatePullzoneResponse = TypedDict("CreatePullzoneResponse", {"pull_zone": "Pullzone"}, total=False)
+CreatePullzoneResponse.__doc__ = "Response of create_pullzone()."
+
+GetPullzoneResponse = TypedDict("GetPullzoneResponse", {"pull_zone": "Pullzone"}, total=False)
+GetPullzoneResponse.__doc__ = "Response of get_pullzone()."
+
+UpdatePullzoneRequest = TypedDict("UpdatePullzoneRequest", {"label": "str", "vanity_domain": "str", "ssl_cert": "str", "ssl_cert_key": "str", "cors": "bool", "gzip": "bool", "block_ai": "bool", "block_bad_bots": "bool", "regions": "List[Any]"}, total=False)
+UpdatePullzoneRequest.__doc__ = "Request body of update_pullzone()."
+
+UpdatePullzoneResponse = TypedDict("UpdatePullzoneResponse", {"pull_zone": "Pullzone"}, total=False)
+UpdatePullzoneResponse.__doc__ = "Response of update_pullzone()."
+
+ListPushzonesResponse = TypedDict("ListPushzonesResponse", {"push_zones": "List[Pushzone]", "meta": "Meta"}, total=False)
+ListPushzonesResponse.__doc__ = "Response of list_pushzones()."
+
+CreatePushzoneRequest = TypedDict("CreatePushzoneRequest", {"label": "str", "vanity_domain": "str", "ssl_cert": "str", "ssl_cert_key": "str", "cors": "bool", "gzip": "bool", "block_ai": "bool", "block_bad_bots": "bool"}, total=False)
+CreatePushzoneRequest.__doc__ = "Request body of create_pushzone()."
+
+CreatePushzoneResponse = TypedDict("CreatePushzoneResponse", {"push_zone": "Pushzone"}, total=False)
+CreatePushzoneResponse.__doc__ = "Response of create_pushzone()."
+
+GetPushzoneResponse = TypedDict("GetPushzoneResponse", {"push_zone": "Pushzone"}, total=False)
+GetPushzoneResponse.__doc__ = "Response of get_pushzone()."
+
+UpdatePushzoneRequest = TypedDict("UpdatePushzoneRequest", {"label": "str", "vanity_domain": "str", "ssl_cert": "str", "ssl_cert_key": "str", "cors": "bool", "gzip": "bool", "block_ai": "bool", "block_bad_bots": "bool", "regions": "List[Any]"}, total=False)
+UpdatePushzoneRequest.__doc__ = "Request body of update_pushzone()."
+
+UpdatePushzoneResponse = TypedDict("UpdatePushzoneResponse", {"push_zone": "Pushzone"}, total=False)
+UpdatePushzoneResponse.__doc__ = "Response of update_pushzone()."
+
+GetPushzoneFilesResponse = TypedDict("GetPushzoneFilesResponse", {"files": "List[Pushzonefilemeta]", "count": "int", "total_size": "int"}, total=False)
+GetPushzoneFilesResponse.__doc__ = "Response of get_pushzone_files()."
+
+CreatePushzoneUploadRequest = TypedDict("CreatePushzoneUploadRequest", {"name": "str", "size": "int"}, total=False)
+CreatePushzoneUploadRequest.__doc__ = "Request body of create_pushzone_upload()."
+
+CreatePushzoneUploadResponse = TypedDict("CreatePushzoneUploadResponse", {"upload_endpoint": "Uploadendpoint"}, total=False)
+CreatePushzoneUploadResponse.__doc__ = "Response of create_pushzone_upload()."
+
+GetPushzone2Response = TypedDict("GetPushzone2Response", {"file": "Pushzonefile"}, total=False)
+GetPushzone2Response.__doc__ = "Response of get_pushzone_2()."
+
+
+class CDNsResource(Resource):
+    """Operations tagged ``CDNs``."""
+
+    def list_pullzones(self) -> ListPullzonesResponse:
+        """List CDN Pull Zones"""
+        return self._api.call("GET", "/cdns/pull-zones")
+
+    def create_pullzone(self, body: Optional[CreatePullzoneRequest] = None) -> CreatePullzoneResponse:
+        """Create CDN Pull Zones"""
+        return self._api.call("POST", "/cdns/pull-zones", json=body)
+
+    def get_pullzone(self, pullzone_id: str) -> GetPullzoneResponse:
+        """Get CDN Pull Zone"""
+        return self._api.call("GET", f"/cdns/pull-zones/{_quote(pullzone_id)}", route="/cdns/pull-zones/{pullzone-id}")
+
+    def update_pullzone(self, pullzone_id: str, body: Optional[UpdatePullzoneRequest] = None) -> UpdatePullzoneResponse:
+        """Update CDN Pull Zone"""
+        return self._api.call("PUT", f"/cdns/pull-zones/{_quote(pullzone_id)}", json=body, route="/cdns/pull-zones/{pullzone-id}")
+
+    def delete_pullzone(self, pullzone_id: str) -> None:
+        """Delete CDN Pullzone"""
+        return self._api.call("DELETE", f"/cdns/pull-zones/{_quote(pullzone_id)}", route="/cdns/pull-zones/{pullzone-id}")
+
+    def purge_pullzone(self, pullzone_id: str) -> Any:
+        """Purge CDN Pull Zone"""
+        return self._api.call("GET", f"/cdns/pull-zones/{_quote(pullzone_id)}/purge", route="/cdns/pull-zones/{pullzone-id}/purge")
+
+    def list_pushzones(self) -> ListPushzonesResponse:
+        """List CDN Push Zones"""
+        return self._api.call("GET", "/cdns/push-zones")
+
+    def create_pushzone(self, body: Optional[CreatePushzoneRequest] = None) -> CreatePushzoneResponse:
+        """Create CDN Push Zones"""
+        return self._api.call("POST", "/cdns/push-zones", json=body)
+
+    def get_pushzone(self, pushzone_id: str) -> GetPushzoneResponse:
+        """Get CDN Push Zone"""
+        return self._api.call("GET", f"/cdns/push-zones/{_quote(pushzone_id)}", route="/cdns/push-zones/{pushzone-id}")
+
+    def update_pushzone(self, pushzone_id: str, body: Optional[UpdatePushzoneRequest] = None) -> UpdatePushzoneResponse:
+        """Update CDN Push Zone"""
+        return self._api.call("PUT", f"/cdns/push-zones/{_quote(pushzone_id)}", json=body, route="/cdns/push-zones/{pushzone-id}")
+
+    def delete_pushzone(self, pushzone_id: str) -> None:
+        """Delete CDN Pushzone"""
+        return self._api.call("DELETE", f"/cdns/push-zones/{_quote(pushzone_id)}", route="/cdns/push-zones/{pushzone-id}")
+
+    def get_pushzone_files(self, pushzone_id: str) -> GetPushzoneFilesResponse:
+        """List CDN Push Zone Files"""
+        return self._api.call("GET", f"/cdns/push-zones/{_quote(pushzone_id)}/files", route="/cdns/push-zones/{pushzone-id}/files")
+
+    def create_pushzone_upload(self, pushzone_id: str, body: Optional[CreatePushzoneUploadRequest] = None) -> CreatePushzoneUploadResponse:
+        """Create CDN Push Zone File Upload Endpoint"""
+        return self._api.call("POST", f"/cdns/push-zones/{_quote(pushzone_id)}/files", json=body, route="/cdns/push-zones/{pushzone-id}/files")
+
+    def get_pushzone_2(self, pushzone_id: str, file_name: str) -> GetPushzone2Response:
+        """Get CDN Push Zone File"""
+        return self._api.call("GET", f"/cdns/push-zones/{_quote(pushzone_id)}/files/{_quote(file_name)}", route="/cdns/push-zones/{pushzone-id}/files/{file-name}")
+
+    def delete_pushzone_file(self, pushzone_id: str, file_name: str) -> None:
+        """Delete CDN Pushzone File"""
+        return self._api.call("DELETE", f"/cdns/push-zones/{_quote(pushzone_id)}/files/{_quote(file_name)}", route="/cdns/push-zones/{pushzone-id}/files/{file-name}")
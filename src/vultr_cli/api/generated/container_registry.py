@@ -0,0 +1,201 @@
+"""The ``Container Registry`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, Registry, RegistryRegion, RegistryRepository, RegistryRepositoryArtifact, RegistryRobot, Replication, RetentionRule
+
+
+ListRegistriesResponse = TypedDict("ListRegistriesResponse", {"registries": "List[Registry]", "meta": "Meta"}, total=False)
+ListRegistriesResponse.__doc__ = "Response of list_registries()."
+
+CreateRegistryRequest = TypedDict("CreateRegistryRequest", {"name": "str", "public": "bool", "region": "str", "plan": "str"}, total=False)
+CreateRegistryRequest.__doc__ = "Request body of create_registry()."
+
+UpdateRegistryRequest = TypedDict("UpdateRegistryRequest", {"public": "bool", "plan": "str"}, total=False)
+UpdateRegistryRequest.__doc__ = "Request body of update_registry()."
+
+ListReplicationsResponse = TypedDict("ListReplicationsResponse", {"replications": "List[Replication]", "meta": "Meta"}, total=False)
+ListReplicationsResponse.__doc__ = "Response of list_replications()."
+
+CreateReplicationRequest = TypedDict("CreateReplicationRequest", {"region": "str"}, total=False)
+CreateReplicationRequest.__doc__ = "Request body of create_replication()."
+
+UpdateRetentionScheduleRequest = TypedDict("UpdateRetentionScheduleRequest", {"cron": "str"}, total=False)
+UpdateRetentionScheduleRequest.__doc__ = "Request body of update_retention_schedule()."
+
+UpdateRetentionScheduleResponse = TypedDict("UpdateRetentionScheduleResponse", {"schedule": "str", "next_scheduled_time": "str"}, total=False)
+UpdateRetentionScheduleResponse.__doc__ = "Response of update_retention_schedule()."
+
+ExecuteRetentionPolicyRequest = TypedDict("ExecuteRetentionPolicyRequest", {"dry_run": "bool"}, total=False)
+ExecuteRetentionPolicyRequest.__doc__ = "Request body of execute_retention_policy()."
+
+ExecuteRetentionPolicyResponse = TypedDict("ExecuteRetentionPolicyResponse", {"dry_run": "bool", "end_time": "str", "start_time": "str", "trigger": "str"}, total=False)
+ExecuteRetentionPolicyResponse.__doc__ = "Response of execute_retention_policy()."
+
+ListRetentionRulesResponse = TypedDict("ListRetentionRulesResponse", {"retention_rules": "List[RetentionRule]", "meta": "Meta"}, total=False)
+ListRetentionRulesResponse.__doc__ = "Response of list_retention_rules()."
+
+CreateRetentionRuleRequest = TypedDict("CreateRetentionRuleRequest", {"rule_type": "str", "count": "int", "repository_action": "str", "repository_match": "str", "tag_action": "str", "tag_match": "str", "untagged": "bool"}, total=False)
+CreateRetentionRuleRequest.__doc__ = "Request body of create_retention_rule()."
+
+UpdateRetentionRuleRequest = TypedDict("UpdateRetentionRuleRequest", {"disabled": "bool"}, total=False)
+UpdateRetentionRuleRequest.__doc__ = "Request body of update_retention_rule()."
+
+ListRegistryRepositoriesResponse = TypedDict("ListRegistryRepositoriesResponse", {"repositories": "List[RegistryRepository]", "meta": "Meta"}, total=False)
+ListRegistryRepositoriesResponse.__doc__ = "Response of list_registry_repositories()."
+
+UpdateRepositoryRequest = TypedDict("UpdateRepositoryRequest", {"description": "str"}, total=False)
+UpdateRepositoryRequest.__doc__ = "Request body of update_repository()."
+
+UpdateContainerRegistryPasswordRequest = TypedDict("UpdateContainerRegistryPasswordRequest", {"old_password": "str", "new_password": "str"}, total=False)
+UpdateContainerRegistryPasswordRequest.__doc__ = "Request body of update_container_registry_password()."
+
+UpdateContainerRegistryPasswordResponse = TypedDict("UpdateContainerRegistryPasswordResponse", {"success": "str"}, total=False)
+UpdateContainerRegistryPasswordResponse.__doc__ = "Response of update_container_registry_password()."
+
+ListRegistryRobotsResponse = TypedDict("ListRegistryRobotsResponse", {"robots": "List[RegistryRobot]", "meta": "Meta"}, total=False)
+ListRegistryRobotsResponse.__doc__ = "Response of list_registry_robots()."
+
+UpdateRobotRequest = TypedDict("UpdateRobotRequest", {"description": "str", "disable": "bool", "duration": "int", "access": "Dict[str, Any]"}, total=False)
+UpdateRobotRequest.__doc__ = "Request body of update_robot()."
+
+ListRegistryRepositoryArtifactsResponse = TypedDict("ListRegistryRepositoryArtifactsResponse", {"artifacts": "List[RegistryRepositoryArtifact]", "meta": "Meta"}, total=False)
+ListRegistryRepositoryArtifactsResponse.__doc__ = "Response of list_registry_repository_artifacts()."
+
+ListRegistryRegionsResponse = TypedDict("ListRegistryRegionsResponse", {"regions": "List[RegistryRegion]", "meta": "Meta"}, total=False)
+ListRegistryRegionsResponse.__doc__ = "Response of list_registry_regions()."
+
+ListRegistryPlansResponse = TypedDict("ListRegistryPlansResponse", {"plans": "Dict[str, Any]"}, total=False)
+ListRegistryPlansResponse.__doc__ = "Response of list_registry_plans()."
+
+
+class ContainerRegistryResource(Resource):
+    """Operations tagged ``Container Registry``."""
+
+    def list_registries(self) -> ListRegistriesResponse:
+        """List Container Registries"""
+        return self._api.call("GET", "/registries")
+
+    def create_registry(self, body: Optional[CreateRegistryRequest] = None) -> Registry:
+        """Create Container Registry"""
+        return self._api.call("POST", "/registry", json=body)
+
+    def read_registry(self, registry_id: str) -> Registry:
+        """Read Container Registry"""
+        return self._api.call("GET", f"/registry/{_quote(registry_id)}", route="/registry/{registry-id}")
+
+    def update_registry(self, registry_id: str, body: Optional[UpdateRegistryRequest] = None) -> Registry:
+        """Update Container Registry"""
+        return self._api.call("PUT", f"/registry/{_quote(registry_id)}", json=body, route="/registry/{registry-id}")
+
+    def delete_registry(self, registry_id: str) -> None:
+        """Delete Container Registry"""
+        return self._api.call("DELETE", f"/registry/{_quote(registry_id)}", route="/registry/{registry-id}")
+
+    def list_replications(self, registry_id: str) -> ListReplicationsResponse:
+        """List Replication Policies"""
+        return self._api.call("GET", f"/registry/{_quote(registry_id)}/replications", route="/registry/{registry-id}/replications")
+
+    def create_replication(self, registry_id: str, body: Optional[CreateReplicationRequest] = None) -> Replication:
+        """Create Replication Policy"""
+        return self._api.call("POST", f"/registry/{_quote(registry_id)}/replication", json=body, route="/registry/{registry-id}/replication")
+
+    def read_replication(self, registry_id: str, *, vcr_region: Optional[Any] = None) -> Replication:
+        """Read Replication Policy"""
+        return self._api.call("GET", f"/registry/{_quote(registry_id)}/replication/{region}", params={"VCR Region": vcr_region}, route="/registry/{registry-id}/replication/{region}")
+
+    def delete_replication(self, registry_id: str, *, vcr_region: Optional[Any] = None) -> None:
+        """Delete Replication Policy"""
+        return self._api.call("DELETE", f"/registry/{_quote(registry_id)}/replication/{region}", params={"VCR Region": vcr_region}, route="/registry/{registry-id}/replication/{region}")
+
+    def update_retention_schedule(self, registry_id: str, body: Optional[UpdateRetentionScheduleRequest] = None) -> UpdateRetentionScheduleResponse:
+        """Update Retention Policy Schedule"""
+        return self._api.call("PUT", f"/registry/{_quote(registry_id)}/retention/schedule", json=body, route="/registry/{registry-id}/retention/schedule")
+
+    def execute_retention_policy(self, registry_id: str, body: Optional[ExecuteRetentionPolicyRequest] = None) -> ExecuteRetentionPolicyResponse:
+        """Trigger Retention Policy Execution"""
+        return self._api.call("POST", f"/registry/{_quote(registry_id)}/retention/executions", json=body, route="/registry/{registry-id}/retention/executions")
+
+    def list_retention_rules(self, registry_id: str) -> ListRetentionRulesResponse:
+        """List Retention Rules"""
+        return self._api.call("GET", f"/registry/{_quote(registry_id)}/retention/rules", route="/registry/{registry-id}/retention/rules")
+
+    def create_retention_rule(self, registry_id: str, body: Optional[CreateRetentionRuleRequest] = None) -> RetentionRule:
+        """Create Retention Rule"""
+        return self._api.call("POST", f"/registry/{_quote(registry_id)}/retention/rules", json=body, route="/registry/{registry-id}/retention/rules")
+
+    def read_retention_rule(self, registry_id: str, retention_rule_id: int) -> RetentionRule:
+        """Read Retention Rule"""
+        return self._api.call("GET", f"/registry/{_quote(registry_id)}/retention/rules/{_quote(retention_rule_id)}", route="/registry/{registry-id}/retention/rules/{retention-rule-id}")
+
+    def update_retention_rule(self, registry_id: str, retention_rule_id: int, body: Optional[UpdateRetentionRuleRequest] = None) -> RetentionRule:
+        """Update Retention Rule"""
+        return self._api.call("PUT", f"/registry/{_quote(registry_id)}/retention/rules/{_quote(retention_rule_id)}", json=body, route="/registry/{registry-id}/retention/rules/{retention-rule-id}")
+
+    def delete_retention_rule(self, registry_id: str, retention_rule_id: int) -> None:
+        """Delete Retention Rule"""
+        return self._api.call("DELETE", f"/registry/{_quote(registry_id)}/retention/rules/{_quote(retention_rule_id)}", route="/registry/{registry-id}/retention/rules/{retention-rule-id}")
+
+    def list_registry_repositories(self, registry_id: str) -> ListRegistryRepositoriesResponse:
+        """List Repositories"""
+        return self._api.call("GET", f"/registry/{_quote(registry_id)}/repositories", route="/registry/{registry-id}/repositories")
+
+    def read_registry_repository(self, registry_id: str, repository_image: str) -> RegistryRepository:
+        """Read Repository"""
+        return self._api.call("GET", f"/registry/{_quote(registry_id)}/repository/{_quote(repository_image)}", route="/registry/{registry-id}/repository/{repository-image}")
+
+    def update_repository(self, registry_id: str, repository_image: str, body: Optional[UpdateRepositoryRequest] = None) -> RegistryRepository:
+        """Update Repository"""
+        return self._api.call("PUT", f"/registry/{_quote(registry_id)}/repository/{_quote(repository_image)}", json=body, route="/registry/{registry-id}/repository/{repository-image}")
+
+    def delete_repository(self, registry_id: str, repository_image: str) -> None:
+        """Delete Repository"""
+        return self._api.call("DELETE", f"/registry/{_quote(registry_id)}/repository/{_quote(repository_image)}", route="/registry/{registry-id}/repository/{repository-image}")
+
+    def update_container_registry_password(self, registry_id: str, body: Optional[UpdateContainerRegistryPasswordRequest] = None) -> UpdateContainerRegistryPasswordResponse:
+        """Update Container Registry Password"""
+        return self._api.call("PUT", f"/registry/{_quote(registry_id)}/user/password", json=body, route="/registry/{registry-id}/user/password")
+
+    def list_registry_robots(self, registry_id: str) -> ListRegistryRobotsResponse:
+        """List Robots"""
+        return self._api.call("GET", f"/registry/{_quote(registry_id)}/robots", route="/registry/{registry-id}/robots")
+
+    def get_registry_registry_id_robot_robot_name(self, registry_id: str, robot_name: Any) -> RegistryRobot:
+        """Read Robot"""
+        return self._api.call("GET", f"/registry/{_quote(registry_id)}/robot/{_quote(robot_name)}", route="/registry/{registry-id}/robot/{robot-name}")
+
+    def update_robot(self, registry_id: str, robot_name: Any, body: Optional[UpdateRobotRequest] = None) -> RegistryRobot:
+        """Update Robot"""
+        return self._api.call("PUT", f"/registry/{_quote(registry_id)}/robot/{_quote(robot_name)}", json=body, route="/registry/{registry-id}/robot/{robot-name}")
+
+    def delete_robot(self, registry_id: str, robot_name: Any) -> None:
+        """Delete Robot"""
+        return self._api.call("DELETE", f"/registry/{_quote(registry_id)}/robot/{_quote(robot_name)}", route="/registry/{registry-id}/robot/{robot-name}")
+
+    def list_registry_repository_artifacts(self, registry_id: str, repository_image: str) -> ListRegistryRepositoryArtifactsResponse:
+        """List Artifacts"""
+        return self._api.call("GET", f"/registry/{_quote(registry_id)}/repository/{_quote(repository_image)}/artifacts", route="/registry/{registry-id}/repository/{repository-image}/artifacts")
+
+    def get_registry_registry_id_repository_repository_image_artifact_artifact_digest(self, registry_id: str, repository_image: str, artifact_digest: Any) -> RegistryRepositoryArtifact:
+        """Read Artifact"""
+        return self._api.call("GET", f"/registry/{_quote(registry_id)}/repository/{_quote(repository_image)}/artifact/{_quote(artifact_digest)}", route="/registry/{registry-id}/repository/{repository-image}/artifact/{artifact-digest}")
+
+    def delete_registry_registry_id_repository_repository_image_artifact_artifact_digest(self, registry_id: str, repository_image: str, artifact_digest: Any) -> None:
+        """Delete Artifact"""
+        return self._api.call("DELETE", f"/registry/{_quote(registry_id)}/repository/{_quote(repository_image)}/artifact/{_quote(artifact_digest)}", route="/registry/{registry-id}/repository/{repository-image}/artifact/{artifact-digest}")
+
+    def list_registry_regions(self) -> ListRegistryRegionsResponse:
+        """List Registry Regions"""
+        return self._api.call("GET", "/registry/region/list")
+
+    def list_registry_plans(self) -> ListRegistryPlansResponse:
+        """List Registry Plans"""
+        return self._api.call("GET", "/registry/plan/list")
@@ -0,0 +1,109 @@
+"""The ``dns`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import DnsRecord, DnsSoa, Domain, Meta
+
+
+ListDnsDomainsResponse = TypedDict("ListDnsDomainsResponse", {"domains": "List[Domain]", "meta": "Meta"}, total=False)
+ListDnsDomainsResponse.__doc__ = "Response of list_dns_domains()."
+
+CreateDnsDomainRequest = TypedDict("CreateDnsDomainRequest", {"domain": "str", "ip": "str", "dns_sec": "str"}, total=False)
+CreateDnsDomainRequest.__doc__ = "Request body of create_dns_domain()."
+
+CreateDnsDomainResponse = TypedDict("CreateDnsDomainResponse", {"domain": "Domain"}, total=False)
+CreateDnsDomainResponse.__doc__ = "Response of create_dns_domain()."
+
+GetDnsDomainResponse = TypedDict("GetDnsDomainResponse", {"domain": "Domain"}, total=False)
+GetDnsDomainResponse.__doc__ = "Response of get_dns_domain()."
+
+UpdateDnsDomainRequest = TypedDict("UpdateDnsDomainRequest", {"dns_sec": "str"}, total=False)
+UpdateDnsDomainRequest.__doc__ = "Request body of update_dns_domain()."
+
+GetDnsDomainSoaResponse = TypedDict("GetDnsDomainSoaResponse", {"dns_soa": "DnsSoa"}, total=False)
+GetDnsDomainSoaResponse.__doc__ = "Response of get_dns_domain_soa()."
+
+UpdateDnsDomainSoaRequest = TypedDict("UpdateDnsDomainSoaRequest", {"nsprimary": "str", "email": "str"}, total=False)
+UpdateDnsDomainSoaRequest.__doc__ = "Request body of update_dns_domain_soa()."
+
+GetDnsDomainDnssecResponse = TypedDict("GetDnsDomainDnssecResponse", {"dns_sec": "List[str]"}, total=False)
+GetDnsDomainDnssecResponse.__doc__ = "Response of get_dns_domain_dnssec()."
+
+ListDnsDomainRecordsResponse = TypedDict("ListDnsDomainRecordsResponse", {"records": "List[DnsRecord]", "meta": "Meta"}, total=False)
+ListDnsDomainRecordsResponse.__doc__ = "Response of list_dns_domain_records()."
+
+CreateDnsDomainRecordRequest = TypedDict("CreateDnsDomainRecordRequest", {"name": "str", "type": "str", "data": "str", "ttl": "int", "priority": "int"}, total=False)
+CreateDnsDomainRecordRequest.__doc__ = "Request body of create_dns_domain_record()."
+
+CreateDnsDomainRecordResponse = TypedDict("CreateDnsDomainRecordResponse", {"record": "DnsRecord"}, total=False)
+CreateDnsDomainRecordResponse.__doc__ = "Response of create_dns_domain_record()."
+
+GetDnsDomainRecordResponse = TypedDict("GetDnsDomainRecordResponse", {"record": "DnsRecord"}, total=False)
+GetDnsDomainRecordResponse.__doc__ = "Response of get_dns_domain_record()."
+
+UpdateDnsDomainRecordRequest = TypedDict("UpdateDnsDomainRecordRequest", {"name": "str", "data": "str", "ttl": "int", "priority": "int"}, total=False)
+UpdateDnsDomainRecordRequest.__doc__ = "Request body of update_dns_domain_record()."
+
+
+class DnsResource(Resource):
+    """Operations tagged ``dns``."""
+
+    def list_dns_domains(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListDnsDomainsResponse:
+        """List DNS Domains"""
+        return self._api.call("GET", "/domains", params={"per_page": per_page, "cursor": cursor})
+
+    def create_dns_domain(self, body: Optional[CreateDnsDomainRequest] = None) -> CreateDnsDomainResponse:
+        """Create DNS Domain"""
+        return self._api.call("POST", "/domains", json=body)
+
+    def get_dns_domain(self, dns_domain: str) -> GetDnsDomainResponse:
+        """Get DNS Domain"""
+        return self._api.call("GET", f"/domains/{_quote(dns_domain)}", route="/domains/{dns-domain}")
+
+    def update_dns_domain(self, dns_domain: str, body: Optional[UpdateDnsDomainRequest] = None) -> None:
+        """Update a DNS Domain"""
+        return self._api.call("PUT", f"/domains/{_quote(dns_domain)}", json=body, route="/domains/{dns-domain}")
+
+    def delete_dns_domain(self, dns_domain: str) -> None:
+        """Delete Domain"""
+        return self._api.call("DELETE", f"/domains/{_quote(dns_domain)}", route="/domains/{dns-domain}")
+
+    def get_dns_domain_soa(self, dns_domain: str) -> GetDnsDomainSoaResponse:
+        """Get SOA information"""
+        return self._api.call("GET", f"/domains/{_quote(dns_domain)}/soa", route="/domains/{dns-domain}/soa")
+
+    def update_dns_domain_soa(self, dns_domain: str, body: Optional[UpdateDnsDomainSoaRequest] = None) -> None:
+        """Update SOA information"""
+        return self._api.call("PATCH", f"/domains/{_quote(dns_domain)}/soa", json=body, route="/domains/{dns-domain}/soa")
+
+    def get_dns_domain_dnssec(self, dns_domain: str) -> GetDnsDomainDnssecResponse:
+        """Get DNSSec Info"""
+        return self._api.call("GET", f"/domains/{_quote(dns_domain)}/dnssec", route="/domains/{dns-domain}/dnssec")
+
+    def list_dns_domain_records(self, dns_domain: str, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListDnsDomainRecordsResponse:
+        """List Records"""
+        return self._api.call("GET", f"/domains/{_quote(dns_domain)}/records", params={"per_page": per_page, "cursor": cursor}, route="/domains/{dns-domain}/records")
+
+    def create_dns_domain_record(self, dns_domain: str, body: Optional[CreateDnsDomainRecordRequest] = None) -> CreateDnsDomainRecordResponse:
+        """Create Record"""
+        return self._api.call("POST", f"/domains/{_quote(dns_domain)}/records", json=body, route="/domains/{dns-domain}/records")
+
+    def get_dns_domain_record(self, dns_domain: str, record_id: str) -> GetDnsDomainRecordResponse:
+        """Get Record"""
+        return self._api.call("GET", f"/domains/{_quote(dns_domain)}/records/{_quote(record_id)}", route="/domains/{dns-domain}/records/{record-id}")
+
+    def update_dns_domain_record(self, dns_domain: str, record_id: str, body: Optional[UpdateDnsDomainRecordRequest] = None) -> None:
+        """Update Record"""
+        return self._api.call("PATCH", f"/domains/{_quote(dns_domain)}/records/{_quote(record_id)}", json=body, route="/domains/{dns-domain}/records/{record-id}")
+
+    def delete_dns_domain_record(self, dns_domain: str, record_id: str) -> None:
+        """Delete Record"""
+        return self._api.call("DELETE", f"/domains/{_quote(dns_domain)}/records/{_quote(record_id)}", route="/domains/{dns-domain}/records/{record-id}")
@@ -0,0 +1,81 @@
+"""The ``firewall`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import FirewallGroup, FirewallRule, Meta
+
+
+ListFirewallGroupsResponse = TypedDict("ListFirewallGroupsResponse", {"firewall_groups": "List[FirewallGroup]", "meta": "Meta"}, total=False)
+ListFirewallGroupsResponse.__doc__ = "Response of list_firewall_groups()."
+
+CreateFirewallGroupRequest = TypedDict("CreateFirewallGroupRequest", {"description": "str"}, total=False)
+CreateFirewallGroupRequest.__doc__ = "Request body of create_firewall_group()."
+
+CreateFirewallGroupResponse = TypedDict("CreateFirewallGroupResponse", {"firewall_group": "FirewallGroup"}, total=False)
+CreateFirewallGroupResponse.__doc__ = "Response of create_firewall_group()."
+
+GetFirewallGroupResponse = TypedDict("GetFirewallGroupResponse", {"firewall_group": "FirewallGroup"}, total=False)
+GetFirewallGroupResponse.__doc__ = "Response of get_firewall_group()."
+
+UpdateFirewallGroupRequest = TypedDict("UpdateFirewallGroupRequest", {"description": "str"}, total=False)
+UpdateFirewallGroupRequest.__doc__ = "Request body of update_firewall_group()."
+
+ListFirewallGroupRulesResponse = TypedDict("ListFirewallGroupRulesResponse", {"firewall_rules": "List[FirewallRule]", "meta": "Meta"}, total=False)
+ListFirewallGroupRulesResponse.__doc__ = "Response of list_firewall_group_rules()."
+
+PostFirewallsFirewallGroupIdRulesRequest = TypedDict("PostFirewallsFirewallGroupIdRulesRequest", {"ip_type": "str", "protocol": "str", "subnet": "str", "subnet_size": "int", "port": "str", "source": "str", "notes": "str"}, total=False)
+PostFirewallsFirewallGroupIdRulesRequest.__doc__ = "Request body of post_firewalls_firewall_group_id_rules()."
+
+PostFirewallsFirewallGroupIdRulesResponse = TypedDict("PostFirewallsFirewallGroupIdRulesResponse", {"firewall_rule": "FirewallRule"}, total=False)
+PostFirewallsFirewallGroupIdRulesResponse.__doc__ = "Response of post_firewalls_firewall_group_id_rules()."
+
+GetFirewallGroupRuleResponse = TypedDict("GetFirewallGroupRuleResponse", {"firewall_rule": "FirewallRule"}, total=False)
+GetFirewallGroupRuleResponse.__doc__ = "Response of get_firewall_group_rule()."
+
+
+class FirewallResource(Resource):
+    """Operations tagged ``firewall``."""
+
+    def list_firewall_groups(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListFirewallGroupsResponse:
+        """List Firewall Groups"""
+        return self._api.call("GET", "/firewalls", params={"per_page": per_page, "cursor": cursor})
+
+    def create_firewall_group(self, body: Optional[CreateFirewallGroupRequest] = None) -> CreateFirewallGroupResponse:
+        """Create Firewall Group"""
+        return self._api.call("POST", "/firewalls", json=body)
+
+    def get_firewall_group(self, firewall_group_id: str) -> GetFirewallGroupResponse:
+        """Get Firewall Group"""
+        return self._api.call("GET", f"/firewalls/{_quote(firewall_group_id)}", route="/firewalls/{firewall-group-id}")
+
+    def update_firewall_group(self, firewall_group_id: str, body: Optional[UpdateFirewallGroupRequest] = None) -> None:
+        """Update Firewall Group"""
+        return self._api.call("PUT", f"/firewalls/{_quote(firewall_group_id)}", json=body, route="/firewalls/{firewall-group-id}")
+
+    def delete_firewall_group(self, firewall_group_id: str) -> None:
+        """Delete Firewall Group"""
+        return self._api.call("DELETE", f"/firewalls/{_quote(firewall_group_id)}", route="/firewalls/{firewall-group-id}")
+
+    def list_firewall_group_rules(self, firewall_group_id: str, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListFirewallGroupRulesResponse:
+        """List Firewall Rules"""
+        return self._api.call("GET", f"/firewalls/{_quote(firewall_group_id)}/rules", params={"per_page": per_page, "cursor": cursor}, route="/firewalls/{firewall-group-id}/rules")
+
+    def post_firewalls_firewall_group_id_rules(self, firewall_group_id: str, body: Optional[PostFirewallsFirewallGroupIdRulesRequest] = None) -> PostFirewallsFirewallGroupIdRulesResponse:
+        """Create Firewall Rules"""
+        return self._api.call("POST", f"/firewalls/{_quote(firewall_group_id)}/rules", json=body, route="/firewalls/{firewall-group-id}/rules")
+
+    def get_firewall_group_rule(self, firewall_group_id: str, firewall_rule_id: str) -> GetFirewallGroupRuleResponse:
+        """Get Firewall Rule"""
+        return self._api.call("GET", f"/firewalls/{_quote(firewall_group_id)}/rules/{_quote(firewall_rule_id)}", route="/firewalls/{firewall-group-id}/rules/{firewall-rule-id}")
+
+    def delete_firewall_group_rule(self, firewall_group_id: str, firewall_rule_id: str) -> None:
+        """Delete Firewall Rule"""
+        return self._api.call("DELETE", f"/firewalls/{_quote(firewall_group_id)}/rules/{_quote(firewall_rule_id)}", route="/firewalls/{firewall-group-id}/rules/{firewall-rule-id}")
@@ -0,0 +1,302 @@
+"""The ``instances`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import BackupSchedule, BaremetalIpv4, BaremetalIpv6, Instance, InstanceGet, InstanceVpc, InstanceVpc2, Meta, PrivateNetworks
+
+
+ListInstancesResponse = TypedDict("ListInstancesResponse", {"instances": "List[InstanceGet]", "meta": "Meta"}, total=False)
+ListInstancesResponse.__doc__ = "Response of list_instances()."
+
+CreateInstanceRequest = TypedDict("CreateInstanceRequest", {"region": "str", "plan": "str", "os_id": "int", "ipxe_chain_url": "str", "iso_id": "str", "script_id": "str", "snapshot_id": "str", "enable_ipv6": "bool", "disable_public_ipv4": "bool", "attach_private_network": "List[str]", "attach_vpc": "List[str]", "attach_vpc2": "List[str]", "label": "str", "sshkey_id": "List[str]", "backups": "str", "block_devices": "List[Dict[str, Any]]", "app_id": "int", "image_id": "str", "user_data": "str", "ddos_protection": "bool", "activation_email": "bool", "hostname": "str", "tag": "str", "firewall_group_id": "str", "reserved_ipv4": "str", "enable_private_network": "bool", "enable_vpc": "bool", "enable_vpc2": "bool", "tags": "List[str]", "user_scheme": "str", "app_variables": "Dict[str, Any]"}, total=False)
+CreateInstanceRequest.__doc__ = "Request body of create_instance()."
+
+CreateInstanceResponse = TypedDict("CreateInstanceResponse", {"instance": "Instance"}, total=False)
+CreateInstanceResponse.__doc__ = "Response of create_instance()."
+
+GetInstanceResponse = TypedDict("GetInstanceResponse", {"instance": "InstanceGet"}, total=False)
+GetInstanceResponse.__doc__ = "Response of get_instance()."
+
+UpdateInstanceRequest = TypedDict("UpdateInstanceRequest", {"app_id": "int", "image_id": "str", "backups": "str", "firewall_group_id": "str", "enable_ipv6": "bool", "os_id": "str", "user_data": "str", "tag": "str", "plan": "str", "ddos_protection": "bool", "attach_private_network": "List[str]", "attach_vpc": "List[str]", "attach_vpc2": "List[str]", "detach_private_network": "List[str]", "detach_vpc": "List[str]", "detach_vpc2": "List[str]", "enable_private_network": "bool", "enable_vpc": "bool", "enable_vpc2": "bool", "label": "str", "tags": "List[str]", "user_scheme": "str"}, total=False)
+UpdateInstanceRequest.__doc__ = "Request body of update_instance()."
+
+UpdateInstanceResponse = TypedDict("UpdateInstanceResponse", {"instance": "Instance"}, total=False)
+UpdateInstanceResponse.__doc__ = "Response of update_instance()."
+
+HaltInstancesRequest = TypedDict("HaltInstancesRequest", {"instance_ids": "List[str]"}, total=False)
+HaltInstancesRequest.__doc__ = "Request body of halt_instances()."
+
+RebootInstancesRequest = TypedDict("RebootInstancesRequest", {"instance_ids": "List[str]"}, total=False)
+RebootInstancesRequest.__doc__ = "Request body of reboot_instances()."
+
+StartInstancesRequest = TypedDict("StartInstancesRequest", {"instance_ids": "List[str]"}, total=False)
+StartInstancesRequest.__doc__ = "Request body of start_instances()."
+
+ReinstallInstanceRequest = TypedDict("ReinstallInstanceRequest", {"hostname": "str"}, total=False)
+ReinstallInstanceRequest.__doc__ = "Request body of reinstall_instance()."
+
+ReinstallInstanceResponse = TypedDict("ReinstallInstanceResponse", {"instance": "Instance"}, total=False)
+ReinstallInstanceResponse.__doc__ = "Response of reinstall_instance()."
+
+GetInstanceBandwidthResponse = TypedDict("GetInstanceBandwidthResponse", {"bandwidth": "Dict[str, Any]"}, total=False)
+GetInstanceBandwidthResponse.__doc__ = "Response of get_instance_bandwidth()."
+
+GetInstanceNeighborsResponse = TypedDict("GetInstanceNeighborsResponse", {"neighbors": "List[str]"}, total=False)
+GetInstanceNeighborsResponse.__doc__ = "Response of get_instance_neighbors()."
+
+ListInstancePrivateNetworksResponse = TypedDict("ListInstancePrivateNetworksResponse", {"private_networks": "List[PrivateNetworks]", "meta": "Meta"}, total=False)
+ListInstancePrivateNetworksResponse.__doc__ = "Response of list_instance_private_networks()."
+
+ListInstanceVpcsResponse = TypedDict("ListInstanceVpcsResponse", {"vpcs": "List[InstanceVpc]", "meta": "Meta"}, total=False)
+ListInstanceVpcsResponse.__doc__ = "Response of list_instance_vpcs()."
+
+ListInstanceVpc2Response = TypedDict("ListInstanceVpc2Response", {"vpcs": "List[InstanceVpc2]", "meta": "Meta"}, total=False)
+ListInstanceVpc2Response.__doc__ = "Response of list_instance_vpc2()."
+
+GetInstanceIsoStatusResponse = TypedDict("GetInstanceIsoStatusResponse", {"iso_status": "Dict[str, Any]"}, total=False)
+GetInstanceIsoStatusResponse.__doc__ = "Response of get_instance_iso_status()."
+
+AttachInstanceIsoRequest = TypedDict("AttachInstanceIsoRequest", {"iso_id": "str"}, total=False)
+AttachInstanceIsoRequest.__doc__ = "Request body of attach_instance_iso()."
+
+AttachInstanceIsoResponse = TypedDict("AttachInstanceIsoResponse", {"iso_status": "Dict[str, Any]"}, total=False)
+AttachInstanceIsoResponse.__doc__ = "Response of attach_instance_iso()."
+
+DetachInstanceIsoResponse = TypedDict("DetachInstanceIsoResponse", {"iso_status": "Dict[str, Any]"}, total=False)
+DetachInstanceIsoResponse.__doc__ = "Response of detach_instance_iso()."
+
+AttachInstanceNetworkRequest = TypedDict("AttachInstanceNetworkRequest", {"network_id": "str"}, total=False)
+AttachInstanceNetworkRequest.__doc__ = "Request body of attach_instance_network()."
+
+DetachInstanceNetworkRequest = TypedDict("DetachInstanceNetworkRequest", {"network_id": "str"}, total=False)
+DetachInstanceNetworkRequest.__doc__ = "Request body of detach_instance_network()."
+
+AttachInstanceVpcRequest = TypedDict("AttachInstanceVpcRequest", {"vpc_id": "str"}, total=False)
+AttachInstanceVpcRequest.__doc__ = "Request body of attach_instance_vpc()."
+
+DetachInstanceVpcRequest = TypedDict("DetachInstanceVpcRequest", {"vpc_id": "str"}, total=False)
+DetachInstanceVpcRequest.__doc__ = "Request body of detach_instance_vpc()."
+
+AttachInstanceVpc2Request = TypedDict("AttachInstanceVpc2Request", {"vpc_id": "str", "ip_address": "str"}, total=False)
+AttachInstanceVpc2Request.__doc__ = "Request body of attach_instance_vpc2()."
+
+DetachInstanceVpc2Request = TypedDict("DetachInstanceVpc2Request", {"vpc_id": "str"}, total=False)
+DetachInstanceVpc2Request.__doc__ = "Request body of detach_instance_vpc2()."
+
+GetInstanceBackupScheduleResponse = TypedDict("GetInstanceBackupScheduleResponse", {"backup_schedule": "BackupSchedule"}, total=False)
+GetInstanceBackupScheduleResponse.__doc__ = "Response of get_instance_backup_schedule()."
+
+CreateInstanceBackupScheduleRequest = TypedDict("CreateInstanceBackupScheduleRequest", {"type": "str", "hour": "int", "dow": "int", "dom": "int"}, total=False)
+CreateInstanceBackupScheduleRequest.__doc__ = "Request body of create_instance_backup_schedule()."
+
+RestoreInstanceRequest = TypedDict("RestoreInstanceRequest", {"backup_id": "str", "snapshot_id": "str"}, total=False)
+RestoreInstanceRequest.__doc__ = "Request body of restore_instance()."
+
+RestoreInstanceResponse = TypedDict("RestoreInstanceResponse", {"status": "Dict[str, Any]"}, total=False)
+RestoreInstanceResponse.__doc__ = "Response of restore_instance()."
+
+GetInstanceIpv4Response = TypedDict("GetInstanceIpv4Response", {"ipv4s": "List[BaremetalIpv4]", "meta": "Meta"}, total=False)
+GetInstanceIpv4Response.__doc__ = "Response of get_instance_ipv4()."
+
+CreateInstanceIpv4Request = TypedDict("CreateInstanceIpv4Request", {"reboot": "bool"}, total=False)
+CreateInstanceIpv4Request.__doc__ = "Request body of create_instance_ipv4()."
+
+GetInstanceIpv6Response = TypedDict("GetInstanceIpv6Response", {"ipv6s": "List[BaremetalIpv6]", "meta": "Meta"}, total=False)
+GetInstanceIpv6Response.__doc__ = "Response of get_instance_ipv6()."
+
+ListInstanceIpv6ReverseResponse = TypedDict("ListInstanceIpv6ReverseResponse", {"reverse_ipv6s": "List[Dict[str, Any]]"}, total=False)
+ListInstanceIpv6ReverseResponse.__doc__ = "Response of list_instance_ipv6_reverse()."
+
+CreateInstanceReverseIpv6Request = TypedDict("CreateInstanceReverseIpv6Request", {"ip": "str", "reverse": "str"}, total=False)
+CreateInstanceReverseIpv6Request.__doc__ = "Request body of create_instance_reverse_ipv6()."
+
+CreateInstanceReverseIpv4Request = TypedDict("CreateInstanceReverseIpv4Request", {"ip": "str", "reverse": "str"}, total=False)
+CreateInstanceReverseIpv4Request.__doc__ = "Request body of create_instance_reverse_ipv4()."
+
+GetInstanceUserdataResponse = TypedDict("GetInstanceUserdataResponse", {"user_data": "Dict[str, Any]"}, total=False)
+GetInstanceUserdataResponse.__doc__ = "Response of get_instance_userdata()."
+
+PostInstancesInstanceIdIpv4ReverseDefaultRequest = TypedDict("PostInstancesInstanceIdIpv4ReverseDefaultRequest", {"ip": "str"}, total=False)
+PostInstancesInstanceIdIpv4ReverseDefaultRequest.__doc__ = "Request body of post_instances_instance_id_ipv4_reverse_default()."
+
+GetInstanceUpgradesResponse = TypedDict("GetInstanceUpgradesResponse", {"upgrades": "Dict[str, Any]"}, total=False)
+GetInstanceUpgradesResponse.__doc__ = "Response of get_instance_upgrades()."
+
+GetInstanceJobResponse = TypedDict("GetInstanceJobResponse", {"job": "Dict[str, Any]"}, total=False)
+GetInstanceJobResponse.__doc__ = "Response of get_instance_job()."
+
+
+class InstancesResource(Resource):
+    """Operations tagged ``instances``."""
+
+    def list_instances(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None, tag: Optional[str] = None, label: Optional[str] = None, main_ip: Optional[str] = None, region: Optional[str] = None, firewall_group_id: Optional[str] = None, hostname: Optional[str] = None, show_pending_charges: Optional[bool] = None) -> ListInstancesResponse:
+        """List Instances"""
+        return self._api.call("GET", "/instances", params={"per_page": per_page, "cursor": cursor, "tag": tag, "label": label, "main_ip": main_ip, "region": region, "firewall_group_id": firewall_group_id, "hostname": hostname, "show_pending_charges": show_pending_charges})
+
+    def create_instance(self, body: Optional[CreateInstanceRequest] = None) -> CreateInstanceResponse:
+        """Create Instance"""
+        return self._api.call("POST", "/instances", json=body)
+
+    def get_instance(self, instance_id: str) -> GetInstanceResponse:
+        """Get Instance"""
+        return self._api.call("GET", f"/instances/{_quote(instance_id)}", route="/instances/{instance-id}")
+
+    def update_instance(self, instance_id: str, body: Optional[UpdateInstanceRequest] = None) -> UpdateInstanceResponse:
+        """Update Instance"""
+        return self._api.call("PATCH", f"/instances/{_quote(instance_id)}", json=body, route="/instances/{instance-id}")
+
+    def delete_instance(self, instance_id: str) -> None:
+        """Delete Instance"""
+        return self._api.call("DELETE", f"/instances/{_quote(instance_id)}", route="/instances/{instance-id}")
+
+    def halt_instances(self, body: Optional[HaltInstancesRequest] = None) -> None:
+        """Halt Instances"""
+        return self._api.call("POST", "/instances/halt", json=body)
+
+    def reboot_instances(self, body: Optional[RebootInstancesRequest] = None) -> None:
+        """Reboot instances"""
+        return self._api.call("POST", "/instances/reboot", json=body)
+
+    def start_instances(self, body: Optional[StartInstancesRequest] = None) -> None:
+        """Start instances"""
+        return self._api.call("POST", "/instances/start", json=body)
+
+    def start_instance(self, instance_id: str) -> None:
+        """Start instance"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/start", route="/instances/{instance-id}/start")
+
+    def reboot_instance(self, instance_id: str) -> None:
+        """Reboot Instance"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/reboot", route="/instances/{instance-id}/reboot")
+
+    def reinstall_instance(self, instance_id: str, body: Optional[ReinstallInstanceRequest] = None) -> ReinstallInstanceResponse:
+        """Reinstall Instance"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/reinstall", json=body, route="/instances/{instance-id}/reinstall")
+
+    def get_instance_bandwidth(self, instance_id: str, *, date_range: Optional[int] = None) -> GetInstanceBandwidthResponse:
+        """Instance Bandwidth"""
+        return self._api.call("GET", f"/instances/{_quote(instance_id)}/bandwidth", params={"date_range": date_range}, route="/instances/{instance-id}/bandwidth")
+
+    def get_instance_neighbors(self, instance_id: str) -> GetInstanceNeighborsResponse:
+        """Get Instance neighbors"""
+        return self._api.call("GET", f"/instances/{_quote(instance_id)}/neighbors", route="/instances/{instance-id}/neighbors")
+
+    def list_instance_private_networks(self, instance_id: str, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListInstancePrivateNetworksResponse:
+        """List instance Private Networks"""
+        return self._api.call("GET", f"/instances/{_quote(instance_id)}/private-networks", params={"per_page": per_page, "cursor": cursor}, route="/instances/{instance-id}/private-networks")
+
+    def list_instance_vpcs(self, instance_id: str, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListInstanceVpcsResponse:
+        """List instance VPCs"""
+        return self._api.call("GET", f"/instances/{_quote(instance_id)}/vpcs", params={"per_page": per_page, "cursor": cursor}, route="/instances/{instance-id}/vpcs")
+
+    def list_instance_vpc2(self, instance_id: str, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListInstanceVpc2Response:
+        """List Instance VPC 2.0 Networks"""
+        return self._api.call("GET", f"/instances/{_quote(instance_id)}/vpc2", params={"per_page": per_page, "cursor": cursor}, route="/instances/{instance-id}/vpc2")
+
+    def get_instance_iso_status(self, instance_id: str) -> GetInstanceIsoStatusResponse:
+        """Get Instance ISO Status"""
+        return self._api.call("GET", f"/instances/{_quote(instance_id)}/iso", route="/instances/{instance-id}/iso")
+
+    def attach_instance_iso(self, instance_id: str, body: Optional[AttachInstanceIsoRequest] = None) -> AttachInstanceIsoResponse:
+        """Attach ISO to Instance"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/iso/attach", json=body, route="/instances/{instance-id}/iso/attach")
+
+    def detach_instance_iso(self, instance_id: str) -> DetachInstanceIsoResponse:
+        """Detach ISO from instance"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/iso/detach", route="/instances/{instance-id}/iso/detach")
+
+    def attach_instance_network(self, instance_id: str, body: Optional[AttachInstanceNetworkRequest] = None) -> None:
+        """Attach Private Network to Instance"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/private-networks/attach", json=body, route="/instances/{instance-id}/private-networks/attach")
+
+    def detach_instance_network(self, instance_id: str, body: Optional[DetachInstanceNetworkRequest] = None) -> None:
+        """Detach Private Network from Instance."""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/private-networks/detach", json=body, route="/instances/{instance-id}/private-networks/detach")
+
+    def attach_instance_vpc(self, instance_id: str, body: Optional[AttachInstanceVpcRequest] = None) -> None:
+        """Attach VPC to Instance"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/vpcs/attach", json=body, route="/instances/{instance-id}/vpcs/attach")
+
+    def detach_instance_vpc(self, instance_id: str, body: Optional[DetachInstanceVpcRequest] = None) -> None:
+        """Detach VPC from Instance"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/vpcs/detach", json=body, route="/instances/{instance-id}/vpcs/detach")
+
+    def attach_instance_vpc2(self, instance_id: str, body: Optional[AttachInstanceVpc2Request] = None) -> None:
+        """Attach VPC 2.0 Network to Instance"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/vpc2/attach", json=body, route="/instances/{instance-id}/vpc2/attach")
+
+    def detach_instance_vpc2(self, instance_id: str, body: Optional[DetachInstanceVpc2Request] = None) -> None:
+        """Detach VPC 2.0 Network from Instance"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/vpc2/detach", json=body, route="/instances/{instance-id}/vpc2/detach")
+
+    def get_instance_backup_schedule(self, instance_id: str) -> GetInstanceBackupScheduleResponse:
+        """Get Instance Backup Schedule"""
+        return self._api.call("GET", f"/instances/{_quote(instance_id)}/backup-schedule", route="/instances/{instance-id}/backup-schedule")
+
+    def create_instance_backup_schedule(self, instance_id: str, body: Optional[CreateInstanceBackupScheduleRequest] = None) -> None:
+        """Set Instance Backup Schedule"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/backup-schedule", json=body, route="/instances/{instance-id}/backup-schedule")
+
+    def restore_instance(self, instance_id: str, body: Optional[RestoreInstanceRequest] = None) -> RestoreInstanceResponse:
+        """Restore Instance"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/restore", json=body, route="/instances/{instance-id}/restore")
+
+    def get_instance_ipv4(self, instance_id: str, *, public_network: Optional[bool] = None, per_page: Optional[int] = None, cursor: Optional[str] = None) -> GetInstanceIpv4Response:
+        """List Instance IPv4 Information"""
+        return self._api.call("GET", f"/instances/{_quote(instance_id)}/ipv4", params={"public_network": public_network, "per_page": per_page, "cursor": cursor}, route="/instances/{instance-id}/ipv4")
+
+    def create_instance_ipv4(self, instance_id: str, body: Optional[CreateInstanceIpv4Request] = None) -> Any:
+        """Create IPv4"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/ipv4", json=body, route="/instances/{instance-id}/ipv4")
+
+    def get_instance_ipv6(self, instance_id: str) -> GetInstanceIpv6Response:
+        """Get Instance IPv6 Information"""
+        return self._api.call("GET", f"/instances/{_quote(instance_id)}/ipv6", route="/instances/{instance-id}/ipv6")
+
+    def list_instance_ipv6_reverse(self, instance_id: str) -> ListInstanceIpv6ReverseResponse:
+        """List Instance IPv6 Reverse"""
+        return self._api.call("GET", f"/instances/{_quote(instance_id)}/ipv6/reverse", route="/instances/{instance-id}/ipv6/reverse")
+
+    def create_instance_reverse_ipv6(self, instance_id: str, body: Optional[CreateInstanceReverseIpv6Request] = None) -> None:
+        """Create Instance Reverse IPv6"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/ipv6/reverse", json=body, route="/instances/{instance-id}/ipv6/reverse")
+
+    def create_instance_reverse_ipv4(self, instance_id: str, body: Optional[CreateInstanceReverseIpv4Request] = None) -> None:
+        """Create Instance Reverse IPv4"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/ipv4/reverse", json=body, route="/instances/{instance-id}/ipv4/reverse")
+
+    def get_instance_userdata(self, instance_id: str) -> GetInstanceUserdataResponse:
+        """Get Instance User Data"""
+        return self._api.call("GET", f"/instances/{_quote(instance_id)}/user-data", route="/instances/{instance-id}/user-data")
+
+    def halt_instance(self, instance_id: str) -> None:
+        """Halt Instance"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/halt", route="/instances/{instance-id}/halt")
+
+    def post_instances_instance_id_ipv4_reverse_default(self, instance_id: str, body: Optional[PostInstancesInstanceIdIpv4ReverseDefaultRequest] = None) -> None:
+        """Set Default Reverse DNS Entry"""
+        return self._api.call("POST", f"/instances/{_quote(instance_id)}/ipv4/reverse/default", json=body, route="/instances/{instance-id}/ipv4/reverse/default")
+
+    def delete_instance_ipv4(self, instance_id: str, ipv4: str) -> None:
+        """Delete IPv4 Address"""
+        return self._api.call("DELETE", f"/instances/{_quote(instance_id)}/ipv4/{_quote(ipv4)}", route="/instances/{instance-id}/ipv4/{ipv4}")
+
+    def delete_instance_reverse_ipv6(self, instance_id: str, ipv6: str) -> None:
+        """Delete Instance Reverse IPv6"""
+        return self._api.call("DELETE", f"/instances/{_quote(instance_id)}/ipv6/reverse/{_quote(ipv6)}", route="/instances/{instance-id}/ipv6/reverse/{ipv6}")
+
+    def get_instance_upgrades(self, instance_id: str, *, type: Optional[str] = None) -> GetInstanceUpgradesResponse:
+        """Get Available Instance Upgrades"""
+        return self._api.call("GET", f"/instances/{_quote(instance_id)}/upgrades", params={"type": type}, route="/instances/{instance-id}/upgrades")
+
+    def get_instance_job(self, job_id: str) -> GetInstanceJobResponse:
+        """Get Instance Job"""
+        return self._api.call("GET", f"/instances/jobs/{_quote(job_id)}", route="/instances/jobs/{job-id}")
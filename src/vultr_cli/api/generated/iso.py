@@ -0,0 +1,53 @@
+"""The ``iso`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Iso, IsoPublic, Meta
+
+
+ListIsosResponse = TypedDict("ListIsosResponse", {"isos": "List[Iso]", "meta": "Meta"}, total=False)
+ListIsosResponse.__doc__ = "Response of list_isos()."
+
+CreateIsoRequest = TypedDict("CreateIsoRequest", {"url": "str"}, total=False)
+CreateIsoRequest.__doc__ = "Request body of create_iso()."
+
+CreateIsoResponse = TypedDict("CreateIsoResponse", {"iso": "Iso"}, total=False)
+CreateIsoResponse.__doc__ = "Response of create_iso()."
+
+IsoGetResponse = TypedDict("IsoGetResponse", {"iso": "Iso"}, total=False)
+IsoGetResponse.__doc__ = "Response of iso_get()."
+
+ListPublicIsosResponse = TypedDict("ListPublicIsosResponse", {"public_isos": "List[IsoPublic]", "meta": "Meta"}, total=False)
+ListPublicIsosResponse.__doc__ = "Response of list_public_isos()."
+
+
+class IsoResource(Resource):
+    """Operations tagged ``iso``."""
+
+    def list_isos(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListIsosResponse:
+        """List ISOs"""
+        return self._api.call("GET", "/iso", params={"per_page": per_page, "cursor": cursor})
+
+    def create_iso(self, body: Optional[CreateIsoRequest] = None) -> CreateIsoResponse:
+        """Create ISO"""
+        return self._api.call("POST", "/iso", json=body)
+
+    def iso_get(self, iso_id: str) -> IsoGetResponse:
+        """Get ISO"""
+        return self._api.call("GET", f"/iso/{_quote(iso_id)}", route="/iso/{iso-id}")
+
+    def delete_iso(self, iso_id: str) -> None:
+        """Delete ISO"""
+        return self._api.call("DELETE", f"/iso/{_quote(iso_id)}", route="/iso/{iso-id}")
+
+    def list_public_isos(self) -> ListPublicIsosResponse:
+        """List Public ISOs"""
+        return self._api.call("GET", "/iso-public")
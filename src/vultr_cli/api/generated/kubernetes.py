@@ -0,0 +1,138 @@
+"""The ``kubernetes`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Nodepools, VkeCluster
+
+
+ListKubernetesClustersResponse = TypedDict("ListKubernetesClustersResponse", {"vke_clusters": "List[VkeCluster]"}, total=False)
+ListKubernetesClustersResponse.__doc__ = "Response of list_kubernetes_clusters()."
+
+CreateKubernetesClusterRequest = TypedDict("CreateKubernetesClusterRequest", {"label": "str", "region": "str", "version": "str", "vpc_id": "str", "ha_controlplanes": "bool", "enable_firewall": "bool", "oidc": "Dict[str, Any]", "node_pools": "List[Dict[str, Any]]"}, total=False)
+CreateKubernetesClusterRequest.__doc__ = "Request body of create_kubernetes_cluster()."
+
+CreateKubernetesClusterResponse = TypedDict("CreateKubernetesClusterResponse", {"vke_cluster": "VkeCluster"}, total=False)
+CreateKubernetesClusterResponse.__doc__ = "Response of create_kubernetes_cluster()."
+
+GetKubernetesClustersResponse = TypedDict("GetKubernetesClustersResponse", {"vke_cluster": "VkeCluster"}, total=False)
+GetKubernetesClustersResponse.__doc__ = "Response of get_kubernetes_clusters()."
+
+UpdateKubernetesClusterRequest = TypedDict("UpdateKubernetesClusterRequest", {"label": "str", "oidc": "Dict[str, Any]"}, total=False)
+UpdateKubernetesClusterRequest.__doc__ = "Request body of update_kubernetes_cluster()."
+
+GetKubernetesResourcesResponse = TypedDict("GetKubernetesResourcesResponse", {"resources": "Dict[str, Any]"}, total=False)
+GetKubernetesResourcesResponse.__doc__ = "Response of get_kubernetes_resources()."
+
+GetKubernetesAvailableUpgradesResponse = TypedDict("GetKubernetesAvailableUpgradesResponse", {"available_upgrades": "List[str]"}, total=False)
+GetKubernetesAvailableUpgradesResponse.__doc__ = "Response of get_kubernetes_available_upgrades()."
+
+StartKubernetesClusterUpgradeRequest = TypedDict("StartKubernetesClusterUpgradeRequest", {"upgrade_version": "str"}, total=False)
+StartKubernetesClusterUpgradeRequest.__doc__ = "Request body of start_kubernetes_cluster_upgrade()."
+
+GetNodepoolsResponse = TypedDict("GetNodepoolsResponse", {"node_pools": "List[Nodepools]"}, total=False)
+GetNodepoolsResponse.__doc__ = "Response of get_nodepools()."
+
+CreateNodepoolsRequest = TypedDict("CreateNodepoolsRequest", {"node_quantity": "int", "label": "str", "plan": "str", "tag": "str", "auto_scaler": "bool", "min_nodes": "int", "max_nodes": "int", "labels": "Dict[str, Any]", "taints": "List[Any]", "user_data": "str"}, total=False)
+CreateNodepoolsRequest.__doc__ = "Request body of create_nodepools()."
+
+CreateNodepoolsResponse = TypedDict("CreateNodepoolsResponse", {"node_pool": "Nodepools"}, total=False)
+CreateNodepoolsResponse.__doc__ = "Response of create_nodepools()."
+
+GetNodepoolResponse = TypedDict("GetNodepoolResponse", {"node_pool": "Nodepools"}, total=False)
+GetNodepoolResponse.__doc__ = "Response of get_nodepool()."
+
+UpdateNodepoolRequest = TypedDict("UpdateNodepoolRequest", {"node_quantity": "int", "tag": "str", "auto_scaler": "bool", "min_nodes": "int", "max_nodes": "int", "labels": "Dict[str, Any]", "taints": "List[Any]", "user_data": "str"}, total=False)
+UpdateNodepoolRequest.__doc__ = "Request body of update_nodepool()."
+
+UpdateNodepoolResponse = TypedDict("UpdateNodepoolResponse", {"node_pool": "Nodepools"}, total=False)
+UpdateNodepoolResponse.__doc__ = "Response of update_nodepool()."
+
+GetKubernetesClustersConfigResponse = TypedDict("GetKubernetesClustersConfigResponse", {"kube_config": "str"}, total=False)
+GetKubernetesClustersConfigResponse.__doc__ = "Response of get_kubernetes_clusters_config()."
+
+GetKubernetesVersionsResponse = TypedDict("GetKubernetesVersionsResponse", {"versions": "List[str]"}, total=False)
+GetKubernetesVersionsResponse.__doc__ = "Response of get_kubernetes_versions()."
+
+
+class KubernetesResource(Resource):
+    """Operations tagged ``kubernetes``."""
+
+    def list_kubernetes_clusters(self) -> ListKubernetesClustersResponse:
+        """List all Kubernetes Clusters"""
+        return self._api.call("GET", "/kubernetes/clusters")
+
+    def create_kubernetes_cluster(self, body: Optional[CreateKubernetesClusterRequest] = None) -> CreateKubernetesClusterResponse:
+        """Create Kubernetes Cluster"""
+        return self._api.call("POST", "/kubernetes/clusters", json=body)
+
+    def get_kubernetes_clusters(self, vke_id: str) -> GetKubernetesClustersResponse:
+        """Get Kubernetes Cluster"""
+        return self._api.call("GET", f"/kubernetes/clusters/{_quote(vke_id)}", route="/kubernetes/clusters/{vke-id}")
+
+    def update_kubernetes_cluster(self, vke_id: str, body: Optional[UpdateKubernetesClusterRequest] = None) -> None:
+        """Update Kubernetes Cluster"""
+        return self._api.call("PUT", f"/kubernetes/clusters/{_quote(vke_id)}", json=body, route="/kubernetes/clusters/{vke-id}")
+
+    def delete_kubernetes_cluster(self, vke_id: str) -> None:
+        """Delete Kubernetes Cluster"""
+        return self._api.call("DELETE", f"/kubernetes/clusters/{_quote(vke_id)}", route="/kubernetes/clusters/{vke-id}")
+
+    def delete_kubernetes_cluster_vke_id_delete_with_linked_resources(self, vke_id: str) -> None:
+        """Delete VKE Cluster and All Related Resources"""
+        return self._api.call("DELETE", f"/kubernetes/clusters/{_quote(vke_id)}/delete-with-linked-resources", route="/kubernetes/clusters/{vke-id}/delete-with-linked-resources")
+
+    def get_kubernetes_resources(self, vke_id: str) -> GetKubernetesResourcesResponse:
+        """Get Kubernetes Resources"""
+        return self._api.call("GET", f"/kubernetes/clusters/{_quote(vke_id)}/resources", route="/kubernetes/clusters/{vke-id}/resources")
+
+    def get_kubernetes_available_upgrades(self, vke_id: str) -> GetKubernetesAvailableUpgradesResponse:
+        """Get Kubernetes Available Upgrades"""
+        return self._api.call("GET", f"/kubernetes/clusters/{_quote(vke_id)}/available-upgrades", route="/kubernetes/clusters/{vke-id}/available-upgrades")
+
+    def start_kubernetes_cluster_upgrade(self, vke_id: str, body: Optional[StartKubernetesClusterUpgradeRequest] = None) -> None:
+        """Start Kubernetes Cluster Upgrade"""
+        return self._api.call("POST", f"/kubernetes/clusters/{_quote(vke_id)}/upgrades", json=body, route="/kubernetes/clusters/{vke-id}/upgrades")
+
+    def get_nodepools(self, vke_id: str) -> GetNodepoolsResponse:
+        """List NodePools"""
+        return self._api.call("GET", f"/kubernetes/clusters/{_quote(vke_id)}/node-pools", route="/kubernetes/clusters/{vke-id}/node-pools")
+
+    def create_nodepools(self, vke_id: str, body: Optional[CreateNodepoolsRequest] = None) -> CreateNodepoolsResponse:
+        """Create NodePool"""
+        return self._api.call("POST", f"/kubernetes/clusters/{_quote(vke_id)}/node-pools", json=body, route="/kubernetes/clusters/{vke-id}/node-pools")
+
+    def get_nodepool(self, vke_id: str, nodepool_id: str) -> GetNodepoolResponse:
+        """Get NodePool"""
+        return self._api.call("GET", f"/kubernetes/clusters/{_quote(vke_id)}/node-pools/{_quote(nodepool_id)}", route="/kubernetes/clusters/{vke-id}/node-pools/{nodepool-id}")
+
+    def update_nodepool(self, vke_id: str, nodepool_id: str, body: Optional[UpdateNodepoolRequest] = None) -> UpdateNodepoolResponse:
+        """Update Nodepool"""
+        return self._api.call("PATCH", f"/kubernetes/clusters/{_quote(vke_id)}/node-pools/{_quote(nodepool_id)}", json=body, route="/kubernetes/clusters/{vke-id}/node-pools/{nodepool-id}")
+
+    def delete_nodepool(self, vke_id: str, nodepool_id: str) -> None:
+        """Delete Nodepool"""
+        return self._api.call("DELETE", f"/kubernetes/clusters/{_quote(vke_id)}/node-pools/{_quote(nodepool_id)}", route="/kubernetes/clusters/{vke-id}/node-pools/{nodepool-id}")
+
+    def delete_nodepool_instance(self, vke_id: str, nodepool_id: str, node_id: str) -> None:
+        """Delete NodePool Instance"""
+        return self._api.call("DELETE", f"/kubernetes/clusters/{_quote(vke_id)}/node-pools/{_quote(nodepool_id)}/nodes/{_quote(node_id)}", route="/kubernetes/clusters/{vke-id}/node-pools/{nodepool-id}/nodes/{node-id}")
+
+    def recycle_nodepool_instance(self, vke_id: str, nodepool_id: str, node_id: str) -> None:
+        """Recycle a NodePool Instance"""
+        return self._api.call("POST", f"/kubernetes/clusters/{_quote(vke_id)}/node-pools/{_quote(nodepool_id)}/nodes/{_quote(node_id)}/recycle", route="/kubernetes/clusters/{vke-id}/node-pools/{nodepool-id}/nodes/{node-id}/recycle")
+
+    def get_kubernetes_clusters_config(self, vke_id: str) -> GetKubernetesClustersConfigResponse:
+        """Get Kubernetes Cluster Kubeconfig"""
+        return self._api.call("GET", f"/kubernetes/clusters/{_quote(vke_id)}/config", route="/kubernetes/clusters/{vke-id}/config")
+
+    def get_kubernetes_versions(self) -> GetKubernetesVersionsResponse:
+        """Get Kubernetes Versions"""
+        return self._api.call("GET", "/kubernetes/versions")
@@ -0,0 +1,94 @@
+"""The ``load-balancer`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import ForwardingRule, Loadbalancer, LoadbalancerFirewallRule, Meta
+
+
+ListLoadBalancersResponse = TypedDict("ListLoadBalancersResponse", {"load_balancers": "List[Loadbalancer]", "meta": "Meta"}, total=False)
+ListLoadBalancersResponse.__doc__ = "Response of list_load_balancers()."
+
+CreateLoadBalancerRequest = TypedDict("CreateLoadBalancerRequest", {"region": "str", "balancing_algorithm": "str", "ssl_redirect": "bool", "http2": "bool", "http3": "bool", "nodes": "int", "proxy_protocol": "bool", "timeout": "int", "health_check": "Dict[str, Any]", "forwarding_rules": "List[Dict[str, Any]]", "sticky_session": "Dict[str, Any]", "ssl": "Dict[str, Any]", "label": "str", "instances": "List[str]", "firewall_rules": "List[Dict[str, Any]]", "private_network": "str", "vpc": "str", "auto_ssl": "Dict[str, Any]", "global_regions": "List[Dict[str, Any]]"}, total=False)
+CreateLoadBalancerRequest.__doc__ = "Request body of create_load_balancer()."
+
+CreateLoadBalancerResponse = TypedDict("CreateLoadBalancerResponse", {"load_balancer": "Loadbalancer"}, total=False)
+CreateLoadBalancerResponse.__doc__ = "Response of create_load_balancer()."
+
+GetLoadBalancerResponse = TypedDict("GetLoadBalancerResponse", {"load_balancer": "Loadbalancer"}, total=False)
+GetLoadBalancerResponse.__doc__ = "Response of get_load_balancer()."
+
+UpdateLoadBalancerRequest = TypedDict("UpdateLoadBalancerRequest", {"ssl": "Dict[str, Any]", "sticky_session": "Dict[str, Any]", "forwarding_rules": "List[Dict[str, Any]]", "health_check": "Dict[str, Any]", "proxy_protocol": "bool", "timeout": "int", "ssl_redirect": "bool", "http2": "bool", "http3": "bool", "nodes": "int", "balancing_algorithm": "str", "instances": "List[str]", "label": "str", "private_network": "str", "vpc": "str", "firewall_rules": "List[Dict[str, Any]]", "auto_ssl": "Dict[str, Any]", "global_regions": "List[str]"}, total=False)
+UpdateLoadBalancerRequest.__doc__ = "Request body of update_load_balancer()."
+
+ListLoadBalancerForwardingRulesResponse = TypedDict("ListLoadBalancerForwardingRulesResponse", {"forwarding_rules": "List[ForwardingRule]", "meta": "Meta"}, total=False)
+ListLoadBalancerForwardingRulesResponse.__doc__ = "Response of list_load_balancer_forwarding_rules()."
+
+CreateLoadBalancerForwardingRulesRequest = TypedDict("CreateLoadBalancerForwardingRulesRequest", {"frontend_protocol": "str", "frontend_port": "int", "backend_protocol": "str", "backend_port": "int"}, total=False)
+CreateLoadBalancerForwardingRulesRequest.__doc__ = "Request body of create_load_balancer_forwarding_rules()."
+
+GetLoadBalancerForwardingRuleResponse = TypedDict("GetLoadBalancerForwardingRuleResponse", {"forwarding_rule": "ForwardingRule"}, total=False)
+GetLoadBalancerForwardingRuleResponse.__doc__ = "Response of get_load_balancer_forwarding_rule()."
+
+
+class LoadBalancerResource(Resource):
+    """Operations tagged ``load-balancer``."""
+
+    def list_load_balancers(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListLoadBalancersResponse:
+        """List Load Balancers"""
+        return self._api.call("GET", "/load-balancers", params={"per_page": per_page, "cursor": cursor})
+
+    def create_load_balancer(self, body: Optional[CreateLoadBalancerRequest] = None) -> CreateLoadBalancerResponse:
+        """Create Load Balancer"""
+        return self._api.call("POST", "/load-balancers", json=body)
+
+    def get_load_balancer(self, load_balancer_id: str) -> GetLoadBalancerResponse:
+        """Get Load Balancer"""
+        return self._api.call("GET", f"/load-balancers/{_quote(load_balancer_id)}", route="/load-balancers/{load-balancer-id}")
+
+    def update_load_balancer(self, load_balancer_id: str, body: Optional[UpdateLoadBalancerRequest] = None) -> None:
+        """Update Load Balancer"""
+        return self._api.call("PATCH", f"/load-balancers/{_quote(load_balancer_id)}", json=body, route="/load-balancers/{load-balancer-id}")
+
+    def delete_load_balancer(self, load_balancer_id: str) -> None:
+        """Delete Load Balancer"""
+        return self._api.call("DELETE", f"/load-balancers/{_quote(load_balancer_id)}", route="/load-balancers/{load-balancer-id}")
+
+    def delete_load_balancer_ssl(self, load_balancer_id: str) -> None:
+        """Delete Load Balancer SSL"""
+        return self._api.call("DELETE", f"/load-balancers/{_quote(load_balancer_id)}/ssl", route="/load-balancers/{load-balancer-id}/ssl")
+
+    def delete_load_balancer_auto_ssl(self, load_balancer_id: str) -> None:
+        """Disable Load Balancer Auto SSL"""
+        return self._api.call("DELETE", f"/load-balancers/{_quote(load_balancer_id)}/auto_ssl", route="/load-balancers/{load-balancer-id}/auto_ssl")
+
+    def list_load_balancer_forwarding_rules(self, load_balancer_id: str, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListLoadBalancerForwardingRulesResponse:
+        """List Forwarding Rules"""
+        return self._api.call("GET", f"/load-balancers/{_quote(load_balancer_id)}/forwarding-rules", params={"per_page": per_page, "cursor": cursor}, route="/load-balancers/{load-balancer-id}/forwarding-rules")
+
+    def create_load_balancer_forwarding_rules(self, load_balancer_id: str, body: Optional[CreateLoadBalancerForwardingRulesRequest] = None) -> None:
+        """Create Forwarding Rule"""
+        return self._api.call("POST", f"/load-balancers/{_quote(load_balancer_id)}/forwarding-rules", json=body, route="/load-balancers/{load-balancer-id}/forwarding-rules")
+
+    def get_load_balancer_forwarding_rule(self, load_balancer_id: str, forwarding_rule_id: str) -> GetLoadBalancerForwardingRuleResponse:
+        """Get Forwarding Rule"""
+        return self._api.call("GET", f"/load-balancers/{_quote(load_balancer_id)}/forwarding-rules/{_quote(forwarding_rule_id)}", route="/load-balancers/{load-balancer-id}/forwarding-rules/{forwarding-rule-id}")
+
+    def delete_load_balancer_forwarding_rule(self, load_balancer_id: str, forwarding_rule_id: str) -> None:
+        """Delete Forwarding Rule"""
+        return self._api.call("DELETE", f"/load-balancers/{_quote(load_balancer_id)}/forwarding-rules/{_quote(forwarding_rule_id)}", route="/load-balancers/{load-balancer-id}/forwarding-rules/{forwarding-rule-id}")
+
+    def list_loadbalancer_firewall_rules(self, loadbalancer_id: str, *, per_page: Optional[str] = None, cursor: Optional[str] = None) -> LoadbalancerFirewallRule:
+        """List Firewall Rules"""
+        return self._api.call("GET", f"/load-balancers/{_quote(loadbalancer_id)}/firewall-rules", params={"per_page": per_page, "cursor": cursor}, route="/load-balancers/{loadbalancer-id}/firewall-rules")
+
+    def get_loadbalancer_firewall_rule(self, loadbalancer_id: str, firewall_rule_id: str) -> LoadbalancerFirewallRule:
+        """Get Firewall Rule"""
+        return self._api.call("GET", f"/load-balancers/{_quote(loadbalancer_id)}/firewall-rules/{_quote(firewall_rule_id)}", route="/load-balancers/{loadbalancer-id}/firewall-rules/{firewall-rule-id}")
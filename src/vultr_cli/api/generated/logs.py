@@ -0,0 +1,25 @@
+"""The ``logs`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Log, LogMeta
+
+
+ListLogsResponse = TypedDict("ListLogsResponse", {"logs": "List[Log]", "meta": "LogMeta"}, total=False)
+ListLogsResponse.__doc__ = "Response of list_logs()."
+
+
+class LogsResource(Resource):
+    """Operations tagged ``logs``."""
+
+    def list_logs(self, *, start_time: Optional[str] = None, end_time: Optional[str] = None, log_level: Optional[str] = None, resource_type: Optional[str] = None, resource_id: Optional[str] = None) -> ListLogsResponse:
+        """List Logs"""
+        return self._api.call("GET", "/logs", params={"start_time": start_time, "end_time": end_time, "log_level": log_level, "resource_type": resource_type, "resource_id": resource_id})
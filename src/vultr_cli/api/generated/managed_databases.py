@@ -0,0 +1,491 @@
+"""The ``managed-databases`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import ConnectionPool, Database, DatabaseAvailableConnector, DatabaseConnections, DatabaseConnector, DatabaseConnectorConfigurationSchema, DatabaseConnectorStatus, DatabaseDb, DatabaseLatestBackup, DatabaseOldestBackup, DatabaseQuota, DatabaseTopic, DatabaseUsage, DatabaseUser, DbaasAlerts, DbaasAvailableOptions, DbaasMeta, DbaasMigration, DbaasPlan, KafkaConnectAdvancedOptions, KafkaRestAdvancedOptions, SchemaRegistryAdvancedOptions
+
+
+ListDatabasePlansResponse = TypedDict("ListDatabasePlansResponse", {"plans": "List[DbaasPlan]"}, total=False)
+ListDatabasePlansResponse.__doc__ = "Response of list_database_plans()."
+
+ListDatabasesResponse = TypedDict("ListDatabasesResponse", {"databases": "List[Database]", "meta": "DbaasMeta"}, total=False)
+ListDatabasesResponse.__doc__ = "Response of list_databases()."
+
+CreateDatabaseRequest = TypedDict("CreateDatabaseRequest", {"database_engine": "str", "database_engine_version": "str", "region": "str", "plan": "str", "label": "str", "tag": "str", "vpc_id": "str", "maintenance_dow": "str", "maintenance_time": "str", "backup_hour": "str", "backup_minute": "str", "trusted_ips": "List[str]", "mysql_sql_modes": "List[str]", "mysql_require_primary_key": "bool", "mysql_slow_query_log": "bool", "mysql_long_query_time": "int", "redis_eviction_policy": "str", "eviction_policy": "str", "enable_kafka_rest": "bool", "enable_schema_registry": "bool", "enable_kafka_connect": "bool"}, total=False)
+CreateDatabaseRequest.__doc__ = "Request body of create_database()."
+
+CreateDatabaseResponse = TypedDict("CreateDatabaseResponse", {"database": "Database"}, total=False)
+CreateDatabaseResponse.__doc__ = "Response of create_database()."
+
+GetDatabaseResponse = TypedDict("GetDatabaseResponse", {"database": "Database"}, total=False)
+GetDatabaseResponse.__doc__ = "Response of get_database()."
+
+UpdateDatabaseRequest = TypedDict("UpdateDatabaseRequest", {"region": "str", "plan": "str", "label": "str", "tag": "str", "vpc_id": "str", "maintenance_dow": "str", "maintenance_time": "str", "backup_hour": "str", "backup_minute": "str", "cluster_time_zone": "str", "trusted_ips": "List[str]", "mysql_sql_modes": "List[str]", "mysql_require_primary_key": "bool", "mysql_slow_query_log": "bool", "mysql_long_query_time": "int", "redis_eviction_policy": "str", "eviction_policy": "str", "enable_kafka_rest": "bool", "enable_schema_registry": "bool", "enable_kafka_connect": "bool"}, total=False)
+UpdateDatabaseRequest.__doc__ = "Request body of update_database()."
+
+UpdateDatabaseResponse = TypedDict("UpdateDatabaseResponse", {"database": "Database"}, total=False)
+UpdateDatabaseResponse.__doc__ = "Response of update_database()."
+
+GetDatabaseUsageResponse = TypedDict("GetDatabaseUsageResponse", {"usage": "DatabaseUsage"}, total=False)
+GetDatabaseUsageResponse.__doc__ = "Response of get_database_usage()."
+
+ListDatabaseUsersResponse = TypedDict("ListDatabaseUsersResponse", {"users": "List[DatabaseUser]", "meta": "DbaasMeta"}, total=False)
+ListDatabaseUsersResponse.__doc__ = "Response of list_database_users()."
+
+CreateDatabaseUserRequest = TypedDict("CreateDatabaseUserRequest", {"username": "str", "password": "str", "encryption": "str", "permission": "str"}, total=False)
+CreateDatabaseUserRequest.__doc__ = "Request body of create_database_user()."
+
+CreateDatabaseUserResponse = TypedDict("CreateDatabaseUserResponse", {"user": "DatabaseUser"}, total=False)
+CreateDatabaseUserResponse.__doc__ = "Response of create_database_user()."
+
+GetDatabaseUserResponse = TypedDict("GetDatabaseUserResponse", {"user": "DatabaseUser"}, total=False)
+GetDatabaseUserResponse.__doc__ = "Response of get_database_user()."
+
+UpdateDatabaseUserRequest = TypedDict("UpdateDatabaseUserRequest", {"password": "str"}, total=False)
+UpdateDatabaseUserRequest.__doc__ = "Request body of update_database_user()."
+
+UpdateDatabaseUserResponse = TypedDict("UpdateDatabaseUserResponse", {"user": "DatabaseUser"}, total=False)
+UpdateDatabaseUserResponse.__doc__ = "Response of update_database_user()."
+
+SetDatabaseUserAclResponse = TypedDict("SetDatabaseUserAclResponse", {"user": "DatabaseUser"}, total=False)
+SetDatabaseUserAclResponse.__doc__ = "Response of set_database_user_acl()."
+
+ListDatabaseDbsResponse = TypedDict("ListDatabaseDbsResponse", {"dbs": "List[DatabaseDb]", "meta": "DbaasMeta"}, total=False)
+ListDatabaseDbsResponse.__doc__ = "Response of list_database_dbs()."
+
+CreateDatabaseDbRequest = TypedDict("CreateDatabaseDbRequest", {"name": "str"}, total=False)
+CreateDatabaseDbRequest.__doc__ = "Request body of create_database_db()."
+
+CreateDatabaseDbResponse = TypedDict("CreateDatabaseDbResponse", {"db": "DatabaseDb"}, total=False)
+CreateDatabaseDbResponse.__doc__ = "Response of create_database_db()."
+
+GetDatabaseDbResponse = TypedDict("GetDatabaseDbResponse", {"db": "DatabaseDb"}, total=False)
+GetDatabaseDbResponse.__doc__ = "Response of get_database_db()."
+
+ListDatabaseTopicsResponse = TypedDict("ListDatabaseTopicsResponse", {"topics": "List[DatabaseTopic]", "meta": "DbaasMeta"}, total=False)
+ListDatabaseTopicsResponse.__doc__ = "Response of list_database_topics()."
+
+CreateDatabaseTopicRequest = TypedDict("CreateDatabaseTopicRequest", {"name": "str", "partitions": "int", "replication": "int", "retention_hours": "int", "retention_bytes": "int"}, total=False)
+CreateDatabaseTopicRequest.__doc__ = "Request body of create_database_topic()."
+
+CreateDatabaseTopicResponse = TypedDict("CreateDatabaseTopicResponse", {"topic": "DatabaseTopic"}, total=False)
+CreateDatabaseTopicResponse.__doc__ = "Response of create_database_topic()."
+
+GetDatabaseTopicResponse = TypedDict("GetDatabaseTopicResponse", {"topic": "DatabaseTopic"}, total=False)
+GetDatabaseTopicResponse.__doc__ = "Response of get_database_topic()."
+
+UpdateDatabaseTopicRequest = TypedDict("UpdateDatabaseTopicRequest", {"partitions": "int", "replication": "int", "retention_hours": "int", "retention_bytes": "int"}, total=False)
+UpdateDatabaseTopicRequest.__doc__ = "Request body of update_database_topic()."
+
+UpdateDatabaseTopicResponse = TypedDict("UpdateDatabaseTopicResponse", {"topic": "DatabaseTopic"}, total=False)
+UpdateDatabaseTopicResponse.__doc__ = "Response of update_database_topic()."
+
+ListDatabaseQuotasResponse = TypedDict("ListDatabaseQuotasResponse", {"quotas": "List[DatabaseQuota]", "meta": "DbaasMeta"}, total=False)
+ListDatabaseQuotasResponse.__doc__ = "Response of list_database_quotas()."
+
+CreateDatabaseQuotaRequest = TypedDict("CreateDatabaseQuotaRequest", {"client_id": "str", "user": "str", "consumer_byte_rate": "int", "producer_byte_rate": "int", "request_percentage": "int"}, total=False)
+CreateDatabaseQuotaRequest.__doc__ = "Request body of create_database_quota()."
+
+CreateDatabaseQuotaResponse = TypedDict("CreateDatabaseQuotaResponse", {"quota": "DatabaseQuota"}, total=False)
+CreateDatabaseQuotaResponse.__doc__ = "Response of create_database_quota()."
+
+GetDatabaseQuotaResponse = TypedDict("GetDatabaseQuotaResponse", {"quota": "DatabaseQuota"}, total=False)
+GetDatabaseQuotaResponse.__doc__ = "Response of get_database_quota()."
+
+UpdateDatabaseQuotaRequest = TypedDict("UpdateDatabaseQuotaRequest", {"consumer_byte_rate": "int", "producer_byte_rate": "int", "request_percentage": "int"}, total=False)
+UpdateDatabaseQuotaRequest.__doc__ = "Request body of update_database_quota()."
+
+UpdateDatabaseQuotaResponse = TypedDict("UpdateDatabaseQuotaResponse", {"quota": "DatabaseQuota"}, total=False)
+UpdateDatabaseQuotaResponse.__doc__ = "Response of update_database_quota()."
+
+ListDatabaseAvailableConnectorsResponse = TypedDict("ListDatabaseAvailableConnectorsResponse", {"available_connectors": "List[DatabaseAvailableConnector]"}, total=False)
+ListDatabaseAvailableConnectorsResponse.__doc__ = "Response of list_database_available_connectors()."
+
+GetDatabaseConnectorConfigurationSchemaResponse = TypedDict("GetDatabaseConnectorConfigurationSchemaResponse", {"configuration_schema": "List[DatabaseConnectorConfigurationSchema]"}, total=False)
+GetDatabaseConnectorConfigurationSchemaResponse.__doc__ = "Response of get_database_connector_configuration_schema()."
+
+ListDatabaseConnectorsResponse = TypedDict("ListDatabaseConnectorsResponse", {"connectors": "List[DatabaseConnector]", "meta": "DbaasMeta"}, total=False)
+ListDatabaseConnectorsResponse.__doc__ = "Response of list_database_connectors()."
+
+CreateDatabaseConnectorRequest = TypedDict("CreateDatabaseConnectorRequest", {"name": "str", "class": "str", "topics": "str", "config": "Dict[str, Any]"}, total=False)
+CreateDatabaseConnectorRequest.__doc__ = "Request body of create_database_connector()."
+
+CreateDatabaseConnectorResponse = TypedDict("CreateDatabaseConnectorResponse", {"connector": "DatabaseConnector"}, total=False)
+CreateDatabaseConnectorResponse.__doc__ = "Response of create_database_connector()."
+
+GetDatabaseConnectorResponse = TypedDict("GetDatabaseConnectorResponse", {"connector": "DatabaseConnector"}, total=False)
+GetDatabaseConnectorResponse.__doc__ = "Response of get_database_connector()."
+
+UpdateDatabaseConnectorRequest = TypedDict("UpdateDatabaseConnectorRequest", {"topics": "str", "config": "Dict[str, Any]"}, total=False)
+UpdateDatabaseConnectorRequest.__doc__ = "Request body of update_database_connector()."
+
+UpdateDatabaseConnectorResponse = TypedDict("UpdateDatabaseConnectorResponse", {"connector": "DatabaseConnector"}, total=False)
+UpdateDatabaseConnectorResponse.__doc__ = "Response of update_database_connector()."
+
+GetDatabaseConnectorStatusResponse = TypedDict("GetDatabaseConnectorStatusResponse", {"connector_status": "DatabaseConnectorStatus"}, total=False)
+GetDatabaseConnectorStatusResponse.__doc__ = "Response of get_database_connector_status()."
+
+ListMaintenanceUpdatesResponse = TypedDict("ListMaintenanceUpdatesResponse", {"available_updates": "List[str]"}, total=False)
+ListMaintenanceUpdatesResponse.__doc__ = "Response of list_maintenance_updates()."
+
+StartMaintenanceUpdatesResponse = TypedDict("StartMaintenanceUpdatesResponse", {"message": "str"}, total=False)
+StartMaintenanceUpdatesResponse.__doc__ = "Response of start_maintenance_updates()."
+
+ListServiceAlertsRequest = TypedDict("ListServiceAlertsRequest", {"period": "str"}, total=False)
+ListServiceAlertsRequest.__doc__ = "Request body of list_service_alerts()."
+
+ListServiceAlertsResponse = TypedDict("ListServiceAlertsResponse", {"alerts": "DbaasAlerts"}, total=False)
+ListServiceAlertsResponse.__doc__ = "Response of list_service_alerts()."
+
+ViewMigrationStatusResponse = TypedDict("ViewMigrationStatusResponse", {"migration": "DbaasMigration"}, total=False)
+ViewMigrationStatusResponse.__doc__ = "Response of view_migration_status()."
+
+DatabaseStartMigrationRequest = TypedDict("DatabaseStartMigrationRequest", {"host": "str", "port": "int", "username": "str", "password": "str", "database": "str", "ignored_databases": "str", "ssl": "bool"}, total=False)
+DatabaseStartMigrationRequest.__doc__ = "Request body of database_start_migration()."
+
+DatabaseStartMigrationResponse = TypedDict("DatabaseStartMigrationResponse", {"migration": "DbaasMigration"}, total=False)
+DatabaseStartMigrationResponse.__doc__ = "Response of database_start_migration()."
+
+DatabaseAddReadReplicaRequest = TypedDict("DatabaseAddReadReplicaRequest", {"region": "str", "label": "str"}, total=False)
+DatabaseAddReadReplicaRequest.__doc__ = "Request body of database_add_read_replica()."
+
+DatabaseAddReadReplicaResponse = TypedDict("DatabaseAddReadReplicaResponse", {"database": "Database"}, total=False)
+DatabaseAddReadReplicaResponse.__doc__ = "Response of database_add_read_replica()."
+
+GetBackupInformationResponse = TypedDict("GetBackupInformationResponse", {"latest_backup": "DatabaseLatestBackup", "oldest_backup": "DatabaseOldestBackup"}, total=False)
+GetBackupInformationResponse.__doc__ = "Response of get_backup_information()."
+
+DatabaseRestoreFromBackupRequest = TypedDict("DatabaseRestoreFromBackupRequest", {"label": "str", "type": "str", "date": "str", "time": "str"}, total=False)
+DatabaseRestoreFromBackupRequest.__doc__ = "Request body of database_restore_from_backup()."
+
+DatabaseRestoreFromBackupResponse = TypedDict("DatabaseRestoreFromBackupResponse", {"database": "Database"}, total=False)
+DatabaseRestoreFromBackupResponse.__doc__ = "Response of database_restore_from_backup()."
+
+DatabaseForkRequest = TypedDict("DatabaseForkRequest", {"label": "str", "region": "str", "plan": "str", "vpc_id": "str", "type": "str", "date": "str", "time": "str"}, total=False)
+DatabaseForkRequest.__doc__ = "Request body of database_fork()."
+
+DatabaseForkResponse = TypedDict("DatabaseForkResponse", {"database": "Database"}, total=False)
+DatabaseForkResponse.__doc__ = "Response of database_fork()."
+
+ListConnectionPoolsResponse = TypedDict("ListConnectionPoolsResponse", {"connections": "DatabaseConnections", "connection_pools": "List[ConnectionPool]", "meta": "DbaasMeta"}, total=False)
+ListConnectionPoolsResponse.__doc__ = "Response of list_connection_pools()."
+
+CreateConnectionPoolRequest = TypedDict("CreateConnectionPoolRequest", {"name": "str", "database": "str", "username": "str", "mode": "str", "size": "int"}, total=False)
+CreateConnectionPoolRequest.__doc__ = "Request body of create_connection_pool()."
+
+CreateConnectionPoolResponse = TypedDict("CreateConnectionPoolResponse", {"connection_pool": "ConnectionPool"}, total=False)
+CreateConnectionPoolResponse.__doc__ = "Response of create_connection_pool()."
+
+GetConnectionPoolResponse = TypedDict("GetConnectionPoolResponse", {"connection_pool": "ConnectionPool"}, total=False)
+GetConnectionPoolResponse.__doc__ = "Response of get_connection_pool()."
+
+UpdateConnectionPoolRequest = TypedDict("UpdateConnectionPoolRequest", {"database": "str", "username": "str", "mode": "str", "size": "int"}, total=False)
+UpdateConnectionPoolRequest.__doc__ = "Request body of update_connection_pool()."
+
+UpdateConnectionPoolResponse = TypedDict("UpdateConnectionPoolResponse", {"connection_pool": "ConnectionPool"}, total=False)
+UpdateConnectionPoolResponse.__doc__ = "Response of update_connection_pool()."
+
+ListAdvancedOptionsResponse = TypedDict("ListAdvancedOptionsResponse", {"configured_options": "Dict[str, Any]", "available_options": "List[DbaasAvailableOptions]"}, total=False)
+ListAdvancedOptionsResponse.__doc__ = "Response of list_advanced_options()."
+
+UpdateAdvancedOptionsResponse = TypedDict("UpdateAdvancedOptionsResponse", {"configured_options": "Dict[str, Any]", "available_options": "List[DbaasAvailableOptions]"}, total=False)
+UpdateAdvancedOptionsResponse.__doc__ = "Response of update_advanced_options()."
+
+ListAdvancedOptionsKafkaRestResponse = TypedDict("ListAdvancedOptionsKafkaRestResponse", {"configured_options": "Dict[str, Any]", "available_options": "List[DbaasAvailableOptions]"}, total=False)
+ListAdvancedOptionsKafkaRestResponse.__doc__ = "Response of list_advanced_options_kafka_rest()."
+
+UpdateAdvancedOptionsKafkaRestResponse = TypedDict("UpdateAdvancedOptionsKafkaRestResponse", {"configured_options": "Dict[str, Any]", "available_options": "List[DbaasAvailableOptions]"}, total=False)
+UpdateAdvancedOptionsKafkaRestResponse.__doc__ = "Response of update_advanced_options_kafka_rest()."
+
+ListAdvancedOptionsSchemaRegistryResponse = TypedDict("ListAdvancedOptionsSchemaRegistryResponse", {"configured_options": "Dict[str, Any]", "available_options": "List[DbaasAvailableOptions]"}, total=False)
+ListAdvancedOptionsSchemaRegistryResponse.__doc__ = "Response of list_advanced_options_schema_registry()."
+
+UpdateAdvancedOptionsSchemaRegistryResponse = TypedDict("UpdateAdvancedOptionsSchemaRegistryResponse", {"configured_options": "Dict[str, Any]", "available_options": "List[DbaasAvailableOptions]"}, total=False)
+UpdateAdvancedOptionsSchemaRegistryResponse.__doc__ = "Response of update_advanced_options_schema_registry()."
+
+ListAdvancedOptionsKafkaConnectResponse = TypedDict("ListAdvancedOptionsKafkaConnectResponse", {"configured_options": "Dict[str, Any]", "available_options": "List[DbaasAvailableOptions]"}, total=False)
+ListAdvancedOptionsKafkaConnectResponse.__doc__ = "Response of list_advanced_options_kafka_connect()."
+
+UpdateAdvancedOptionsKafkaConnectResponse = TypedDict("UpdateAdvancedOptionsKafkaConnectResponse", {"configured_options": "Dict[str, Any]", "available_options": "List[DbaasAvailableOptions]"}, total=False)
+UpdateAdvancedOptionsKafkaConnectResponse.__doc__ = "Response of update_advanced_options_kafka_connect()."
+
+ListAvailableVersionsResponse = TypedDict("ListAvailableVersionsResponse", {"available_versions": "List[str]"}, total=False)
+ListAvailableVersionsResponse.__doc__ = "Response of list_available_versions()."
+
+StartVersionUpgradeRequest = TypedDict("StartVersionUpgradeRequest", {"version": "str"}, total=False)
+StartVersionUpgradeRequest.__doc__ = "Request body of start_version_upgrade()."
+
+StartVersionUpgradeResponse = TypedDict("StartVersionUpgradeResponse", {"message": "str"}, total=False)
+StartVersionUpgradeResponse.__doc__ = "Response of start_version_upgrade()."
+
+
+class ManagedDatabasesResource(Resource):
+    """Operations tagged ``managed-databases``."""
+
+    def list_database_plans(self, *, engine: Optional[str] = None, nodes: Optional[int] = None, region: Optional[str] = None) -> ListDatabasePlansResponse:
+        """List Managed Database Plans"""
+        return self._api.call("GET", "/databases/plans", params={"engine": engine, "nodes": nodes, "region": region})
+
+    def list_databases(self, *, label: Optional[str] = None, tag: Optional[str] = None, region: Optional[str] = None) -> ListDatabasesResponse:
+        """List Managed Databases"""
+        return self._api.call("GET", "/databases", params={"label": label, "tag": tag, "region": region})
+
+    def create_database(self, body: Optional[CreateDatabaseRequest] = None) -> CreateDatabaseResponse:
+        """Create Managed Database"""
+        return self._api.call("POST", "/databases", json=body)
+
+    def get_database(self, database_id: str) -> GetDatabaseResponse:
+        """Get Managed Database"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}", route="/databases/{database-id}")
+
+    def update_database(self, database_id: str, body: Optional[UpdateDatabaseRequest] = None) -> UpdateDatabaseResponse:
+        """Update Managed Database"""
+        return self._api.call("PUT", f"/databases/{_quote(database_id)}", json=body, route="/databases/{database-id}")
+
+    def delete_database(self, database_id: str) -> None:
+        """Delete Managed Database"""
+        return self._api.call("DELETE", f"/databases/{_quote(database_id)}", route="/databases/{database-id}")
+
+    def get_database_usage(self, database_id: str) -> GetDatabaseUsageResponse:
+        """Get Database Usage Information"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/usage", route="/databases/{database-id}/usage")
+
+    def list_database_users(self, database_id: str) -> ListDatabaseUsersResponse:
+        """List Database Users"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/users", route="/databases/{database-id}/users")
+
+    def create_database_user(self, database_id: str, body: Optional[CreateDatabaseUserRequest] = None) -> CreateDatabaseUserResponse:
+        """Create Database User"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/users", json=body, route="/databases/{database-id}/users")
+
+    def get_database_user(self, database_id: str, username: str) -> GetDatabaseUserResponse:
+        """Get Database User"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/users/{_quote(username)}", route="/databases/{database-id}/users/{username}")
+
+    def update_database_user(self, database_id: str, username: str, body: Optional[UpdateDatabaseUserRequest] = None) -> UpdateDatabaseUserResponse:
+        """Update Database User"""
+        return self._api.call("PUT", f"/databases/{_quote(database_id)}/users/{_quote(username)}", json=body, route="/databases/{database-id}/users/{username}")
+
+    def delete_database_user(self, database_id: str, username: str) -> None:
+        """Delete Database User"""
+        return self._api.call("DELETE", f"/databases/{_quote(database_id)}/users/{_quote(username)}", route="/databases/{database-id}/users/{username}")
+
+    def set_database_user_acl(self, database_id: str, username: str, body: Optional[Dict[str, Any]] = None) -> SetDatabaseUserAclResponse:
+        """Set Database User Access Control"""
+        return self._api.call("PUT", f"/databases/{_quote(database_id)}/users/{_quote(username)}/access-control", json=body, route="/databases/{database-id}/users/{username}/access-control")
+
+    def list_database_dbs(self, database_id: str) -> ListDatabaseDbsResponse:
+        """List Logical Databases"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/dbs", route="/databases/{database-id}/dbs")
+
+    def create_database_db(self, database_id: str, body: Optional[CreateDatabaseDbRequest] = None) -> CreateDatabaseDbResponse:
+        """Create Logical Database"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/dbs", json=body, route="/databases/{database-id}/dbs")
+
+    def get_database_db(self, database_id: str, db_name: str) -> GetDatabaseDbResponse:
+        """Get Logical Database"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/dbs/{_quote(db_name)}", route="/databases/{database-id}/dbs/{db-name}")
+
+    def delete_database_db(self, database_id: str, db_name: str) -> None:
+        """Delete Logical Database"""
+        return self._api.call("DELETE", f"/databases/{_quote(database_id)}/dbs/{_quote(db_name)}", route="/databases/{database-id}/dbs/{db-name}")
+
+    def list_database_topics(self, database_id: str) -> ListDatabaseTopicsResponse:
+        """List Database Topics"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/topics", route="/databases/{database-id}/topics")
+
+    def create_database_topic(self, database_id: str, body: Optional[CreateDatabaseTopicRequest] = None) -> CreateDatabaseTopicResponse:
+        """Create Database Topic"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/topics", json=body, route="/databases/{database-id}/topics")
+
+    def get_database_topic(self, database_id: str, topic_name: str) -> GetDatabaseTopicResponse:
+        """Get Database Topic"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/topics/{_quote(topic_name)}", route="/databases/{database-id}/topics/{topic-name}")
+
+    def update_database_topic(self, database_id: str, topic_name: str, body: Optional[UpdateDatabaseTopicRequest] = None) -> UpdateDatabaseTopicResponse:
+        """Update Database Topic"""
+        return self._api.call("PUT", f"/databases/{_quote(database_id)}/topics/{_quote(topic_name)}", json=body, route="/databases/{database-id}/topics/{topic-name}")
+
+    def delete_database_topic(self, database_id: str, topic_name: str) -> None:
+        """Delete Database Topic"""
+        return self._api.call("DELETE", f"/databases/{_quote(database_id)}/topics/{_quote(topic_name)}", route="/databases/{database-id}/topics/{topic-name}")
+
+    def list_database_quotas(self, database_id: str) -> ListDatabaseQuotasResponse:
+        """List Database Quotas"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/quotas", route="/databases/{database-id}/quotas")
+
+    def create_database_quota(self, database_id: str, body: Optional[CreateDatabaseQuotaRequest] = None) -> CreateDatabaseQuotaResponse:
+        """Create Database Quota"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/quotas", json=body, route="/databases/{database-id}/quotas")
+
+    def get_database_quota(self, database_id: str, client_id: str, username: str) -> GetDatabaseQuotaResponse:
+        """Get Database Quota"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/quotas/{_quote(client_id)}/{_quote(username)}", route="/databases/{database-id}/quotas/{client-id}/{username}")
+
+    def update_database_quota(self, database_id: str, client_id: str, username: str, body: Optional[UpdateDatabaseQuotaRequest] = None) -> UpdateDatabaseQuotaResponse:
+        """Update Database Quota"""
+        return self._api.call("PUT", f"/databases/{_quote(database_id)}/quotas/{_quote(client_id)}/{_quote(username)}", json=body, route="/databases/{database-id}/quotas/{client-id}/{username}")
+
+    def delete_database_quota(self, database_id: str, client_id: str, username: str) -> None:
+        """Delete Database Quota"""
+        return self._api.call("DELETE", f"/databases/{_quote(database_id)}/quotas/{_quote(client_id)}/{_quote(username)}", route="/databases/{database-id}/quotas/{client-id}/{username}")
+
+    def list_database_available_connectors(self, database_id: str) -> ListDatabaseAvailableConnectorsResponse:
+        """List Database Available Connectors"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/available-connectors", route="/databases/{database-id}/available-connectors")
+
+    def get_database_connector_configuration_schema(self, database_id: str, connector_class: str) -> GetDatabaseConnectorConfigurationSchemaResponse:
+        """Get Database Connector Configuration Schema"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/available-connectors/{_quote(connector_class)}/configuration", route="/databases/{database-id}/available-connectors/{connector-class}/configuration")
+
+    def list_database_connectors(self, database_id: str) -> ListDatabaseConnectorsResponse:
+        """List Database Connectors"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/connectors", route="/databases/{database-id}/connectors")
+
+    def create_database_connector(self, database_id: str, body: Optional[CreateDatabaseConnectorRequest] = None) -> CreateDatabaseConnectorResponse:
+        """Create Database Connector"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/connectors", json=body, route="/databases/{database-id}/connectors")
+
+    def get_database_connector(self, database_id: str, connector_name: str) -> GetDatabaseConnectorResponse:
+        """Get Database Connector"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/connectors/{_quote(connector_name)}", route="/databases/{database-id}/connectors/{connector-name}")
+
+    def update_database_connector(self, database_id: str, connector_name: str, body: Optional[UpdateDatabaseConnectorRequest] = None) -> UpdateDatabaseConnectorResponse:
+        """Update Database Connector"""
+        return self._api.call("PUT", f"/databases/{_quote(database_id)}/connectors/{_quote(connector_name)}", json=body, route="/databases/{database-id}/connectors/{connector-name}")
+
+    def delete_database_connector(self, database_id: str, connector_name: str) -> None:
+        """Delete Database Connector"""
+        return self._api.call("DELETE", f"/databases/{_quote(database_id)}/connectors/{_quote(connector_name)}", route="/databases/{database-id}/connectors/{connector-name}")
+
+    def get_database_connector_status(self, database_id: str, connector_name: str) -> GetDatabaseConnectorStatusResponse:
+        """Get Database Connector Status"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/connectors/{_quote(connector_name)}/status", route="/databases/{database-id}/connectors/{connector-name}/status")
+
+    def restart_database_connector(self, database_id: str, connector_name: str) -> None:
+        """Restart Database Connector"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/connectors/{_quote(connector_name)}/restart", route="/databases/{database-id}/connectors/{connector-name}/restart")
+
+    def pause_database_connector(self, database_id: str, connector_name: str) -> None:
+        """Pause Database Connector"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/connectors/{_quote(connector_name)}/pause", route="/databases/{database-id}/connectors/{connector-name}/pause")
+
+    def resume_database_connector(self, database_id: str, connector_name: str) -> None:
+        """Resume Database Connector"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/connectors/{_quote(connector_name)}/resume", route="/databases/{database-id}/connectors/{connector-name}/resume")
+
+    def restart_database_connector_task(self, database_id: str, connector_name: str, task_id: str) -> None:
+        """Restart Database Connector Task"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/connectors/{_quote(connector_name)}/tasks/{_quote(task_id)}/restart", route="/databases/{database-id}/connectors/{connector-name}/tasks/{task-id}/restart")
+
+    def list_maintenance_updates(self, database_id: str) -> ListMaintenanceUpdatesResponse:
+        """List Maintenance Updates"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/maintenance", route="/databases/{database-id}/maintenance")
+
+    def start_maintenance_updates(self, database_id: str) -> StartMaintenanceUpdatesResponse:
+        """Start Maintenance Updates"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/maintenance", route="/databases/{database-id}/maintenance")
+
+    def list_service_alerts(self, database_id: str, body: Optional[ListServiceAlertsRequest] = None) -> ListServiceAlertsResponse:
+        """List Service Alerts"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/alerts", json=body, route="/databases/{database-id}/alerts")
+
+    def view_migration_status(self, database_id: str) -> ViewMigrationStatusResponse:
+        """Get Migration Status"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/migration", route="/databases/{database-id}/migration")
+
+    def database_start_migration(self, database_id: str, body: Optional[DatabaseStartMigrationRequest] = None) -> DatabaseStartMigrationResponse:
+        """Start Migration"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/migration", json=body, route="/databases/{database-id}/migration")
+
+    def database_detach_migration(self, database_id: str) -> None:
+        """Detach Migration"""
+        return self._api.call("DELETE", f"/databases/{_quote(database_id)}/migration", route="/databases/{database-id}/migration")
+
+    def database_add_read_replica(self, database_id: str, body: Optional[DatabaseAddReadReplicaRequest] = None) -> DatabaseAddReadReplicaResponse:
+        """Add Read-Only Replica"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/read-replica", json=body, route="/databases/{database-id}/read-replica")
+
+    def database_promote_read_replica(self, database_id: str) -> None:
+        """Promote Read-Only Replica"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/promote-read-replica", route="/databases/{database-id}/promote-read-replica")
+
+    def get_backup_information(self, database_id: str) -> GetBackupInformationResponse:
+        """Get Backup Information"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/backups", route="/databases/{database-id}/backups")
+
+    def database_restore_from_backup(self, database_id: str, body: Optional[DatabaseRestoreFromBackupRequest] = None) -> DatabaseRestoreFromBackupResponse:
+        """Restore from Backup"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/restore", json=body, route="/databases/{database-id}/restore")
+
+    def database_fork(self, database_id: str, body: Optional[DatabaseForkRequest] = None) -> DatabaseForkResponse:
+        """Fork Managed Database"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/fork", json=body, route="/databases/{database-id}/fork")
+
+    def list_connection_pools(self, database_id: str) -> ListConnectionPoolsResponse:
+        """List Connection Pools"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/connection-pools", route="/databases/{database-id}/connection-pools")
+
+    def create_connection_pool(self, database_id: str, body: Optional[CreateConnectionPoolRequest] = None) -> CreateConnectionPoolResponse:
+        """Create Connection Pool"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/connection-pools", json=body, route="/databases/{database-id}/connection-pools")
+
+    def get_connection_pool(self, database_id: str, pool_name: str) -> GetConnectionPoolResponse:
+        """Get Connection Pool"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/connection-pools/{_quote(pool_name)}", route="/databases/{database-id}/connection-pools/{pool-name}")
+
+    def update_connection_pool(self, database_id: str, pool_name: str, body: Optional[UpdateConnectionPoolRequest] = None) -> UpdateConnectionPoolResponse:
+        """Update Connection Pool"""
+        return self._api.call("PUT", f"/databases/{_quote(database_id)}/connection-pools/{_quote(pool_name)}", json=body, route="/databases/{database-id}/connection-pools/{pool-name}")
+
+    def delete_connection_pool(self, database_id: str, pool_name: str) -> None:
+        """Delete Connection Pool"""
+        return self._api.call("DELETE", f"/databases/{_quote(database_id)}/connection-pools/{_quote(pool_name)}", route="/databases/{database-id}/connection-pools/{pool-name}")
+
+    def list_advanced_options(self, database_id: str) -> ListAdvancedOptionsResponse:
+        """List Advanced Options"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/advanced-options", route="/databases/{database-id}/advanced-options")
+
+    def update_advanced_options(self, database_id: str, body: Optional[Dict[str, Any]] = None) -> UpdateAdvancedOptionsResponse:
+        """Update Advanced Options"""
+        return self._api.call("PUT", f"/databases/{_quote(database_id)}/advanced-options", json=body, route="/databases/{database-id}/advanced-options")
+
+    def list_advanced_options_kafka_rest(self, database_id: str) -> ListAdvancedOptionsKafkaRestResponse:
+        """List Kafka REST Advanced Options"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/advanced-options/kafka-rest", route="/databases/{database-id}/advanced-options/kafka-rest")
+
+    def update_advanced_options_kafka_rest(self, database_id: str, body: Optional[KafkaRestAdvancedOptions] = None) -> UpdateAdvancedOptionsKafkaRestResponse:
+        """Update Kafka REST Advanced Options"""
+        return self._api.call("PUT", f"/databases/{_quote(database_id)}/advanced-options/kafka-rest", json=body, route="/databases/{database-id}/advanced-options/kafka-rest")
+
+    def list_advanced_options_schema_registry(self, database_id: str) -> ListAdvancedOptionsSchemaRegistryResponse:
+        """List Schema Registry Advanced Options"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/advanced-options/schema-registry", route="/databases/{database-id}/advanced-options/schema-registry")
+
+    def update_advanced_options_schema_registry(self, database_id: str, body: Optional[SchemaRegistryAdvancedOptions] = None) -> UpdateAdvancedOptionsSchemaRegistryResponse:
+        """Update Schema Registry Advanced Options"""
+        return self._api.call("PUT", f"/databases/{_quote(database_id)}/advanced-options/schema-registry", json=body, route="/databases/{database-id}/advanced-options/schema-registry")
+
+    def list_advanced_options_kafka_connect(self, database_id: str) -> ListAdvancedOptionsKafkaConnectResponse:
+        """List Kafka Connect Advanced Options"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/advanced-options/kafka-connect", route="/databases/{database-id}/advanced-options/kafka-connect")
+
+    def update_advanced_options_kafka_connect(self, database_id: str, body: Optional[KafkaConnectAdvancedOptions] = None) -> UpdateAdvancedOptionsKafkaConnectResponse:
+        """Update Kafka Connect Advanced Options"""
+        return self._api.call("PUT", f"/databases/{_quote(database_id)}/advanced-options/kafka-connect", json=body, route="/databases/{database-id}/advanced-options/kafka-connect")
+
+    def list_available_versions(self, database_id: str) -> ListAvailableVersionsResponse:
+        """List Available Versions"""
+        return self._api.call("GET", f"/databases/{_quote(database_id)}/version-upgrade", route="/databases/{database-id}/version-upgrade")
+
+    def start_version_upgrade(self, database_id: str, body: Optional[StartVersionUpgradeRequest] = None) -> StartVersionUpgradeResponse:
+        """Start Version Upgrade"""
+        return self._api.call("POST", f"/databases/{_quote(database_id)}/version-upgrade", json=body, route="/databases/{database-id}/version-upgrade")
@@ -0,0 +1,25 @@
+"""The ``marketplace`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import AppVariable
+
+
+ListMarketplaceAppVariablesResponse = TypedDict("ListMarketplaceAppVariablesResponse", {"variables": "List[AppVariable]"}, total=False)
+ListMarketplaceAppVariablesResponse.__doc__ = "Response of list_marketplace_app_variables()."
+
+
+class MarketplaceResource(Resource):
+    """Operations tagged ``marketplace``."""
+
+    def list_marketplace_app_variables(self, image_id: str) -> ListMarketplaceAppVariablesResponse:
+        """List Marketplace App Variables"""
+        return self._api.call("GET", f"/marketplace/apps/{_quote(image_id)}/variables", route="/marketplace/apps/{image-id}/variables")
@@ -0,0 +1,360 @@
+"""Typed models for the Vultr API component schemas.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from typing import Any, Dict, List
+
+try:
+    from typing import TypedDict
+except ImportError:  # Python < 3.8
+    from typing_extensions import TypedDict
+
+
+VfsRegion = TypedDict("VfsRegion", {"id": "str", "country": "str", "continent": "str", "description": "str", "price_per_gb": "Dict[str, Any]", "min_size_gb": "Dict[str, Any]"}, total=False)
+VfsRegion.__doc__ = "vfs_region"
+
+VfsStorageSize = TypedDict("VfsStorageSize", {"bytes": "int", "gb": "int"}, total=False)
+VfsStorageSize.__doc__ = "vfs_storage_size"
+
+VfsBilling = TypedDict("VfsBilling", {"charges": "float", "monthly": "float"}, total=False)
+VfsBilling.__doc__ = "vfs_billing"
+
+Vfs = TypedDict("Vfs", {"id": "str", "region": "str", "date_created": "str", "status": "str", "label": "str", "tags": "List[str]", "disk_type": "str", "storage_size": "VfsStorageSize", "storage_used": "VfsStorageSize", "billing": "VfsBilling"}, total=False)
+Vfs.__doc__ = "Vultr File System subscription entity"
+
+VfsAttachment = TypedDict("VfsAttachment", {"state": "str", "vfs_id": "str", "target_id": "str", "mount_tag": "int"}, total=False)
+VfsAttachment.__doc__ = "Represents an attachment between a VFS and a target resource"
+
+Pullzone = TypedDict("Pullzone", {"id": "str", "date_created": "str", "status": "str", "label": "str", "origin_scheme": "str", "origin_domain": "str", "cdn_url": "str", "vanity_domain": "str", "cache_size": "float", "requests": "float", "in_bytes": "float", "out_bytes": "float", "packets_per_sec": "float", "last_purge": "str", "cors": "bool", "gzip": "bool", "block_ai": "bool", "block_bad_bots": "bool", "regions": "List[Any]"}, total=False)
+Pullzone.__doc__ = "CDN Pull Zone information."
+
+Pushzone = TypedDict("Pushzone", {"id": "str", "date_created": "str", "status": "str", "label": "str", "cdn_url": "str", "vanity_domain": "str", "cache_size": "float", "requests": "float", "in_bytes": "float", "out_bytes": "float", "packets_per_sec": "float", "cors": "bool", "gzip": "bool", "block_ai": "bool", "block_bad_bots": "bool", "regions": "List[Any]"}, total=False)
+Pushzone.__doc__ = "CDN Push Zone information."
+
+Pushzonefile = TypedDict("Pushzonefile", {"name": "str", "mime": "str", "size": "str", "content": "str", "last_modified": "str"}, total=False)
+Pushzonefile.__doc__ = "CDN Push Zone file information."
+
+Pushzonefilemeta = TypedDict("Pushzonefilemeta", {"name": "str", "size": "str", "last_modified": "str"}, total=False)
+Pushzonefilemeta.__doc__ = "CDN Push Zone file meta information."
+
+Uploadendpoint = TypedDict("Uploadendpoint", {"URL": "str", "inputs": "List[NodepoolInstances]"}, total=False)
+Uploadendpoint.__doc__ = "CDN Push Zone file meta information."
+
+UploadendpointInputs = TypedDict("UploadendpointInputs", {"acl": "str", "key": "str", "X-Amz-Credential": "str", "X-Amz-Algorithm": "str", "Policy": "str", "X-Amz-Signature": "str"}, total=False)
+UploadendpointInputs.__doc__ = "CDN Push Zone file meta information."
+
+Billing = TypedDict("Billing", {"id": "float", "date": "str", "type": "str", "description": "str", "amount": "float", "balance": "float"}, total=False)
+Billing.__doc__ = "Invoice"
+
+Invoice = TypedDict("Invoice", {"id": "int", "date": "str", "description": "str", "amount": "float", "balance": "float"}, total=False)
+Invoice.__doc__ = "invoice"
+
+VkeCluster = TypedDict("VkeCluster", {"id": "str", "firewall_group_id": "str", "label": "str", "date_created": "str", "cluster_subnet": "str", "service_subnet": "str", "ip": "str", "endpoint": "str", "version": "str", "region": "str", "status": "str", "ha_controlplanes": "bool", "oidc": "Dict[str, Any]", "node_pools": "List[Nodepools]", "vpcs": "List[AttachedVpcs]"}, total=False)
+VkeCluster.__doc__ = "VKE Cluster"
+
+NodepoolInstances = TypedDict("NodepoolInstances", {"id": "str", "label": "str", "date_created": "str"}, total=False)
+NodepoolInstances.__doc__ = "Instance that belongs to a nodepool"
+
+Nodepools = TypedDict("Nodepools", {"id": "str", "date_created": "str", "label": "str", "tag": "str", "plan": "str", "status": "str", "node_quantity": "int", "nodes": "List[NodepoolInstances]", "date_updated": "str", "auto_scaler": "bool", "min_nodes": "int", "max_nodes": "Any", "labels": "Dict[str, Any]", "taints": "List[Any]", "user_data": "str"}, total=False)
+Nodepools.__doc__ = "NodePool"
+
+AttachedVpcs = TypedDict("AttachedVpcs", {"id": "str", "version": "int", "subnet": "str"}, total=False)
+AttachedVpcs.__doc__ = "Information about a specific VPC Network to which the instance is attached."
+
+Network = TypedDict("Network", {"id": "str", "region": "str", "date_created": "str", "description": "str", "v4_subnet": "str", "v4_subnet_mask": "int"}, total=False)
+Network.__doc__ = "Network information."
+
+Vpc = TypedDict("Vpc", {"id": "str", "region": "str", "date_created": "str", "description": "str", "v4_subnet": "str", "v4_subnet_mask": "int", "nodes": "List[VpcNode]"}, total=False)
+Vpc.__doc__ = "VPC information."
+
+VpcNode = TypedDict("VpcNode", {"id": "str", "type": "str", "subnet": "str"}, total=False)
+VpcNode.__doc__ = "VPC node information."
+
+InstanceVpc = TypedDict("InstanceVpc", {"id": "str", "mac_address": "str", "ip_address": "str"}, total=False)
+InstanceVpc.__doc__ = "VPC information."
+
+Vpc2 = TypedDict("Vpc2", {"id": "str", "region": "str", "date_created": "str", "description": "str", "ip_block": "str", "prefix_length": "int"}, total=False)
+Vpc2.__doc__ = "VPC 2.0 information."
+
+Vpc2nodes = TypedDict("Vpc2nodes", {"id": "str", "ip_address": "str", "mac_address": "str", "description": "str", "type": "str", "node_status": "str"}, total=False)
+Vpc2nodes.__doc__ = "VPC 2.0 node information."
+
+InstanceVpc2 = TypedDict("InstanceVpc2", {"id": "str", "mac_address": "str", "ip_address": "str"}, total=False)
+InstanceVpc2.__doc__ = "VPC 2.0 information."
+
+User = TypedDict("User", {"user": "Dict[str, Any]"}, total=False)
+User.__doc__ = "User information."
+
+IpWhitelistEntry = TypedDict("IpWhitelistEntry", {"subnet": "str", "subnet_size": "int", "date_added": "str", "ip_type": "str"}, total=False)
+IpWhitelistEntry.__doc__ = "IP whitelist entry information."
+
+Startup = TypedDict("Startup", {"id": "str", "date_created": "str", "date_modified": "str", "name": "str", "script": "str", "type": "str"}, total=False)
+Startup.__doc__ = "Startup Script information."
+
+Ssh = TypedDict("Ssh", {"id": "str", "date_created": "str", "name": "str", "ssh_key": "str"}, total=False)
+Ssh.__doc__ = "SSH Key information."
+
+Snapshot = TypedDict("Snapshot", {"id": "str", "date_created": "str", "description": "str", "size": "int", "status": "str", "os_id": "int", "app_id": "int"}, total=False)
+Snapshot.__doc__ = "Snapshot information."
+
+Subaccount = TypedDict("Subaccount", {"id": "str", "email": "str", "subaccount_name": "str", "subaccount_id": "str", "activated": "bool", "balance": "float", "pending_charges": "float"}, total=False)
+Subaccount.__doc__ = "Sub-account information."
+
+ReservedIp = TypedDict("ReservedIp", {"id": "str", "region": "str", "ip_type": "str", "subnet": "str", "subnet_size": "int", "label": "str", "instance_id": "str"}, total=False)
+ReservedIp.__doc__ = "Reserved IP information."
+
+Os = TypedDict("Os", {"id": "int", "name": "str", "arch": "str", "family": "str"}, total=False)
+Os.__doc__ = "Operating System information."
+
+Application = TypedDict("Application", {"id": "int", "name": "str", "short_name": "str", "deploy_name": "str", "type": "str", "vendor": "str", "image_id": "str"}, total=False)
+Application.__doc__ = "Application information."
+
+Account = TypedDict("Account", {"name": "str", "email": "str", "acls": "List[str]", "balance": "float", "pending_charges": "float", "last_payment_date": "str", "last_payment_amount": "float"}, total=False)
+Account.__doc__ = "Account information."
+
+AccountBgp = TypedDict("AccountBgp", {"asn": "float", "password": "str", "enabled": "bool"}, total=False)
+AccountBgp.__doc__ = "Account BGP information."
+
+AccountBandwidth = TypedDict("AccountBandwidth", {"previous_month": "Dict[str, Any]", "current_month_to_date": "Dict[str, Any]", "current_month_projected": "Dict[str, Any]"}, total=False)
+AccountBandwidth.__doc__ = "Account Bandwidth information."
+
+Backup = TypedDict("Backup", {"id": "str", "date_created": "str", "description": "str", "size": "int", "status": "str", "os_id": "int", "app_id": "int"}, total=False)
+Backup.__doc__ = "Backup information."
+
+Blockstorage = TypedDict("Blockstorage", {"id": "str", "cost": "int", "status": "str", "size_gb": "int", "region": "str", "attached_to_instance": "str", "date_created": "str", "label": "str", "mount_id": "str"}, total=False)
+Blockstorage.__doc__ = "Block Storage information."
+
+FirewallGroup = TypedDict("FirewallGroup", {"id": "str", "description": "str", "date_created": "str", "date_modified": "str", "instance_count": "int", "rule_count": "int", "max_rule_count": "int"}, total=False)
+FirewallGroup.__doc__ = "Firewall Group information."
+
+FirewallRule = TypedDict("FirewallRule", {"id": "int", "type": "str", "ip_type": "str", "action": "str", "protocol": "str", "port": "str", "subnet": "str", "subnet_size": "int", "source": "str", "notes": "str"}, total=False)
+FirewallRule.__doc__ = "Firewall rule information."
+
+Iso = TypedDict("Iso", {"id": "str", "date_created": "str", "filename": "str", "size": "int", "md5sum": "str", "sha512sum": "str", "status": "str"}, total=False)
+Iso.__doc__ = "ISO information."
+
+IsoPublic = TypedDict("IsoPublic", {"id": "str", "name": "str", "description": "str", "md5sum": "str"}, total=False)
+IsoPublic.__doc__ = "Public ISO information."
+
+StorageGateway = TypedDict("StorageGateway", {"id": "str", "date_created": "str", "status": "str", "type": "str", "label": "str", "pending_charges": "float", "tags": "List[str]", "health": "str", "network_config": "StorageGatewayNetwork", "export_config": "StorageGatewayExport"}, total=False)
+StorageGateway.__doc__ = "Storage Gateway information"
+
+StorageGatewayNetwork = TypedDict("StorageGatewayNetwork", {"primary": "Dict[str, Any]"}, total=False)
+StorageGatewayNetwork.__doc__ = "storage-gateway-network"
+
+StorageGatewayExport = TypedDict("StorageGatewayExport", {"label": "str", "vfs_uuid": "str", "pseudo_root_path": "str", "allowed_ips": "List[str]"}, total=False)
+StorageGatewayExport.__doc__ = "storage-gateway-export"
+
+ObjectStorages = TypedDict("ObjectStorages", {"id": "str", "date_created": "str", "cluster_id": "int", "region": "str", "label": "str", "status": "str", "s3_hostname": "str", "s3_access_key": "str", "s3_secret_key": "str", "tier": "Dict[str, Any]"}, total=False)
+ObjectStorages.__doc__ = "Object Storage information."
+
+ObjectStorage = TypedDict("ObjectStorage", {"id": "str", "date_created": "str", "cluster_id": "int", "region": "str", "label": "str", "status": "str", "s3_hostname": "str", "s3_access_key": "str", "s3_secret_key": "str"}, total=False)
+ObjectStorage.__doc__ = "Object Storage information."
+
+Clusters = TypedDict("Clusters", {"id": "int", "region": "str", "hostname": "str", "deploy": "str"}, total=False)
+Clusters.__doc__ = "Object Storage Cluster information."
+
+Tiers = TypedDict("Tiers", {"id": "int", "bw_gb_price": "Any", "disk_gb_price": "Any", "is_default": "str", "price": "Any", "ratelimit_ops_bytes": "int", "ratelimit_ops_secs": "int", "sales_desc": "str", "sales_name": "str", "slug": "str", "locations": "List[Dict[str, Any]]"}, total=False)
+Tiers.__doc__ = "Object Storage Tier information."
+
+ClusterTiers = TypedDict("ClusterTiers", {"id": "int", "bw_gb_price": "Any", "disk_gb_price": "Any", "is_default": "str", "price": "Any", "ratelimit_ops_bytes": "int", "ratelimit_ops_secs": "int", "sales_desc": "str", "sales_name": "str", "slug": "str"}, total=False)
+ClusterTiers.__doc__ = "Object Storage Tier information."
+
+Domain = TypedDict("Domain", {"domain": "str", "date_created": "str", "dns_sec": "str"}, total=False)
+Domain.__doc__ = "DNS Domain information."
+
+DnsSoa = TypedDict("DnsSoa", {"nsprimary": "str", "email": "str"}, total=False)
+DnsSoa.__doc__ = "SOA Record information."
+
+DnsRecord = TypedDict("DnsRecord", {"id": "str", "type": "str", "name": "str", "data": "str", "priority": "int", "ttl": "int"}, total=False)
+DnsRecord.__doc__ = "DNS Record information."
+
+Loadbalancer = TypedDict("Loadbalancer", {"id": "str", "date_created": "str", "region": "str", "label": "str", "status": "str", "ipv4": "str", "ipv6": "str", "generic_info": "Dict[str, Any]", "health_check": "Dict[str, Any]", "has_ssl": "bool", "http2": "bool", "http3": "bool", "nodes": "int", "forward_rules": "List[Dict[str, Any]]", "instances": "List[str]", "firewall_rules": "List[Dict[str, Any]]", "node_ips": "Dict[str, Any]", "auto_ssl": "Dict[str, Any]", "global_parent_id": "str", "global_regions": "List[str]", "global_children_ids": "List[str]", "ssl_cert_b64": "str", "pending_charges": "Any"}, total=False)
+Loadbalancer.__doc__ = "Load Balancer information."
+
+Log = TypedDict("Log", {"resource_id": "str", "resource_type": "str", "log_level": "str", "message": "str", "timestamp": "str", "metadata": "Dict[str, Any]"}, total=False)
+Log.__doc__ = "Log line information"
+
+LogMeta = TypedDict("LogMeta", {"next_page_url": "str", "continue_time": "str", "returned_count": "int", "unreturned_count": "int", "total_count": "int"}, total=False)
+LogMeta.__doc__ = "log-meta"
+
+Region = TypedDict("Region", {"id": "str", "country": "str", "options": "List[str]", "continent": "str", "city": "str"}, total=False)
+Region.__doc__ = "Region information."
+
+Plans = TypedDict("Plans", {"id": "str", "name": "str", "vcpu_count": "int", "ram": "int", "disk": "int", "bandwidth": "int", "monthly_cost": "int", "type": "str", "locations": "List[str]", "disk_count": "int"}, total=False)
+Plans.__doc__ = "Plans for VPS instances."
+
+PlansMetal = TypedDict("PlansMetal", {"id": "str", "cpu_count": "int", "cpu_model": "str", "cpu_threads": "int", "ram": "int", "disk": "str", "bandwidth": "int", "locations": "List[str]", "type": "str", "monthly_cost": "int", "monthly_cost_preemptible": "int", "disk_count": "int"}, total=False)
+PlansMetal.__doc__ = "Plans for Bare Metal instances."
+
+Baremetal = TypedDict("Baremetal", {"id": "str", "os": "str", "ram": "str", "disk": "str", "main_ip": "str", "cpu_count": "int", "region": "str", "default_password": "str", "date_created": "str", "status": "str", "netmask_v4": "str", "gateway_v4": "str", "plan": "str", "label": "str", "tag": "str", "os_id": "int", "app_id": "int", "image_id": "str", "snapshot_id": "str", "v6_network": "str", "v6_main_ip": "str", "v6_network_size": "int", "mac_address": "int", "tags": "List[str]", "user_scheme": "str"}, total=False)
+Baremetal.__doc__ = "Bare Metal information."
+
+BaremetalGet = TypedDict("BaremetalGet", {"id": "str", "os": "str", "ram": "str", "disk": "str", "main_ip": "str", "cpu_count": "int", "region": "str", "default_password": "str", "date_created": "str", "status": "str", "netmask_v4": "str", "gateway_v4": "str", "plan": "str", "label": "str", "internal_ip": "str", "vpcs": "List[AttachedVpcs]", "tag": "str", "os_id": "int", "app_id": "int", "image_id": "str", "snapshot_id": "str", "v6_network": "str", "v6_main_ip": "str", "v6_network_size": "int", "mac_address": "int", "tags": "List[str]", "user_scheme": "str"}, total=False)
+BaremetalGet.__doc__ = "Bare Metal information."
+
+BaremetalIpv4 = TypedDict("BaremetalIpv4", {"ip": "str", "netmask": "str", "gateway": "str", "type": "str", "reverse": "str", "mac_address": "str"}, total=False)
+BaremetalIpv4.__doc__ = "Bare Metal IPv4 information."
+
+BaremetalIpv6 = TypedDict("BaremetalIpv6", {"ip": "str", "network": "str", "network_size": "int", "type": "str"}, total=False)
+BaremetalIpv6.__doc__ = "Bare Metal IPv6 information."
+
+Bandwidth = TypedDict("Bandwidth", {"incoming_bytes": "int", "outgoing_bytes": "int"}, total=False)
+Bandwidth.__doc__ = "Bandwidth information."
+
+Instance = TypedDict("Instance", {"id": "str", "os": "str", "ram": "int", "disk": "int", "main_ip": "str", "vcpu_count": "int", "region": "str", "default_password": "str", "date_created": "str", "status": "str", "power_status": "str", "server_status": "str", "allowed_bandwidth": "int", "netmask_v4": "str", "gateway_v4": "str", "v6_networks": "List[Dict[str, Any]]", "hostname": "str", "label": "str", "tag": "str", "internal_ip": "str", "kvm": "str", "os_id": "int", "app_id": "int", "image_id": "str", "snapshot_id": "str", "firewall_group_id": "str", "features": "List[str]", "plan": "str", "tags": "List[str]", "user_scheme": "str"}, total=False)
+Instance.__doc__ = "Instance information."
+
+InstanceGet = TypedDict("InstanceGet", {"id": "str", "os": "str", "ram": "int", "disk": "int", "main_ip": "str", "vcpu_count": "int", "region": "str", "default_password": "str", "date_created": "str", "status": "str", "power_status": "str", "server_status": "str", "allowed_bandwidth": "int", "netmask_v4": "str", "gateway_v4": "str", "v6_networks": "List[Dict[str, Any]]", "hostname": "str", "label": "str", "tag": "str", "internal_ip": "str", "vpcs": "List[AttachedVpcs]", "kvm": "str", "os_id": "int", "app_id": "int", "image_id": "str", "snapshot_id": "str", "firewall_group_id": "str", "features": "List[str]", "plan": "str", "tags": "List[str]", "user_scheme": "str"}, total=False)
+InstanceGet.__doc__ = "Instance information."
+
+DbaasMeta = TypedDict("DbaasMeta", {"total": "int"}, total=False)
+DbaasMeta.__doc__ = "The meta information object."
+
+Database = TypedDict("Database", {"id": "str", "date_created": "str", "plan": "str", "plan_disk": "int", "plan_ram": "int", "plan_vcpus": "int", "plan_replicas": "int", "plan_brokers": "int", "region": "str", "database_engine": "str", "database_engine_version": "str", "vpc_id": "str", "status": "str", "label": "str", "tag": "str", "dbname": "str", "host": "str", "public_host": "str", "user": "str", "password": "str", "access_key": "str", "access_cert": "str", "port": "str", "sasl_port": "str", "enable_kafka_rest": "bool", "kafka_rest_uri": "bool", "enable_schema_registry": "bool", "schema_registry_uri": "bool", "enable_kafka_connect": "bool", "maintenance_dow": "str", "maintenance_time": "str", "backup_hour": "str", "backup_minute": "str", "latest_backup": "str", "trusted_ips": "List[str]", "ca_certificate": "str", "mysql_sql_modes": "List[str]", "mysql_require_primary_key": "bool", "mysql_slow_query_log": "bool", "mysql_long_query_time": "int", "pg_available_extensions": "List[Dict[str, Any]]", "redis_eviction_policy": "str", "eviction_policy": "str", "cluster_time_zone": "str", "read_replicas": "List[Dict[str, Any]]"}, total=False)
+Database.__doc__ = "Managed Database information."
+
+DbaasPlan = TypedDict("DbaasPlan", {"id": "str", "number_of_nodes": "int", "type": "str", "vcpu_count": "int", "ram": "int", "disk": "int", "monthly_cost": "int", "supported_engines": "Dict[str, Any]", "max_connections": "Dict[str, Any]", "locations": "List[str]"}, total=False)
+DbaasPlan.__doc__ = "Managed Database plan information."
+
+DatabaseUsage = TypedDict("DatabaseUsage", {"disk": "Dict[str, Any]", "memory": "Dict[str, Any]", "cpu": "Dict[str, Any]"}, total=False)
+DatabaseUsage.__doc__ = "Managed Database usage information."
+
+DatabaseUser = TypedDict("DatabaseUser", {"username": "str", "password": "str", "encryption": "str", "access_control": "Dict[str, Any]", "permission": "str", "access_key": "str", "access_cert": "str"}, total=False)
+DatabaseUser.__doc__ = "Managed Database user information."
+
+DatabaseTopic = TypedDict("DatabaseTopic", {"name": "str", "partitions": "int", "replication": "int", "retention_hours": "int", "retention_bytes": "int"}, total=False)
+DatabaseTopic.__doc__ = "Managed Database topic information."
+
+DatabaseQuota = TypedDict("DatabaseQuota", {"client_id": "str", "user": "str", "consumer_byte_rate": "int", "producer_byte_rate": "int", "request_percentage": "int"}, total=False)
+DatabaseQuota.__doc__ = "Managed Database quota information."
+
+DatabaseAvailableConnector = TypedDict("DatabaseAvailableConnector", {"class": "str", "title": "str", "version": "str", "type": "str", "doc_url": "str"}, total=False)
+DatabaseAvailableConnector.__doc__ = "Managed Database available connector information."
+
+DatabaseConnectorConfigurationSchema = TypedDict("DatabaseConnectorConfigurationSchema", {"name": "str", "type": "str", "required": "bool", "default_value": "str", "description": "str"}, total=False)
+DatabaseConnectorConfigurationSchema.__doc__ = "Managed Database connector configuration schema."
+
+DatabaseConnector = TypedDict("DatabaseConnector", {"name": "str", "class": "str", "topics": "str", "config": "Dict[str, Any]"}, total=False)
+DatabaseConnector.__doc__ = "Managed Database connector information."
+
+DatabaseConnectorStatus = TypedDict("DatabaseConnectorStatus", {"state": "str", "tasks": "List[DatabaseConnectorStatusTask]"}, total=False)
+DatabaseConnectorStatus.__doc__ = "Managed Database connector status information."
+
+DatabaseConnectorStatusTask = TypedDict("DatabaseConnectorStatusTask", {"id": "int", "state": "str", "trace": "str"}, total=False)
+DatabaseConnectorStatusTask.__doc__ = "Managed Database connector task status information."
+
+DbaasAlerts = TypedDict("DbaasAlerts", {"timestamp": "str", "message_type": "str", "description": "str", "recommendation": "str", "maintenance_scheduled": "str", "resource_type": "str", "table_count": "int"}, total=False)
+DbaasAlerts.__doc__ = "Managed Database alerts information."
+
+DbaasMigration = TypedDict("DbaasMigration", {"status": "str", "method": "str", "error": "str", "credentials": "Dict[str, Any]"}, total=False)
+DbaasMigration.__doc__ = "Managed Database migration information."
+
+DatabaseLatestBackup = TypedDict("DatabaseLatestBackup", {"date": "str", "time": "str"}, total=False)
+DatabaseLatestBackup.__doc__ = "Managed Database latest backup information."
+
+DatabaseOldestBackup = TypedDict("DatabaseOldestBackup", {"date": "str", "time": "str"}, total=False)
+DatabaseOldestBackup.__doc__ = "Managed Database oldest backup information."
+
+DatabaseConnections = TypedDict("DatabaseConnections", {"used": "int", "available": "int", "max": "int"}, total=False)
+DatabaseConnections.__doc__ = "Managed Database connection information."
+
+ConnectionPool = TypedDict("ConnectionPool", {"name": "str", "database": "str", "username": "str", "mode": "str", "size": "int"}, total=False)
+ConnectionPool.__doc__ = "Managed Database connection pool information."
+
+DbaasAvailableOptions = TypedDict("DbaasAvailableOptions", {"name": "str", "type": "str", "enumerals": "List[str]", "min_value": "float", "max_value": "float", "alt_values": "List[int]", "units": "str"}, total=False)
+DbaasAvailableOptions.__doc__ = "Managed Database PostgreSQL advanced configuration options."
+
+DatabaseDb = TypedDict("DatabaseDb", {"name": "str"}, total=False)
+DatabaseDb.__doc__ = "Managed Database logical database information."
+
+PgAdvancedOptions = TypedDict("PgAdvancedOptions", {"autovacuum_analyze_scale_factor": "float", "autovacuum_analyze_threshold": "int", "autovacuum_freeze_max_age": "int", "autovacuum_max_workers": "int", "autovacuum_naptime": "int", "autovacuum_vacuum_cost_delay": "int", "autovacuum_vacuum_cost_limit": "int", "autovacuum_vacuum_scale_factor": "float", "autovacuum_vacuum_threshold": "int", "bgwriter_delay": "int", "bgwriter_flush_after": "int", "bgwriter_lru_maxpages": "int", "bgwriter_lru_multiplier": "float", "deadlock_timeout": "int", "default_toast_compression": "str", "idle_in_transaction_session_timeout": "int", "jit": "bool", "log_autovacuum_min_duration": "int", "log_error_verbosity": "str", "log_line_prefix": "str", "log_min_duration_statement": "int", "max_files_per_process": "int", "max_locks_per_transaction": "int", "max_logical_replication_workers": "int", "max_parallel_workers": "int", "max_parallel_workers_per_gather": "int", "max_pred_locks_per_transaction": "int", "max_prepared_transactions": "int", "max_replication_slots": "int", "max_stack_depth": "int", "max_standby_archive_delay": "int", "max_standby_streaming_delay": "int", "max_wal_senders": "int", "max_worker_processes": "int", "pg_partman_bgw.interval": "int", "pg_partman_bgw.role": "str", "pg_stat_statements.track": "str", "temp_file_limit": "int", "track_activity_query_size": "int", "track_commit_timestamp": "str", "track_functions": "str", "track_io_timing": "str", "wal_sender_timeout": "int", "wal_writer_delay": "int"}, total=False)
+PgAdvancedOptions.__doc__ = "Managed Database PostgreSQL Advanced Options"
+
+MysqlAdvancedOptions = TypedDict("MysqlAdvancedOptions", {"connect_timeout": "int", "group_concat_max_len": "int", "innodb_change_buffer_max_size": "int", "innodb_flush_neighbors": "int", "innodb_ft_min_token_size": "int", "innodb_ft_server_stopword_table": "str", "innodb_lock_wait_timeout": "int", "innodb_log_buffer_size": "int", "innodb_online_alter_log_max_size": "int", "innodb_print_all_deadlocks": "bool", "innodb_read_io_threads": "int", "innodb_rollback_on_timeout": "bool", "innodb_thread_concurrency": "int", "innodb_write_io_threads": "int", "internal_tmp_mem_storage_engine": "str", "net_buffer_length": "int", "net_read_timeout": "int", "net_write_timeout": "int", "wait_timeout": "int", "max_allowed_packet": "int", "max_heap_table_size": "int", "sort_buffer_size": "int", "tmp_table_size": "int"}, total=False)
+MysqlAdvancedOptions.__doc__ = "Managed Database MySQL Advanced Options"
+
+KafkaAdvancedOptions = TypedDict("KafkaAdvancedOptions", {"compression_type": "str", "group_initial_rebalance_delay_ms": "int", "group_min_session_timeout_ms": "int", "group_max_session_timeout_ms": "int", "connections_max_idle_ms": "int", "max_incremental_fetch_session_cache_slots": "int", "message_max_bytes": "int", "offsets_retention_minutes": "int", "log_cleaner_delete_retention_ms": "int", "log_cleaner_min_cleanable_ratio": "float", "log_cleaner_max_compaction_lag_ms": "int", "log_cleaner_min_compaction_lag_ms": "int", "log_cleanup_policy": "str", "log_flush_interval_messages": "int", "log_flush_interval_ms": "int", "log_index_interval_bytes": "int", "log_index_size_max_bytes": "int", "log_local_retention_ms": "int", "log_local_retention_bytes": "int", "log_message_downconversion_enable": "bool", "log_message_timestamp_type": "str", "log_message_timestamp_difference_max_ms": "int", "log_preallocate": "bool", "log_retention_bytes": "int", "log_retention_hours": "int", "log_retention_ms": "int", "log_roll_jitter_ms": "int", "log_roll_ms": "int", "log_segment_bytes": "int", "log_segment_delete_delay_ms": "int", "auto_create_topics_enable": "bool", "min_insync_replicas": "int", "num_partitions": "int", "default_replication_factor": "int", "replica_fetch_max_bytes": "int", "replica_fetch_response_max_bytes": "int", "max_connections_per_ip": "int", "producer_purgatory_purge_interval_requests": "int", "sasl_oauthbearer_expected_audience": "str", "sasl_oauthbearer_expected_issuer": "str", "sasl_oauthbearer_jwks_endpoint_url": "str", "sasl_oauthbearer_sub_claim_name": "str", "socket_request_max_bytes": "int", "transaction_state_log_segment_bytes": "int", "transaction_remove_expired_transaction_cleanup_interval_ms": "int", "transaction_partition_verification_enable": "bool"}, total=False)
+KafkaAdvancedOptions.__doc__ = "Managed Database Kafka Advanced Options"
+
+KafkaRestAdvancedOptions = TypedDict("KafkaRestAdvancedOptions", {"producer_acks": "str", "producer_compression_type": "str", "producer_linger_ms": "int", "producer_max_request_size": "int", "consumer_enable_auto_commit": "bool", "consumer_request_max_bytes": "int", "consumer_request_timeout_ms": "int", "name_strategy": "str", "name_strategy_validation": "bool", "simpleconsumer_pool_size_max": "int"}, total=False)
+KafkaRestAdvancedOptions.__doc__ = "Managed Database Kafka REST Advanced Options"
+
+SchemaRegistryAdvancedOptions = TypedDict("SchemaRegistryAdvancedOptions", {"leader_eligibility": "bool", "schema_reader_strict_mode": "bool", "retriable_errors_silenced": "bool"}, total=False)
+SchemaRegistryAdvancedOptions.__doc__ = "Managed Database Schema Registry Advanced Options"
+
+KafkaConnectAdvancedOptions = TypedDict("KafkaConnectAdvancedOptions", {"connector_client_config_override_policy": "str", "consumer_auto_offset_reset": "str", "consumer_fetch_max_bytes": "int", "consumer_isolation_level": "str", "consumer_max_partition_fetch_bytes": "int", "consumer_max_poll_interval_ms": "int", "consumer_max_poll_records": "int", "offset_flush_interval_ms": "int", "offset_flush_timeout_ms": "int", "producer_batch_size": "int", "producer_buffer_memory": "int", "producer_compression_type": "str", "producer_linger_ms": "int", "producer_max_request_size": "int", "scheduled_rebalance_max_delay_ms": "int", "session_timeout_ms": "int"}, total=False)
+KafkaConnectAdvancedOptions.__doc__ = "Managed Database Kafka Connect Advanced Options"
+
+AccessControl = TypedDict("AccessControl", {"redis_acl_categories": "List[str]", "redis_acl_channels": "List[str]", "redis_acl_commands": "List[str]", "redis_acl_keys": "List[str]", "acl_categories": "List[str]", "acl_channels": "List[str]", "acl_commands": "List[str]", "acl_keys": "List[str]"}, total=False)
+AccessControl.__doc__ = "Managed Database Valkey User Access Control"
+
+KafkaPermissions = TypedDict("KafkaPermissions", {"permission": "str"}, total=False)
+KafkaPermissions.__doc__ = "Managed Database Kafka User Permissions"
+
+AppVariable = TypedDict("AppVariable", {"name": "str", "description": "str", "required": "bool"}, total=False)
+AppVariable.__doc__ = "Marketplace app variable information."
+
+InferenceSubscription = TypedDict("InferenceSubscription", {"id": "str", "date_created": "str", "label": "str", "api_key": "str"}, total=False)
+InferenceSubscription.__doc__ = "Serverless Inference information."
+
+InferenceUsage = TypedDict("InferenceUsage", {"chat": "Dict[str, Any]", "audio": "Dict[str, Any]"}, total=False)
+InferenceUsage.__doc__ = "Serverless Inference usage information."
+
+PrivateNetworks = TypedDict("PrivateNetworks", {"id": "str", "mac_address": "str", "ip_address": "str"}, total=False)
+PrivateNetworks.__doc__ = "Private Network information."
+
+BackupSchedule = TypedDict("BackupSchedule", {"enabled": "bool", "type": "str", "next_scheduled_time_utc": "str", "hour": "int", "dow": "int", "dom": "int"}, total=False)
+BackupSchedule.__doc__ = "Backup schedule information."
+
+ForwardingRule = TypedDict("ForwardingRule", {"id": "str", "frontend_protocol": "str", "frontend_port": "int", "backend_protocol": "str", "backend_port": "int"}, total=False)
+ForwardingRule.__doc__ = "Forwarding Rule information."
+
+Meta = TypedDict("Meta", {"total": "int", "links": "Dict[str, Any]"}, total=False)
+Meta.__doc__ = "The meta information object. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination) for more information."
+
+LoadbalancerFirewallRule = TypedDict("LoadbalancerFirewallRule", {"id": "str", "port": "int", "source": "str", "ip_type": "str"}, total=False)
+LoadbalancerFirewallRule.__doc__ = "Load Balancer firewall rule information."
+
+Registry = TypedDict("Registry", {"id": "str", "name": "str", "urn": "str", "storage": "Dict[str, Any]", "date_created": "str", "public": "bool", "root_user": "RegistryUser", "metadata": "Dict[str, Any]"}, total=False)
+Registry.__doc__ = "Container Registry Entity"
+
+Replication = TypedDict("Replication", {"region": "str", "namespace": "str", "urn": "str"}, total=False)
+Replication.__doc__ = "Container Registry Replication Policy"
+
+RetentionRule = TypedDict("RetentionRule", {"id": "int", "disabled": "bool", "action": "str", "params": "Dict[str, Any]", "scope_selectors": "Dict[str, Any]", "tag_selectors": "List[Dict[str, Any]]", "template": "str"}, total=False)
+RetentionRule.__doc__ = "Container Registry Retention Policy Rule"
+
+RegistryStorage = TypedDict("RegistryStorage", {"bytes": "float", "mb": "float", "gb": "float", "tb": "float", "updated_at": "str"}, total=False)
+RegistryStorage.__doc__ = "Container Registry Storage Information"
+
+RegistryRepository = TypedDict("RegistryRepository", {"name": "str", "image": "str", "description": "str", "added_at": "str", "updated_at": "str", "pull_count": "int", "artifact_count": "int"}, total=False)
+RegistryRepository.__doc__ = "Container Registry Repository Entity"
+
+RegistryUser = TypedDict("RegistryUser", {"id": "int", "username": "str", "password": "str", "root": "bool", "added_at": "str", "updated_at": "str"}, total=False)
+RegistryUser.__doc__ = "Container Registry User Entity"
+
+RegistryUserCurrent = TypedDict("RegistryUserCurrent", {"id": "int", "username": "str", "added_at": "str", "updated_at": "str"}, total=False)
+RegistryUserCurrent.__doc__ = "Container Registry User Entity"
+
+RegistryRegion = TypedDict("RegistryRegion", {"id": "int", "name": "str", "urn": "str", "base_url": "str", "public": "bool", "added_at": "str", "updated_at": "str", "data_center": "Dict[str, Any]"}, total=False)
+RegistryRegion.__doc__ = "Container Registry Region Entity"
+
+RegistryPlan = TypedDict("RegistryPlan", {"vanity_name": "str", "max_storage_mb": "int", "monthly_price": "int"}, total=False)
+RegistryPlan.__doc__ = "Container Registry Plan Entity. The KEY of this entity is the Plan ID you will use to create/upgrade your Container Registry"
+
+RegistryDockerCredentials = TypedDict("RegistryDockerCredentials", {"auths": "Dict[str, Any]"}, total=False)
+RegistryDockerCredentials.__doc__ = "Container Registry Docker Credentials Entity"
+
+RegistryKubernetesDockerCredentials = TypedDict("RegistryKubernetesDockerCredentials", {"apiVersion": "str", "kind": "str", "metadata": "Dict[str, Any]", "data": "Dict[str, Any]", "type": "str"}, total=False)
+RegistryKubernetesDockerCredentials.__doc__ = "Container Registry Kubernetes Docker Credentials Entity"
+
+RegistryRepositoryArtifact = TypedDict("RegistryRepositoryArtifact", {"artifact_type": "str", "digest": "str", "manifest_media_type": "str", "media_type": "str", "pull_time": "str", "push_time": "str", "repository_name": "str", "size": "int", "type": "str", "tags": "List[Any]"}, total=False)
+RegistryRepositoryArtifact.__doc__ = "Container Registry Repository Artifact Entity"
+
+RegistryRobot = TypedDict("RegistryRobot", {"name": "str", "description": "str", "secret": "str", "disable": "bool", "duration": "int", "creation_time": "str", "permissions": "Dict[str, Any]"}, total=False)
+RegistryRobot.__doc__ = "Container Registry Robot Account"
+
+Apikey = TypedDict("Apikey", {"id": "str", "api_key": "str", "name": "str", "expire": "bool", "date_expire": "str"}, total=False)
+Apikey.__doc__ = "API key information."
@@ -0,0 +1,25 @@
+"""The ``os`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, Os
+
+
+ListOsResponse = TypedDict("ListOsResponse", {"os": "List[Os]", "meta": "Meta"}, total=False)
+ListOsResponse.__doc__ = "Response of list_os()."
+
+
+class OsResource(Resource):
+    """Operations tagged ``os``."""
+
+    def list_os(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListOsResponse:
+        """List OS"""
+        return self._api.call("GET", "/os", params={"per_page": per_page, "cursor": cursor})
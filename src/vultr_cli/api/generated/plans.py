@@ -0,0 +1,32 @@
+"""The ``plans`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, Plans, PlansMetal
+
+
+ListPlansResponse = TypedDict("ListPlansResponse", {"plans": "List[Plans]", "meta": "Meta"}, total=False)
+ListPlansResponse.__doc__ = "Response of list_plans()."
+
+ListMetalPlansResponse = TypedDict("ListMetalPlansResponse", {"plans": "List[PlansMetal]", "meta": "Meta"}, total=False)
+ListMetalPlansResponse.__doc__ = "Response of list_metal_plans()."
+
+
+class PlansResource(Resource):
+    """Operations tagged ``plans``."""
+
+    def list_plans(self, *, type: Optional[str] = None, per_page: Optional[int] = None, cursor: Optional[str] = None, os: Optional[str] = None) -> ListPlansResponse:
+        """List Plans"""
+        return self._api.call("GET", "/plans", params={"type": type, "per_page": per_page, "cursor": cursor, "os": os})
+
+    def list_metal_plans(self, *, per_page: Optional[str] = None, cursor: Optional[str] = None) -> ListMetalPlansResponse:
+        """List Bare Metal Plans"""
+        return self._api.call("GET", "/plans-metal", params={"per_page": per_page, "cursor": cursor})
@@ -0,0 +1,53 @@
+"""The ``private Networks`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, Network
+
+
+GetNetworkResponse = TypedDict("GetNetworkResponse", {"network": "Network"}, total=False)
+GetNetworkResponse.__doc__ = "Response of get_network()."
+
+UpdateNetworkRequest = TypedDict("UpdateNetworkRequest", {"description": "str"}, total=False)
+UpdateNetworkRequest.__doc__ = "Request body of update_network()."
+
+ListNetworksResponse = TypedDict("ListNetworksResponse", {"networks": "List[Network]", "meta": "Meta"}, total=False)
+ListNetworksResponse.__doc__ = "Response of list_networks()."
+
+CreateNetworkRequest = TypedDict("CreateNetworkRequest", {"region": "str", "description": "str", "v4_subnet": "str", "v4_subnet_mask": "int"}, total=False)
+CreateNetworkRequest.__doc__ = "Request body of create_network()."
+
+CreateNetworkResponse = TypedDict("CreateNetworkResponse", {"network": "Network"}, total=False)
+CreateNetworkResponse.__doc__ = "Response of create_network()."
+
+
+class PrivateNetworksResource(Resource):
+    """Operations tagged ``private Networks``."""
+
+    def get_network(self, network_id: str) -> GetNetworkResponse:
+        """Get a private network"""
+        return self._api.call("GET", f"/private-networks/{_quote(network_id)}", route="/private-networks/{network-id}")
+
+    def update_network(self, network_id: str, body: Optional[UpdateNetworkRequest] = None) -> None:
+        """Update a Private Network"""
+        return self._api.call("PUT", f"/private-networks/{_quote(network_id)}", json=body, route="/private-networks/{network-id}")
+
+    def delete_network(self, network_id: str) -> None:
+        """Delete a private network"""
+        return self._api.call("DELETE", f"/private-networks/{_quote(network_id)}", route="/private-networks/{network-id}")
+
+    def list_networks(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListNetworksResponse:
+        """List Private Networks"""
+        return self._api.call("GET", "/private-networks", params={"per_page": per_page, "cursor": cursor})
+
+    def create_network(self, body: Optional[CreateNetworkRequest] = None) -> CreateNetworkResponse:
+        """Create a Private Network"""
+        return self._api.call("POST", "/private-networks", json=body)
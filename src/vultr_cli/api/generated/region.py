@@ -0,0 +1,32 @@
+"""The ``region`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, Region
+
+
+ListRegionsResponse = TypedDict("ListRegionsResponse", {"regions": "List[Region]", "meta": "Meta"}, total=False)
+ListRegionsResponse.__doc__ = "Response of list_regions()."
+
+ListAvailablePlansRegionResponse = TypedDict("ListAvailablePlansRegionResponse", {"available_plans": "List[str]"}, total=False)
+ListAvailablePlansRegionResponse.__doc__ = "Response of list_available_plans_region()."
+
+
+class RegionResource(Resource):
+    """Operations tagged ``region``."""
+
+    def list_regions(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListRegionsResponse:
+        """List Regions"""
+        return self._api.call("GET", "/regions", params={"per_page": per_page, "cursor": cursor})
+
+    def list_available_plans_region(self, region_id: str, *, type: Optional[str] = None) -> ListAvailablePlansRegionResponse:
+        """List available plans in region"""
+        return self._api.call("GET", f"/regions/{_quote(region_id)}/availability", params={"type": type}, route="/regions/{region-id}/availability")
@@ -0,0 +1,77 @@
+"""The ``reserved-ip`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, ReservedIp
+
+
+GetReservedIpResponse = TypedDict("GetReservedIpResponse", {"reserved_ip": "ReservedIp"}, total=False)
+GetReservedIpResponse.__doc__ = "Response of get_reserved_ip()."
+
+PatchReservedIpsReservedIpRequest = TypedDict("PatchReservedIpsReservedIpRequest", {"label": "str"}, total=False)
+PatchReservedIpsReservedIpRequest.__doc__ = "Request body of patch_reserved_ips_reserved_ip()."
+
+PatchReservedIpsReservedIpResponse = TypedDict("PatchReservedIpsReservedIpResponse", {"reserved_ip": "ReservedIp"}, total=False)
+PatchReservedIpsReservedIpResponse.__doc__ = "Response of patch_reserved_ips_reserved_ip()."
+
+ListReservedIpsResponse = TypedDict("ListReservedIpsResponse", {"reserved_ips": "List[ReservedIp]", "meta": "Meta"}, total=False)
+ListReservedIpsResponse.__doc__ = "Response of list_reserved_ips()."
+
+CreateReservedIpRequest = TypedDict("CreateReservedIpRequest", {"region": "str", "ip_type": "str", "label": "str"}, total=False)
+CreateReservedIpRequest.__doc__ = "Request body of create_reserved_ip()."
+
+CreateReservedIpResponse = TypedDict("CreateReservedIpResponse", {"reserved_ip": "ReservedIp"}, total=False)
+CreateReservedIpResponse.__doc__ = "Response of create_reserved_ip()."
+
+AttachReservedIpRequest = TypedDict("AttachReservedIpRequest", {"instance_id": "str"}, total=False)
+AttachReservedIpRequest.__doc__ = "Request body of attach_reserved_ip()."
+
+ConvertReservedIpRequest = TypedDict("ConvertReservedIpRequest", {"ip_address": "str", "label": "str"}, total=False)
+ConvertReservedIpRequest.__doc__ = "Request body of convert_reserved_ip()."
+
+ConvertReservedIpResponse = TypedDict("ConvertReservedIpResponse", {"reserved_ip": "ReservedIp"}, total=False)
+ConvertReservedIpResponse.__doc__ = "Response of convert_reserved_ip()."
+
+
+class ReservedIpResource(Resource):
+    """Operations tagged ``reserved-ip``."""
+
+    def get_reserved_ip(self, reserved_ip: str) -> GetReservedIpResponse:
+        """Get Reserved IP"""
+        return self._api.call("GET", f"/reserved-ips/{_quote(reserved_ip)}", route="/reserved-ips/{reserved-ip}")
+
+    def patch_reserved_ips_reserved_ip(self, reserved_ip: str, body: Optional[PatchReservedIpsReservedIpRequest] = None) -> PatchReservedIpsReservedIpResponse:
+        """Update Reserved IP"""
+        return self._api.call("PATCH", f"/reserved-ips/{_quote(reserved_ip)}", json=body, route="/reserved-ips/{reserved-ip}")
+
+    def delete_reserved_ip(self, reserved_ip: str) -> None:
+        """Delete Reserved IP"""
+        return self._api.call("DELETE", f"/reserved-ips/{_quote(reserved_ip)}", route="/reserved-ips/{reserved-ip}")
+
+    def list_reserved_ips(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListReservedIpsResponse:
+        """List Reserved IPs"""
+        return self._api.call("GET", "/reserved-ips", params={"per_page": per_page, "cursor": cursor})
+
+    def create_reserved_ip(self, body: Optional[CreateReservedIpRequest] = None) -> CreateReservedIpResponse:
+        """Create Reserved IP"""
+        return self._api.call("POST", "/reserved-ips", json=body)
+
+    def attach_reserved_ip(self, reserved_ip: str, body: Optional[AttachReservedIpRequest] = None) -> None:
+        """Attach Reserved IP"""
+        return self._api.call("POST", f"/reserved-ips/{_quote(reserved_ip)}/attach", json=body, route="/reserved-ips/{reserved-ip}/attach")
+
+    def detach_reserved_ip(self, reserved_ip: str) -> None:
+        """Detach Reserved IP"""
+        return self._api.call("POST", f"/reserved-ips/{_quote(reserved_ip)}/detach", route="/reserved-ips/{reserved-ip}/detach")
+
+    def convert_reserved_ip(self, body: Optional[ConvertReservedIpRequest] = None) -> ConvertReservedIpResponse:
+        """Convert Instance IP to Reserved IP"""
+        return self._api.call("POST", "/reserved-ips/convert", json=body)
@@ -0,0 +1,81 @@
+"""The ``s3`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import ClusterTiers, Clusters, Meta, ObjectStorage, ObjectStorages, Tiers
+
+
+ListObjectStoragesResponse = TypedDict("ListObjectStoragesResponse", {"object_storages": "List[ObjectStorages]", "meta": "Meta"}, total=False)
+ListObjectStoragesResponse.__doc__ = "Response of list_object_storages()."
+
+CreateObjectStorageRequest = TypedDict("CreateObjectStorageRequest", {"cluster_id": "int", "tier_id": "int", "label": "str"}, total=False)
+CreateObjectStorageRequest.__doc__ = "Request body of create_object_storage()."
+
+CreateObjectStorageResponse = TypedDict("CreateObjectStorageResponse", {"object_storage": "ObjectStorage"}, total=False)
+CreateObjectStorageResponse.__doc__ = "Response of create_object_storage()."
+
+GetObjectStorageResponse = TypedDict("GetObjectStorageResponse", {"object_storage": "ObjectStorage"}, total=False)
+GetObjectStorageResponse.__doc__ = "Response of get_object_storage()."
+
+UpdateObjectStorageRequest = TypedDict("UpdateObjectStorageRequest", {"label": "str"}, total=False)
+UpdateObjectStorageRequest.__doc__ = "Request body of update_object_storage()."
+
+RegenerateObjectStorageKeysResponse = TypedDict("RegenerateObjectStorageKeysResponse", {"s3_credentials": "Dict[str, Any]"}, total=False)
+RegenerateObjectStorageKeysResponse.__doc__ = "Response of regenerate_object_storage_keys()."
+
+ListObjectStorageClustersResponse = TypedDict("ListObjectStorageClustersResponse", {"clusters": "List[Clusters]", "meta": "Meta"}, total=False)
+ListObjectStorageClustersResponse.__doc__ = "Response of list_object_storage_clusters()."
+
+ListObjectStorageTiersResponse = TypedDict("ListObjectStorageTiersResponse", {"tiers": "List[Tiers]"}, total=False)
+ListObjectStorageTiersResponse.__doc__ = "Response of list_object_storage_tiers()."
+
+ListObjectStorageClusterTiersResponse = TypedDict("ListObjectStorageClusterTiersResponse", {"tiers": "List[ClusterTiers]"}, total=False)
+ListObjectStorageClusterTiersResponse.__doc__ = "Response of list_object_storage_cluster_tiers()."
+
+
+class S3Resource(Resource):
+    """Operations tagged ``s3``."""
+
+    def list_object_storages(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListObjectStoragesResponse:
+        """List Object Storages"""
+        return self._api.call("GET", "/object-storage", params={"per_page": per_page, "cursor": cursor})
+
+    def create_object_storage(self, body: Optional[CreateObjectStorageRequest] = None) -> CreateObjectStorageResponse:
+        """Create Object Storage"""
+        return self._api.call("POST", "/object-storage", json=body)
+
+    def get_object_storage(self, object_storage_id: str) -> GetObjectStorageResponse:
+        """Get Object Storage"""
+        return self._api.call("GET", f"/object-storage/{_quote(object_storage_id)}", route="/object-storage/{object-storage-id}")
+
+    def update_object_storage(self, object_storage_id: str, body: Optional[UpdateObjectStorageRequest] = None) -> None:
+        """Update Object Storage"""
+        return self._api.call("PUT", f"/object-storage/{_quote(object_storage_id)}", json=body, route="/object-storage/{object-storage-id}")
+
+    def delete_object_storage(self, object_storage_id: str) -> None:
+        """Delete Object Storage"""
+        return self._api.call("DELETE", f"/object-storage/{_quote(object_storage_id)}", route="/object-storage/{object-storage-id}")
+
+    def regenerate_object_storage_keys(self, object_storage_id: str) -> RegenerateObjectStorageKeysResponse:
+        """Regenerate Object Storage Keys"""
+        return self._api.call("POST", f"/object-storage/{_quote(object_storage_id)}/regenerate-keys", route="/object-storage/{object-storage-id}/regenerate-keys")
+
+    def list_object_storage_clusters(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListObjectStorageClustersResponse:
+        """Get All Clusters"""
+        return self._api.call("GET", "/object-storage/clusters", params={"per_page": per_page, "cursor": cursor})
+
+    def list_object_storage_tiers(self) -> ListObjectStorageTiersResponse:
+        """Get All Tiers"""
+        return self._api.call("GET", "/object-storage/tiers")
+
+    def list_object_storage_cluster_tiers(self, cluster_id: str) -> ListObjectStorageClusterTiersResponse:
+        """Get All Cluster Tiers"""
+        return self._api.call("GET", f"/object-storage/clusters/{_quote(cluster_id)}/tiers", route="/object-storage/clusters/{cluster-id}/tiers")
@@ -0,0 +1,63 @@
+"""The ``serverless-inference`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import InferenceSubscription, InferenceUsage
+
+
+ListInferenceResponse = TypedDict("ListInferenceResponse", {"subscriptions": "List[InferenceSubscription]"}, total=False)
+ListInferenceResponse.__doc__ = "Response of list_inference()."
+
+CreateInferenceRequest = TypedDict("CreateInferenceRequest", {"label": "str"}, total=False)
+CreateInferenceRequest.__doc__ = "Request body of create_inference()."
+
+CreateInferenceResponse = TypedDict("CreateInferenceResponse", {"subscription": "InferenceSubscription"}, total=False)
+CreateInferenceResponse.__doc__ = "Response of create_inference()."
+
+GetInferenceResponse = TypedDict("GetInferenceResponse", {"subscription": "InferenceSubscription"}, total=False)
+GetInferenceResponse.__doc__ = "Response of get_inference()."
+
+UpdateInferenceRequest = TypedDict("UpdateInferenceRequest", {"label": "str"}, total=False)
+UpdateInferenceRequest.__doc__ = "Request body of update_inference()."
+
+UpdateInferenceResponse = TypedDict("UpdateInferenceResponse", {"subscription": "InferenceSubscription"}, total=False)
+UpdateInferenceResponse.__doc__ = "Response of update_inference()."
+
+GetInferenceUsageResponse = TypedDict("GetInferenceUsageResponse", {"usage": "InferenceUsage"}, total=False)
+GetInferenceUsageResponse.__doc__ = "Response of get_inference_usage()."
+
+
+class ServerlessInferenceResource(Resource):
+    """Operations tagged ``serverless-inference``."""
+
+    def list_inference(self) -> ListInferenceResponse:
+        """List Serverless Inference"""
+        return self._api.call("GET", "/inference")
+
+    def create_inference(self, body: Optional[CreateInferenceRequest] = None) -> CreateInferenceResponse:
+        """Create Serverless Inference"""
+        return self._api.call("POST", "/inference", json=body)
+
+    def get_inference(self, inference_id: str) -> GetInferenceResponse:
+        """Get Serverless Inference"""
+        return self._api.call("GET", f"/inference/{_quote(inference_id)}", route="/inference/{inference-id}")
+
+    def update_inference(self, inference_id: str, body: Optional[UpdateInferenceRequest] = None) -> UpdateInferenceResponse:
+        """Update Serverless Inference"""
+        return self._api.call("PATCH", f"/inference/{_quote(inference_id)}", json=body, route="/inference/{inference-id}")
+
+    def delete_inference(self, inference_id: str) -> None:
+        """Delete Serverless Inference"""
+        return self._api.call("DELETE", f"/inference/{_quote(inference_id)}", route="/inference/{inference-id}")
+
+    def get_inference_usage(self, inference_id: str) -> GetInferenceUsageResponse:
+        """Get Serverless Inference Usage Information"""
+        return self._api.call("GET", f"/inference/{_quote(inference_id)}/usage", route="/inference/{inference-id}/usage")
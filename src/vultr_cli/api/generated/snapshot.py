@@ -0,0 +1,63 @@
+"""The ``snapshot`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, Snapshot
+
+
+GetSnapshotResponse = TypedDict("GetSnapshotResponse", {"snapshot": "Snapshot"}, total=False)
+GetSnapshotResponse.__doc__ = "Response of get_snapshot()."
+
+PutSnapshotsSnapshotIdRequest = TypedDict("PutSnapshotsSnapshotIdRequest", {"description": "str"}, total=False)
+PutSnapshotsSnapshotIdRequest.__doc__ = "Request body of put_snapshots_snapshot_id()."
+
+ListSnapshotsResponse = TypedDict("ListSnapshotsResponse", {"snapshots": "List[Snapshot]", "meta": "Meta"}, total=False)
+ListSnapshotsResponse.__doc__ = "Response of list_snapshots()."
+
+CreateSnapshotRequest = TypedDict("CreateSnapshotRequest", {"instance_id": "str", "description": "str"}, total=False)
+CreateSnapshotRequest.__doc__ = "Request body of create_snapshot()."
+
+CreateSnapshotResponse = TypedDict("CreateSnapshotResponse", {"snapshot": "Snapshot"}, total=False)
+CreateSnapshotResponse.__doc__ = "Response of create_snapshot()."
+
+CreateSnapshotCreateFromUrlRequest = TypedDict("CreateSnapshotCreateFromUrlRequest", {"url": "str", "description": "str", "uefi": "bool"}, total=False)
+CreateSnapshotCreateFromUrlRequest.__doc__ = "Request body of create_snapshot_create_from_url()."
+
+CreateSnapshotCreateFromUrlResponse = TypedDict("CreateSnapshotCreateFromUrlResponse", {"snapshot": "Snapshot"}, total=False)
+CreateSnapshotCreateFromUrlResponse.__doc__ = "Response of create_snapshot_create_from_url()."
+
+
+class SnapshotResource(Resource):
+    """Operations tagged ``snapshot``."""
+
+    def get_snapshot(self, snapshot_id: str) -> GetSnapshotResponse:
+        """Get Snapshot"""
+        return self._api.call("GET", f"/snapshots/{_quote(snapshot_id)}", route="/snapshots/{snapshot-id}")
+
+    def put_snapshots_snapshot_id(self, snapshot_id: str, body: Optional[PutSnapshotsSnapshotIdRequest] = None) -> None:
+        """Update Snapshot"""
+        return self._api.call("PUT", f"/snapshots/{_quote(snapshot_id)}", json=body, route="/snapshots/{snapshot-id}")
+
+    def delete_snapshot(self, snapshot_id: str) -> None:
+        """Delete Snapshot"""
+        return self._api.call("DELETE", f"/snapshots/{_quote(snapshot_id)}", route="/snapshots/{snapshot-id}")
+
+    def list_snapshots(self, *, description: Optional[str] = None, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListSnapshotsResponse:
+        """List Snapshots"""
+        return self._api.call("GET", "/snapshots", params={"description": description, "per_page": per_page, "cursor": cursor})
+
+    def create_snapshot(self, body: Optional[CreateSnapshotRequest] = None) -> CreateSnapshotResponse:
+        """Create Snapshot"""
+        return self._api.call("POST", "/snapshots", json=body)
+
+    def create_snapshot_create_from_url(self, body: Optional[CreateSnapshotCreateFromUrlRequest] = None) -> CreateSnapshotCreateFromUrlResponse:
+        """Create Snapshot from URL"""
+        return self._api.call("POST", "/snapshots/create-from-url", json=body)
@@ -0,0 +1,53 @@
+"""The ``ssh`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, Ssh
+
+
+GetSshKeyResponse = TypedDict("GetSshKeyResponse", {"ssh_key": "Ssh"}, total=False)
+GetSshKeyResponse.__doc__ = "Response of get_ssh_key()."
+
+UpdateSshKeyRequest = TypedDict("UpdateSshKeyRequest", {"name": "str", "ssh_key": "str"}, total=False)
+UpdateSshKeyRequest.__doc__ = "Request body of update_ssh_key()."
+
+ListSshKeysResponse = TypedDict("ListSshKeysResponse", {"ssh_keys": "List[Ssh]", "meta": "Meta"}, total=False)
+ListSshKeysResponse.__doc__ = "Response of list_ssh_keys()."
+
+CreateSshKeyRequest = TypedDict("CreateSshKeyRequest", {"name": "str", "ssh_key": "str"}, total=False)
+CreateSshKeyRequest.__doc__ = "Request body of create_ssh_key()."
+
+CreateSshKeyResponse = TypedDict("CreateSshKeyResponse", {"ssh_key": "Ssh"}, total=False)
+CreateSshKeyResponse.__doc__ = "Response of create_ssh_key()."
+
+
+class SshResource(Resource):
+    """Operations tagged ``ssh``."""
+
+    def get_ssh_key(self, ssh_key_id: str) -> GetSshKeyResponse:
+        """Get SSH Key"""
+        return self._api.call("GET", f"/ssh-keys/{_quote(ssh_key_id)}", route="/ssh-keys/{ssh-key-id}")
+
+    def update_ssh_key(self, ssh_key_id: str, body: Optional[UpdateSshKeyRequest] = None) -> None:
+        """Update SSH Key"""
+        return self._api.call("PATCH", f"/ssh-keys/{_quote(ssh_key_id)}", json=body, route="/ssh-keys/{ssh-key-id}")
+
+    def delete_ssh_key(self, ssh_key_id: str) -> None:
+        """Delete SSH Key"""
+        return self._api.call("DELETE", f"/ssh-keys/{_quote(ssh_key_id)}", route="/ssh-keys/{ssh-key-id}")
+
+    def list_ssh_keys(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListSshKeysResponse:
+        """List SSH Keys"""
+        return self._api.call("GET", "/ssh-keys", params={"per_page": per_page, "cursor": cursor})
+
+    def create_ssh_key(self, body: Optional[CreateSshKeyRequest] = None) -> CreateSshKeyResponse:
+        """Create SSH key"""
+        return self._api.call("POST", "/ssh-keys", json=body)
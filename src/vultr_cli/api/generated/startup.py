@@ -0,0 +1,53 @@
+"""The ``startup`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, Startup
+
+
+GetStartupScriptResponse = TypedDict("GetStartupScriptResponse", {"startup_script": "Startup"}, total=False)
+GetStartupScriptResponse.__doc__ = "Response of get_startup_script()."
+
+UpdateStartupScriptRequest = TypedDict("UpdateStartupScriptRequest", {"name": "str", "script": "str", "type": "str"}, total=False)
+UpdateStartupScriptRequest.__doc__ = "Request body of update_startup_script()."
+
+ListStartupScriptsResponse = TypedDict("ListStartupScriptsResponse", {"startup_scripts": "List[Startup]", "meta": "Meta"}, total=False)
+ListStartupScriptsResponse.__doc__ = "Response of list_startup_scripts()."
+
+CreateStartupScriptRequest = TypedDict("CreateStartupScriptRequest", {"name": "str", "type": "str", "script": "str"}, total=False)
+CreateStartupScriptRequest.__doc__ = "Request body of create_startup_script()."
+
+CreateStartupScriptResponse = TypedDict("CreateStartupScriptResponse", {"startup_script": "Startup"}, total=False)
+CreateStartupScriptResponse.__doc__ = "Response of create_startup_script()."
+
+
+class StartupResource(Resource):
+    """Operations tagged ``startup``."""
+
+    def get_startup_script(self, startup_id: str) -> GetStartupScriptResponse:
+        """Get Startup Script"""
+        return self._api.call("GET", f"/startup-scripts/{_quote(startup_id)}", route="/startup-scripts/{startup-id}")
+
+    def update_startup_script(self, startup_id: str, body: Optional[UpdateStartupScriptRequest] = None) -> None:
+        """Update Startup Script"""
+        return self._api.call("PATCH", f"/startup-scripts/{_quote(startup_id)}", json=body, route="/startup-scripts/{startup-id}")
+
+    def delete_startup_script(self, startup_id: str) -> None:
+        """Delete Startup Script"""
+        return self._api.call("DELETE", f"/startup-scripts/{_quote(startup_id)}", route="/startup-scripts/{startup-id}")
+
+    def list_startup_scripts(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListStartupScriptsResponse:
+        """List Startup Scripts"""
+        return self._api.call("GET", "/startup-scripts", params={"per_page": per_page, "cursor": cursor})
+
+    def create_startup_script(self, body: Optional[CreateStartupScriptRequest] = None) -> CreateStartupScriptResponse:
+        """Create Startup Script"""
+        return self._api.call("POST", "/startup-scripts", json=body)
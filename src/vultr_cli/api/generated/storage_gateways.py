@@ -0,0 +1,64 @@
+"""The ``storage-gateways`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, StorageGateway, StorageGatewayExport
+
+
+ListStorageGatewaysResponse = TypedDict("ListStorageGatewaysResponse", {"storage_gateway": "List[StorageGateway]", "meta": "Meta"}, total=False)
+ListStorageGatewaysResponse.__doc__ = "Response of list_storage_gateways()."
+
+CreateStorageGatewayRequest = TypedDict("CreateStorageGatewayRequest", {"label": "str", "type": "str", "region": "str", "export_config": "List[StorageGatewayExport]", "network_config": "Any"}, total=False)
+CreateStorageGatewayRequest.__doc__ = "Request body of create_storage_gateway()."
+
+CreateStorageGatewayResponse = TypedDict("CreateStorageGatewayResponse", {"storage_gateway": "StorageGateway"}, total=False)
+CreateStorageGatewayResponse.__doc__ = "Response of create_storage_gateway()."
+
+AddStorageGatewayExportResponse = TypedDict("AddStorageGatewayExportResponse", {"vpc": "StorageGatewayExport"}, total=False)
+AddStorageGatewayExportResponse.__doc__ = "Response of add_storage_gateway_export()."
+
+GetStorageGatewayResponse = TypedDict("GetStorageGatewayResponse", {"storage_gateway": "StorageGateway"}, total=False)
+GetStorageGatewayResponse.__doc__ = "Response of get_storage_gateway()."
+
+UpdateStorageGatewayRequest = TypedDict("UpdateStorageGatewayRequest", {"label": "str"}, total=False)
+UpdateStorageGatewayRequest.__doc__ = "Request body of update_storage_gateway()."
+
+
+class StorageGatewaysResource(Resource):
+    """Operations tagged ``storage-gateways``."""
+
+    def list_storage_gateways(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListStorageGatewaysResponse:
+        """List storage gateways"""
+        return self._api.call("GET", "/storage-gateways", params={"per_page": per_page, "cursor": cursor})
+
+    def create_storage_gateway(self, body: Optional[CreateStorageGatewayRequest] = None) -> CreateStorageGatewayResponse:
+        """Create Storage Gateway"""
+        return self._api.call("POST", "/storage-gateways", json=body)
+
+    def delete_storage_gateway_export(self, storage_gateway_id: Any, export_id: Any) -> None:
+        """Delete Storage Gateway Export"""
+        return self._api.call("DELETE", f"/storage-gateways/{_quote(storage_gateway_id)}/exports/{_quote(export_id)}", route="/storage-gateways/{storage-gateway-id}/exports/{export-id}")
+
+    def add_storage_gateway_export(self, storage_gateway_id: str, body: Optional[Dict[str, Any]] = None) -> AddStorageGatewayExportResponse:
+        """Add a new export to this storage gateway"""
+        return self._api.call("POST", f"/storage-gateways/{_quote(storage_gateway_id)}/exports", json=body, route="/storage-gateways/{storage-gateway-id}/exports")
+
+    def get_storage_gateway(self, storage_gateway_id: str) -> GetStorageGatewayResponse:
+        """Get Storage Gateway"""
+        return self._api.call("GET", f"/storage-gateways/{_quote(storage_gateway_id)}", route="/storage-gateways/{storage-gateway-id}")
+
+    def update_storage_gateway(self, storage_gateway_id: str, body: Optional[UpdateStorageGatewayRequest] = None) -> None:
+        """Update Storage Gateway"""
+        return self._api.call("PUT", f"/storage-gateways/{_quote(storage_gateway_id)}", json=body, route="/storage-gateways/{storage-gateway-id}")
+
+    def delete_storage_gateway(self, storage_gateway_id: str) -> None:
+        """Delete Storage Gateway"""
+        return self._api.call("DELETE", f"/storage-gateways/{_quote(storage_gateway_id)}", route="/storage-gateways/{storage-gateway-id}")
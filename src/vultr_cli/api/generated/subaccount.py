@@ -0,0 +1,35 @@
+"""The ``subaccount`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, Subaccount
+
+
+ListSubaccountsResponse = TypedDict("ListSubaccountsResponse", {"subaccounts": "List[Subaccount]", "meta": "Meta"}, total=False)
+ListSubaccountsResponse.__doc__ = "Response of list_subaccounts()."
+
+CreateSubaccountRequest = TypedDict("CreateSubaccountRequest", {"email": "str", "subaccount_name": "str", "subaccount_id": "str"}, total=False)
+CreateSubaccountRequest.__doc__ = "Request body of create_subaccount()."
+
+CreateSubaccountResponse = TypedDict("CreateSubaccountResponse", {"subaccount": "Subaccount"}, total=False)
+CreateSubaccountResponse.__doc__ = "Response of create_subaccount()."
+
+
+class SubaccountResource(Resource):
+    """Operations tagged ``subaccount``."""
+
+    def list_subaccounts(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListSubaccountsResponse:
+        """List Sub-Accounts"""
+        return self._api.call("GET", "/subaccounts", params={"per_page": per_page, "cursor": cursor})
+
+    def create_subaccount(self, body: Optional[CreateSubaccountRequest] = None) -> CreateSubaccountResponse:
+        """Create Sub-Account"""
+        return self._api.call("POST", "/subaccounts", json=body)
@@ -0,0 +1,100 @@
+"""The ``users`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Apikey, IpWhitelistEntry, Meta, User
+
+
+GetUserIpWhitelistEntryResponse = TypedDict("GetUserIpWhitelistEntryResponse", {"ip_whitelist_entry": "IpWhitelistEntry"}, total=False)
+GetUserIpWhitelistEntryResponse.__doc__ = "Response of get_user_ip_whitelist_entry()."
+
+ListUserIpWhitelistResponse = TypedDict("ListUserIpWhitelistResponse", {"ip_whitelist": "List[IpWhitelistEntry]", "meta": "Meta"}, total=False)
+ListUserIpWhitelistResponse.__doc__ = "Response of list_user_ip_whitelist()."
+
+AddUserIpWhitelistRequest = TypedDict("AddUserIpWhitelistRequest", {"subnet": "str", "subnet_size": "int"}, total=False)
+AddUserIpWhitelistRequest.__doc__ = "Request body of add_user_ip_whitelist()."
+
+UpdateUserRequest = TypedDict("UpdateUserRequest", {"email": "str", "name": "str", "first_name": "str", "last_name": "str", "password": "str", "api_enabled": "bool", "acls": "List[str]"}, total=False)
+UpdateUserRequest.__doc__ = "Request body of update_user()."
+
+RemoveUserIpWhitelistRequest = TypedDict("RemoveUserIpWhitelistRequest", {"subnet": "str", "subnet_size": "int"}, total=False)
+RemoveUserIpWhitelistRequest.__doc__ = "Request body of remove_user_ip_whitelist()."
+
+ListUserApiKeysResponse = TypedDict("ListUserApiKeysResponse", {"api_keys": "List[Apikey]"}, total=False)
+ListUserApiKeysResponse.__doc__ = "Response of list_user_api_keys()."
+
+CreateUserApiKeyRequest = TypedDict("CreateUserApiKeyRequest", {"name": "str", "expire": "bool", "date_expire": "str"}, total=False)
+CreateUserApiKeyRequest.__doc__ = "Request body of create_user_api_key()."
+
+GetUserApiKeyResponse = TypedDict("GetUserApiKeyResponse", {"api_key": "Apikey"}, total=False)
+GetUserApiKeyResponse.__doc__ = "Response of get_user_api_key()."
+
+ListUsersResponse = TypedDict("ListUsersResponse", {"users": "List[User]", "meta": "Meta"}, total=False)
+ListUsersResponse.__doc__ = "Response of list_users()."
+
+CreateUserRequest = TypedDict("CreateUserRequest", {"email": "str", "name": "str", "first_name": "str", "last_name": "str", "password": "str", "api_enabled": "bool", "acls": "List[str]", "service_user": "bool"}, total=False)
+CreateUserRequest.__doc__ = "Request body of create_user()."
+
+
+class UsersResource(Resource):
+    """Operations tagged ``users``."""
+
+    def get_user(self, user_id: str) -> User:
+        """Get User"""
+        return self._api.call("GET", f"/users/{_quote(user_id)}", route="/users/{user-id}")
+
+    def delete_user(self, user_id: str) -> None:
+        """Delete User"""
+        return self._api.call("DELETE", f"/users/{_quote(user_id)}", route="/users/{user-id}")
+
+    def get_user_ip_whitelist_entry(self, user_id: str, *, subnet: Optional[str] = None, subnet_size: Optional[int] = None) -> GetUserIpWhitelistEntryResponse:
+        """Get User IP Whitelist Entry"""
+        return self._api.call("GET", f"/users/{_quote(user_id)}/ip-whitelist/entry", params={"subnet": subnet, "subnet_size": subnet_size}, route="/users/{user-id}/ip-whitelist/entry")
+
+    def list_user_ip_whitelist(self, user_id: str) -> ListUserIpWhitelistResponse:
+        """List User IP Whitelist"""
+        return self._api.call("GET", f"/users/{_quote(user_id)}/ip-whitelist", route="/users/{user-id}/ip-whitelist")
+
+    def add_user_ip_whitelist(self, user_id: str, body: Optional[AddUserIpWhitelistRequest] = None) -> None:
+        """Add IP to User Whitelist"""
+        return self._api.call("POST", f"/users/{_quote(user_id)}/ip-whitelist", json=body, route="/users/{user-id}/ip-whitelist")
+
+    def update_user(self, user_id: str, body: Optional[UpdateUserRequest] = None) -> None:
+        """Update User"""
+        return self._api.call("PATCH", f"/users/{_quote(user_id)}/ip-whitelist", json=body, route="/users/{user-id}/ip-whitelist")
+
+    def remove_user_ip_whitelist(self, user_id: str, body: Optional[RemoveUserIpWhitelistRequest] = None) -> None:
+        """Remove IP from User Whitelist"""
+        return self._api.call("DELETE", f"/users/{_quote(user_id)}/ip-whitelist", json=body, route="/users/{user-id}/ip-whitelist")
+
+    def list_user_api_keys(self, user_id: str) -> ListUserApiKeysResponse:
+        """List User API Keys"""
+        return self._api.call("GET", f"/users/{_quote(user_id)}/apikeys", route="/users/{user-id}/apikeys")
+
+    def create_user_api_key(self, user_id: str, body: Optional[CreateUserApiKeyRequest] = None) -> None:
+        """Create User API Key"""
+        return self._api.call("POST", f"/users/{_quote(user_id)}/apikeys", json=body, route="/users/{user-id}/apikeys")
+
+    def get_user_api_key(self, user_id: str, apikey_id: str) -> GetUserApiKeyResponse:
+        """Get User API Key"""
+        return self._api.call("GET", f"/users/{_quote(user_id)}/apikeys/{_quote(apikey_id)}", route="/users/{user-id}/apikeys/{apikey-id}")
+
+    def delete_user_api_key(self, user_id: str, apikey_id: str) -> None:
+        """Delete User API Key"""
+        return self._api.call("DELETE", f"/users/{_quote(user_id)}/apikeys/{_quote(apikey_id)}", route="/users/{user-id}/apikeys/{apikey-id}")
+
+    def list_users(self, *, per_page: Optional[float] = None, cursor: Optional[str] = None) -> ListUsersResponse:
+        """Get Users"""
+        return self._api.call("GET", "/users", params={"per_page": per_page, "cursor": cursor})
+
+    def create_user(self, body: Optional[CreateUserRequest] = None) -> User:
+        """Create User"""
+        return self._api.call("POST", "/users", json=body)
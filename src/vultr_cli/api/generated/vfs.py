@@ -0,0 +1,73 @@
+"""The ``VFS`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Vfs, VfsAttachment, VfsRegion
+
+
+ListRegionsResponse = TypedDict("ListRegionsResponse", {"regions": "List[VfsRegion]"}, total=False)
+ListRegionsResponse.__doc__ = "Response of list_regions()."
+
+ListVfsResponse = TypedDict("ListVfsResponse", {"vfs": "List[Vfs]"}, total=False)
+ListVfsResponse.__doc__ = "Response of list_vfs()."
+
+CreateVfsRequest = TypedDict("CreateVfsRequest", {"region": "str", "label": "str", "storage_size": "Dict[str, Any]", "disk_type": "str", "tags": "List[str]"}, total=False)
+CreateVfsRequest.__doc__ = "Request body of create_vfs()."
+
+UpdateVfsRequest = TypedDict("UpdateVfsRequest", {"label": "str", "storage_size": "Dict[str, Any]"}, total=False)
+UpdateVfsRequest.__doc__ = "Request body of update_vfs()."
+
+ListVfsattachmentsResponse = TypedDict("ListVfsattachmentsResponse", {"attachments": "List[VfsAttachment]"}, total=False)
+ListVfsattachmentsResponse.__doc__ = "Response of list_vfsattachments()."
+
+
+class VFSResource(Resource):
+    """Operations tagged ``VFS``."""
+
+    def list_regions(self) -> ListRegionsResponse:
+        """List VFS Regions"""
+        return self._api.call("GET", "/vfs/regions")
+
+    def list_vfs(self) -> ListVfsResponse:
+        """List VFSs"""
+        return self._api.call("GET", "/vfs")
+
+    def create_vfs(self, body: CreateVfsRequest) -> Vfs:
+        """Create VFS"""
+        return self._api.call("POST", "/vfs", json=body)
+
+    def get_vfs(self, vfs_id: str) -> Vfs:
+        """Get VFS"""
+        return self._api.call("GET", f"/vfs/{_quote(vfs_id)}", route="/vfs/{vfs_id}")
+
+    def update_vfs(self, body: Optional[UpdateVfsRequest] = None) -> Vfs:
+        """Update VFS"""
+        return self._api.call("PUT", "/vfs/{vfs_id}", json=body)
+
+    def delete_vfs(self, vfs_id: str) -> None:
+        """Delete VFS"""
+        return self._api.call("DELETE", f"/vfs/{_quote(vfs_id)}", route="/vfs/{vfs_id}")
+
+    def list_vfsattachments(self, vfs_id: str) -> ListVfsattachmentsResponse:
+        """List VFS Attachments"""
+        return self._api.call("GET", f"/vfs/{_quote(vfs_id)}/attachments", route="/vfs/{vfs_id}/attachments")
+
+    def get_vfsattachment(self, vfs_id: str, vps_id: str) -> VfsAttachment:
+        """Get VFS Attachment"""
+        return self._api.call("GET", f"/vfs/{_quote(vfs_id)}/attachments/{_quote(vps_id)}", route="/vfs/{vfs_id}/attachments/{vps_id}")
+
+    def create_vfsattachment(self, vfs_id: str, vps_id: str) -> VfsAttachment:
+        """Attach VPS Instance to VFS"""
+        return self._api.call("PUT", f"/vfs/{_quote(vfs_id)}/attachments/{_quote(vps_id)}", route="/vfs/{vfs_id}/attachments/{vps_id}")
+
+    def delete_vfsattachment(self, vfs_id: str, vps_id: str) -> None:
+        """Delete VFS Attachment"""
+        return self._api.call("DELETE", f"/vfs/{_quote(vfs_id)}/attachments/{_quote(vps_id)}", route="/vfs/{vfs_id}/attachments/{vps_id}")
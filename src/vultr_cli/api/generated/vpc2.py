@@ -0,0 +1,74 @@
+"""The ``VPC2`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, Vpc2, Vpc2nodes
+
+
+GetVpc2Response = TypedDict("GetVpc2Response", {"vpc": "Vpc2"}, total=False)
+GetVpc2Response.__doc__ = "Response of get_vpc2()."
+
+UpdateVpc2Request = TypedDict("UpdateVpc2Request", {"description": "str"}, total=False)
+UpdateVpc2Request.__doc__ = "Request body of update_vpc2()."
+
+ListVpc2Response = TypedDict("ListVpc2Response", {"vpcs": "List[Vpc2]", "meta": "Meta"}, total=False)
+ListVpc2Response.__doc__ = "Response of list_vpc2()."
+
+CreateVpc2Request = TypedDict("CreateVpc2Request", {"region": "str", "description": "str", "ip_type": "str", "ip_block": "str", "prefix_length": "int"}, total=False)
+CreateVpc2Request.__doc__ = "Request body of create_vpc2()."
+
+CreateVpc2Response = TypedDict("CreateVpc2Response", {"vpc": "Vpc2"}, total=False)
+CreateVpc2Response.__doc__ = "Response of create_vpc2()."
+
+ListVpc2NodesResponse = TypedDict("ListVpc2NodesResponse", {"nodes": "Vpc2nodes"}, total=False)
+ListVpc2NodesResponse.__doc__ = "Response of list_vpc2_nodes()."
+
+AttachVpc2NodesRequest = TypedDict("AttachVpc2NodesRequest", {"nodes": "List[Any]"}, total=False)
+AttachVpc2NodesRequest.__doc__ = "Request body of attach_vpc2_nodes()."
+
+DetachVpc2NodesRequest = TypedDict("DetachVpc2NodesRequest", {"nodes": "List[Any]"}, total=False)
+DetachVpc2NodesRequest.__doc__ = "Request body of detach_vpc2_nodes()."
+
+
+class VPC2Resource(Resource):
+    """Operations tagged ``VPC2``."""
+
+    def get_vpc2(self, vpc_id: str) -> GetVpc2Response:
+        """Get a VPC 2.0 network"""
+        return self._api.call("GET", f"/vpc2/{_quote(vpc_id)}", route="/vpc2/{vpc-id}")
+
+    def update_vpc2(self, vpc_id: str, body: Optional[UpdateVpc2Request] = None) -> None:
+        """Update a VPC 2.0 network"""
+        return self._api.call("PUT", f"/vpc2/{_quote(vpc_id)}", json=body, route="/vpc2/{vpc-id}")
+
+    def delete_vpc2(self, vpc_id: str) -> None:
+        """Delete a VPC 2.0 network"""
+        return self._api.call("DELETE", f"/vpc2/{_quote(vpc_id)}", route="/vpc2/{vpc-id}")
+
+    def list_vpc2(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListVpc2Response:
+        """List VPC 2.0 networks"""
+        return self._api.call("GET", "/vpc2", params={"per_page": per_page, "cursor": cursor})
+
+    def create_vpc2(self, body: Optional[CreateVpc2Request] = None) -> CreateVpc2Response:
+        """Create a VPC 2.0 network"""
+        return self._api.call("POST", "/vpc2", json=body)
+
+    def list_vpc2_nodes(self, vpc_id: str, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListVpc2NodesResponse:
+        """Get a list of nodes attached to a VPC 2.0 network"""
+        return self._api.call("GET", f"/vpc2/{_quote(vpc_id)}/nodes", params={"per_page": per_page, "cursor": cursor}, route="/vpc2/{vpc-id}/nodes")
+
+    def attach_vpc2_nodes(self, vpc_id: str, body: Optional[AttachVpc2NodesRequest] = None) -> None:
+        """Attach nodes to a VPC 2.0 network"""
+        return self._api.call("POST", f"/vpc2/{_quote(vpc_id)}/nodes/attach", json=body, route="/vpc2/{vpc-id}/nodes/attach")
+
+    def detach_vpc2_nodes(self, vpc_id: str, body: Optional[DetachVpc2NodesRequest] = None) -> None:
+        """Remove nodes from a VPC 2.0 network"""
+        return self._api.call("POST", f"/vpc2/{_quote(vpc_id)}/nodes/detach", json=body, route="/vpc2/{vpc-id}/nodes/detach")
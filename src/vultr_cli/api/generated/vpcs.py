@@ -0,0 +1,53 @@
+"""The ``VPCs`` resource group of the Vultr API.
+
+Generated from openapi.json by tools/generate_client.py; do not edit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ._base import Resource, TypedDict, _quote
+
+if TYPE_CHECKING:
+    from .models import Meta, Vpc
+
+
+GetVpcResponse = TypedDict("GetVpcResponse", {"vpc": "Vpc"}, total=False)
+GetVpcResponse.__doc__ = "Response of get_vpc()."
+
+UpdateVpcRequest = TypedDict("UpdateVpcRequest", {"description": "str"}, total=False)
+UpdateVpcRequest.__doc__ = "Request body of update_vpc()."
+
+ListVpcsResponse = TypedDict("ListVpcsResponse", {"vpcs": "List[Vpc]", "meta": "Meta"}, total=False)
+ListVpcsResponse.__doc__ = "Response of list_vpcs()."
+
+CreateVpcRequest = TypedDict("CreateVpcRequest", {"region": "str", "description": "str", "v4_subnet": "str", "v4_subnet_mask": "int"}, total=False)
+CreateVpcRequest.__doc__ = "Request body of create_vpc()."
+
+CreateVpcResponse = TypedDict("CreateVpcResponse", {"vpc": "Vpc"}, total=False)
+CreateVpcResponse.__doc__ = "Response of create_vpc()."
+
+
+class VPCsResource(Resource):
+    """Operations tagged ``VPCs``."""
+
+    def get_vpc(self, vpc_id: str) -> GetVpcResponse:
+        """Get a VPC"""
+        return self._api.call("GET", f"/vpcs/{_quote(vpc_id)}", route="/vpcs/{vpc-id}")
+
+    def update_vpc(self, vpc_id: str, body: Optional[UpdateVpcRequest] = None) -> None:
+        """Update a VPC"""
+        return self._api.call("PUT", f"/vpcs/{_quote(vpc_id)}", json=body, route="/vpcs/{vpc-id}")
+
+    def delete_vpc(self, vpc_id: str) -> None:
+        """Delete a VPC"""
+        return self._api.call("DELETE", f"/vpcs/{_quote(vpc_id)}", route="/vpcs/{vpc-id}")
+
+    def list_vpcs(self, *, per_page: Optional[int] = None, cursor: Optional[str] = None) -> ListVpcsResponse:
+        """List VPCs"""
+        return self._api.call("GET", "/vpcs", params={"per_page": per_page, "cursor": cursor})
+
+    def create_vpc(self, body: Optional[CreateVpcRequest] = None) -> CreateVpcResponse:
+        """Create a VPC"""
+        return self._api.call("POST", "/vpcs", json=body)
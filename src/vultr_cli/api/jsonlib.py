@@ -0,0 +1,20 @@
+"""JSON decoding with an optional faster backend.
+
+Uses orjson when it is installed (it is optional, and not available in every
+python-for-android build) and the standard library otherwise. Both accept
+``bytes`` and raise a ``ValueError`` subclass on malformed input.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    BACKEND = "orjson"
+    loads = orjson.loads
+else:
+    BACKEND = "json"
+    loads = json.loads
@@ -0,0 +1,141 @@
+"""Incremental decoding of the list responses of the API.
+
+A list response is one object whose largest member is an array, e.g.
+``{"instances": [...], "meta": {...}}``. ``ArrayStream`` is fed the body
+chunk by chunk as it arrives and hands out the array's elements as soon as
+each one is complete, so neither the whole body nor the whole list of
+decoded dicts is ever held in memory. Every element and every other member
+is decoded by the standard library's C scanner; only the object and array
+punctuation between them is walked here.
+"""
+
+import codecs
+import json
+import re
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_decode = json.JSONDecoder().raw_decode
+
+# Parser states
+_OPEN, _KEY, _COLON, _VALUE, _MEMBER_END, _ITEM, _ITEM_END, _DONE = range(8)
+
+
+class ArrayStream:
+    """Push parser yielding the elements of the array member ``key``.
+
+    ``feed`` takes the next chunk of the body (bytes) and returns the
+    elements completed by it, passed through ``convert`` when given, e.g. a
+    model's ``from_dict`` so that only the fields it keeps outlive the
+    chunk. The other members (e.g. ``meta``) are collected in ``members``.
+    ``close`` must be called after the last chunk; it raises ``ValueError``
+    if the body was truncated or malformed.
+    """
+
+    def __init__(self, key, convert=None):
+        self.key = key
+        self.convert = convert
+        self.members = {}
+        self.size = 0
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = _OPEN
+        self._member = None
+
+    def feed(self, chunk):
+        self.size += len(chunk)
+        self._buffer += self._text.decode(chunk)
+        return self._parse()
+
+    def close(self):
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._parse()
+        if self._state != _DONE or self._buffer.strip():
+            raise ValueError(f"Truncated or malformed JSON list response for {self.key!r}")
+        return items
+
+    def _value(self, buffer, pos):
+        """Decode the value at ``pos``; None if it may still be incomplete.
+
+        A value is only trusted once the ``,``, ``:``, ``]`` or ``}`` after
+        it has arrived: ``1`` may still become ``1.5e3``.
+        """
+        try:
+            value, end = _decode(buffer, pos)
+        except ValueError:
+            return None
+        after = _WHITESPACE.match(buffer, end).end()
+        if after >= len(buffer) or buffer[after] not in ",:]}":
+            return None
+        return value, end
+
+    def _parse(self):
+        buffer = self._buffer
+        items = []
+        pos = 0
+        state = self._state
+        convert = self.convert
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+            char = buffer[pos]
+            if state == _ITEM:
+                if char == "]":
+                    state = _MEMBER_END
+                    pos += 1
+                    continue
+                decoded = self._value(buffer, pos)
+                if decoded is None:
+                    break
+                item, pos = decoded
+                items.append(item if convert is None else convert(item))
+                state = _ITEM_END
+            elif state == _ITEM_END:
+                if char not in ",]":
+                    raise self._error(pos)
+                state = _ITEM if char == "," else _MEMBER_END
+                pos += 1
+            elif state == _OPEN:
+                if char != "{":
+                    raise self._error(pos)
+                state = _KEY
+                pos += 1
+            elif state == _KEY:
+                if char == "}":
+                    state = _DONE
+                    pos += 1
+                    continue
+                decoded = self._value(buffer, pos)
+                if decoded is None:
+                    break
+                self._member, pos = decoded
+                state = _COLON
+            elif state == _COLON:
+                if char != ":":
+                    raise self._error(pos)
+                state = _VALUE
+                pos += 1
+            elif state == _VALUE:
+                if self._member == self.key and char == "[":
+                    state = _ITEM
+                    pos += 1
+                    continue
+                decoded = self._value(buffer, pos)
+                if decoded is None:
+                    break
+                self.members[self._member], pos = decoded
+                state = _MEMBER_END
+            elif state == _MEMBER_END:
+                if char not in ",}":
+                    raise self._error(pos)
+                state = _KEY if char == "," else _DONE
+                pos += 1
+            else:
+                raise self._error(pos)
+        self._buffer = buffer[pos:]
+        self._state = state
+        return items
+
+    def _error(self, pos):
+        return ValueError(f"Unexpected {self._buffer[pos:pos + 20]!r} in JSON list "
+                          f"response for {self.key!r}")
@@ -0,0 +1,103 @@
+"""Compact models for the API objects the app keeps in memory."""
+
+import sys
+from operator import attrgetter
+
+
+class Model:
+    """Base class of the slotted API models.
+
+    ``from_dict`` keeps only the fields named in ``__slots__`` (missing ones
+    are None), stores the list fields named in ``TUPLES`` as tuples and
+    interns the short, repetitive strings named in ``INTERNED`` so that e.g.
+    a fleet of instances shares one copy of each region, plan and status
+    value. ``to_dict`` returns the trimmed JSON form.
+    """
+
+    __slots__ = ()
+    INTERNED = ()
+    TUPLES = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Split once per class so from_dict does no per-field lookups
+        converted = dict.fromkeys(cls.INTERNED, sys.intern)
+        converted.update(dict.fromkeys(cls.TUPLES, tuple))
+        cls._plain = tuple(name for name in cls.__slots__ if name not in converted)
+        cls._converted = tuple(converted.items())
+        # All fields at once, for the equality tests of list refreshes
+        cls._values = attrgetter(*cls.__slots__)
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    @classmethod
+    def from_dict(cls, data):
+        model = cls.__new__(cls)
+        get = data.get
+        for name in cls._plain:
+            setattr(model, name, get(name))
+        for name, convert in cls._converted:
+            value = get(name)
+            setattr(model, name, value if value is None else convert(value))
+        return model
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values(self) == other._values(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}(id={getattr(self, 'id', None)!r})"
+
+
+class Region(Model):
+    __slots__ = ("id", "city", "country", "continent")
+    INTERNED = ("id", "city", "country", "continent")
+
+
+class Plan(Model):
+    __slots__ = ("id", "type", "vcpu_count", "ram", "disk", "disk_count",
+                 "bandwidth", "monthly_cost", "hourly_cost")
+    INTERNED = ("id", "type")
+
+
+class Snapshot(Model):
+    __slots__ = ("id", "description", "date_created", "size", "status", "os_id")
+    INTERNED = ("status",)
+
+
+class Instance(Model):
+    __slots__ = ("id", "label", "hostname", "os", "region", "plan", "main_ip",
+                 "v6_main_ip", "status", "power_status", "server_status",
+                 "vcpu_count", "ram", "disk", "date_created", "pending_charges",
+                 "tags")
+    TUPLES = ("tags",)
+    INTERNED = ("os", "region", "plan", "status", "power_status", "server_status")
+
+
+class Account(Model):
+    __slots__ = ("name", "email", "balance", "pending_charges", "last_payment_date",
+                 "last_payment_amount")
+
+
+class BillingEntry(Model):
+    __slots__ = ("id", "date", "type", "description", "amount", "balance")
+    INTERNED = ("type",)
+
+
+class PendingCharge(Model):
+    __slots__ = ("description", "start_date", "end_date", "units", "unit_type",
+                 "unit_price", "total", "product")
+    INTERNED = ("unit_type", "product")
+
+
+def intern_ids(ids):
+    """Intern a list of plan or region ids."""
+    return [sys.intern(value) for value in ids]
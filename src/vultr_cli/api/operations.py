@@ -0,0 +1,114 @@
+"""Durable, idempotently replayed instance operations."""
+
+import threading
+
+from .bulk import BulkOperations, fan_out
+from .client import VultrAPI, VultrAPIError
+from .store import PENDING
+
+
+class OperationQueue:
+    """Write-ahead queue of creates and destroys on top of a ``LocalStore``.
+
+    ``submit`` records an operation in the store before sending it and then
+    runs it once. If the API cannot be reached (see
+    ``VultrAPI.is_transient``) the operation stays pending and ``replay``
+    sends it again later, e.g. when connectivity returns or on the next
+    start; any other error marks it failed. ``submit_many`` records a batch
+    of operations the same way and runs them concurrently.
+
+    Replays never duplicate work. Every create is tagged ``op-<id>``, and
+    before re-sending one the queue looks for an instance with that tag in
+    case an earlier attempt reached the API but its response was lost. A
+    destroy answered with 404 means the instance is already gone.
+    """
+
+    TAG_PREFIX = "op-"
+
+    def __init__(self, api, store):
+        self.api = api
+        self.store = store
+        self.handlers = {"create": self._create, "destroy": self._destroy}
+        self._lock = threading.Lock()  # One operation in flight at a time
+
+    def submit(self, kind, **params):
+        """Record and run a ``create`` (``create_instance`` arguments) or
+        ``destroy`` (``instance_id``) operation.
+
+        Returns the stored ``Operation``, done or still pending; raises the
+        error if the API refused it.
+        """
+        operation = self.store.enqueue(kind, params)
+        with self._lock:
+            return self._run(operation)
+
+    def submit_many(self, kind, items, max_workers=BulkOperations.DEFAULT_MAX_WORKERS):
+        """Record one operation per params dict in ``items``, then run them
+        on up to ``max_workers`` threads.
+
+        Yields a ``BulkResult`` per item in completion order whose result is
+        the stored ``Operation``, done or still pending.
+        """
+        items = list(items)
+        with self._lock:  # Recorded under the lock, so a replay cannot run them too
+            operations = [self.store.enqueue(kind, params) for params in items]
+            params = {operation.id: item for operation, item in zip(operations, items)}
+            for result in fan_out(self._run, operations, max_workers):
+                yield result._replace(item=params[result.item.id])
+
+    def replay(self):
+        """Send the pending operations again, oldest first.
+
+        Stops at the first one that still cannot reach the API. Returns the
+        operations that finished (done or failed) during this replay.
+        """
+        if not self._lock.acquire(blocking=False):
+            return []  # Already replaying or submitting
+        finished = []
+        try:
+            for operation in self.store.operations(PENDING):
+                try:
+                    operation = self._run(operation)
+                except Exception:
+                    operation = self.store.get(operation.id)
+                if operation.status == PENDING:
+                    break
+                finished.append(operation)
+        finally:
+            self._lock.release()
+        return finished
+
+    def pending(self):
+        return self.store.operations(PENDING)
+
+    def _run(self, operation):
+        self.store.begin(operation.id)
+        try:
+            result = self.handlers[operation.kind](operation)
+        except Exception as e:
+            if VultrAPI.is_transient(e):
+                self.store.retry_later(operation.id, str(e))
+                return self.store.get(operation.id)
+            self.store.fail(operation.id, str(e))
+            raise
+        self.store.complete(operation.id, result)
+        return self.store.get(operation.id)
+
+    def _create(self, operation):
+        tag = self.TAG_PREFIX + operation.id
+        if operation.attempts:
+            # An earlier attempt may have created it before the network dropped
+            for instance in self.api.iter_instances(tag=tag):
+                return instance.to_dict()
+        instance = self.api.create_instance(tags=[tag], **operation.params)
+        return instance.to_dict()
+
+    def _destroy(self, operation):
+        instance_id = operation.params["instance_id"]
+        try:
+            self.api.call("DELETE", f"/instances/{instance_id}",
+                          route="/instances/{instance-id}")
+        except VultrAPIError as e:
+            if e.status_code != 404:
+                raise
+        return instance_id
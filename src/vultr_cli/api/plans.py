@@ -0,0 +1,69 @@
+"""Local plan catalog index for filtering and sorting without the network."""
+
+from bisect import bisect_left, bisect_right
+
+
+class PlanIndex:
+    """Plans pre-sorted by each ``SORT_KEYS`` field, built once per catalog load.
+
+    ``query`` walks one of the pre-sorted orderings and keeps the plans that
+    pass the filters, so results come back already sorted. When the
+    ``max_price`` or a minimum applies to the ordering being walked, the scan
+    is cut short with a binary search instead of visiting every plan.
+    """
+
+    SORT_KEYS = ("monthly_cost", "vcpu_count", "ram", "disk")
+
+    def __init__(self, plans=()):
+        self.load(plans)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, plan_id):
+        return plan_id in self._by_id
+
+    def load(self, plans):
+        """Replace the indexed catalog with ``plans``."""
+        self._by_id = {plan.id: plan for plan in plans}
+        self._orders = {}
+        self._values = {}
+        for key in self.SORT_KEYS:
+            order = sorted(self._by_id.values(),
+                           key=lambda plan: (getattr(plan, key) or 0, plan.id))
+            self._orders[key] = order
+            self._values[key] = [getattr(plan, key) or 0 for plan in order]
+        self.types = sorted({plan.type for plan in self._by_id.values() if plan.type})
+
+    def get(self, plan_id):
+        return self._by_id.get(plan_id)
+
+    def query(self, available=None, plan_type=None, min_vcpu=None, min_ram=None,
+              max_price=None, sort="monthly_cost", descending=False):
+        """Plans matching every given filter, ordered by ``sort``.
+
+        ``available`` is a set of plan ids (e.g. ``AvailabilityIndex.plans_in``
+        for the selected region); ``min_ram`` is in MB like the API's ``ram``.
+        """
+        order = self._orders[sort]
+        values = self._values[sort]
+        start, end = 0, len(order)
+        bounds = {"monthly_cost": (None, max_price), "vcpu_count": (min_vcpu, None),
+                  "ram": (min_ram, None)}
+        low, high = bounds.get(sort, (None, None))
+        if low is not None:
+            start = bisect_left(values, low)
+        if high is not None:
+            end = bisect_right(values, high)
+
+        result = [
+            plan for plan in order[start:end]
+            if (available is None or plan.id in available)
+            and (plan_type is None or plan.type == plan_type)
+            and (min_vcpu is None or (plan.vcpu_count or 0) >= min_vcpu)
+            and (min_ram is None or (plan.ram or 0) >= min_ram)
+            and (max_price is None or (plan.monthly_cost or 0) <= max_price)
+        ]
+        if descending:
+            result.reverse()
+        return result
@@ -0,0 +1,76 @@
+"""Client-side rate limiting for the Vultr API."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    ``acquire()`` blocks until a token is available and ``acquire_async()``
+    awaits one, so threads and event loops can share a bucket. ``waits``
+    and ``wait_time`` count how often and how long callers were throttled.
+    """
+
+    # Vultr throttles clients above 30 requests per second.
+    DEFAULT_RATE = 25
+    DEFAULT_BURST = 25
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rate=DEFAULT_RATE, capacity=DEFAULT_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self.waits = 0
+        self.wait_time = 0.0
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, api_key):
+        """Process-wide bucket for ``api_key``, shared by every client using it."""
+        with cls._shared_lock:
+            bucket = cls._shared.get(api_key)
+            if bucket is None:
+                bucket = cls._shared[api_key] = cls()
+            return bucket
+
+    def _take(self, tokens, waited):
+        """Take ``tokens`` and return 0 if they are available, otherwise the
+        seconds until they will be."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity,
+                               self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                if waited:
+                    self.waits += 1
+                    self.wait_time += waited
+                return 0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens=1):
+        """Take ``tokens``, sleeping as needed; returns the seconds waited."""
+        waited = 0.0
+        while True:
+            delay = self._take(tokens, waited)
+            if not delay:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    async def acquire_async(self, tokens=1):
+        """``acquire()`` for coroutines: waits without blocking the event loop."""
+        import asyncio  # Only async clients need it; keeps CLI startup lean
+
+        waited = 0.0
+        while True:
+            delay = self._take(tokens, waited)
+            if not delay:
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
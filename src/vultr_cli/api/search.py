@@ -0,0 +1,282 @@
+"""In-memory search index over the instances of an account."""
+
+import re
+from bisect import bisect_left
+
+# Instance fields by how their values are tokenized: "words" are also split
+# on punctuation so that e.g. "web" finds the label "prod-web-1"
+WORD_FIELDS = ("label", "hostname", "os", "plan", "tags")
+VALUE_FIELDS = ("id", "main_ip", "v6_main_ip", "region", "status", "power_status",
+                "server_status")
+# Field names accepted in "field:prefix" terms
+ALIASES = {
+    "ip": ("main_ip", "v6_main_ip"),
+    "tag": ("tags",),
+    "state": ("status", "power_status", "server_status"),
+}
+_SEPARATORS = re.compile(r"[\s\-_.:/,]+")
+
+
+class InstanceIndex:
+    """Inverted index from field tokens to instance ids.
+
+    Values are lowercased. ``VALUE_FIELDS`` are indexed whole, so ids and
+    IPs match by prefix as typed; ``WORD_FIELDS`` are indexed word by word,
+    plus whole for values of several words, in a separate table that only
+    prefixes spanning a separator (``node-1``) look at, so that a short
+    prefix like ``n`` does not have to merge every ``node-<n>`` label.
+
+    ``search`` matches each whitespace-separated term as a prefix of some
+    token; a term ``field:prefix`` (e.g. ``region:ewr``, ``tag:web``,
+    ``ip:10.1``, see ``ALIASES``) only looks at that field. Instances must
+    match every term.
+
+    ``update`` takes the refreshed instance list and reindexes only the
+    changed fields of the instances that were added, changed or removed.
+    The matches of recent terms are kept until an update touches their
+    tables, since search-as-you-type repeats all but the last term on
+    every keystroke.
+    """
+
+    FIELDS = WORD_FIELDS + VALUE_FIELDS
+    TERM_CACHE_SIZE = 64
+    BLOCK = 64  # Sorted tokens per precomputed union
+
+    def __init__(self, instances=()):
+        self._instances = {}  # id -> indexed instance
+        # (field, whole) -> token -> ids; a 1-tuple for the many tokens of one
+        # instance (ids, IPs, labels) since a set costs four times the memory
+        self._postings = {(field, False): {} for field in self.FIELDS}
+        self._postings.update({(field, True): {} for field in WORD_FIELDS})
+        self._sorted = {table: [] for table in self._postings}
+        self._blocks = {table: [] for table in self._postings}
+        self._terms = {}  # term -> (tables, ids)
+        self._order = []  # Instances as last passed to update
+        self._position = {}  # id -> index in _order
+        self._ids = frozenset()
+        self._complete = set()  # Tables with a token for every instance
+        self.update(instances)
+
+    def __len__(self):
+        return len(self._instances)
+
+    def __contains__(self, instance_id):
+        return instance_id in self._instances
+
+    @staticmethod
+    def _tokens(field, value):
+        """``(whole, token)`` pairs of a field value."""
+        if not value:
+            return ()
+        if field not in WORD_FIELDS:
+            return ((False, str(value).lower()),)
+        pairs = set()
+        for value in value if isinstance(value, tuple) else (value,):
+            value = str(value).lower()
+            words = [word for word in _SEPARATORS.split(value) if word]
+            pairs.update((False, word) for word in words)
+            if len(words) > 1:
+                pairs.add((True, value))
+        return pairs
+
+    def _add(self, instances, fields, touched):
+        """Index ``fields`` of ``instances``, adding the tables changed to
+        ``touched``; returns the tables that gained tokens."""
+        grown = set()
+        for field in fields:
+            # Group the new ids by token first: one merge per distinct token
+            # instead of one per instance is what keeps building 10k fast
+            groups = {(field, False): {}, (field, True): {}}
+            words = groups[(field, False)]
+            if field in WORD_FIELDS:
+                tokens = {}  # Repeated values (os, plan, tags) are split once
+                for instance in instances:
+                    value = getattr(instance, field)
+                    if not value:
+                        continue
+                    pairs = tokens.get(value)
+                    if pairs is None:
+                        pairs = tokens[value] = self._tokens(field, value)
+                    for whole, token in pairs:
+                        groups[(field, whole)].setdefault(token, []).append(instance.id)
+            else:
+                for instance in instances:
+                    value = getattr(instance, field)
+                    if value:
+                        words.setdefault(str(value).lower(), []).append(instance.id)
+
+            for table, group in groups.items():
+                if not group:
+                    continue
+                postings = self._postings[table]
+                size = len(postings)
+                for token, new in group.items():
+                    ids = postings.get(token)
+                    if ids.__class__ is set:
+                        ids.update(new)
+                        continue
+                    if ids is not None:
+                        new += ids
+                    postings[token] = tuple(new) if len(new) == 1 else set(new)
+                touched.add(table)
+                if len(postings) != size:
+                    grown.add(table)
+        return grown
+
+    def _remove(self, instances, fields, touched):
+        """Unindex ``fields`` of ``instances``; returns the tables that lost
+        tokens."""
+        shrunk = set()
+        for field in fields:
+            for instance in instances:
+                for whole, token in self._tokens(field, getattr(instance, field)):
+                    table = (field, whole)
+                    postings = self._postings[table]
+                    ids = postings[token]
+                    touched.add(table)
+                    if ids.__class__ is set:
+                        ids.discard(instance.id)
+                        if len(ids) == 1:
+                            postings[token] = tuple(ids)
+                    else:
+                        del postings[token]
+                        shrunk.add(table)
+        return shrunk
+
+    def update(self, instances):
+        """Make the index hold exactly ``instances``; returns how many were
+        ``(added, changed, removed)``."""
+        current = {instance.id: instance for instance in instances}
+        removed = [instance for instance_id, instance in self._instances.items()
+                   if instance_id not in current]
+        touched = set()
+        resort = self._remove(removed, self.FIELDS, touched)
+        for instance in removed:
+            del self._instances[instance.id]
+
+        added = []
+        changed = 0
+        fields = {}  # field -> ([indexed instance], [instance]) of the changed
+        for instance_id, instance in current.items():
+            indexed = self._instances.get(instance_id)
+            if indexed is None:
+                added.append(instance)
+            elif indexed is not instance and indexed != instance:
+                changed += 1
+                for field in self.FIELDS:
+                    if getattr(indexed, field) != getattr(instance, field):
+                        old, new = fields.setdefault(field, ([], []))
+                        old.append(indexed)
+                        new.append(instance)
+                self._instances[instance_id] = instance
+        for field, (old, new) in fields.items():
+            resort |= self._remove(old, (field,), touched)
+            resort |= self._add(new, (field,), touched)
+        if added:
+            resort |= self._add(added, self.FIELDS, touched)
+            for instance in added:
+                self._instances[instance.id] = instance
+
+        for table in resort:
+            self._sorted[table] = sorted(self._postings[table])
+        for table in touched:
+            # Unions of BLOCK consecutive tokens, so that a prefix matching
+            # thousands of tokens (an IP's "10.") merges a few dozen sets
+            postings = self._postings[table]
+            tokens = self._sorted[table]
+            blocks = self._blocks[table] = [
+                set().union(*[postings[token] for token in tokens[i:i + self.BLOCK]])
+                for i in range(0, len(tokens), self.BLOCK)
+            ] if len(tokens) >= 4 * self.BLOCK else []
+            # A prefix of every token ("inst-", "10.") of a field all instances
+            # have matches the whole fleet, which is then not merged again
+            if len(set().union(*(blocks or postings.values()))) == len(current):
+                self._complete.add(table)
+            else:
+                self._complete.discard(table)
+        if added:
+            # Added instances have no token in the tables they did not touch
+            self._complete &= touched
+        for term in [term for term, (tables, ids) in self._terms.items()
+                     if not tables.isdisjoint(touched)]:
+            del self._terms[term]
+        self._order = list(current.values())
+        self._position = {instance_id: i for i, instance_id in enumerate(current)}
+        self._ids = frozenset(current)
+        return len(added), changed, len(removed)
+
+    def _prefix(self, table, prefix):
+        """Ids with a token in ``table`` starting with ``prefix``."""
+        postings = self._postings[table]
+        tokens = self._sorted[table]
+        start = bisect_left(tokens, prefix)
+        end = bisect_left(tokens, prefix + "\uffff", start)
+        if start == 0 and end == len(tokens) and table in self._complete:
+            return self._ids
+        if end - start == 1:
+            return postings[tokens[start]]
+        blocks = self._blocks[table]
+        first = -(-start // self.BLOCK)
+        last = end // self.BLOCK
+        if not blocks or last - first < 2:
+            return set().union(*[postings[token] for token in tokens[start:end]])
+        edges = tokens[start:first * self.BLOCK] + tokens[last * self.BLOCK:end]
+        return set().union(*blocks[first:last], *[postings[token] for token in edges])
+
+    def _term(self, term):
+        cached = self._terms.get(term)
+        if cached is not None:
+            return cached[1]
+        field, sep, prefix = term.partition(":")
+        fields = None
+        if sep:
+            fields = ALIASES.get(field, (field,) if field in self.FIELDS else None)
+        if fields is None:
+            # No field given, or not a field name, e.g. part of an IPv6 address
+            fields, prefix = self.FIELDS, term
+        whole = _SEPARATORS.search(prefix) is not None
+        tables = frozenset((field, whole and field in WORD_FIELDS) for field in fields)
+        found = [ids for ids in (self._prefix(table, prefix) for table in tables) if ids]
+        everything = next((ids for ids in found if len(ids) == len(self._instances)), None)
+        if everything is not None:
+            # A short prefix often matches the whole fleet in several fields
+            matches = everything
+        elif len(found) > 1:
+            matches = set().union(*found)
+        else:
+            matches = found[0] if found else ()
+        if len(self._terms) >= self.TERM_CACHE_SIZE:
+            self._terms.pop(next(iter(self._terms)))
+        self._terms[term] = (tables, matches)
+        return matches
+
+    def search(self, query):
+        """Ids of the instances matching every term of ``query`` (a set,
+        frozenset or tuple shared with the index: do not modify it), or None
+        for an empty query (everything matches)."""
+        terms = query.lower().split()
+        if not terms:
+            return None
+        # Most selective term first, so intersections stay small
+        matches = sorted((self._term(term) for term in terms), key=len)
+        result = matches[0]
+        for ids in matches[1:]:
+            if not result:
+                break
+            result = set(result).intersection(ids)
+        return result
+
+    def filter(self, query):
+        """The indexed instances matching ``query``, in the order they were
+        last passed to ``update``."""
+        matches = self.search(query)
+        if matches is None or len(matches) == len(self._order):
+            return list(self._order)
+        if len(matches) * 8 < len(self._order):
+            # Few matches: sorting them beats scanning the whole fleet
+            instances = self._instances
+            return [instances[instance_id]
+                    for instance_id in sorted(matches, key=self._position.__getitem__)]
+        if matches.__class__ is not set:
+            matches = set(matches)
+        return [instance for instance in self._order if instance.id in matches]
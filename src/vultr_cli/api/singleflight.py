@@ -0,0 +1,76 @@
+"""Coalescing of concurrent identical calls ("single flight")."""
+
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Runs a function once for all concurrent callers of the same key.
+
+    The first caller of a key runs the function; callers arriving while it
+    is still running wait for it and get the same result or exception. Once
+    it has finished the key is free again, so nothing is cached. ``forget``
+    detaches in-flight calls from their keys, e.g. after a mutation, so
+    later callers start a fresh call instead of joining one that may return
+    data from before it.
+    """
+
+    def __init__(self):
+        self.stats = {"calls": 0, "shared": 0}
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, keys, fn):
+        """Return ``fn()``, sharing it with concurrent callers.
+
+        ``keys`` lists the keys whose in-flight call this caller may join,
+        preferred first; a new call is registered under the last one.
+        """
+        with self._lock:
+            for key in keys:
+                call = self._calls.get(key)
+                if call is not None:
+                    self.stats["shared"] += 1
+                    leader = False
+                    break
+            else:
+                key = keys[-1]
+                call = self._calls[key] = _Call()
+                self.stats["calls"] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    def forget(self, prefix):
+        """Detach in-flight calls whose key starts with path ``prefix``."""
+        with self._lock:
+            for key in [key for key in self._calls if key[0].startswith(prefix)]:
+                del self._calls[key]
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,78 @@
+"""Local snapshot catalog for picking a snapshot without the network."""
+
+PENDING = "pending"
+COMPLETE = "complete"
+
+
+class SnapshotCatalog:
+    """Snapshots by id, pre-sorted by each ``SORT_KEYS`` field.
+
+    Loaded from the stored or cached list, then kept current one snapshot at
+    a time by ``update``/``remove`` as the status polls of pending snapshots
+    come back, so that the list is never fetched again just to see a status
+    change. ``query`` filters on a text and the status without re-sorting.
+    """
+
+    SORT_KEYS = {"date_created": "", "size": 0, "description": ""}  # -> value if missing
+
+    def __init__(self, snapshots=()):
+        self.load(snapshots)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, snapshot_id):
+        return snapshot_id in self._by_id
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def load(self, snapshots):
+        """Replace the catalog with ``snapshots``."""
+        self._by_id = {snapshot.id: snapshot for snapshot in snapshots}
+        self._reindex()
+
+    def _reindex(self):
+        self._orders = {
+            key: sorted(self._by_id.values(),
+                        key=lambda snapshot: (getattr(snapshot, key) or missing, snapshot.id))
+            for key, missing in self.SORT_KEYS.items()
+        }
+        # What a text query is matched against
+        self._text = {snapshot.id: f"{snapshot.id} {snapshot.description or ''}".lower()
+                      for snapshot in self._by_id.values()}
+
+    def get(self, snapshot_id):
+        return self._by_id.get(snapshot_id)
+
+    def update(self, snapshot):
+        """Add or replace one snapshot, e.g. the result of a status poll."""
+        self._by_id[snapshot.id] = snapshot
+        self._reindex()
+
+    def remove(self, snapshot_id):
+        if self._by_id.pop(snapshot_id, None) is not None:
+            self._reindex()
+
+    @property
+    def pending(self):
+        return [snapshot for snapshot in self._by_id.values() if snapshot.status == PENDING]
+
+    def default(self):
+        """The most recent complete snapshot, or None."""
+        return next((snapshot for snapshot in reversed(self._orders["date_created"])
+                     if snapshot.status == COMPLETE), None)
+
+    def query(self, text=None, status=None, sort="date_created", descending=True):
+        """Snapshots whose id or description contains every word of ``text``
+        and with ``status`` (if given), ordered by ``sort``; newest or
+        largest first by default."""
+        words = (text or "").lower().split()
+        result = [
+            snapshot for snapshot in self._orders[sort]
+            if (status is None or snapshot.status == status)
+            and all(word in self._text[snapshot.id] for word in words)
+        ]
+        if descending:
+            result.reverse()
+        return result
@@ -0,0 +1,186 @@
+"""SQLite store of the last known API state and of queued operations."""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import namedtuple
+
+from .models import Instance, Snapshot
+
+Operation = namedtuple("Operation", ["id", "kind", "params", "status", "attempts",
+                                     "created_at", "result", "error"])
+Operation.__doc__ = """One mutating operation recorded in a ``LocalStore``."""
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+class LocalStore:
+    """Last known instances and snapshots, the analytics tables, and a
+    write-ahead operation log.
+
+    Collections are replaced wholesale by ``save`` after every successful
+    listing, so the UI can render the previous state instantly (and offline)
+    while the API is queried in the background. Operations are recorded by
+    ``enqueue`` before anything is sent, so a create or destroy cut off by a
+    network drop is still known after a restart; ``OperationQueue`` runs and
+    replays them.
+
+    One connection is shared by all threads behind a lock; the database is
+    in WAL mode so the small writes from request threads stay cheap.
+    """
+
+    MODELS = {"instances": Instance, "snapshots": Snapshot}
+    KEEP_FINISHED = 7 * 24 * 3600  # Seconds to keep done/failed operations
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS items (
+            kind TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (kind, position)
+        );
+        CREATE TABLE IF NOT EXISTS columns (
+            kind TEXT NOT NULL,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            data BLOB NOT NULL,
+            PRIMARY KEY (kind, name)
+        );
+        CREATE TABLE IF NOT EXISTS synced (
+            kind TEXT PRIMARY KEY,
+            synced_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS operations (
+            id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            params TEXT NOT NULL,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            result TEXT,
+            error TEXT
+        );
+        CREATE INDEX IF NOT EXISTS operations_status ON operations (status, created_at);
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(self.SCHEMA)
+            self._db.execute("DELETE FROM operations WHERE status != ? AND updated_at < ?",
+                             (PENDING, time.time() - self.KEEP_FINISHED))
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def save(self, kind, items):
+        """Replace the stored ``kind`` collection with ``items`` (models)."""
+        rows = [(kind, position, json.dumps(item.to_dict(), separators=(",", ":")))
+                for position, item in enumerate(items)]
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM items WHERE kind = ?", (kind,))
+            self._db.executemany("INSERT INTO items VALUES (?, ?, ?)", rows)
+            self._db.execute("INSERT OR REPLACE INTO synced VALUES (?, ?)",
+                             (kind, time.time()))
+
+    def load(self, kind):
+        """The stored ``kind`` collection as models, in the order it was saved."""
+        with self._lock:
+            rows = self._db.execute("SELECT data FROM items WHERE kind = ? ORDER BY position",
+                                    (kind,)).fetchall()
+        model = self.MODELS[kind]
+        return [model.from_dict(json.loads(data)) for data, in rows]
+
+    def save_columns(self, kind, columns):
+        """Replace the stored ``kind`` table with ``columns``, a dict of
+        column name -> ``(type, bytes)`` (see ``analytics.Table.dump``)."""
+        rows = [(kind, name, column_type, data)
+                for name, (column_type, data) in columns.items()]
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM columns WHERE kind = ?", (kind,))
+            self._db.executemany("INSERT INTO columns VALUES (?, ?, ?, ?)", rows)
+            self._db.execute("INSERT OR REPLACE INTO synced VALUES (?, ?)",
+                             (kind, time.time()))
+
+    def load_columns(self, kind):
+        """The stored ``kind`` table as column name -> ``(type, bytes)``."""
+        with self._lock:
+            rows = self._db.execute("SELECT name, type, data FROM columns WHERE kind = ?",
+                                    (kind,)).fetchall()
+        return {name: (column_type, bytes(data)) for name, column_type, data in rows}
+
+    def synced_at(self, kind):
+        """When ``kind`` was last saved (a ``time.time()`` value), or None."""
+        with self._lock:
+            row = self._db.execute("SELECT synced_at FROM synced WHERE kind = ?",
+                                   (kind,)).fetchone()
+        return row[0] if row else None
+
+    def enqueue(self, kind, params):
+        """Record a pending operation and return it."""
+        operation = Operation(uuid.uuid4().hex, kind, params, PENDING, 0, time.time(),
+                              None, None)
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT INTO operations (id, kind, params, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (operation.id, kind, json.dumps(params), PENDING, operation.created_at,
+                 operation.created_at))
+        return operation
+
+    def get(self, operation_id):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, kind, params, status, attempts, created_at, result, error "
+                "FROM operations WHERE id = ?", (operation_id,)).fetchone()
+        return self._operation(row) if row else None
+
+    def operations(self, status=PENDING):
+        """Operations with ``status``, oldest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, kind, params, status, attempts, created_at, result, error "
+                "FROM operations WHERE status = ? ORDER BY created_at", (status,)).fetchall()
+        return [self._operation(row) for row in rows]
+
+    def pending_count(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM operations WHERE status = ?",
+                                    (PENDING,)).fetchone()[0]
+
+    def begin(self, operation_id):
+        """Count an attempt before its request is sent."""
+        self._update(operation_id, "attempts = attempts + 1", ())
+
+    def retry_later(self, operation_id, error):
+        """Leave an operation pending after a transient ``error``."""
+        self._update(operation_id, "error = ?", (error,))
+
+    def complete(self, operation_id, result=None):
+        self._update(operation_id, "status = ?, result = ?, error = NULL",
+                     (DONE, json.dumps(result)))
+
+    def fail(self, operation_id, error):
+        self._update(operation_id, "status = ?, error = ?", (FAILED, error))
+
+    def _update(self, operation_id, assignments, values):
+        with self._lock, self._db:
+            self._db.execute(
+                f"UPDATE operations SET {assignments}, updated_at = ? WHERE id = ?",
+                values + (time.time(), operation_id))
+
+    @staticmethod
+    def _operation(row):
+        id, kind, params, status, attempts, created_at, result, error = row
+        return Operation(id, kind, json.loads(params), status, attempts, created_at,
+                         json.loads(result) if result is not None else None, error)
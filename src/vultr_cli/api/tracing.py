@@ -0,0 +1,62 @@
+"""Connection-level timing for the requests/urllib3 transport.
+
+requests reports when the response headers arrived (``response.elapsed``)
+but not how much of that went to opening the connection. ``TracingAdapter``
+swaps in urllib3 connection classes that time ``connect()`` (DNS, TCP and,
+for HTTPS, the TLS handshake) into a thread-local read by ``connect_time``.
+"""
+
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+_local = threading.local()
+
+
+def reset():
+    """Start timing a new request on this thread."""
+    _local.connect = 0.0
+
+
+def connect_time():
+    """Seconds spent opening connections since the last ``reset()``."""
+    return getattr(_local, "connect", 0.0)
+
+
+class _TimedConnect:
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _local.connect = connect_time() + time.perf_counter() - start
+
+
+class _TimedHTTPConnection(_TimedConnect, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnect, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TracingAdapter(HTTPAdapter):
+    """``HTTPAdapter`` whose pooled connections report their connect time."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
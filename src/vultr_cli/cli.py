@@ -0,0 +1,251 @@
+"""Headless ``vultr-cli`` command line for scripted use (cron, CI).
+
+Shares the API layer with the app but never imports Kivy. The HTTP stack
+is only imported once a subcommand actually runs, so ``--help`` and
+argument errors return immediately.
+
+    vultr-cli regions
+    vultr-cli --format ndjson list
+    vultr-cli create --plan vc2-1c-1gb --region nrt --snapshot SNAP --count 5
+    vultr-cli --workers 16 destroy ID [ID ...]
+    vultr-cli --profile work list
+    vultr-cli fleet
+
+The API key comes from ``--api-key``, ``$VULTR_API_KEY`` or the app's
+``vultr_config.json`` in the current directory (its active profile, or the
+one named by ``--profile``), in that order. ``fleet`` uses every profile.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from .profiles import CONFIG_FILE, load_profiles
+
+
+def api_key_from(args):
+    if args.api_key:
+        return args.api_key
+    if os.environ.get("VULTR_API_KEY") and not args.profile:
+        return os.environ["VULTR_API_KEY"]
+    profiles, active = load_profiles(CONFIG_FILE)
+    return profiles.get(args.profile or active)
+
+
+def to_json(value):
+    """JSON-ready form of models, bulk results and exceptions."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if hasattr(value, "_asdict"):
+        return {name: to_json(item) for name, item in value._asdict().items()}
+    if isinstance(value, BaseException):
+        return str(value)
+    return value
+
+
+class Output:
+    """Writes results as they arrive, as one JSON array or as NDJSON lines."""
+
+    def __init__(self, fmt, stream=None):
+        self.fmt = fmt
+        self.stream = stream or sys.stdout
+        self.count = 0
+
+    def __enter__(self):
+        if self.fmt == "json":
+            self.stream.write("[")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.fmt == "json":
+            self.stream.write("\n]\n" if self.count else "]\n")
+        self.stream.flush()
+
+    def write(self, item):
+        line = json.dumps(to_json(item), separators=(",", ":"))
+        if self.fmt == "json":
+            self.stream.write(("," if self.count else "") + "\n  " + line)
+        else:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+        self.count += 1
+
+
+def cmd_regions(api, args, out):
+    regions = api.get_regions() if api.cache else api.iter_regions()
+    for region in regions:
+        out.write(region)
+
+
+def cmd_plans(api, args, out):
+    plans = api.get_plans(args.type) if api.cache else api.iter_plans(args.type)
+    for plan in plans:
+        out.write(plan)
+
+
+def cmd_list(api, args, out):
+    for instance in api.iter_instances(per_page=args.per_page):
+        out.write(instance)
+
+
+def cmd_create(api, args, out, bulk):
+    specs = [
+        {
+            "plan_id": args.plan,
+            "region_id": args.region,
+            "snapshot_id": args.snapshot,
+            "label": f"{args.label}-{i + 1}" if args.label and args.count > 1 else args.label,
+        }
+        for i in range(args.count)
+    ]
+    return write_results(bulk.create_many(specs, retry=args.retry), out)
+
+
+def cmd_destroy(api, args, out, bulk):
+    return write_results(bulk.destroy_many(args.instance_ids), out)
+
+
+def cmd_fleet(clients, args, out):
+    from .api.fleet import Fleet
+
+    failed = 0
+    for result in Fleet(clients, max_workers=args.workers).fetch():
+        record = {"profile": result.profile, "kind": result.kind}
+        if not result.ok:
+            failed += 1
+            out.write(dict(record, error=str(result.error)))
+        elif result.kind == "account":
+            out.write(dict(record, **result.result.to_dict()))
+        else:
+            for instance in result.result:
+                out.write(dict(record, kind="instance", **instance.to_dict()))
+    return 1 if failed else 0
+
+
+def write_results(results, out):
+    failed = 0
+    for result in results:
+        failed += not result.ok
+        out.write(result)
+    return 1 if failed else 0
+
+
+def positive_int(text):
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an integer: {text!r}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="vultr-cli",
+                                     description="Manage Vultr instances from scripts.")
+    parser.add_argument("--api-key", help="API key (default: $VULTR_API_KEY or "
+                                          f"{CONFIG_FILE})")
+    parser.add_argument("--profile", help=f"profile of {CONFIG_FILE} to use "
+                                          "(default: the active one)")
+    parser.add_argument("--base-url", help="API base URL")
+    parser.add_argument("--format", choices=["json", "ndjson"], default="json",
+                        help="output a JSON array or one JSON object per line; both "
+                             "are streamed as results arrive (default: json)")
+    parser.add_argument("--workers", type=positive_int, default=8,
+                        help="parallel requests for create/destroy (default: 8)")
+    parser.add_argument("--cache-dir",
+                        help="serve regions/plans through an on-disk catalog cache")
+    parser.add_argument("--metrics", choices=["json", "prometheus"],
+                        help="print request metrics to stderr when done")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    commands.add_parser("regions", help="list regions").set_defaults(run=cmd_regions)
+
+    plans = commands.add_parser("plans", help="list plans")
+    plans.add_argument("--type", default="all", help="plan type (default: all)")
+    plans.set_defaults(run=cmd_plans)
+
+    listing = commands.add_parser("list", help="list instances")
+    listing.add_argument("--per-page", type=positive_int, help="page size (max 500)")
+    listing.set_defaults(run=cmd_list)
+
+    create = commands.add_parser("create", help="create instances from a snapshot")
+    create.add_argument("--plan", required=True)
+    create.add_argument("--region", required=True)
+    create.add_argument("--snapshot", required=True)
+    create.add_argument("--label")
+    create.add_argument("--count", type=positive_int, default=1)
+    create.add_argument("--retry", action="store_true",
+                        help="retry creates on 429/5xx (may create duplicates)")
+    create.set_defaults(run=cmd_create, bulk=True)
+
+    destroy = commands.add_parser("destroy", help="destroy instances")
+    destroy.add_argument("instance_ids", nargs="+", metavar="ID")
+    destroy.set_defaults(run=cmd_destroy, bulk=True)
+
+    commands.add_parser("fleet", help=f"instances and billing of every profile in "
+                                      f"{CONFIG_FILE}, as each account answers"
+                        ).set_defaults(run=cmd_fleet, fleet=True)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "fleet", False):
+        profiles = load_profiles(CONFIG_FILE)[0]
+        if not profiles:
+            parser.error(f"fleet needs profiles in {CONFIG_FILE}")
+    else:
+        api_key = api_key_from(args)
+        if not api_key:
+            parser.error("no API key: pass --api-key, set VULTR_API_KEY or create "
+                         f"{CONFIG_FILE}")
+        profiles = {args.profile: api_key}
+
+    # Deferred: importing requests dominates startup
+    from requests import RequestException
+
+    from .api.client import VultrAPI, VultrAPIError
+
+    metrics = None
+    if args.metrics:
+        from .api.metrics import MetricsRegistry
+        metrics = MetricsRegistry()
+
+    cache = None
+    if args.cache_dir:
+        from .api.cache import CatalogCache
+        cache = CatalogCache(args.cache_dir)
+
+    clients = {
+        profile: VultrAPI(api_key, base_url=args.base_url, pool_size=max(args.workers, 1),
+                          cache=cache, metrics=metrics)
+        for profile, api_key in profiles.items()
+    }
+    try:
+        with Output(args.format) as out:
+            if getattr(args, "fleet", False):
+                return args.run(clients, args, out)
+            api = next(iter(clients.values()))
+            if getattr(args, "bulk", False):
+                from .api.bulk import BulkOperations
+                return args.run(api, args, out, BulkOperations(api, max_workers=args.workers))
+            return args.run(api, args, out) or 0
+    except (VultrAPIError, RequestException) as e:
+        print(f"vultr-cli: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        for client in clients.values():
+            client.close()
+        if metrics is not None:
+            sys.stderr.write(metrics.to_json(indent=2) + "\n" if args.metrics == "json"
+                             else metrics.to_prometheus())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Named API key profiles stored in ``vultr_config.json``.
+
+    {"profiles": {"personal": {"api_key": "..."}, "work": {"api_key": "..."}},
+     "active": "personal"}
+
+The single-key format of earlier versions (``{"api_key": "..."}``) is read
+as a profile named ``default``. Neither Kivy nor requests is imported here,
+so the command line can use it too.
+"""
+
+import hashlib
+import json
+import re
+
+CONFIG_FILE = "vultr_config.json"
+DEFAULT_PROFILE = "default"
+_SAFE_NAME = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def load_profiles(path=CONFIG_FILE):
+    """Return ``(profiles, active)``: profile name -> API key, and the name
+    of the active profile (None when there are no profiles)."""
+    try:
+        with open(path) as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        return {}, None
+    if config.get("api_key"):
+        return {DEFAULT_PROFILE: config["api_key"]}, DEFAULT_PROFILE
+    profiles = {name: profile["api_key"]
+                for name, profile in config.get("profiles", {}).items()
+                if profile.get("api_key")}
+    active = config.get("active")
+    if active not in profiles:
+        active = next(iter(profiles), None)
+    return profiles, active
+
+
+def save_profiles(profiles, active, path=CONFIG_FILE):
+    config = {
+        "profiles": {name: {"api_key": api_key} for name, api_key in profiles.items()},
+        "active": active,
+    }
+    with open(path, "w") as f:
+        json.dump(config, f, indent=2)
+
+
+def profile_slug(name):
+    """``name`` made safe for a file name. Names of letters, digits, ``_``
+    and ``-`` are kept as they are; others are reduced to those characters
+    plus a hash of the name, so that no name can leave the directory and
+    different names never share a file."""
+    if _SAFE_NAME.fullmatch(name):
+        return name
+    digest = hashlib.sha1(name.encode()).hexdigest()[:8]
+    return "_".join(_SAFE_NAME.findall(name)) + "-" + digest
@@ -1,22 +1,50 @@
 """Main Kivy application for Vultr CLI Android App."""
 
-import json
-import os
+import time
 
 from kivy.app import App
 from kivy.clock import Clock
+from kivy.core.clipboard import Clipboard
+from kivy.core.window import Window
+from kivy.logger import Logger
 from kivy.metrics import dp
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
-from kivy.uix.gridlayout import GridLayout
+from kivy.uix.checkbox import CheckBox
 from kivy.uix.label import Label
 from kivy.uix.popup import Popup
 from kivy.uix.progressbar import ProgressBar
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.spinner import Spinner
 from kivy.uix.textinput import TextInput
 
-from ..api.client import VultrAPI
+from ..api.analytics import CostAnalytics, SyncCancelled
+from ..api.availability import AvailabilityIndex
+from ..api.bulk import BulkOperations
+from ..api.cache import CatalogCache
+from ..api.client import VultrAPI, VultrAPIError
+from ..api.fleet import Fleet
+from ..api.metrics import MetricsRegistry
+from ..api.operations import OperationQueue
+from ..api.plans import PlanIndex
+from ..api.search import InstanceIndex
+from ..api.snapshots import COMPLETE, SnapshotCatalog
+from ..api.store import DONE, PENDING, LocalStore, Operation
+from ..profiles import (
+    CONFIG_FILE,
+    DEFAULT_PROFILE,
+    load_profiles,
+    profile_slug,
+    save_profiles,
+)
+from .dispatcher import RequestDispatcher
+from .watcher import InstanceWatcher, SnapshotWatcher
+
+CACHE_DIR = "vultr_cache"
+STORE_FILE = "vultr_state.db"  # Per profile: vultr_state-<profile>.db
 
 
 class LoadingPopup(Popup):
@@ -35,25 +63,198 @@ class LoadingPopup(Popup):
         self.content = layout
 
 
+class BulkProgressPopup(Popup):
+    """Single progress bar for a bulk operation over many instances."""
+
+    def __init__(self, action, total, **kwargs):
+        super().__init__(**kwargs)
+        self.title = action
+        self.size_hint = (0.8, 0.3)
+        self.auto_dismiss = False
+        self.total = total
+        self.completed = 0
+        self.failures = []
+        self.queued = 0  # Operations left pending for a replay
+
+        layout = BoxLayout(orientation='vertical', padding=dp(20))
+        self.status_label = Label(text=f"0 / {total}")
+        layout.add_widget(self.status_label)
+        self.progress = ProgressBar(max=max(total, 1))
+        layout.add_widget(self.progress)
+
+        self.content = layout
+
+    def add_result(self, result):
+        """Advance the bar by one finished item."""
+        self.completed += 1
+        if not result.ok:
+            self.failures.append(result)
+        elif isinstance(result.result, Operation) and result.result.status == PENDING:
+            self.queued += 1
+        self.progress.value = self.completed
+        self.status_label.text = f"{self.completed} / {self.total}"
+        if self.failures:
+            self.status_label.text += f" ({len(self.failures)} failed)"
+
+    def succeeded(self):
+        """Whether every item finished without an error."""
+        return self.completed == self.total and not self.failures
+
+    def summary(self):
+        """Describe the failures and unfinished items for an error popup."""
+        lines = []
+        if self.completed < self.total:
+            lines.append(f"{self.total - self.completed} of {self.total} not finished")
+        if self.failures:
+            lines.append(f"{len(self.failures)} of {self.total} failed:")
+        lines += [f"{result.item}: {result.error}" for result in self.failures]
+        return "\n".join(lines)
+
+
+class PlanRow(RecycleDataViewBehavior, Button):
+    """Recycled button showing one plan in the deploy page's plan list."""
+
+    plan = None
+    page = None
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.page = rv.page
+        self.plan = data["plan"]
+        self.text = data["text"]
+        # Highlight the selected plan (light blue)
+        if self.plan.id == self.page.selected_plan_id:
+            self.background_color = (0.6, 0.8, 1.0, 1.0)
+        else:
+            self.background_color = (1.0, 1.0, 1.0, 1.0)
+
+    def on_press(self):
+        self.page.select_plan(self.plan)
+
+
+class SnapshotRow(RecycleDataViewBehavior, Button):
+    """Recycled button showing one snapshot in the snapshot picker."""
+
+    snapshot = None
+    page = None
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.page = rv.page
+        self.snapshot = data["snapshot"]
+        self.text = data["text"]
+        # Only complete snapshots can be deployed
+        self.disabled = self.snapshot.status != COMPLETE
+        if self.snapshot.id == self.page.selected_id:
+            self.background_color = (0.6, 0.8, 1.0, 1.0)
+        else:
+            self.background_color = (1.0, 1.0, 1.0, 1.0)
+
+    def on_press(self):
+        self.page.select_snapshot(self.snapshot)
+
+
+def describe_snapshot(snapshot):
+    """One-line summary of a snapshot for the picker."""
+    text = (f"{snapshot.description or snapshot.id} - {(snapshot.size or 0) / 2 ** 30:.1f} GB"
+            f" - {(snapshot.date_created or '')[:10]}")
+    if snapshot.status != COMPLETE:
+        text += f" ({snapshot.status})"
+    return text
+
+
+class DataListView(RecycleView):
+    """Virtualized list: only the visible rows have widgets."""
+
+    def __init__(self, page, viewclass, row_height, **kwargs):
+        super().__init__(**kwargs)
+        self.page = page  # Owner page, used by the recycled row views
+        layout = RecycleBoxLayout(orientation='vertical', spacing=dp(5),
+                                  default_size=(None, row_height),
+                                  default_size_hint=(1, None), size_hint_y=None)
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+        # Set once the layout manager exists, which holds the view class
+        self.viewclass = viewclass
+
+
+class SnapshotPicker(Popup):
+    """Searchable list of the snapshot catalog; pending ones are shown but
+    cannot be picked until their status poll reports them complete."""
+
+    SORTS = {"Newest": "date_created", "Largest": "size", "Name": "description"}
+
+    def __init__(self, catalog, selected_id, on_select, **kwargs):
+        super().__init__(**kwargs)
+        self.title = "Select snapshot"
+        self.size_hint = (0.9, 0.8)
+        self.catalog = catalog
+        self.selected_id = selected_id
+        self.on_select = on_select
+
+        layout = BoxLayout(orientation='vertical', spacing=dp(5))
+        filter_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40),
+                                  spacing=dp(5))
+        self.search_input = TextInput(hint_text="Search description or id", multiline=False)
+        self.sort_spinner = Spinner(text="Newest", values=list(self.SORTS), size_hint_x=0.3)
+        for widget in (self.search_input, self.sort_spinner):
+            widget.bind(text=lambda *args: self.refresh())
+            filter_layout.add_widget(widget)
+        layout.add_widget(filter_layout)
+        self.snapshots_view = DataListView(self, SnapshotRow, dp(50))
+        layout.add_widget(self.snapshots_view)
+        self.content = layout
+        self.refresh()
+
+    def refresh(self):
+        """Re-query the catalog, e.g. after a status poll changed it."""
+        sort = self.SORTS[self.sort_spinner.text]
+        snapshots = self.catalog.query(self.search_input.text, sort=sort,
+                                       descending=sort != "description")
+        self.snapshots_view.data = [{"snapshot": snapshot, "text": describe_snapshot(snapshot)}
+                                    for snapshot in snapshots]
+
+    def select_snapshot(self, snapshot):
+        self.dismiss()
+        self.on_select(snapshot)
+
+
 class DeployPage(BoxLayout):
     """Page for deploying new instances."""
 
-    def __init__(self, api_client, switch_callback=None, **kwargs):
+    ALL_TYPES = "All types"
+    SORT_FIELDS = {"Price": "monthly_cost", "vCPU": "vcpu_count", "RAM": "ram",
+                   "Disk": "disk"}
+
+    def __init__(self, api_client, dispatcher, store, operations, switch_callback=None,
+                 prefetch_availability=True, **kwargs):
         super().__init__(**kwargs)
         self.api_client = api_client
+        self.dispatcher = dispatcher
+        self.store = store
+        self.operations = operations
         self.switch_callback = switch_callback  # Callback to switch to instance list
+        self.prefetch_availability = prefetch_availability
         self.orientation = 'vertical'
         self.padding = dp(10)
         self.spacing = dp(10)
 
         self.snapshot_id = None
+        # Last known snapshots, so a deploy never waits on the snapshot list
+        self.snapshots = SnapshotCatalog(self.store.load("snapshots"))
+        self.snapshot_picker = None
+        # Polls pending snapshots one by one instead of reloading the list
+        self.snapshot_watcher = SnapshotWatcher(api_client, dispatcher,
+                                                on_update=self.on_snapshot_update,
+                                                on_removed=self.on_snapshot_removed)
         self.selected_plan_id = None
         self.selected_region_id = None
         self.regions_map = {}
         self.all_plans = []
-        self.selected_plan_btn = None  # Track the currently selected plan button
+        self.plan_index = PlanIndex()
+        self.available_plans = None  # Plan ids available in the selected region
+        self.availability = AvailabilityIndex()
 
         self.init_ui()
+        self.show_snapshots()
 
     def init_ui(self):
         """Initialize UI components."""
@@ -64,21 +265,51 @@ class DeployPage(BoxLayout):
         city_layout.add_widget(self.city_spinner)
         self.add_widget(city_layout)
 
+        # Snapshot selection, through a searchable picker
+        snapshot_layout = BoxLayout(orientation='horizontal', size_hint_y=None,
+                                    height=dp(40))
+        snapshot_layout.add_widget(Label(text="Snapshot:", size_hint_x=0.3))
+        self.snapshot_btn = Button(text='Loading...')
+        self.snapshot_btn.bind(on_press=lambda x: self.open_snapshot_picker())
+        snapshot_layout.add_widget(self.snapshot_btn)
+        self.add_widget(snapshot_layout)
+
         # Plans label
         self.add_widget(Label(text="Available Plans:", size_hint_y=None, height=dp(30)))
 
-        # Plans scroll view
-        self.plans_scroll = ScrollView()
-        self.plans_layout = GridLayout(cols=1, spacing=dp(5), size_hint_y=None)
-        self.plans_layout.bind(minimum_height=self.plans_layout.setter('height'))
-        self.plans_scroll.add_widget(self.plans_layout)
-        self.add_widget(self.plans_scroll)
-
-        # Create instance button
-        self.create_btn = Button(text="Create Instance", size_hint_y=None, height=dp(50))
+        # Plan filters, applied locally through the plan index
+        filter_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40),
+                                  spacing=dp(5))
+        self.type_spinner = Spinner(text=self.ALL_TYPES, values=[self.ALL_TYPES])
+        self.min_vcpu_input = TextInput(hint_text="Min vCPU", multiline=False,
+                                        input_filter='int')
+        self.min_ram_input = TextInput(hint_text="Min RAM GB", multiline=False,
+                                       input_filter='int')
+        self.max_price_input = TextInput(hint_text="Max $/mo", multiline=False,
+                                         input_filter='float')
+        self.sort_spinner = Spinner(text="Price", values=list(self.SORT_FIELDS))
+        for widget in (self.type_spinner, self.min_vcpu_input, self.min_ram_input,
+                       self.max_price_input, self.sort_spinner):
+            widget.bind(text=lambda *args: self.apply_plan_filters())
+            filter_layout.add_widget(widget)
+        self.add_widget(filter_layout)
+
+        # Plans list
+        self.plans_view = DataListView(self, PlanRow, dp(50))
+        self.add_widget(self.plans_view)
+
+        # Instance count and create instance button
+        create_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50),
+                                  spacing=dp(5))
+        create_layout.add_widget(Label(text="Count:", size_hint_x=0.2))
+        self.count_input = TextInput(text='1', multiline=False, input_filter='int',
+                                     size_hint_x=0.2)
+        create_layout.add_widget(self.count_input)
+        self.create_btn = Button(text="Create Instance")
         self.create_btn.disabled = True
         self.create_btn.bind(on_press=self.create_instance)
-        self.add_widget(self.create_btn)
+        create_layout.add_widget(self.create_btn)
+        self.add_widget(create_layout)
 
         # Load initial data
         Clock.schedule_once(lambda dt: self.load_initial_data(), 0)
@@ -88,39 +319,122 @@ class DeployPage(BoxLayout):
         loading = LoadingPopup()
         loading.open()
 
-        try:
-            # Load regions
-            regions = self.api_client.get_regions()
-            city_values = []
-            for region in regions:
-                city = region.get("city", "Unknown")
-                region_id = region.get("id")
-                self.regions_map[city] = region_id
-                city_values.append(city)
-
-            self.city_spinner.values = city_values
-
-            # Set default to Osaka if available
-            if "Osaka" in city_values:
-                self.city_spinner.text = "Osaka"
-            elif city_values:
-                self.city_spinner.text = city_values[0]
-
-            # Load plans
-            self.all_plans = self.api_client.get_plans("vc2")
-
-            # Load snapshot
-            snapshots = self.api_client.get_snapshots()
-            if snapshots:
-                self.snapshot_id = snapshots[0].get("id")
+        # Regions and plans are independent, so fetch them in parallel
+        self.dispatcher.submit_all(
+            [
+                (self.api_client.get_regions, ()),
+                (self.api_client.get_plans, ("all",)),
+            ],
+            on_success=self.on_initial_data,
+            on_error=lambda e: self.show_error(f"Failed to load data: {str(e)}"),
+            on_finally=loading.dismiss,
+        )
+        # Snapshots are reconciled in the background: the stored ones are
+        # already on screen, so they do not hold up the page
+        self.load_snapshots()
+
+    def load_snapshots(self):
+        """Reconcile the snapshot catalog with the API."""
+        def on_error(e):
+            if len(self.snapshots):
+                Logger.warning("Deploy: keeping stored snapshots: %s", e)
+            else:
+                self.show_error(f"Failed to load snapshots: {str(e)}")
 
-            self.city_spinner.bind(text=self.on_city_changed)
-            self.on_city_changed(self.city_spinner, self.city_spinner.text)
+        self.dispatcher.submit(self.fetch_snapshots, key="snapshots",
+                               on_success=self.on_snapshots, on_error=on_error)
 
+    def fetch_snapshots(self):
+        """Snapshots from the API, or the stored ones when it is unreachable."""
+        try:
+            snapshots = self.api_client.get_snapshots()
         except Exception as e:
-            self.show_error(f"Failed to load data: {str(e)}")
-        finally:
-            loading.dismiss()
+            stored = self.store.load("snapshots")
+            if not stored or not VultrAPI.is_transient(e):
+                raise
+            return stored
+        self.store.save("snapshots", snapshots)
+        return snapshots
+
+    def on_initial_data(self, result):
+        """Populate the page once regions and plans arrived."""
+        regions, plans = result
+
+        city_values = []
+        for region in regions:
+            city = region.city or "Unknown"
+            self.regions_map[city] = region.id
+            city_values.append(city)
+
+        self.city_spinner.values = city_values
+
+        # Set default to Osaka if available
+        if "Osaka" in city_values:
+            self.city_spinner.text = "Osaka"
+        elif city_values:
+            self.city_spinner.text = city_values[0]
+
+        self.all_plans = plans
+        self.plan_index.load(plans)
+        self.type_spinner.values = [self.ALL_TYPES] + self.plan_index.types
+
+        self.city_spinner.bind(text=self.on_city_changed)
+        self.on_city_changed(self.city_spinner, self.city_spinner.text)
+
+        if self.prefetch_availability:
+            # Index every region in the background so city switches are local
+            self.dispatcher.submit(self.availability.prefetch, self.api_client,
+                                   list(self.regions_map.values()))
+
+    def on_snapshots(self, snapshots):
+        """Replace the catalog with the listed snapshots and watch the
+        pending ones."""
+        self.snapshots.load(snapshots)
+        self.show_snapshots()
+        self.snapshot_watcher.watch(snapshots)
+
+    def show_snapshots(self):
+        """Keep the chosen snapshot if it still exists, else pick the most
+        recent complete one, and show it on the picker button."""
+        snapshot = self.snapshots.get(self.snapshot_id) or self.snapshots.default()
+        self.snapshot_id = snapshot.id if snapshot is not None else None
+        if snapshot is not None:
+            self.snapshot_btn.text = describe_snapshot(snapshot)
+        elif self.snapshots.pending:
+            self.snapshot_btn.text = "Snapshots still pending"
+        else:
+            self.snapshot_btn.text = "No snapshots" if len(self.snapshots) else "Loading..."
+        if self.snapshot_picker is not None:
+            self.snapshot_picker.selected_id = self.snapshot_id
+            self.snapshot_picker.refresh()
+
+    def open_snapshot_picker(self):
+        """Let the user choose the snapshot to deploy from."""
+        self.snapshot_picker = SnapshotPicker(self.snapshots, self.snapshot_id,
+                                              on_select=self.select_snapshot)
+        self.snapshot_picker.bind(on_dismiss=lambda popup: setattr(self, "snapshot_picker",
+                                                                   None))
+        self.snapshot_picker.open()
+
+    def select_snapshot(self, snapshot):
+        self.snapshot_id = snapshot.id
+        self.show_snapshots()
+
+    def on_snapshot_update(self, snapshot):
+        """Apply a status poll of one pending snapshot."""
+        self.snapshots.update(snapshot)
+        self.save_snapshots()
+        self.show_snapshots()
+
+    def on_snapshot_removed(self, snapshot_id):
+        self.snapshots.remove(snapshot_id)
+        self.save_snapshots()
+        self.show_snapshots()
+
+    def save_snapshots(self):
+        """Store the polled state; the cached list predates it."""
+        self.store.save("snapshots", self.snapshots.query())
+        self.api_client.invalidate_cache("snapshots")
 
     def on_city_changed(self, spinner, city):
         """Handle city selection change."""
@@ -128,7 +442,6 @@ class DeployPage(BoxLayout):
             self.selected_region_id = self.regions_map[city]
             # Reset plan selection when city changes
             self.selected_plan_id = None
-            self.selected_plan_btn = None
             self.create_btn.disabled = True
             self.load_available_plans()
 
@@ -137,44 +450,74 @@ class DeployPage(BoxLayout):
         if not self.selected_region_id:
             return
 
+        available_plans = self.availability.plans_in(self.selected_region_id)
+        if available_plans is not None:
+            self.dispatcher.cancel("availability")
+            self.show_available_plans(available_plans)
+            return
+
         loading = LoadingPopup()
         loading.open()
 
-        try:
-            available_plans = self.api_client.get_available_plans_in_region(self.selected_region_id)
-
-            # Clear existing plans
-            self.plans_layout.clear_widgets()
-
-            # Filter plans based on availability
-            filtered_plans = [plan for plan in self.all_plans if plan["id"] in available_plans]
-
-            for plan in filtered_plans:
-                plan_btn = Button(
-                    text=f"{plan['id']} - {plan.get('vcpu_count', 'N/A')} vCPU - ${plan.get('monthly_cost', 'N/A')}/month",
-                    size_hint_y=None,
-                    height=dp(50)
-                )
-                plan_btn.bind(on_press=lambda btn, p=plan: self.select_plan(p, btn))
-                self.plans_layout.add_widget(plan_btn)
-
-        except Exception as e:
-            self.show_error(f"Failed to load available plans: {str(e)}")
-        finally:
-            loading.dismiss()
-
-    def select_plan(self, plan, btn):
-        """Select a plan and highlight the button."""
-        # Reset previous selection
-        if self.selected_plan_btn:
-            self.selected_plan_btn.background_color = (1.0, 1.0, 1.0, 1.0)
-
-        # Highlight the selected button (light blue)
-        btn.background_color = (0.6, 0.8, 1.0, 1.0)
-        self.selected_plan_btn = btn
-
-        # Store selected plan ID
-        self.selected_plan_id = plan["id"]
+        region_id = self.selected_region_id
+
+        def on_available(available_plans):
+            self.availability.update(region_id, available_plans)
+            self.show_available_plans(self.availability.plans_in(region_id))
+
+        # Keyed so that switching city again drops the previous, stale request
+        self.dispatcher.submit(
+            self.api_client.get_available_plans_in_region,
+            region_id,
+            key="availability",
+            on_success=on_available,
+            on_error=lambda e: self.show_error(f"Failed to load available plans: {str(e)}"),
+            on_finally=loading.dismiss,
+        )
+
+    def show_available_plans(self, available_plans):
+        """Render the plans available in the selected region."""
+        self.available_plans = available_plans
+        self.apply_plan_filters()
+
+    def plan_filters(self):
+        """Current values of the filter controls as ``PlanIndex.query`` arguments."""
+        def number(text, convert):
+            try:
+                return convert(text)
+            except ValueError:
+                return None
+
+        min_ram = number(self.min_ram_input.text, int)
+        plan_type = self.type_spinner.text
+        return {
+            "plan_type": None if plan_type == self.ALL_TYPES else plan_type,
+            "min_vcpu": number(self.min_vcpu_input.text, int),
+            "min_ram": None if min_ram is None else min_ram * 1024,
+            "max_price": number(self.max_price_input.text, float),
+            "sort": self.SORT_FIELDS[self.sort_spinner.text],
+        }
+
+    def apply_plan_filters(self):
+        """Re-query the plan index for the selected region and filters."""
+        if self.available_plans is None:
+            return
+        filtered_plans = self.plan_index.query(self.available_plans, **self.plan_filters())
+
+        self.plans_view.data = [
+            {
+                "plan": plan,
+                "text": f"{plan.id} - {plan.vcpu_count or 'N/A'} vCPU - "
+                        f"{(plan.ram or 0) / 1024:g} GB - ${plan.monthly_cost or 'N/A'}/month",
+            }
+            for plan in filtered_plans
+        ]
+
+    def select_plan(self, plan):
+        """Select a plan and highlight its row."""
+        # Store selected plan ID; the visible rows re-read it for the highlight
+        self.selected_plan_id = plan.id
+        self.plans_view.refresh_from_data()
         self.create_btn.disabled = False
 
     def create_instance(self, instance):
@@ -182,9 +525,18 @@ class DeployPage(BoxLayout):
         if not all([self.selected_plan_id, self.selected_region_id, self.snapshot_id]):
             self.show_error("Please select a plan and ensure all data is loaded")
             return
+        snapshot = self.snapshots.get(self.snapshot_id)
+        if snapshot is not None and snapshot.status != COMPLETE:
+            self.show_error(f"Snapshot {snapshot.description or snapshot.id} is still "
+                            f"{snapshot.status}")
+            return
 
+        count = self.instance_count()
         content = BoxLayout(orientation='vertical', spacing=dp(10))
-        content.add_widget(Label(text=f"Create instance with:\nPlan: {self.selected_plan_id}\nRegion: {self.selected_region_id}"))
+        content.add_widget(Label(text=f"Create {count} instance(s) with:\n"
+                                      f"Plan: {self.selected_plan_id}\n"
+                                      f"Region: {self.selected_region_id}\n"
+                                      f"Snapshot: {self.snapshot_btn.text}"))
 
         btn_layout = BoxLayout(spacing=dp(10), size_hint_y=None, height=dp(40))
         yes_btn = Button(text="Yes")
@@ -208,25 +560,81 @@ class DeployPage(BoxLayout):
 
         popup.open()
 
+    def instance_count(self):
+        """Number of instances requested in the count box (at least 1)."""
+        try:
+            return max(int(self.count_input.text), 1)
+        except ValueError:
+            return 1
+
     def do_create_instance(self):
         """Actually create the instance."""
+        count = self.instance_count()
+        if count > 1:
+            self.do_create_instances(count)
+            return
+
         loading = LoadingPopup()
         loading.open()
 
-        try:
-            result = self.api_client.create_instance(
-                self.selected_plan_id,
-                self.selected_region_id,
-                self.snapshot_id
-            )
-            self.show_success("Instance created successfully!")
+        def on_created(operation):
+            if operation.status == DONE:
+                self.show_success("Instance created successfully!")
+            else:
+                self.show_success("No connection: the instance will be created "
+                                  "when the connection returns")
             # Switch to instance list using callback if available
             if self.switch_callback:
                 self.switch_callback()
-        except Exception as e:
-            self.show_error(f"Failed to create instance: {str(e)}")
-        finally:
-            loading.dismiss()
+
+        # Queued first, so a dropped connection cannot lose the request
+        self.dispatcher.submit(
+            self.operations.submit,
+            "create",
+            plan_id=self.selected_plan_id,
+            region_id=self.selected_region_id,
+            snapshot_id=self.snapshot_id,
+            on_success=on_created,
+            on_error=lambda e: self.show_error(f"Failed to create instance: {str(e)}"),
+            on_finally=loading.dismiss,
+        )
+
+    def do_create_instances(self, count):
+        """Create ``count`` instances in parallel behind one progress bar."""
+        progress = BulkProgressPopup("Creating instances", count)
+        progress.open()
+
+        specs = [
+            {
+                "plan_id": self.selected_plan_id,
+                "region_id": self.selected_region_id,
+                "snapshot_id": self.snapshot_id,
+            }
+            for _ in range(count)
+        ]
+
+        def on_finished():
+            progress.dismiss()
+            if not progress.succeeded():
+                # Also after the stream itself failed, when no item reported it
+                self.show_error(progress.summary())
+            elif progress.queued:
+                self.show_success(f"No connection: {progress.queued} of {count} instances "
+                                  "will be created when the connection returns")
+            else:
+                self.show_success(f"{count} instances created successfully!")
+            if progress.completed > len(progress.failures) and self.switch_callback:
+                self.switch_callback()
+
+        # Queued first, so a dropped connection cannot lose the requests
+        self.dispatcher.stream(
+            self.operations.submit_many,
+            "create",
+            specs,
+            on_item=progress.add_result,
+            on_error=lambda e: self.show_error(f"Failed to create instances: {str(e)}"),
+            on_finally=on_finished,
+        )
 
     def show_error(self, message):
         """Show error popup."""
@@ -251,76 +659,286 @@ class DeployPage(BoxLayout):
         Clock.schedule_once(lambda dt: popup.dismiss(), 2)
 
 
+class InstanceRow(RecycleDataViewBehavior, BoxLayout):
+    """Recycled view of one instance in the instance list."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.page = None
+        self.instance = None
+        self.instance_id = None
+        self.orientation = 'vertical'
+
+        # Selection checkbox next to the instance info
+        info_layout = BoxLayout(orientation='horizontal', size_hint_y=0.7)
+        self.select_box = CheckBox(size_hint_x=0.15)
+        self.select_box.bind(
+            active=lambda box, active: self.page.toggle_selected(self.instance_id, active))
+        info_layout.add_widget(self.select_box)
+        self.info_label = Label(text_size=(None, None))
+        info_layout.add_widget(self.info_label)
+        self.add_widget(info_layout)
+
+        # Delete button
+        self.delete_btn = Button(text="Destroy", size_hint_y=None, height=dp(30))
+        self.delete_btn.bind(on_press=lambda btn: self.page.delete_instance(self.instance_id))
+        self.add_widget(self.delete_btn)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.page = rv.page
+        self.update(data["instance"])
+
+    def update(self, instance):
+        """Show ``instance``; handlers always act on the current id."""
+        self.instance = instance
+        self.instance_id = instance.id
+
+        # Instance info
+        info_text = f"ID: {instance.id or 'N/A'}\n"
+        info_text += f"Plan: {instance.plan or 'N/A'}\n"
+        info_text += f"IP: {instance.main_ip or 'N/A'}\n"
+        info_text += f"Status: {instance.status or 'N/A'}\n"
+        info_text += f"Server_status: {instance.server_status or 'N/A'}"
+
+        # Add pending charges if available
+        pending_charges = instance.pending_charges
+        if pending_charges:
+            info_text += f"\nPending: ${pending_charges}"
+
+        self.info_label.text = info_text
+        self.select_box.active = self.instance_id in self.page.selected_ids
+        self.delete_btn.disabled = instance.server_status != "ok"
+
+
 class InstanceListPage(BoxLayout):
     """Page for listing and managing instances."""
 
-    def __init__(self, api_client, **kwargs):
+    def __init__(self, api_client, dispatcher, store, operations, **kwargs):
         super().__init__(**kwargs)
         self.api_client = api_client
+        self.dispatcher = dispatcher
+        self.store = store
+        self.operations = operations
         self.orientation = 'vertical'
         self.padding = dp(10)
         self.spacing = dp(10)
 
+        self.selected_ids = set()  # Instances ticked for a bulk operation
+        self.instances = []  # All known instances, in API order
+        self.rows = {}  # Instance id -> instance
+        self.index = InstanceIndex()  # Backs the search box
+        self.render_stats = {}
+        self.offline = False  # Showing stored instances after a failed refresh
+        # Polls pending/booting instances so the user need not press Refresh
+        self.watcher = InstanceWatcher(api_client, dispatcher,
+                                       on_update=self.merge_instance,
+                                       on_removed=self.remove_instance)
+
         self.init_ui()
+        # Last known state first; load_instances() reconciles it with the API
+        self.show_instances(self.store.load("instances"))
+        self.update_status()
 
     def init_ui(self):
         """Initialize UI components."""
-        # Refresh button
-        refresh_btn = Button(text="Refresh", size_hint_y=None, height=dp(50))
+        # Toolbar: refresh and bulk actions on the selected instances
+        toolbar = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50),
+                            spacing=dp(5))
+        refresh_btn = Button(text="Refresh")
         refresh_btn.bind(on_press=lambda x: self.load_instances())
-        self.add_widget(refresh_btn)
-
-        # Instances scroll view
-        self.instances_scroll = ScrollView()
-        self.instances_layout = GridLayout(cols=1, spacing=dp(5), size_hint_y=None)
-        self.instances_layout.bind(minimum_height=self.instances_layout.setter('height'))
-        self.instances_scroll.add_widget(self.instances_layout)
-        self.add_widget(self.instances_scroll)
-
-        # Load initial data
-        Clock.schedule_once(lambda dt: self.load_instances(), 0)
+        toolbar.add_widget(refresh_btn)
+        self.reboot_selected_btn = Button(text="Reboot selected", disabled=True)
+        self.reboot_selected_btn.bind(on_press=lambda x: self.confirm_bulk("reboot"))
+        toolbar.add_widget(self.reboot_selected_btn)
+        self.destroy_selected_btn = Button(text="Destroy selected", disabled=True)
+        self.destroy_selected_btn.bind(on_press=lambda x: self.confirm_bulk("destroy"))
+        toolbar.add_widget(self.destroy_selected_btn)
+        self.add_widget(toolbar)
+
+        # Offline and queued operation notices
+        self.status_label = Label(text="", size_hint_y=None, height=dp(30))
+        self.add_widget(self.status_label)
+
+        # Search as you type, e.g. "web region:ewr"
+        self.search_input = TextInput(
+            hint_text="Search label, IP, tag, region, plan, status (e.g. region:ewr)",
+            multiline=False, size_hint_y=None, height=dp(40))
+        self.search_input.bind(text=lambda instance, text: self.render_instances())
+        self.add_widget(self.search_input)
+
+        # Instances list
+        self.instances_view = DataListView(self, InstanceRow, dp(140))
+        self.add_widget(self.instances_view)
 
     def load_instances(self):
         """Load instances from API."""
         loading = LoadingPopup()
         loading.open()
 
-        try:
-            instances = self.api_client.get_instances()
-            self.instances_layout.clear_widgets()
+        def on_loaded(instances):
+            self.offline = False
+            self.show_instances(instances)
+            self.update_status()
 
-            for instance in instances:
-                instance_layout = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(140))
+        def on_error(e):
+            if VultrAPI.is_transient(e) and self.store.synced_at("instances"):
+                self.offline = True
+                self.update_status()
+            else:
+                self.show_error(f"Failed to load instances: {str(e)}")
+
+        # Keyed so that a newer refresh supersedes one still in flight
+        self.dispatcher.submit(
+            self.fetch_instances,
+            key="instances",
+            on_success=on_loaded,
+            on_error=on_error,
+            on_finally=loading.dismiss,
+        )
+
+    def fetch_instances(self):
+        """Fetch the instances and remember them for the next start."""
+        instances = self.api_client.get_instances()
+        self.store.save("instances", instances)
+        return instances
+
+    def update_status(self):
+        """Show whether the list is offline data and what is still queued."""
+        notices = []
+        if self.offline:
+            synced_at = time.strftime("%H:%M", time.localtime(self.store.synced_at("instances")))
+            notices.append(f"Offline, showing instances from {synced_at}")
+        pending = self.store.pending_count()
+        if pending:
+            notices.append(f"{pending} operation(s) waiting for a connection")
+        self.status_label.text = " - ".join(notices)
+
+    def show_instances(self, instances):
+        """Render the instance list, touching only rows that changed."""
+        started = time.perf_counter()
+        previous = {instance.id: instance for instance in self.instances}
+        self.instances = list(instances)
+        self.rows = {instance.id: instance for instance in self.instances}
+        self.selected_ids &= self.rows.keys()
+        self.update_bulk_buttons()
+        self.index.update(self.instances)
+        changed = {instance.id for instance in self.instances
+                   if instance.id in previous and previous[instance.id] != instance}
+        self.render_instances(changed)
+        self.render_stats.update(
+            added=sum(1 for instance in self.instances if instance.id not in previous),
+            updated=len(changed),
+            ms=(time.perf_counter() - started) * 1000,
+        )
+        Logger.debug("InstanceList: rendered %(rows)d rows (%(added)d added, "
+                     "%(updated)d updated) in %(ms).1fms", self.render_stats)
+        self.watcher.watch(self.instances)
+
+    def render_instances(self, changed=()):
+        """Show the instances matching the search box; of rows already shown
+        in the same order, only those in ``changed`` are replaced."""
+        started = time.perf_counter()
+        instances = self.index.filter(self.search_input.text)
+        search_ms = (time.perf_counter() - started) * 1000
+        order = [instance.id for instance in instances]
+
+        data = self.instances_view.data
+        if [item["instance"].id for item in data] == order:
+            # Same rows in the same order: refresh only the changed ones
+            for index, instance in enumerate(instances):
+                if instance.id in changed:
+                    data[index] = {"instance": instance}
+        else:
+            self.instances_view.data = [{"instance": instance} for instance in instances]
+        self.render_stats = {"rows": len(order), "total": len(self.instances),
+                             "search_ms": search_ms}
+
+    def merge_instance(self, instance):
+        """Apply a single updated instance without reloading the list."""
+        rows = dict(self.rows)
+        rows[instance.id] = instance
+        self.show_instances(list(rows.values()))
+
+    def remove_instance(self, instance_id):
+        """Drop an instance that no longer exists from the list."""
+        self.show_instances([instance for id, instance in self.rows.items()
+                             if id != instance_id])
+
+    def toggle_selected(self, instance_id, active):
+        """Add or remove an instance from the bulk selection."""
+        if active:
+            self.selected_ids.add(instance_id)
+        else:
+            self.selected_ids.discard(instance_id)
+        self.update_bulk_buttons()
+
+    def update_bulk_buttons(self):
+        """Enable the bulk action buttons only when something is selected."""
+        self.reboot_selected_btn.disabled = not self.selected_ids
+        self.destroy_selected_btn.disabled = not self.selected_ids
+
+    def confirm_bulk(self, action):
+        """Ask for confirmation before a bulk action on the selection."""
+        instance_ids = sorted(self.selected_ids)
+        content = BoxLayout(orientation='vertical', spacing=dp(10))
+        content.add_widget(Label(text=f"{action.capitalize()} {len(instance_ids)} "
+                                      "selected instance(s)?"))
 
-                # Instance info
-                info_text = f"ID: {instance.get('id', 'N/A')}\n"
-                info_text += f"Plan: {instance.get('plan', 'N/A')}\n"
-                info_text += f"IP: {instance.get('main_ip', 'N/A')}\n"
-                info_text += f"Status: {instance.get('status', 'N/A')}\n"
-                info_text += f"Server_status: {instance.get('server_status', 'N/A')}"
+        btn_layout = BoxLayout(spacing=dp(10), size_hint_y=None, height=dp(40))
+        yes_btn = Button(text="Yes")
+        no_btn = Button(text="No")
 
-                # Add pending charges if available
-                pending_charges = instance.get('pending_charges')
-                if pending_charges:
-                    info_text += f"\nPending: ${pending_charges}"
+        popup = Popup(title="Confirm", content=content, size_hint=(0.8, 0.4))
 
-                info_label = Label(text=info_text, size_hint_y=0.7, text_size=(None, None))
-                instance_layout.add_widget(info_label)
+        def on_yes(btn):
+            popup.dismiss()
+            self.do_bulk(action, instance_ids)
 
-                # Delete button
-                delete_btn = Button(text="Destroy", size_hint_y=None, height=dp(30))
-                instance_id = instance.get("id")
-                server_status = instance.get("server_status")
-                delete_btn.disabled = server_status != "ok"
-                delete_btn.bind(on_press=lambda btn, id=instance_id: self.delete_instance(id))
-                instance_layout.add_widget(delete_btn)
+        def on_no(btn):
+            popup.dismiss()
 
-                self.instances_layout.add_widget(instance_layout)
+        yes_btn.bind(on_press=on_yes)
+        no_btn.bind(on_press=on_no)
 
-        except Exception as e:
-            self.show_error(f"Failed to load instances: {str(e)}")
-        finally:
-            loading.dismiss()
+        btn_layout.add_widget(yes_btn)
+        btn_layout.add_widget(no_btn)
+        content.add_widget(btn_layout)
+
+        popup.open()
+
+    def do_bulk(self, action, instance_ids):
+        """Run a bulk action over ``instance_ids`` behind one progress bar."""
+        bulk = BulkOperations(self.api_client)
+        operations = {"reboot": bulk.reboot, "destroy": self.destroy_many}
+        progress = BulkProgressPopup(f"{action.capitalize()} instances", len(instance_ids))
+        progress.open()
+
+        def on_finished():
+            progress.dismiss()
+            if not progress.succeeded():
+                self.show_error(progress.summary())
+            elif progress.queued:
+                self.show_success(f"No connection: {progress.queued} instance(s) will be "
+                                  "destroyed when the connection returns")
+            else:
+                self.show_success(f"{action.capitalize()} finished for "
+                                  f"{len(instance_ids)} instance(s)")
+            self.selected_ids.clear()
+            self.load_instances()
+
+        self.dispatcher.stream(
+            operations[action],
+            instance_ids,
+            on_item=progress.add_result,
+            on_error=lambda e: self.show_error(f"Failed to {action} instances: {str(e)}"),
+            on_finally=on_finished,
+        )
+
+    def destroy_many(self, instance_ids):
+        """Destroy through the operation queue, one result per instance id."""
+        items = [{"instance_id": instance_id} for instance_id in instance_ids]
+        for result in self.operations.submit_many("destroy", items):
+            yield result._replace(item=result.item["instance_id"])
 
     def delete_instance(self, instance_id):
         """Delete instance button handler."""
@@ -354,17 +972,24 @@ class InstanceListPage(BoxLayout):
         loading = LoadingPopup()
         loading.open()
 
-        try:
-            success = self.api_client.delete_instance(instance_id)
-            if success:
+        def on_deleted(operation):
+            if operation.status == DONE:
                 self.show_success("Instance destroyed successfully!")
                 self.load_instances()
             else:
-                self.show_error("Failed to destroy instance")
-        except Exception as e:
-            self.show_error(f"Failed to destroy instance: {str(e)}")
-        finally:
-            loading.dismiss()
+                self.show_success("No connection: the instance will be destroyed "
+                                  "when the connection returns")
+                self.update_status()
+
+        # Queued first, so a dropped connection cannot lose the request
+        self.dispatcher.submit(
+            self.operations.submit,
+            "destroy",
+            instance_id=instance_id,
+            on_success=on_deleted,
+            on_error=lambda e: self.show_error(f"Failed to destroy instance: {str(e)}"),
+            on_finally=loading.dismiss,
+        )
 
     def show_error(self, message):
         """Show error popup."""
@@ -389,15 +1014,334 @@ class InstanceListPage(BoxLayout):
         Clock.schedule_once(lambda dt: popup.dismiss(), 2)
 
 
-class MainScreen(BoxLayout):
-    """Main application screen."""
+class FleetRow(RecycleDataViewBehavior, Label):
+    """Recycled view of one instance in the fleet page."""
+
+    def refresh_view_attrs(self, rv, index, data):
+        instance = data["instance"]
+        self.halign = 'left'
+        self.valign = 'middle'
+        self.text_size = (rv.width - dp(20), None)
+        self.text = (f"[{data['profile']}] {instance.label or instance.id}  "
+                     f"{instance.main_ip or ''}\n"
+                     f"{instance.status} / {instance.power_status}  {instance.region}  "
+                     f"{instance.plan}  pending ${instance.pending_charges or 0}")
+
+
+class FleetPage(BoxLayout):
+    """Instances and billing of every profile, merged as accounts answer.
+
+    Each account is fetched concurrently through ``Fleet``; rows and totals
+    are updated per result, so a slow account only delays its own rows.
+    """
+
+    def __init__(self, fleet, dispatcher, **kwargs):
+        super().__init__(**kwargs)
+        self.fleet = fleet
+        self.dispatcher = dispatcher
+        self.orientation = 'vertical'
+        self.padding = dp(10)
+        self.spacing = dp(10)
+
+        self.accounts = {}  # Profile -> Account
+        self.instances = {}  # Profile -> list of Instance
+        self.errors = {}  # Profile -> error message
+        self.loading = False
+
+        self.init_ui()
+
+    def init_ui(self):
+        """Initialize UI components."""
+        refresh_btn = Button(text="Refresh", size_hint_y=None, height=dp(50))
+        refresh_btn.bind(on_press=lambda x: self.load())
+        self.add_widget(refresh_btn)
+
+        self.summary_label = Label(text="", markup=True, size_hint_y=None, halign='left',
+                                   valign='top')
+        self.summary_label.bind(
+            width=lambda label, width: setattr(label, 'text_size', (width, None)),
+            texture_size=lambda label, size: setattr(label, 'height', size[1]))
+        self.add_widget(self.summary_label)
+
+        self.instances_view = DataListView(self, FleetRow, dp(60))
+        self.add_widget(self.instances_view)
+
+    def load(self):
+        """Fetch every account again; results replace the old ones as they arrive."""
+        self.errors = {}
+        self.loading = True
+        self.update_summary()
+        self.dispatcher.stream(
+            self.fleet.fetch,
+            key="fleet",
+            on_item=self.add_result,
+            on_error=lambda e: self.show_error(f"Failed to load the fleet: {str(e)}"),
+            on_finally=self.on_loaded,
+        )
+
+    def on_loaded(self):
+        self.loading = False
+        self.update_summary()
+
+    def add_result(self, result):
+        """Merge one account's instances or billing into the page."""
+        if not result.ok:
+            self.errors[result.profile] = str(result.error)
+        elif result.kind == "account":
+            self.accounts[result.profile] = result.result
+        else:
+            self.instances[result.profile] = result.result
+            self.instances_view.data = [
+                {"profile": profile, "instance": instance}
+                for profile in sorted(self.instances)
+                for instance in self.instances[profile]
+            ]
+        self.update_summary()
+
+    def update_summary(self):
+        """Billing per profile and in total, plus what is still loading."""
+        lines = []
+        for profile in self.fleet.clients:
+            account = self.accounts.get(profile)
+            parts = [f"[b]{profile}[/b]"]
+            if profile in self.instances:
+                parts.append(f"{len(self.instances[profile])} instances")
+            if account is not None:
+                parts.append(f"balance ${float(account.balance or 0):.2f}, "
+                             f"pending ${float(account.pending_charges or 0):.2f}")
+            if profile in self.errors:
+                parts.append(f"error: {self.errors[profile]}")
+            elif self.loading and (account is None or profile not in self.instances):
+                parts.append("loading...")
+            lines.append("  ".join(parts))
+        totals = Fleet.billing_totals(self.accounts.values())
+        lines.append(f"[b]Total[/b]  {sum(map(len, self.instances.values()))} instances, "
+                     f"balance ${totals['balance']:.2f}, "
+                     f"pending ${totals['pending_charges']:.2f}")
+        self.summary_label.text = "\n".join(lines)
+
+    def show_error(self, message):
+        """Show error popup."""
+        scroll = ScrollView(size_hint=(1, 1))
+        label = Label(text=message, text_size=(None, None), size_hint_y=None)
+        label.bind(texture_size=label.setter('size'))
+        scroll.add_widget(label)
+
+        popup = Popup(title="Error", content=scroll, size_hint=(0.9, 0.6))
+        popup.open()
+
+
+def format_bytes(count):
+    for unit in ("B", "KB", "MB", "GB"):
+        if count < 1000:
+            return f"{count:.0f} {unit}"
+        count /= 1000
+    return f"{count:.1f} TB"
+
+
+class CostPage(BoxLayout):
+    """Costs and traffic of the account, from ``CostAnalytics``.
+
+    The summary is rendered from the local tables as soon as the page is
+    shown; a sync fetching what is new runs behind it and renders again.
+    """
+
+    TOP = 5  # Rows per breakdown
+
+    def __init__(self, analytics, dispatcher, **kwargs):
+        super().__init__(**kwargs)
+        self.analytics = analytics
+        self.dispatcher = dispatcher
+        self.orientation = 'vertical'
+        self.padding = dp(10)
+        self.spacing = dp(10)
+        self.status = ""
+
+        refresh_btn = Button(text="Refresh", size_hint_y=None, height=dp(50))
+        refresh_btn.bind(on_press=lambda x: self.load(refresh=True))
+        self.add_widget(refresh_btn)
+
+        scroll = ScrollView()
+        self.summary_label = Label(text="", markup=True, size_hint_y=None, halign='left',
+                                   valign='top')
+        self.summary_label.bind(
+            width=lambda label, width: setattr(label, 'text_size', (width, None)),
+            texture_size=lambda label, size: setattr(label, 'height', size[1]))
+        scroll.add_widget(self.summary_label)
+        self.add_widget(scroll)
+
+    def load(self, refresh=False):
+        """Render the stored data, then sync (all bandwidth if ``refresh``)."""
+        self.status = "Updating..."
+        self.render()
+        self.analytics.cancel()  # The sync this one supersedes
+        self.dispatcher.submit(self.analytics.sync, refresh, key="analytics",
+                               on_success=self.on_synced,
+                               on_error=lambda e: self.on_synced(({}, [e])))
+
+    def on_synced(self, result):
+        counts, errors = result
+        self.status = "; ".join(f"Update failed: {error}" for error in errors
+                                if not isinstance(error, SyncCancelled))
+        self.render()
+
+    def cancel(self):
+        """Stop a running sync, e.g. when the app goes to the background."""
+        self.analytics.cancel()
+
+    def render(self):
+        start = time.perf_counter()
+        summary = self.analytics.summary(self.TOP)
+        burn = summary["burn_rate"]
+        lines = [
+            f"[b]This month[/b]  ${burn['month_to_date']:.2f} so far, "
+            f"${burn['per_day']:.2f}/day, projected ${burn['projected']:.2f}",
+        ]
+        if burn["last_invoice"] is not None:
+            lines.append(f"Last invoice ${burn['last_invoice']:.2f}, "
+                         f"recent average ${burn['average_invoice']:.2f}")
+        for title, key in (("By region", "by_region"), ("By plan", "by_plan")):
+            lines.append(f"\n[b]{title}[/b] ({summary['instances']} instances)")
+            lines += [f"    {value}  ${total:.2f}  ({count})"
+                      for value, total, count in summary[key]]
+        lines.append("\n[b]By product[/b]")
+        lines += [f"    {product}  ${total:.2f}" for product, total in summary["by_product"]]
+        lines.append("\n[b]Most traffic, 30 days[/b]")
+        lines += [f"    {label}  in {format_bytes(incoming)}, out {format_bytes(outgoing)}"
+                  for instance_id, label, incoming, outgoing in summary["top_bandwidth"]]
+
+        synced_at = self.analytics.synced_at()
+        footer = [time.strftime("Updated %Y-%m-%d %H:%M", time.localtime(synced_at))
+                  if synced_at else "Not synced yet"]
+        footer.append(f"rendered in {(time.perf_counter() - start) * 1000:.1f}ms")
+        if self.status:
+            footer.append(self.status)
+        lines.append("\n" + ", ".join(footer))
+        self.summary_label.text = "\n".join(lines)
+
+
+class DiagnosticsPage(BoxLayout):
+    """Hidden page with request metrics; open it by triple-tapping the nav bar."""
+
+    PHASES = ("connect", "ttfb", "download", "decode", "total")
 
     def __init__(self, api_client, **kwargs):
         super().__init__(**kwargs)
         self.api_client = api_client
         self.orientation = 'vertical'
+        self.padding = dp(10)
+        self.spacing = dp(10)
+
+        toolbar = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50),
+                            spacing=dp(5))
+        actions = [
+            ("Refresh", self.refresh),
+            ("Copy JSON", lambda: self.copy(self.metrics.to_json(indent=2))),
+            ("Copy Prometheus", lambda: self.copy(self.metrics.to_prometheus())),
+            ("Reset", self.reset),
+        ]
+        for text, action in actions:
+            button = Button(text=text)
+            button.bind(on_press=lambda btn, action=action: action())
+            toolbar.add_widget(button)
+        self.add_widget(toolbar)
+
+        scroll = ScrollView()
+        self.report_label = Label(size_hint_y=None, halign='left', valign='top',
+                                  font_size='12sp')
+        self.report_label.bind(
+            width=lambda label, width: setattr(label, 'text_size', (width, None)),
+            texture_size=lambda label, size: setattr(label, 'height', size[1]))
+        scroll.add_widget(self.report_label)
+        self.add_widget(scroll)
+
+    @property
+    def metrics(self):
+        return self.api_client.metrics or MetricsRegistry()
+
+    def copy(self, text):
+        Clipboard.copy(text)
+
+    def reset(self):
+        self.metrics.reset()
+        self.refresh()
+
+    def refresh(self):
+        """Rebuild the report from the current metrics and counters."""
+        snapshot = self.metrics.snapshot()
+        routes = {}
+        for counter in snapshot["counters"]:
+            labels = counter["labels"]
+            route = routes.setdefault((labels["method"], labels["route"]),
+                                      {"requests": 0, "errors": 0, "retries": 0})
+            if counter["name"] == "vultr_api_retries_total":
+                route["retries"] += counter["value"]
+            elif counter["name"] == "vultr_api_requests_total":
+                route["requests"] += counter["value"]
+                if not labels["status"].startswith(("2", "3")):
+                    route["errors"] += counter["value"]
+        for histogram in snapshot["histograms"]:
+            labels = histogram["labels"]
+            if "phase" in labels and (labels["method"], labels["route"]) in routes:
+                routes[labels["method"], labels["route"]][labels["phase"]] = histogram
+
+        lines = []
+        for (method, route), stats in sorted(routes.items()):
+            lines.append(f"[b]{method} {route}[/b]  {stats['requests']} requests, "
+                         f"{stats['errors']} errors, {stats['retries']} retries")
+            for phase in self.PHASES:
+                if phase in stats:
+                    h = stats[phase]
+                    lines.append(f"    {phase:<9} p50 {h['p50'] * 1000:7.1f}ms  "
+                                 f"p95 {h['p95'] * 1000:7.1f}ms  "
+                                 f"p99 {h['p99'] * 1000:7.1f}ms")
+        if not lines:
+            lines.append("No requests recorded yet")
+
+        api = self.api_client
+        lines.append("")
+        lines.append(f"Client: {api.stats}")
+        lines.append(f"Coalesced GETs: {api.inflight.stats['shared']} shared, "
+                     f"{api.inflight.stats['calls']} sent")
+        lines.append(f"Rate limiter: {api.rate_limiter.waits} waits, "
+                     f"{api.rate_limiter.wait_time:.2f}s waited")
+        if api.cache is not None:
+            lines.append(f"Catalog cache: {api.cache.stats}, "
+                         f"hit rate {api.cache.hit_rate:.0%}")
+        app = App.get_running_app()
+        if app is not None and getattr(app, 'startup_stats', None):
+            lines.append("Startup: " + ", ".join(
+                f"{event} {ms:.0f}ms" for event, ms in app.startup_stats.items()))
+        self.report_label.markup = True
+        self.report_label.text = "\n".join(lines)
+
+
+class MainScreen(BoxLayout):
+    """Main application screen.
+
+    Owns the operation queue of the pages and replays what is still pending
+    on start, on resume and every ``REPLAY_INTERVAL`` seconds.
+    """
+
+    REPLAY_INTERVAL = 30
+    ADD_PROFILE = "Add profile..."
+
+    def __init__(self, api_client, dispatcher, store, fleet=None, profiles=(),
+                 active_profile=None, on_profile=None, **kwargs):
+        super().__init__(**kwargs)
+        self.api_client = api_client
+        self.dispatcher = dispatcher
+        self.store = store
+        self.operations = OperationQueue(api_client, store)
+        self.fleet = fleet
+        self.profiles = list(profiles)
+        self.active_profile = active_profile
+        self.on_profile = on_profile  # Called with a profile name, or None to add one
+        self.orientation = 'vertical'
+        self.replay_event = None
 
         self.init_ui()
+        self.resume()
 
     def init_ui(self):
         """Initialize UI components."""
@@ -409,11 +1353,31 @@ class MainScreen(BoxLayout):
         self.instance_list_btn.bind(on_press=lambda x: self.switch_to_instance_list())
         nav_layout.add_widget(self.deploy_btn)
         nav_layout.add_widget(self.instance_list_btn)
+        self.costs_btn = Button(text="Costs")
+        self.costs_btn.bind(on_press=lambda x: self.switch_to_costs())
+        nav_layout.add_widget(self.costs_btn)
+        if self.fleet is not None and len(self.fleet) > 1:
+            self.fleet_btn = Button(text="Fleet")
+            self.fleet_btn.bind(on_press=lambda x: self.switch_to_fleet())
+            nav_layout.add_widget(self.fleet_btn)
+        if self.on_profile is not None:
+            self.profile_spinner = Spinner(text=self.active_profile or "",
+                                           values=self.profiles + [self.ADD_PROFILE])
+            self.profile_spinner.bind(text=self.on_profile_spinner)
+            nav_layout.add_widget(self.profile_spinner)
+        # Hidden diagnostics page: triple-tap anywhere on the navigation bar
+        nav_layout.bind(on_touch_down=self.on_nav_touch)
         self.add_widget(nav_layout)
 
-        # Content area - pass callback to switch to instance list
-        self.deploy_page = DeployPage(self.api_client, switch_callback=self.switch_to_instance_list)
-        self.instance_list_page = InstanceListPage(self.api_client)
+        # Content area - pass callback to switch to instance list. The
+        # instance list is built the first time it is shown.
+        self.deploy_page = DeployPage(self.api_client, self.dispatcher, self.store,
+                                      self.operations,
+                                      switch_callback=self.switch_to_instance_list)
+        self.instance_list_page = None
+        self.fleet_page = None
+        self.cost_page = None
+        self.diagnostics_page = None
         self.add_widget(self.deploy_page)
 
         # Show deploy page by default
@@ -426,8 +1390,101 @@ class MainScreen(BoxLayout):
             self.add_widget(self.deploy_page)
             self.current_page = self.deploy_page
 
+    def on_profile_spinner(self, spinner, text):
+        if text == self.ADD_PROFILE:
+            spinner.text = self.active_profile
+            self.on_profile(None)
+        elif text != self.active_profile:
+            self.on_profile(text)
+
+    def switch_to_fleet(self):
+        """Switch to the aggregated view of every profile."""
+        if self.fleet_page is None:
+            self.fleet_page = FleetPage(self.fleet, self.dispatcher)
+        if self.current_page != self.fleet_page:
+            self.remove_widget(self.current_page)
+            self.add_widget(self.fleet_page)
+            self.current_page = self.fleet_page
+            self.fleet_page.load()
+
+    def switch_to_costs(self):
+        """Switch to the cost page, building it on first use."""
+        if self.cost_page is None:
+            self.cost_page = CostPage(CostAnalytics(self.api_client, self.store),
+                                      self.dispatcher)
+        if self.current_page != self.cost_page:
+            self.remove_widget(self.current_page)
+            self.add_widget(self.cost_page)
+            self.current_page = self.cost_page
+            self.cost_page.load()
+
+    def on_nav_touch(self, nav_layout, touch):
+        if touch.is_triple_tap and nav_layout.collide_point(*touch.pos):
+            self.switch_to_diagnostics()
+            return True
+        return False
+
+    def switch_to_diagnostics(self):
+        """Switch to the hidden diagnostics page."""
+        if self.diagnostics_page is None:
+            self.diagnostics_page = DiagnosticsPage(self.api_client)
+        if self.current_page != self.diagnostics_page:
+            self.remove_widget(self.current_page)
+            self.add_widget(self.diagnostics_page)
+            self.current_page = self.diagnostics_page
+        self.diagnostics_page.refresh()
+
+    def pause(self):
+        """Stop background polling while the app is not visible."""
+        if self.replay_event is not None:
+            self.replay_event.cancel()
+            self.replay_event = None
+        if self.instance_list_page is not None:
+            self.instance_list_page.watcher.pause()
+        self.deploy_page.snapshot_watcher.pause()
+        if self.cost_page is not None:
+            self.cost_page.cancel()
+
+    def resume(self):
+        """Restart background polling after ``pause()``."""
+        if self.replay_event is None:
+            self.replay_event = Clock.schedule_interval(
+                lambda dt: self.replay_operations(), self.REPLAY_INTERVAL)
+            Clock.schedule_once(lambda dt: self.replay_operations(), 0)
+        if self.instance_list_page is not None:
+            self.instance_list_page.watcher.resume()
+        self.deploy_page.snapshot_watcher.resume()
+        if self.cost_page is not None and self.current_page is self.cost_page:
+            self.cost_page.load()
+
+    def replay_operations(self):
+        """Retry queued operations in the background if there are any."""
+        if self.store.pending_count():
+            self.dispatcher.submit(self.operations.replay, key="replay",
+                                   on_success=self.on_replayed)
+
+    def on_replayed(self, finished):
+        """Report operations a replay finished and refresh the instances."""
+        for operation in finished:
+            Logger.info("Operations: queued %s %s %s", operation.kind, operation.id,
+                        operation.status)
+        page = self.instance_list_page
+        if page is None:
+            return
+        if finished:
+            failed = [operation for operation in finished if operation.status != DONE]
+            if failed:
+                page.show_error("\n".join(f"Queued {operation.kind} failed: {operation.error}"
+                                          for operation in failed))
+            page.load_instances()
+        else:
+            page.update_status()
+
     def switch_to_instance_list(self):
-        """Switch to instance list page."""
+        """Switch to instance list page, building it on first use."""
+        if self.instance_list_page is None:
+            self.instance_list_page = InstanceListPage(self.api_client, self.dispatcher,
+                                                       self.store, self.operations)
         if self.current_page != self.instance_list_page:
             self.remove_widget(self.current_page)
             self.add_widget(self.instance_list_page)
@@ -436,42 +1493,124 @@ class MainScreen(BoxLayout):
 
 
 class VultrCliApp(App):
-    """Main Kivy application class."""
+    """Main Kivy application class.
 
-    def __init__(self, **kwargs):
+    Startup is optimistic: with a stored API key the main screen is built
+    straight away (from the catalog cache where possible) and the key is
+    validated in the background. ``startup_stats`` records milliseconds
+    since ``started`` (a ``time.perf_counter()`` value, by default the
+    app's creation) for ``build``, ``first_frame`` and ``key_validated``.
+
+    Several accounts can be used through named profiles (see
+    ``vultr_cli.profiles``). Each profile gets its own pooled client and
+    local store on first use; the fleet page aggregates all of them.
+    """
+
+    def __init__(self, started=None, **kwargs):
         super().__init__(**kwargs)
+        self.started = time.perf_counter() if started is None else started
+        self.startup_stats = {}
+        self.profiles = {}  # Profile name -> API key
+        self.active_profile = None
+        self.clients = {}  # Profile name -> VultrAPI, created on first use
+        self.stores = {}  # Profile name -> LocalStore, opened on first use
         self.api_key = None
         self.api_client = None
+        self.catalog_cache = CatalogCache(CACHE_DIR)
+        self.metrics = MetricsRegistry()
+        self.dispatcher = RequestDispatcher()
+
+    def client_for(self, profile):
+        """The pooled client of ``profile``."""
+        if profile not in self.clients:
+            self.clients[profile] = VultrAPI(self.profiles[profile], cache=self.catalog_cache,
+                                             metrics=self.metrics)
+        return self.clients[profile]
+
+    def store_for(self, profile):
+        """The local store of ``profile``; the default profile keeps the
+        file name used before profiles existed."""
+        if profile not in self.stores:
+            path = STORE_FILE if profile == DEFAULT_PROFILE else \
+                STORE_FILE.replace(".db", f"-{profile_slug(profile)}.db")
+            self.stores[profile] = LocalStore(path)
+        return self.stores[profile]
+
+    def activate(self, profile):
+        """Make ``profile`` the one the main screen works on."""
+        self.active_profile = profile
+        self.api_key = self.profiles[profile]
+        self.api_client = self.client_for(profile)
+
+    def main_screen(self):
+        fleet = Fleet({profile: self.client_for(profile) for profile in self.profiles})
+        return MainScreen(self.api_client, self.dispatcher, self.store_for(self.active_profile),
+                          fleet=fleet, profiles=list(self.profiles),
+                          active_profile=self.active_profile,
+                          on_profile=self.on_profile_selected)
 
     def build(self):
         """Build the application."""
         self.title = "Vultr CLI"
+        Window.bind(on_flip=self.on_first_frame)
+
+        self.profiles, active = load_profiles(CONFIG_FILE)
+        if active:
+            # Trust the stored key for now; validate_api_key() checks it
+            self.activate(active)
+            self.validate_api_key()
+            root = self.main_screen()
+        else:
+            # If config file doesn't exist, show API key screen
+            root = self.get_api_key_screen()
+        self.mark_startup("build")
+        return root
+
+    def mark_startup(self, event):
+        """Record the time of a startup milestone in ``startup_stats``."""
+        self.startup_stats[event] = (time.perf_counter() - self.started) * 1000
+        Logger.info("Startup: %s after %.0fms", event, self.startup_stats[event])
+
+    def on_first_frame(self, window):
+        Window.unbind(on_flip=self.on_first_frame)
+        self.mark_startup("first_frame")
+
+    def validate_api_key(self):
+        """Check the stored key in the background; go back to the key screen
+        only if the API rejects it (offline starts keep the cached data)."""
+        profile = self.active_profile
+
+        def on_error(e):
+            if isinstance(e, VultrAPIError) and e.status_code in (401, 403):
+                client = self.clients.pop(profile, None)
+                if client is not None:
+                    client.close()
+                self.api_client = None
+                self.api_key = None
+                self.replace_root(self.get_api_key_screen(profile))
+                self.show_error(f"The saved API key of {profile} was rejected, "
+                                "please enter it again")
+            else:
+                Logger.warning("Startup: could not validate the API key: %s", e)
 
-        # Try to load API key from config file
-        config_file = "vultr_config.json"
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    api_key = config.get('api_key')
-                    if api_key:
-                        # Test the API key
-                        test_client = VultrAPI(api_key)
-                        regions = test_client.get_regions()
-                        if regions:
-                            self.api_key = api_key
-                            self.api_client = test_client
-                            return MainScreen(self.api_client)
-            except Exception:
-                pass
-
-        # If config file doesn't exist or API key is invalid, show API key screen
-        return self.get_api_key_screen()
-
-    def get_api_key_screen(self):
+        self.dispatcher.submit(
+            self.api_client.get_regions,
+            refresh=True,
+            key="validate_key",
+            on_success=lambda regions: self.mark_startup("key_validated"),
+            on_error=on_error,
+        )
+
+    def get_api_key_screen(self, profile=None):
         """Create API key input screen."""
         layout = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(20))
 
+        layout.add_widget(Label(text="Profile name:"))
+        self.profile_input = TextInput(text=profile or ("" if self.profiles else
+                                                        DEFAULT_PROFILE),
+                                       multiline=False)
+        layout.add_widget(self.profile_input)
+
         layout.add_widget(Label(text="Enter your Vultr API Key:"))
 
         self.api_input = TextInput(multiline=False, password=True)
@@ -481,11 +1620,21 @@ class VultrCliApp(App):
         submit_btn.bind(on_press=self.submit_api_key)
         layout.add_widget(submit_btn)
 
+        if self.api_client is not None:
+            # Adding another profile: allow going back to the current one
+            cancel_btn = Button(text="Cancel", size_hint_y=None, height=dp(50))
+            cancel_btn.bind(on_press=lambda x: self.show_main_screen())
+            layout.add_widget(cancel_btn)
+
         return layout
 
     def submit_api_key(self, instance):
         """Handle API key submission."""
+        profile = self.profile_input.text.strip()
         api_key = self.api_input.text.strip()
+        if not profile:
+            self.show_error("Profile name is required")
+            return
         if not api_key:
             self.show_error("API Key is required")
             return
@@ -494,35 +1643,83 @@ class VultrCliApp(App):
         loading = LoadingPopup()
         loading.open()
 
-        try:
-            test_client = VultrAPI(api_key)
-            regions = test_client.get_regions()
+        test_client = VultrAPI(api_key, cache=self.catalog_cache, metrics=self.metrics)
+
+        def on_regions(regions):
             if regions:
-                self.api_key = api_key
-                self.api_client = test_client
+                if profile in self.clients:
+                    self.clients.pop(profile).close()
+                self.profiles[profile] = api_key
+                self.clients[profile] = test_client
+                self.activate(profile)
 
-                # Save API key to config file
-                config_file = "vultr_config.json"
-                config = {"api_key": api_key}
-                with open(config_file, 'w') as f:
-                    json.dump(config, f)
+                # Save the profiles to the config file
+                save_profiles(self.profiles, profile, CONFIG_FILE)
 
-                loading.dismiss()
                 self.show_success("API Key saved successfully!")
                 self.show_main_screen()
             else:
-                loading.dismiss()
+                test_client.close()
                 self.show_error("Invalid API Key")
-        except Exception as e:
-            loading.dismiss()
+
+        def on_error(e):
+            test_client.close()
             self.show_error(f"Failed to connect: {str(e)}")
 
-    def show_main_screen(self):
-        """Switch to main screen."""
+        self.dispatcher.submit(
+            test_client.get_regions,
+            refresh=True,
+            key="validate_key",
+            on_success=on_regions,
+            on_error=on_error,
+            on_finally=loading.dismiss,
+        )
+
+    def on_pause(self):
+        """Stop polling in the background; returning True keeps the app alive."""
+        if isinstance(self.root, MainScreen):
+            self.root.pause()
+        return True
+
+    def on_resume(self):
+        """Resume polling when the app comes back to the foreground."""
+        if isinstance(self.root, MainScreen):
+            self.root.resume()
+
+    def on_stop(self):
+        """Stop background work and release pooled connections."""
+        if isinstance(self.root, MainScreen):
+            self.root.pause()
+        self.dispatcher.shutdown()
+        for client in self.clients.values():
+            client.close()
+        for store in self.stores.values():
+            store.close()
+
+    def on_profile_selected(self, profile):
+        """Switch the main screen to ``profile``, or ask for a new one's key
+        when ``profile`` is None."""
+        if profile is None:
+            self.replace_root(self.get_api_key_screen())
+            return
+        if profile == self.active_profile:
+            return
+        self.activate(profile)
+        save_profiles(self.profiles, profile, CONFIG_FILE)
+        self.validate_api_key()
+        self.show_main_screen()
+
+    def replace_root(self, root):
+        if isinstance(self.root, MainScreen):
+            self.root.pause()
         self.root_window.remove_widget(self.root)
-        self.root = MainScreen(self.api_client)
+        self.root = root
         self.root_window.add_widget(self.root)
 
+    def show_main_screen(self):
+        """Switch to main screen."""
+        self.replace_root(self.main_screen())
+
     def show_error(self, message):
         """Show error popup."""
         scroll = ScrollView(size_hint=(1, 1))
@@ -0,0 +1,152 @@
+"""Background dispatch of blocking API calls for the Kivy UI."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from kivy.clock import Clock
+
+
+class RequestHandle:
+    """Handle to a dispatched call; ``cancel()`` drops its result."""
+
+    def __init__(self, key=None):
+        self.key = key
+        self.cancelled = False
+        self.future = None
+
+    def cancel(self):
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def done(self):
+        return self.future is not None and self.future.done()
+
+
+class RequestDispatcher:
+    """Runs ``VultrAPI`` calls on a bounded thread pool.
+
+    Results are delivered back on the Kivy main thread through
+    ``Clock.schedule_once``. Submitting with a ``key`` cancels the previous
+    request with the same key, so a stale response (e.g. availability for a
+    city the user already left) never reaches the UI. ``on_finally`` always
+    runs, even for cancelled requests, so popups opened for them get closed.
+    """
+
+    def __init__(self, max_workers=4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="vultr-api")
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, on_success=None, on_error=None, on_finally=None,
+               key=None, **kwargs):
+        """Run ``fn(*args, **kwargs)`` in the background and return its handle."""
+        handle = RequestHandle(key)
+        if key is not None:
+            with self._lock:
+                previous = self._pending.get(key)
+                self._pending[key] = handle
+            if previous is not None:
+                previous.cancel()
+
+        handle.future = self._executor.submit(fn, *args, **kwargs)
+        handle.future.add_done_callback(
+            lambda future: Clock.schedule_once(
+                lambda dt: self._deliver(handle, on_success, on_error, on_finally)
+            )
+        )
+        return handle
+
+    def stream(self, fn, *args, on_item=None, on_error=None, on_finally=None,
+               key=None, **kwargs):
+        """Iterate ``fn(*args, **kwargs)`` in the background.
+
+        Each yielded item is handed to ``on_item`` on the main thread as soon
+        as it is produced; cancelling the handle stops the iteration.
+        """
+        handles = []
+
+        def cancelled():
+            return bool(handles) and handles[0].cancelled
+
+        def run():
+            for item in fn(*args, **kwargs):
+                if cancelled():
+                    break
+                Clock.schedule_once(lambda dt, item=item: cancelled() or on_item(item))
+
+        handles.append(self.submit(run, key=key, on_error=on_error,
+                                   on_finally=on_finally))
+        return handles[0]
+
+    def submit_all(self, calls, on_success=None, on_error=None, on_finally=None):
+        """Run independent ``(fn, args)`` calls concurrently.
+
+        ``on_success`` receives the list of results in call order once all of
+        them finished; ``on_error`` receives the first failure instead.
+        """
+        results = [None] * len(calls)
+        remaining = [len(calls)]
+        failed = [False]
+
+        def collect(index, result):
+            results[index] = result
+
+        def fail(error):
+            if not failed[0]:
+                failed[0] = True
+                if on_error:
+                    on_error(error)
+
+        def finish():
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                try:
+                    if not failed[0] and on_success:
+                        on_success(results)
+                finally:
+                    if on_finally:
+                        on_finally()
+
+        return [
+            self.submit(fn, *args,
+                        on_success=lambda result, i=index: collect(i, result),
+                        on_error=fail, on_finally=finish)
+            for index, (fn, args) in enumerate(calls)
+        ]
+
+    def cancel(self, key):
+        """Cancel the pending request registered under ``key``, if any."""
+        with self._lock:
+            handle = self._pending.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+    def _deliver(self, handle, on_success, on_error, on_finally):
+        if handle.key is not None:
+            with self._lock:
+                if self._pending.get(handle.key) is handle:
+                    del self._pending[handle.key]
+        try:
+            if handle.cancelled:
+                return
+            error = handle.future.exception()
+            if error is not None:
+                if on_error:
+                    on_error(error)
+            elif on_success:
+                on_success(handle.future.result())
+        finally:
+            if on_finally:
+                on_finally()
+
+    def shutdown(self):
+        """Cancel everything still queued and stop the worker threads."""
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for handle in pending:
+            handle.cancel()
+        self._executor.shutdown(wait=False)
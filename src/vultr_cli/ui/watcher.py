@@ -0,0 +1,172 @@
+"""Adaptive status polling for instances and snapshots still changing state."""
+
+from kivy.clock import Clock
+
+from ..api.client import VultrAPIError
+from ..api.snapshots import PENDING
+
+
+def is_transitional(instance):
+    """True while an instance is still being provisioned or (re)booting."""
+    if instance.status == "pending":
+        return True
+    return instance.power_status == "running" and instance.server_status != "ok"
+
+
+class StatusWatcher:
+    """Polls only the items in transitional states until they settle.
+
+    Each round fetches the watched items one by one with ``fetch`` (e.g.
+    ``/instances/{id}``) instead of reloading the whole list. The delay
+    starts at ``min_interval`` and doubles (up to ``max_interval``) while
+    nothing changes, dropping back to ``min_interval`` as soon as a watched
+    item moves. ``on_update`` gets every changed item, ``on_removed`` the id
+    of one that disappeared. Polling stops on its own once nothing is
+    transitional, and ``pause()`` suspends it while the app is in the
+    background. Subclasses define ``fetch``, ``is_transitional`` and the
+    dispatcher ``KEY`` of their rounds.
+    """
+
+    KEY = None
+    MIN_INTERVAL = 3
+    MAX_INTERVAL = 60
+
+    def __init__(self, api_client, dispatcher, on_update, on_removed=None,
+                 min_interval=None, max_interval=None):
+        self.api_client = api_client
+        self.dispatcher = dispatcher
+        self.on_update = on_update
+        self.on_removed = on_removed
+        self.min_interval = min_interval or self.MIN_INTERVAL
+        self.max_interval = max_interval or self.MAX_INTERVAL
+        self.interval = self.min_interval
+        self.paused = False
+        self.stats = {"polls": 0, "requests": 0}
+        self._watched = {}  # Item id -> last seen payload
+        self._event = None
+        self._polling = False
+
+    @property
+    def watched_ids(self):
+        return set(self._watched)
+
+    def watch(self, items):
+        """Start watching the transitional ones among ``items``."""
+        added = False
+        for item in items:
+            if self.is_transitional(item):
+                added = added or item.id not in self._watched
+                self._watched[item.id] = item
+            else:
+                self._watched.pop(item.id, None)
+        if added:
+            self.interval = self.min_interval
+            self._schedule(reset=True)
+        elif not self._watched:
+            self._cancel()
+
+    def pause(self):
+        self.paused = True
+        self._cancel()
+
+    def resume(self):
+        self.paused = False
+        self.interval = self.min_interval
+        self._schedule(reset=True)
+
+    def _schedule(self, reset=False):
+        if self.paused or not self._watched or self._polling:
+            return
+        if self._event is not None:
+            if not reset:
+                return
+            self._event.cancel()
+        self._event = Clock.schedule_once(self._poll, self.interval)
+
+    def _cancel(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def _poll(self, dt):
+        self._event = None
+        if self.paused or not self._watched:
+            return
+        self._polling = True
+        self.stats["polls"] += 1
+        # The worker gets a copy: watch() keeps changing _watched on this thread
+        watched = dict(self._watched)
+        self.stats["requests"] += len(watched)
+        self.dispatcher.submit(self._fetch, watched, key=self.KEY,
+                               on_success=self._on_results,
+                               on_error=lambda e: self._back_off(),
+                               on_finally=self._on_round_done)
+
+    def _fetch(self, watched):
+        """Fetch every item of ``watched`` (id -> last seen); a failed fetch
+        keeps the last seen item, None marks one that is gone."""
+        results = {}
+        for item_id, last_seen in watched.items():
+            try:
+                results[item_id] = self.fetch(item_id)
+            except VultrAPIError as e:
+                results[item_id] = None if e.status_code == 404 else last_seen
+        return results
+
+    def _on_results(self, results):
+        changed = False
+        # on_update may call watch() again, so _watched can shrink meanwhile
+        for item_id, item in results.items():
+            if item_id not in self._watched:
+                continue
+            if item is None:
+                self._watched.pop(item_id, None)
+                changed = True
+                if self.on_removed:
+                    self.on_removed(item_id)
+                continue
+            if item != self._watched[item_id]:
+                changed = True
+                self.on_update(item)
+            if self.is_transitional(item):
+                self._watched[item_id] = item
+            else:
+                self._watched.pop(item_id, None)
+
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self._back_off()
+
+    def _back_off(self):
+        self.interval = min(self.interval * 2, self.max_interval)
+
+    def _on_round_done(self):
+        self._polling = False
+        self._schedule()
+
+
+class InstanceWatcher(StatusWatcher):
+    """Polls ``/instances/{id}`` of pending and booting instances."""
+
+    KEY = "instance_watcher"
+
+    def fetch(self, instance_id):
+        return self.api_client.get_instance(instance_id)
+
+    def is_transitional(self, instance):
+        return is_transitional(instance)
+
+
+class SnapshotWatcher(StatusWatcher):
+    """Polls ``/snapshots/{id}`` of pending snapshots, which take minutes."""
+
+    KEY = "snapshot_watcher"
+    MIN_INTERVAL = 10
+    MAX_INTERVAL = 120
+
+    def fetch(self, snapshot_id):
+        return self.api_client.get_snapshot(snapshot_id)
+
+    def is_transitional(self, snapshot):
+        return snapshot.status == PENDING
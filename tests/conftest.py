@@ -0,0 +1,24 @@
+import pytest
+from stub_server import StubServer, make_dataset
+
+from vultr_cli.api.client import VultrAPI
+from vultr_cli.api.ratelimit import TokenBucket
+
+
+@pytest.fixture
+def stub():
+    with StubServer(dataset=make_dataset(instances=20, plans=10, regions=4)) as server:
+        yield server
+
+
+def make_api(server, api_key="test", **kwargs):
+    """A client of ``server`` that neither waits on the rate limit nor retries."""
+    kwargs.setdefault("max_retries", 0)
+    return VultrAPI(api_key, base_url=server.base_url,
+                    rate_limiter=TokenBucket(rate=1e6, capacity=1e6), **kwargs)
+
+
+@pytest.fixture
+def api(stub):
+    with make_api(stub) as client:
+        yield client
@@ -0,0 +1,105 @@
+import threading
+from collections import defaultdict
+
+import pytest
+
+from vultr_cli.api.analytics import CostAnalytics, SyncCancelled, Table
+from vultr_cli.api.store import LocalStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalStore(str(tmp_path / "state.db"))
+    yield store
+    store.close()
+
+
+def test_table_round_trips_through_dump():
+    table = Table({"name": "text", "value": "d"})
+    table.extend([("a", 1.0), ("b", 2.0), ("a", 3.5)])
+    table.keep([True, False, True])
+    copy = Table(table.schema)
+    copy.load(table.dump())
+    assert copy.decode("name") == ["a", "a"]
+    assert copy.group_sum("name", "value") == {"a": (4.5, 2)}
+
+
+def test_summary_matches_the_api_data(api, store):
+    analytics = CostAnalytics(api, store)
+    counts, errors = analytics.sync()
+    assert errors == []
+    assert counts["history"] == len(api.get_billing_history())
+
+    totals = defaultdict(float)
+    for instance in api.get_instances():
+        totals[instance.region] += float(instance.pending_charges)
+    by_region = {region: total for region, total, count in analytics.cost_by("region")}
+    assert by_region == pytest.approx(dict(totals))
+
+    # Read back from the store alone
+    summary = CostAnalytics(api, store).summary()
+    assert summary["by_region"] == analytics.cost_by("region")
+    assert summary["top_bandwidth"] == analytics.top_bandwidth()
+
+
+def test_second_sync_fetches_only_what_is_new(api, stub, store):
+    analytics = CostAnalytics(api, store)
+    analytics.sync()
+    requests = stub.requests
+    counts, errors = analytics.sync()
+    assert counts["history"] == 0 and counts["bandwidth"] == 0
+    assert stub.requests == requests + 3  # History, pending charges, instances
+
+
+def test_concurrent_syncs_store_each_row_once(api, store):
+    analytics = CostAnalytics(api, store)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(analytics.sync()))
+               for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [errors for counts, errors in results] == [[], []]
+    assert sum(counts["history"] for counts, errors in results) == len(
+        api.get_billing_history())
+
+    for table in (analytics.tables["history"], CostAnalytics(api, store).tables["history"]):
+        ids = list(table.columns["id"])
+        assert len(ids) == len(set(ids)) == len(api.get_billing_history())
+    bandwidth = analytics.tables["bandwidth"]
+    days = list(zip(bandwidth.columns["instance"], bandwidth.columns["day"]))
+    assert len(days) == len(set(days))
+
+
+def test_current_day_is_fetched_again_once_stale(api, stub, store):
+    analytics = CostAnalytics(api, store)
+    analytics.sync()
+    rows = len(analytics.tables["bandwidth"])
+    analytics.BANDWIDTH_TTL = 0
+    counts, errors = analytics.sync()
+    assert counts["bandwidth"] > 0
+    assert len(analytics.tables["bandwidth"]) == rows  # Replaced, not duplicated
+
+
+def test_cancel_stops_between_bandwidth_batches_and_keeps_them(api, stub, store):
+    analytics = CostAnalytics(api, store)
+    analytics.BANDWIDTH_BATCH = 5
+    calls = []
+    concurrently = api.concurrently
+
+    def first_batch_then_cancel(*args):
+        calls.append(args)
+        analytics.cancel()
+        return concurrently(*args)
+
+    api.concurrently = first_batch_then_cancel
+    with pytest.raises(SyncCancelled):
+        analytics.sync()
+    assert len(calls) == 1
+    assert len(analytics.tables["fetched"]) == 5
+
+    api.concurrently = concurrently
+    counts, errors = analytics.sync()
+    assert counts["bandwidth"] and errors == []
+    assert len(analytics.tables["fetched"]) == len(api.get_instances())
@@ -0,0 +1,26 @@
+from conftest import make_api
+
+from vultr_cli.api.bulk import BulkOperations
+
+
+def instance_ids(stub):
+    return [instance["id"] for instance in stub.httpd.dataset["instances"]]
+
+
+def test_retried_delete_of_an_instance_already_gone_succeeds(stub):
+    instance_id = instance_ids(stub)[0]
+    with make_api(stub, max_retries=1) as api:
+        # Deleted, but the response is lost behind a 503; the retry gets 404
+        stub.inject(503, retry_after=0, applied=True)
+        assert api.delete_instance(instance_id)
+    assert instance_id not in instance_ids(stub)
+
+
+def test_destroy_many_reports_every_instance_gone(stub):
+    targets = instance_ids(stub)[:3]
+    # Any request may draw a fault, so allow one retry per fault
+    with make_api(stub, max_retries=len(targets)) as api:
+        stub.inject(503, count=len(targets), retry_after=0, applied=True)
+        results = list(BulkOperations(api).destroy_many(targets))
+    assert sorted(result.item for result in results if result.ok) == sorted(targets)
+    assert not set(targets) & set(instance_ids(stub))
@@ -0,0 +1,102 @@
+import pytest
+
+from vultr_cli.api.cache import CatalogCache
+from vultr_cli.api.client import VultrAPIError
+
+from conftest import make_api
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CatalogCache(str(tmp_path / "cache"))
+
+
+def test_fresh_entry_is_served_without_a_request(stub, cache):
+    with make_api(stub, cache=cache) as api:
+        regions = api.get_regions()
+        requests = stub.requests
+        assert api.get_regions() == regions
+    assert stub.requests == requests
+    assert cache.stats["hits"] == 1
+
+
+def test_stale_entry_is_revalidated_with_its_etag(stub, tmp_path):
+    cache = CatalogCache(str(tmp_path / "cache"), ttls={"regions": 0})
+    with make_api(stub, cache=cache) as api:
+        regions = api.get_regions()
+        assert api.get_regions() == regions
+        assert cache.stats["revalidated"] == 1
+
+        stub.httpd.dataset["regions"][0]["city"] = "Renamed"
+        assert api.get_regions()[0].city == "Renamed"
+        assert cache.stats["revalidated"] == 1
+
+
+def test_entries_survive_a_new_cache_instance(stub, tmp_path):
+    with make_api(stub, cache=CatalogCache(str(tmp_path / "cache"))) as api:
+        regions = api.get_regions()
+    requests = stub.requests
+    with make_api(stub, cache=CatalogCache(str(tmp_path / "cache"))) as api:
+        assert api.get_regions() == regions
+    assert stub.requests == requests
+
+
+def test_stale_entry_is_served_while_the_api_is_down(stub, tmp_path):
+    cache = CatalogCache(str(tmp_path / "cache"), ttls={"regions": 0})
+    with make_api(stub, cache=cache) as api:
+        regions = api.get_regions()
+        stub.inject(503)
+        assert api.get_regions() == regions
+    assert cache.stats["stale"] == 1
+
+
+def test_refused_request_is_not_masked_by_stale_data(stub, tmp_path):
+    cache = CatalogCache(str(tmp_path / "cache"), ttls={"regions": 0})
+    with make_api(stub, cache=cache) as api:
+        api.get_regions()
+        stub.inject(401)
+        with pytest.raises(VultrAPIError):
+            api.get_regions()
+
+
+def test_invalidate_drops_only_that_endpoint(stub, cache):
+    with make_api(stub, cache=cache) as api:
+        api.get_regions()
+        api.get_plans()
+        api.invalidate_cache("regions")
+        requests = stub.requests
+        api.get_plans()
+        assert stub.requests == requests
+        api.get_regions()
+        assert stub.requests == requests + 1
+
+
+def test_account_endpoints_are_not_shared_between_keys(stub, cache):
+    stub.httpd.dataset["snapshots"] = [dict(stub.httpd.dataset["snapshots"][0],
+                                            id="snap-of-alice")]
+    with make_api(stub, "alice", cache=cache) as alice, \
+            make_api(stub, "bob", cache=cache) as bob:
+        assert [s.id for s in alice.get_snapshots()] == ["snap-of-alice"]
+        alice.get_regions()
+        stub.httpd.dataset["snapshots"][0]["id"] = "snap-of-bob"
+        requests = stub.requests
+        assert [s.id for s in bob.get_snapshots()] == ["snap-of-bob"]
+        bob.get_regions()  # Catalogs are the same for every account
+        assert stub.requests == requests + 1
+
+        bob.invalidate_cache("snapshots")
+        requests = stub.requests
+        assert [s.id for s in alice.get_snapshots()] == ["snap-of-alice"]
+        assert stub.requests == requests
+
+
+def test_invalidate_without_a_scope_drops_every_account(stub, cache):
+    with make_api(stub, "alice", cache=cache) as alice, \
+            make_api(stub, "bob", cache=cache) as bob:
+        alice.get_snapshots()
+        bob.get_snapshots()
+        cache.invalidate("snapshots")
+        requests = stub.requests
+        alice.get_snapshots()
+        bob.get_snapshots()
+        assert stub.requests == requests + 2
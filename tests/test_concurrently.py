@@ -0,0 +1,84 @@
+import threading
+import time
+
+import pytest
+from stub_server import StubServer, make_dataset
+
+from conftest import make_api
+
+IDS = [(f"inst-{i:06d}",) for i in range(20)]
+
+
+@pytest.fixture
+def slow_stub():
+    with StubServer(dataset=make_dataset(instances=20), latency=0.5) as server:
+        yield server
+
+
+def close_while_running(api, max_concurrency):
+    """Close ``api`` while a ``concurrently`` call is in flight on another
+    thread; returns what that call returned or raised and how long it took
+    to finish after the close."""
+    outcome = {}
+
+    def run():
+        try:
+            outcome["result"] = api.concurrently("get_instance", IDS, max_concurrency)
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    time.sleep(0.2)
+    closed_at = time.perf_counter()
+    api.close()
+    thread.join(5)
+    assert not thread.is_alive()
+    return outcome, time.perf_counter() - closed_at
+
+
+def test_results_in_argument_order(api):
+    results = api.concurrently("get_instance", IDS[:5] + [("missing",)], 3)
+    assert [instance.id for instance in results[:5]] == [args[0] for args in IDS[:5]]
+    assert isinstance(results[5], Exception)
+
+
+def test_thread_pool_by_default(api):
+    api.concurrently("get_instance", IDS[:2])
+    assert api._delegate is None
+
+
+def test_close_stops_the_thread_pool_calls_still_queued(slow_stub):
+    outcome, elapsed = close_while_running(make_api(slow_stub), max_concurrency=2)
+    # Only the two calls already sent finish; the queued ones are skipped
+    assert elapsed < 1.5
+    errors = [result for result in outcome["result"] if isinstance(result, RuntimeError)]
+    assert len(errors) >= len(IDS) - 4
+
+
+def test_close_cancels_the_asyncio_calls_in_flight(slow_stub):
+    pytest.importorskip("aiohttp")
+    api = make_api(slow_stub, use_asyncio=True)
+    outcome, elapsed = close_while_running(api, max_concurrency=5)
+    assert isinstance(outcome.get("error"), RuntimeError)
+    assert elapsed < 1.5
+
+
+def test_calls_after_close_fail_fast(stub):
+    for use_asyncio in (False, True):
+        api = make_api(stub, use_asyncio=use_asyncio)
+        api.close()
+        with pytest.raises(RuntimeError):
+            api.concurrently("get_instance", IDS[:1])
+
+
+def test_closed_delegate_fails_fast(stub):
+    pytest.importorskip("aiohttp")
+    from vultr_cli.api.aio import AsyncDelegate
+
+    with make_api(stub) as api:
+        delegate = AsyncDelegate(api)
+        assert delegate.map("get_instance", IDS[:2], 2)[0].id == IDS[0][0]
+        delegate.close()
+        with pytest.raises(RuntimeError):
+            delegate.map("get_instance", IDS[:1], 1)
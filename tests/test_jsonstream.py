@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from vultr_cli.api.jsonstream import ArrayStream
+
+BODY = json.dumps({
+    "instances": [{"id": "a", "label": "café ☃", "ram": 1024, "cost": 1.5e3,
+                   "tags": ["x", "y"], "nested": {"list": [1, [2, {}]]}},
+                  {"id": "b", "label": "quote \" and ] } ,", "ram": -7, "ok": True},
+                  {"id": "c", "none": None}],
+    "meta": {"total": 3, "links": {"next": "", "prev": ""}},
+}, ensure_ascii=False).encode()
+
+
+def decode(body, size):
+    stream = ArrayStream("instances")
+    items = []
+    for start in range(0, len(body), size):
+        items += stream.feed(body[start:start + size])
+    items += stream.close()
+    return items, stream.members
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(BODY)])
+def test_every_chunk_boundary_decodes_the_same(size):
+    expected = json.loads(BODY)
+    items, members = decode(BODY, size)
+    assert items == expected["instances"]
+    assert members == {"meta": expected["meta"]}
+
+
+def test_items_are_handed_out_as_soon_as_complete():
+    stream = ArrayStream("instances", convert=lambda item: item["id"])
+    end_of_first = BODY.index(b"}}") + 2
+    assert stream.feed(BODY[:end_of_first]) == []  # "," not seen yet
+    assert stream.feed(BODY[end_of_first:end_of_first + 1]) == ["a"]
+
+
+def test_number_split_across_chunks_is_not_truncated():
+    body = b'{"instances": [12345.5e2, 7]}'
+    assert decode(body, 1)[0] == [1234550.0, 7]
+
+
+@pytest.mark.parametrize("body", [BODY[:-1], BODY[:len(BODY) // 2], b'{"instances": [1,, 2]}'])
+def test_truncated_or_malformed_body_raises(body):
+    with pytest.raises(ValueError):
+        decode(body, 5)
@@ -0,0 +1,102 @@
+import pytest
+
+from vultr_cli.api.operations import OperationQueue
+from vultr_cli.api.store import DONE, FAILED, PENDING, LocalStore
+
+CREATE = {"plan_id": "vc2-1c-1gb", "region_id": "r00", "snapshot_id": "snap-0"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalStore(str(tmp_path / "state.db"))
+    yield store
+    store.close()
+
+
+def tagged(stub, tag):
+    return [i for i in stub.httpd.dataset["instances"] if tag in i["tags"]]
+
+
+def test_create_is_sent_and_recorded(api, stub, store):
+    operation = OperationQueue(api, store).submit("create", **CREATE)
+    assert operation.status == DONE
+    assert len(tagged(stub, "op-" + operation.id)) == 1
+    assert store.pending_count() == 0
+
+
+def test_unreachable_api_keeps_the_operation_for_replay(api, stub, store):
+    queue = OperationQueue(api, store)
+    stub.inject(503)
+    operation = queue.submit("create", **CREATE)
+    assert operation.status == PENDING
+    assert tagged(stub, "op-" + operation.id) == []
+
+    finished = queue.replay()
+    assert [(op.id, op.status) for op in finished] == [(operation.id, DONE)]
+    assert len(tagged(stub, "op-" + operation.id)) == 1
+    assert queue.replay() == []
+
+
+def test_replay_does_not_recreate_after_a_lost_response(api, stub, store):
+    queue = OperationQueue(api, store)
+    stub.inject(503)
+    operation = queue.submit("create", **CREATE)
+    # The earlier attempt did reach the API, only its response was lost
+    lost = dict(stub.httpd.dataset["instances"][0], id="lost",
+                tags=["op-" + operation.id])
+    stub.httpd.dataset["instances"].append(lost)
+
+    (finished,) = queue.replay()
+    assert finished.status == DONE
+    assert finished.result["id"] == "lost"
+    assert len(tagged(stub, "op-" + operation.id)) == 1
+
+
+def test_replay_stops_at_the_first_operation_still_unreachable(api, stub, store):
+    queue = OperationQueue(api, store)
+    stub.inject(503, count=2)
+    first = queue.submit("destroy", instance_id="inst-000001")
+    second = queue.submit("destroy", instance_id="inst-000002")
+    stub.inject(503)
+    assert queue.replay() == []
+    assert [op.id for op in queue.pending()] == [first.id, second.id]
+    assert [op.id for op in queue.replay()] == [first.id, second.id]
+
+
+def test_destroy_of_a_missing_instance_counts_as_done(api, stub, store):
+    stub.inject(404)
+    assert OperationQueue(api, store).submit("destroy", instance_id="gone").status == DONE
+
+
+def test_refused_operation_fails_and_raises(api, stub, store):
+    stub.inject(400)
+    with pytest.raises(Exception):
+        OperationQueue(api, store).submit("create", **CREATE)
+    (operation,) = store.operations(FAILED)
+    assert "400" in operation.error
+
+
+def test_submit_many_records_every_item_and_queues_the_unreachable(api, stub, store):
+    queue = OperationQueue(api, store)
+    stub.inject(503)
+    results = list(queue.submit_many("create", [dict(CREATE, label=f"bulk-{i}")
+                                                for i in range(3)]))
+    assert sorted(result.item["label"] for result in results) == [
+        "bulk-0", "bulk-1", "bulk-2"]
+    assert all(result.ok for result in results)
+    statuses = sorted(result.result.status for result in results)
+    assert statuses == [DONE, DONE, PENDING]
+
+    (pending,) = [result.result for result in results if result.result.status == PENDING]
+    assert [op.id for op in queue.replay()] == [pending.id]
+    for result in results:
+        assert len(tagged(stub, "op-" + result.result.id)) == 1
+
+
+def test_submit_many_reports_refused_items(api, stub, store):
+    queue = OperationQueue(api, store)
+    stub.inject(400)
+    results = list(queue.submit_many("destroy", [{"instance_id": "inst-000001"}]))
+    assert [(result.item, result.ok) for result in results] == [
+        ({"instance_id": "inst-000001"}, False)]
+    assert [op.status for op in store.operations(FAILED)] == [FAILED]
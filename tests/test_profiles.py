@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+from vultr_cli.profiles import profile_slug
+
+
+@pytest.mark.parametrize("name", ["work", "team_a", "prod-1"])
+def test_safe_names_are_kept(name):
+    assert profile_slug(name) == name
+
+
+@pytest.mark.parametrize("name", ["../../etc/x", "a/b", "..", "with space", "/abs", "ü"])
+def test_other_names_stay_in_the_directory(name):
+    slug = profile_slug(name)
+    assert os.path.basename(slug) == slug
+    assert slug not in ("", ".", "..") and "/" not in slug and ".." not in slug
+
+
+def test_different_names_get_different_slugs():
+    names = ["a/b", "a b", "a_b", "a:b"]
+    assert len({profile_slug(name) for name in names}) == len(names)
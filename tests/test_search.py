@@ -0,0 +1,72 @@
+import pytest
+
+from vultr_cli.api.models import Instance
+from vultr_cli.api.search import InstanceIndex
+
+
+def instance(id, **fields):
+    fields.setdefault("label", id)
+    fields.setdefault("region", "ewr")
+    fields.setdefault("status", "active")
+    return Instance.from_dict(dict(fields, id=id))
+
+
+@pytest.fixture
+def instances():
+    return [
+        instance("i-1", label="prod-web-1", main_ip="10.0.1.7", region="ewr",
+                 plan="vc2-1c-1gb", tags=["web"]),
+        instance("i-2", label="prod-db-1", main_ip="10.0.2.9", region="nrt",
+                 plan="vc2-2c-4gb", tags=["db"], status="pending"),
+        instance("i-3", label="staging web", main_ip="192.168.0.1", region="ewr",
+                 plan="vhf-1c-1gb", tags=["web", "staging"]),
+    ]
+
+
+def ids(index, query):
+    return [i.id for i in index.filter(query)]
+
+
+def test_word_and_prefix_matches(instances):
+    index = InstanceIndex(instances)
+    assert ids(index, "web") == ["i-1", "i-3"]
+    assert ids(index, "prod-w") == ["i-1"]
+    assert ids(index, "10.0") == ["i-1", "i-2"]
+    assert ids(index, "") == ["i-1", "i-2", "i-3"]
+    assert ids(index, "nothing") == []
+
+
+def test_every_term_must_match(instances):
+    index = InstanceIndex(instances)
+    assert ids(index, "web ewr") == ["i-1", "i-3"]
+    assert ids(index, "web staging") == ["i-3"]
+    assert ids(index, "db ewr") == []
+
+
+def test_field_terms_look_at_that_field_only(instances):
+    index = InstanceIndex(instances)
+    assert ids(index, "region:nrt") == ["i-2"]
+    assert ids(index, "tag:web") == ["i-1", "i-3"]
+    assert ids(index, "ip:192") == ["i-3"]
+    assert ids(index, "state:pend") == ["i-2"]
+    assert ids(index, "label:staging") == ["i-3"]
+
+
+def test_update_reindexes_changes_and_keeps_order(instances):
+    index = InstanceIndex(instances)
+    assert ids(index, "web") == ["i-1", "i-3"]
+    renamed = instance("i-1", label="prod-api-1", region="ewr")
+    added = instance("i-4", label="web-new", region="ams")
+    assert index.update([added, renamed, instances[1]]) == (1, 1, 1)
+    assert ids(index, "web") == ["i-4"]
+    assert ids(index, "prod") == ["i-1", "i-2"]
+    assert ids(index, "region:ams") == ["i-4"]
+    assert "i-3" not in index
+
+
+@pytest.mark.parametrize("word", ["plan", "os", "id", "label", "region", "state", "tag",
+                                  "ip", "hostname"])
+def test_field_names_without_a_colon_are_words(word):
+    index = InstanceIndex([instance("i-1", label="other", plan="vc2-1c-1gb"),
+                           instance("i-2", label=f"my-{word}-box", plan="vc2-1c-1gb")])
+    assert ids(index, word) == ["i-2"]
@@ -0,0 +1,70 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from vultr_cli.api.singleflight import SingleFlight
+
+KEY = ("/regions", (), False)
+
+
+def run_concurrently(flight, callers, fn, keys=(KEY,)):
+    """Start ``callers`` calls of ``fn`` and return their futures once all
+    of them have joined the flight."""
+    executor = ThreadPoolExecutor(max_workers=callers)
+    futures = [executor.submit(flight.do, list(keys), fn) for _ in range(callers)]
+    while flight.stats["calls"] + flight.stats["shared"] < callers:
+        threading.Event().wait(0.001)
+    executor.shutdown(wait=False)
+    return futures
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return ["result"]
+
+    futures = run_concurrently(flight, 8, fetch)
+    release.set()
+    assert [future.result(5) for future in futures] == [["result"]] * 8
+    assert len(calls) == 1
+    assert flight.stats == {"calls": 1, "shared": 7}
+    assert flight.in_flight() == 0
+
+
+def test_error_reaches_every_caller_and_frees_the_key():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise RuntimeError("boom")
+
+    futures = run_concurrently(flight, 4, fail)
+    release.set()
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(5)
+    assert flight.do([KEY], lambda: "again") == "again"
+
+
+def test_nothing_is_cached_after_the_call():
+    flight = SingleFlight()
+    assert flight.do([KEY], lambda: 1) == 1
+    assert flight.do([KEY], lambda: 2) == 2
+    assert flight.stats == {"calls": 2, "shared": 0}
+
+
+def test_forget_makes_later_callers_start_a_new_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    (old,) = run_concurrently(flight, 1, lambda: release.wait(5) and "old")
+    flight.forget("/regions")
+    assert flight.do([KEY], lambda: "new") == "new"
+    release.set()
+    assert old.result(5) == "old"
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""Generate the spec-driven Vultr client from openapi.json.
+
+Writes one module per API tag plus shared models into
+src/vultr_cli/api/generated/, so the 36k-line spec is only ever parsed here,
+at build time, and never by the app. Re-run after updating openapi.json:
+
+    python tools/generate_client.py
+"""
+
+import json
+import keyword
+import os
+import re
+import shutil
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+SPEC = os.path.join(ROOT, "openapi.json")
+OUTPUT = os.path.join(ROOT, "src", "vultr_cli", "api", "generated")
+
+HEADER = '"""{doc}\n\nGenerated from openapi.json by tools/generate_client.py; do not edit.\n"""\n'
+METHODS = ("get", "post", "put", "patch", "delete")
+SCALARS = {"string": "str", "integer": "int", "number": "float", "boolean": "bool"}
+
+
+def snake(name):
+    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
+    name = re.sub(r"[^0-9a-zA-Z]+", "_", name).strip("_").lower()
+    if not name or name[0].isdigit():
+        name = f"_{name}"
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def camel(name):
+    return "".join(part[:1].upper() + part[1:] for part in re.split(r"[^0-9a-zA-Z]+", name) if part)
+
+
+def one_line(text):
+    return " ".join((text or "").split()).replace('"""', "'''").replace("\\", "\\\\")
+
+
+class Generator:
+    def __init__(self, spec):
+        self.spec = spec
+        self.schemas = spec["components"]["schemas"]
+        self.model_names = {name: camel(name) for name in self.schemas}
+
+    def resolve(self, node):
+        while "$ref" in node:
+            target = self.spec
+            for part in node["$ref"].lstrip("#/").split("/"):
+                target = target[part]
+            node = target
+        return node
+
+    def annotation(self, schema, models):
+        """Python type annotation for ``schema``; referenced models go into ``models``."""
+        schema = schema or {}
+        if "$ref" in schema:
+            parts = schema["$ref"].split("/")
+            if len(parts) != 4:  # points inside a schema, e.g. at one property
+                return self.annotation(self.resolve(schema), models)
+            name = self.model_names[parts[-1]]
+            models.add(name)
+            return name
+        kind = schema.get("type")
+        if kind in SCALARS:
+            return SCALARS[kind]
+        if kind == "array":
+            return f"List[{self.annotation(schema.get('items', {}), models)}]"
+        if kind == "object" or "properties" in schema:
+            return "Dict[str, Any]"
+        return "Any"
+
+    def typed_dict(self, name, schema, models, doc):
+        # Field types stay strings (forward references): models may refer to
+        # each other out of order, and groups only import them for type checking.
+        properties = schema.get("properties") or {}
+        fields = ", ".join(
+            f'"{key}": "{self.annotation(value, models)}"' for key, value in properties.items()
+        )
+        return (f'{name} = TypedDict("{name}", {{{fields}}}, total=False)\n'
+                f'{name}.__doc__ = "{one_line(doc)}"\n')
+
+    def models_module(self):
+        models = set()
+        body = [
+            self.typed_dict(self.model_names[name], schema, models,
+                            schema.get("description") or schema.get("title") or name)
+            for name, schema in self.schemas.items()
+        ]
+        return (
+            HEADER.format(doc="Typed models for the Vultr API component schemas.")
+            + "\nfrom typing import Any, Dict, List\n\n"
+            + "try:\n    from typing import TypedDict\nexcept ImportError:  # Python < 3.8\n"
+            + "    from typing_extensions import TypedDict\n\n\n"
+            + "\n".join(body)
+        )
+
+    def operations(self):
+        """Yield (tag, method, path, path-level params, operation) in spec order."""
+        for path, item in self.spec["paths"].items():
+            for method in METHODS:
+                if method in item:
+                    operation = item[method]
+                    tag = (operation.get("tags") or ["misc"])[0]
+                    yield tag, method, path, item.get("parameters", []), operation
+
+    def operation_name(self, method, path, operation, taken):
+        name = snake(operation.get("operationId") or f"{method} {path}")
+        base, index = name, 2
+        while name in taken:
+            name = f"{base}_{index}"
+            index += 1
+        taken.add(name)
+        return name
+
+    def method_source(self, name, method, path, path_params, operation, models, local_types):
+        params = [self.resolve(p) for p in path_params + operation.get("parameters", [])]
+        # A few spec parameters omit ``in``; they are all query parameters
+        path_args = [p for p in params if p.get("in") == "path"]
+        query_args = [p for p in params if p.get("in", "query") == "query"]
+        op_type = camel(name)
+
+        # Request body: a TypedDict for inline object schemas, else the referenced model
+        body_type = None
+        request = operation.get("requestBody")
+        if request:
+            schema = (request.get("content") or {}).get("application/json", {}).get("schema", {})
+            if "$ref" in schema:
+                body_type = self.annotation(schema, models)
+            elif schema.get("properties"):
+                body_type = f"{op_type}Request"
+                local_types.append(self.typed_dict(body_type, schema, models,
+                                                   f"Request body of {name}()."))
+            else:
+                body_type = "Dict[str, Any]"
+
+        # Response: the first 2xx JSON body, typed the same way
+        return_type = "None"
+        for code, response in sorted(operation.get("responses", {}).items()):
+            if not code.startswith("2"):
+                continue
+            content = self.resolve(response).get("content") or {}
+            if not content:
+                continue
+            if "application/json" not in content:
+                return_type = "str"  # e.g. the CSV export of pending charges
+                break
+            schema = content["application/json"].get("schema", {})
+            if "$ref" in schema:
+                return_type = self.annotation(schema, models)
+            elif schema.get("properties"):
+                return_type = f"{op_type}Response"
+                local_types.append(self.typed_dict(return_type, schema, models,
+                                                   f"Response of {name}()."))
+            else:
+                return_type = "Any"
+            break
+
+        args = ["self"]
+        url = path
+        for param in path_args:
+            arg = snake(param["name"])
+            args.append(f"{arg}: {self.annotation(param.get('schema', {}), models)}")
+            url = url.replace("{" + param["name"] + "}", "{_quote(" + arg + ")}")
+        if body_type:
+            if request.get("required"):
+                args.append(f"body: {body_type}")
+            else:
+                args.append(f"body: Optional[{body_type}] = None")
+        if query_args:
+            args.append("*")
+            for param in query_args:
+                kind = self.annotation(param.get("schema", {}), models)
+                args.append(f"{snake(param['name'])}: Optional[{kind}] = None")
+
+        lines = [f"    def {name}({', '.join(args)}) -> {return_type}:"]
+        summary = one_line(operation.get("summary") or operation.get("description") or name)
+        lines.append(f'        """{summary}"""')
+        call = [f'"{method.upper()}"', f'f"{url}"' if path_args else f'"{url}"']
+        if query_args:
+            query = ", ".join(f'"{p["name"]}": {snake(p["name"])}' for p in query_args)
+            call.append(f"params={{{query}}}")
+        if body_type:
+            call.append("json=body")
+        if path_args:
+            call.append(f'route="{path}"')
+        lines.append(f"        return self._api.call({', '.join(call)})")
+        return "\n".join(lines) + "\n"
+
+    def group_modules(self):
+        groups = {}
+        for tag, method, path, path_params, operation in self.operations():
+            groups.setdefault(tag, []).append((method, path, path_params, operation))
+
+        modules = {}
+        for tag, operations in groups.items():
+            module = snake(tag)
+            class_name = f"{camel(tag)}Resource"
+            models, local_types, methods, taken = set(), [], [], set()
+            for method, path, path_params, operation in operations:
+                name = self.operation_name(method, path, operation, taken)
+                methods.append(self.method_source(name, method, path, path_params,
+                                                  operation, models, local_types))
+            source = HEADER.format(doc=f"The ``{tag}`` resource group of the Vultr API.")
+            source += "\nfrom __future__ import annotations\n\n"
+            source += "from typing import TYPE_CHECKING, Any, Dict, List, Optional\n\n"
+            source += "from ._base import Resource, TypedDict, _quote\n"
+            if models:
+                source += "\nif TYPE_CHECKING:\n"
+                source += f"    from .models import {', '.join(sorted(models))}\n"
+            source += "\n\n" + "\n".join(local_types)
+            if local_types:
+                source += "\n\n"
+            source += f"class {class_name}(Resource):\n"
+            source += f'    """Operations tagged ``{tag}``."""\n\n'
+            source += "\n".join(methods)
+            modules[module] = (class_name, tag, len(operations), source)
+        return modules
+
+    def package_init(self, modules):
+        entries = "".join(
+            f'    "{module}": ("{class_name}", {count}),  # {tag}\n'
+            for module, (class_name, tag, count, _) in sorted(modules.items())
+        )
+        total = sum(count for _, _, count, _ in modules.values())
+        return (
+            HEADER.format(doc=f"Spec-driven Vultr API client ({total} operations).")
+            + '''
+import importlib
+
+# Resource group attribute -> (class name, operation count). Each group lives
+# in its own module, imported the first time the attribute is used.
+GROUPS = {
+''' + entries + '''}
+
+
+class VultrClient:
+    """Every operation of the Vultr API, grouped by resource.
+
+    Wraps a ``VultrAPI`` so generated calls share its pooled session, rate
+    limiter and retries::
+
+        client = VultrClient(VultrAPI(api_key))
+        client.billing.list_billing_history()
+    """
+
+    def __init__(self, api):
+        self._api = api
+
+    def __getattr__(self, name):
+        if name not in GROUPS:
+            raise AttributeError(f"VultrClient has no resource group {name!r}")
+        resource = getattr(_load(name), GROUPS[name][0])(self._api)
+        setattr(self, name, resource)
+        return resource
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(GROUPS))
+
+
+def _load(module):
+    return importlib.import_module(f"{__name__}.{module}")
+
+
+def __getattr__(name):
+    """Lazily expose the resource classes, e.g. ``generated.InstancesResource``."""
+    for module, (class_name, _) in GROUPS.items():
+        if class_name == name:
+            return getattr(_load(module), class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+'''
+        )
+
+
+BASE = HEADER.format(doc="Shared helpers for the generated resource groups.") + '''
+from urllib.parse import quote
+
+try:
+    from typing import TypedDict
+except ImportError:  # Python < 3.8
+    from typing_extensions import TypedDict
+
+__all__ = ["Resource", "TypedDict", "_quote"]
+
+
+def _quote(value):
+    return quote(str(value), safe="")
+
+
+class Resource:
+    """Base class of the generated resource groups."""
+
+    def __init__(self, api):
+        self._api = api
+'''
+
+
+def main():
+    with open(SPEC) as f:
+        spec = json.load(f)
+    generator = Generator(spec)
+    modules = generator.group_modules()
+
+    if os.path.isdir(OUTPUT):
+        shutil.rmtree(OUTPUT)
+    os.makedirs(OUTPUT)
+    files = {
+        "__init__.py": generator.package_init(modules),
+        "_base.py": BASE,
+        "models.py": generator.models_module(),
+    }
+    files.update({f"{module}.py": source for module, (_, _, _, source) in modules.items()})
+    for name, source in files.items():
+        with open(os.path.join(OUTPUT, name), "w") as f:
+            f.write(source)
+    operations = sum(count for _, _, count, _ in modules.values())
+    print(f"wrote {len(files)} modules, {operations} operations to {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()